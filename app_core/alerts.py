@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+
+def _percent(used: float, total: float) -> float:
+    return used * 100.0 / total if total > 0 else 0.0
+
+
+# Metric names usable in rules, read from a ``MetricsSnapshot``.
+ALERT_METRICS: Dict[str, Callable[..., float]] = {
+    'cpu_usage': lambda s: float(s.cpu_usage),
+    'cpu_temp': lambda s: float(s.cpu_temp),
+    'ram': lambda s: _percent(s.ram_used, s.ram_total),
+    'swap': lambda s: _percent(s.swap_used, s.swap_total),
+    'disk': lambda s: _percent(s.disk_used, s.disk_total),
+    'ram_used': lambda s: float(s.ram_used),
+    'disk_used': lambda s: float(s.disk_used),
+    'net_recv': lambda s: float(s.net_recv),
+    'net_sent': lambda s: float(s.net_sent),
+}
+
+DEFAULT_ALERT_RULES = [
+    'cpu_temp > 90 for 30s',
+    'ram > 95% for 60s',
+    'disk > 95%',
+]
+
+DEFAULT_COOLDOWN_SEC = 300.0
+DEFAULT_ZSCORE_WINDOW = 120
+# Without an explicit ``clear`` level a rule resolves 5% below its threshold
+# (a z-score rule at 3/4 of it), so values hovering at the limit do not flap.
+HYSTERESIS_RATIO = 0.05
+ZSCORE_CLEAR_RATIO = 0.75
+ZSCORE_MIN_SAMPLES = 10
+
+_RULE_RE = re.compile(
+    r'^\s*(?P<metric>[a-z_]+)\s+(?:(?P<zscore>zscore)\s+)?(?P<op>[<>]=?)\s*'
+    r'(?P<value>[-+]?\d+(?:\.\d+)?)\s*%?(?P<options>(?:\s+\S+\s+\S+)*)\s*$',
+    re.IGNORECASE,
+)
+_DURATION_UNITS = {'': 1.0, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+
+
+class AlertRuleError(ValueError):
+    pass
+
+
+class AlertRule(NamedTuple):
+    text: str
+    metric: str
+    op: str
+    threshold: float
+    duration: float = 0.0
+    clear: Optional[float] = None
+    cooldown: float = DEFAULT_COOLDOWN_SEC
+    zscore: bool = False
+    window: int = DEFAULT_ZSCORE_WINDOW
+
+    def triggered(self, value: float) -> bool:
+        if self.op == '>':
+            return value > self.threshold
+        if self.op == '>=':
+            return value >= self.threshold
+        if self.op == '<':
+            return value < self.threshold
+        return value <= self.threshold
+
+    def cleared(self, value: float) -> bool:
+        return value < self.clear if self.op.startswith('>') else value > self.clear
+
+
+class AlertEvent(NamedTuple):
+    rule: AlertRule
+    value: float
+    firing: bool
+    timestamp: float
+
+    def describe(self) -> str:
+        name = f"{self.rule.metric} z-score" if self.rule.zscore else self.rule.metric
+        return f"{name} = {self.value:.1f} ({self.rule.text})"
+
+
+def _parse_duration(value: str) -> float:
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)([smh]?)', value.lower())
+    if not match:
+        raise AlertRuleError(f"bad duration: {value!r}")
+    return float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+
+
+def parse_rule(text: str) -> AlertRule:
+    """Parse ``<metric> [zscore] <op> <value>[%] [for <dur>] [clear <value>] [cooldown <dur>] [window <n>]``.
+
+    Examples: ``cpu_temp > 90 for 30s``, ``disk > 95%``,
+    ``cpu_usage zscore > 4 window 300 cooldown 10m``.
+    """
+    match = _RULE_RE.match(text or '')
+    if not match:
+        raise AlertRuleError(f"cannot parse rule: {text!r}")
+    metric = match.group('metric').lower()
+    if metric not in ALERT_METRICS:
+        raise AlertRuleError(f"unknown metric: {metric!r}")
+    op = match.group('op')
+    threshold = float(match.group('value'))
+    zscore = bool(match.group('zscore'))
+    fields = {'duration': 0.0, 'clear': None, 'cooldown': DEFAULT_COOLDOWN_SEC, 'window': DEFAULT_ZSCORE_WINDOW}
+    tokens = match.group('options').split()
+    for key, value in zip(tokens[::2], tokens[1::2]):
+        key = key.lower()
+        if key == 'for':
+            fields['duration'] = _parse_duration(value)
+        elif key == 'cooldown':
+            fields['cooldown'] = _parse_duration(value)
+        elif key == 'clear':
+            try:
+                fields['clear'] = float(value.rstrip('%'))
+            except ValueError:
+                raise AlertRuleError(f"bad clear level: {value!r}") from None
+        elif key == 'window':
+            if not value.isdigit() or int(value) < 2:
+                raise AlertRuleError(f"bad window: {value!r}")
+            fields['window'] = int(value)
+        else:
+            raise AlertRuleError(f"unknown option: {key!r}")
+    if fields['clear'] is None:
+        if zscore:
+            fields['clear'] = threshold * ZSCORE_CLEAR_RATIO
+        else:
+            margin = abs(threshold) * HYSTERESIS_RATIO
+            fields['clear'] = threshold - margin if op.startswith('>') else threshold + margin
+    return AlertRule(text.strip(), metric, op, threshold, zscore=zscore, **fields)
+
+
+class RollingStats:
+    """Mean and standard deviation of the last ``window`` values in O(1) per value.
+
+    Running sums are refreshed from the window once per ``window`` evictions
+    (amortised O(1)), so float error does not accumulate.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values: Deque[float] = deque()
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, value: float) -> None:
+        self._values.append(value)
+        self._sum += value
+        self._sum_sq += value * value
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            self._sum -= old
+            self._sum_sq -= old * old
+            self._evictions += 1
+            if self._evictions >= self.window:
+                self._evictions = 0
+                self._sum = math.fsum(self._values)
+                self._sum_sq = math.fsum(v * v for v in self._values)
+
+    def zscore(self, value: float) -> Optional[float]:
+        count = len(self._values)
+        if count < min(self.window, ZSCORE_MIN_SAMPLES):
+            return None
+        mean = self._sum / count
+        variance = max(0.0, self._sum_sq / count - mean * mean)
+        std = math.sqrt(variance)
+        if std < 1e-9:
+            return None
+        return (value - mean) / std
+
+
+class _RuleState:
+    def __init__(self, rule: AlertRule):
+        self.rule = rule
+        self.firing = False
+        self.since: Optional[float] = None
+        self.last_fired = float('-inf')
+        self.stats = RollingStats(rule.window) if rule.zscore else None
+
+
+class AlertEngine:
+    """Evaluates alert rules incrementally, one snapshot at a time.
+
+    Each rule keeps a few scalars (and a rolling window for z-score rules), so
+    a sample costs O(1) per rule and history is never rescanned. A rule fires
+    once its condition has held for ``duration`` and ``cooldown`` has passed
+    since it last fired; it resolves only when the value crosses ``clear``.
+    ``evaluate`` returns the fire/resolve transitions.
+    """
+
+    def __init__(self, rules: Sequence[str] = ()):
+        self._states: List[_RuleState] = []
+        self.set_rules(rules)
+
+    @property
+    def rules(self) -> List[AlertRule]:
+        return [state.rule for state in self._states]
+
+    @property
+    def firing(self) -> List[AlertRule]:
+        return [state.rule for state in self._states if state.firing]
+
+    def set_rules(self, rules: Sequence[str]) -> List[Tuple[str, str]]:
+        """Replace the rule set, keeping the state of rules that did not change.
+
+        Returns ``(rule, error)`` for every rule that failed to parse.
+        """
+        previous = {state.rule.text: state for state in self._states}
+        states: List[_RuleState] = []
+        errors: List[Tuple[str, str]] = []
+        for text in rules:
+            text = str(text).strip()
+            if not text:
+                continue
+            if text in previous:
+                states.append(previous[text])
+                continue
+            try:
+                states.append(_RuleState(parse_rule(text)))
+            except AlertRuleError as e:
+                errors.append((text, str(e)))
+        self._states = states
+        return errors
+
+    def evaluate(self, snapshot, now: Optional[float] = None) -> List[AlertEvent]:
+        now = snapshot.timestamp if now is None else now
+        values: Dict[str, float] = {}
+        events: List[AlertEvent] = []
+        for state in self._states:
+            rule = state.rule
+            value = values.get(rule.metric)
+            if value is None:
+                value = values[rule.metric] = ALERT_METRICS[rule.metric](snapshot)
+            if rule.zscore:
+                score = state.stats.zscore(value)
+                state.stats.add(value)
+                if score is None:
+                    continue
+                value = score
+            event = self._step(state, value, now)
+            if event is not None:
+                events.append(event)
+        return events
+
+    @staticmethod
+    def _step(state: _RuleState, value: float, now: float) -> Optional[AlertEvent]:
+        rule = state.rule
+        if state.firing:
+            if rule.cleared(value):
+                state.firing = False
+                state.since = None
+                return AlertEvent(rule, value, False, now)
+            return None
+        if not rule.triggered(value):
+            state.since = None
+            return None
+        if state.since is None:
+            state.since = now
+        if now - state.since >= rule.duration and now - state.last_fired >= rule.cooldown:
+            state.firing = True
+            state.last_fired = now
+            return AlertEvent(rule, value, True, now)
+        return None
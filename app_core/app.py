@@ -3,15 +3,13 @@ from __future__ import annotations
 import json
 import logging
 import platform
-from collections import deque
 from datetime import datetime
-from queue import Empty, Full, Queue
 import signal
 import subprocess
 import threading
 import time
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 import gi
 
@@ -33,20 +31,36 @@ from .constants import (
     APP_NAME,
     ICON_FALLBACK,
     LOG_FILE,
+    BIN_LOG_FILE,
     SETTINGS_FILE,
     TIME_UPDATE_SEC,
     GRAPH_HISTORY_MINUTES_DEFAULT,
     GRAPH_HISTORY_MINUTES_MIN,
     GRAPH_HISTORY_MINUTES_MAX,
+    HISTORY_RETENTION_DAYS_DEFAULT,
+    HISTORY_RETENTION_DAYS_MIN,
+    HISTORY_RETENTION_DAYS_MAX,
+    METRICS_DIR,
     SUPPORTED_LANGS,
     MENU_ORDER_DEFAULT,
 )
+from .alerts import DEFAULT_ALERT_RULES, AlertEngine
+from .binary_log import LOG_HEADER, encode_snapshot
+from .decimation import MODE_MINMAX, decimate_view, lttb_indices
 from .dialogs import SettingsDialog
+from .graph_widget import HeatmapGraph, MetricGraph
+from .history import HistoryView, MetricHistory, SeriesFamily
+from .http_transport import close_transport, get_transport
+from .label_cache import LabelCache
+from .language import LANGUAGE_NAMES
 from .localization import tr, detect_system_language, set_language, get_language
-from .logging_utils import rotate_log_if_needed
-from notifications import TelegramNotifier, DiscordNotifier
+from .logging_utils import LOG_BACKUPS_DEFAULT, LOG_BACKUPS_MAX, LOG_COMPRESSIONS, LogWriter
+from .metric_graphs import METRIC_GRAPHS
+from .metrics_store import MetricsStore
+from notifications import DiscordNotifier, NotificationDispatcher, TelegramNotifier, create_channels
 from .power_control import PowerControl
-from .system_usage import MetricsSampler
+from .sampler import MetricsSnapshot, SamplingEngine
+from .system_usage import MetricsSampler, SystemUsage
 from .click_tracker import increment_keyboard, increment_mouse, get_counts
 
 logger = logging.getLogger(__name__)
@@ -62,8 +76,17 @@ POLL_INTERVAL_SETTING_KEYS = (
     'net_interval_sec',
     'disk_interval_sec',
     'swap_interval_sec',
+    'disk_io_interval_sec',
 )
 
+# Metric families shown as heatmaps: menu key -> poll interval setting they share.
+FAMILY_INTERVAL_KEYS = {
+    'cpu_cores': 'cpu_interval_sec',
+    'net_ifaces': 'net_interval_sec',
+    'mounts': 'disk_interval_sec',
+    'disk_io': 'disk_io_interval_sec',
+}
+
 GRAPH_COLOR_DEFAULTS = {
     'graph_line_color_cpu': '#19ccff',
     'graph_line_color_temp': '#ff6633',
@@ -76,19 +99,6 @@ GRAPH_COLOR_DEFAULTS = {
     'graph_line_color_mouse': '#66e6ff',
 }
 
-
-
-def _text_width(text_extents) -> float:
-    """Return cairo text extents width for both object- and tuple-based APIs."""
-    width = getattr(text_extents, "width", None)
-    if width is not None:
-        return float(width)
-    try:
-        # tuple API: (x_bearing, y_bearing, width, height, x_advance, y_advance)
-        return float(text_extents[2])
-    except Exception:
-        return 0.0
-
 LANGUAGE_FLAGS = {
     'ru': '🇷🇺',
     'en': '🇬🇧',
@@ -136,134 +146,120 @@ class SystemTrayApp:
         self.power_control = PowerControl(self)
         self.power_control.set_parent_window(None)
 
+        self._menu_open = False
+        self.label_cache = LabelCache()
         self.create_menu()
 
-        net = psutil.net_io_counters()
-        self.prev_net_data = {'recv': net.bytes_recv, 'sent': net.bytes_sent, 'time': time.time()}
+        bytes_recv, bytes_sent = SystemUsage.get_net_bytes()
+        self.prev_net_data = {'recv': bytes_recv, 'sent': bytes_sent, 'time': time.time()}
 
         self.keyboard_listener = None
         self.mouse_listener = None
         self._notify_no_global_hooks = False
         self.init_listeners()
 
-        self.telegram_notifier = TelegramNotifier()
-        self.discord_notifier = DiscordNotifier()
-        self.last_telegram_notification_time = 0.0
-        self.last_discord_notification_time = 0.0
-        self._notification_stop_event = threading.Event()
-        self._telegram_queue: Queue[Optional[str]] = Queue(maxsize=1)
-        self._discord_queue: Queue[Optional[str]] = Queue(maxsize=1)
-        self._telegram_worker = threading.Thread(
-            target=self._notification_worker,
-            args=(self._telegram_queue, self.telegram_notifier.send_message, "Telegram"),
-            daemon=True,
-        )
-        self._discord_worker = threading.Thread(
-            target=self._notification_worker,
-            args=(self._discord_queue, self.discord_notifier.send_message, "Discord"),
-            daemon=True,
-        )
-        self._telegram_worker.start()
-        self._discord_worker.start()
+        self.notification_channels = create_channels()
+        self.telegram_notifier = self.notification_channels['telegram']
+        self.discord_notifier = self.notification_channels['discord']
+        self.last_notification_time: Dict[str, float] = dict.fromkeys(self.notification_channels, 0.0)
+        self.notification_dispatcher = NotificationDispatcher()
+        for channel in self.notification_channels.values():
+            self.notification_dispatcher.add(channel)
+        self.notification_dispatcher.start()
+        self.alert_engine = AlertEngine()
+        self._configure_alerts()
 
         self.telegram_notifier.set_power_control(self.power_control)
         self.telegram_notifier.set_app_context(self)
+        self.telegram_notifier.set_dispatcher(self.notification_dispatcher)
         if self.telegram_notifier.enabled:
             self.telegram_notifier.start_bot()
 
         self.settings_dialog: Optional[SettingsDialog] = None
         self._progress_dialog: Optional[Gtk.MessageDialog] = None
         self.metrics_sampler = MetricsSampler()
-        self._profiling_cycle_count = 0
-        self._profiling_total_ms = 0.0
-        self._profiling_max_ms = 0.0
+        self._last_item_update_ts: Dict[str, float] = {}
+        self._item_display_cache: Dict[str, str] = {}
+        self._published_texts: Dict[str, str] = {}
+        self.sampler_engine = SamplingEngine(
+            self._collect_snapshot,
+            self._on_snapshot,
+            self._update_ui,
+            GLib.idle_add,
+            TIME_UPDATE_SEC,
+            next_delay=self._next_sample_delay,
+        )
 
-        self.cpu_graph_window: Optional[Gtk.Window] = None
-        self.cpu_graph_area: Optional[Gtk.DrawingArea] = None
-        self.cpu_graph_hint_label: Optional[Gtk.Label] = None
         graph_points = self._graph_history_points(self.visibility_settings['graph_history_minutes'])
-        self.cpu_history = deque(maxlen=graph_points)
-
-        self.ram_graph_window: Optional[Gtk.Window] = None
-        self.ram_graph_area: Optional[Gtk.DrawingArea] = None
-        self.ram_graph_hint_label: Optional[Gtk.Label] = None
-        self.ram_history = deque(maxlen=graph_points)
-
-        self.swap_graph_window: Optional[Gtk.Window] = None
-        self.swap_graph_area: Optional[Gtk.DrawingArea] = None
-        self.swap_graph_hint_label: Optional[Gtk.Label] = None
-        self.swap_history = deque(maxlen=graph_points)
-
-        self.disk_graph_window: Optional[Gtk.Window] = None
-        self.disk_graph_area: Optional[Gtk.DrawingArea] = None
-        self.disk_graph_hint_label: Optional[Gtk.Label] = None
-        self.disk_history = deque(maxlen=graph_points)
-
-        self.net_graph_window: Optional[Gtk.Window] = None
-        self.net_graph_area: Optional[Gtk.DrawingArea] = None
-        self.net_graph_hint_label: Optional[Gtk.Label] = None
-        self.net_history = deque(maxlen=graph_points)
-
-        self.keyboard_graph_window: Optional[Gtk.Window] = None
-        self.keyboard_graph_area: Optional[Gtk.DrawingArea] = None
-        self.keyboard_graph_hint_label: Optional[Gtk.Label] = None
-        self.keyboard_history = deque(maxlen=graph_points)
-
-        self.mouse_graph_window: Optional[Gtk.Window] = None
-        self.mouse_graph_area: Optional[Gtk.DrawingArea] = None
-        self.mouse_graph_hint_label: Optional[Gtk.Label] = None
-        self.mouse_history = deque(maxlen=graph_points)
+        self.cpu_history = MetricHistory(('usage', 'temp'), graph_points, TIME_UPDATE_SEC)
+        self.ram_history = MetricHistory(('used', 'total', 'percent'), graph_points, TIME_UPDATE_SEC)
+        self.swap_history = MetricHistory(('used', 'total', 'percent'), graph_points, TIME_UPDATE_SEC)
+        self.disk_history = MetricHistory(('used', 'total', 'percent'), graph_points, TIME_UPDATE_SEC)
+        self.net_history = MetricHistory(('recv', 'sent'), graph_points, TIME_UPDATE_SEC)
+        self.keyboard_history = MetricHistory(('count',), graph_points, TIME_UPDATE_SEC)
+        self.mouse_history = MetricHistory(('count',), graph_points, TIME_UPDATE_SEC)
+
+        # Totals over all disks for the Telegram /io_graph; per-disk busy share lives in the family.
+        self.disk_io_history = MetricHistory(('read', 'write', 'iops', 'busy'), graph_points, TIME_UPDATE_SEC)
+
+        # Family histories and stores are created, restored and dropped on the sampler thread only.
+        self.family_histories: Dict[str, SeriesFamily] = {}
+        self.family_stores: Dict[str, MetricsStore] = {}
+        self._requested_families: Tuple[str, ...] = ()
+        self._active_families: Tuple[str, ...] = ()
+
+        self._history_series = (
+            ('cpu', self.cpu_history),
+            ('ram', self.ram_history),
+            ('swap', self.swap_history),
+            ('disk', self.disk_history),
+            ('net', self.net_history),
+            ('keyboard', self.keyboard_history),
+            ('mouse', self.mouse_history),
+        )
+        self.metrics_store = MetricsStore(
+            METRICS_DIR,
+            [f"{name}.{field}" for name, history in self._history_series for field in history.fields],
+            self.visibility_settings['history_retention_days'],
+        )
+        self._restore_history()
+        self._thread(self.metrics_store.maintain)
+        self._apply_metric_families()
 
+        self.graphs: Dict[str, MetricGraph] = {
+            **{descriptor.key: MetricGraph(self, descriptor.key, descriptor) for descriptor in METRIC_GRAPHS},
+            **{family_key: HeatmapGraph(self, family_key) for family_key in FAMILY_INTERVAL_KEYS},
+        }
         self.graph_zoom_state: Dict[str, Dict[str, float]] = {
-            'cpu': {'scale': 1.0, 'center': 1.0, 'dragging': 0.0, 'last_x': 0.0, 'hovering': 0.0, 'hover_x': 0.0, 'hover_y': 0.0},
-            'ram': {'scale': 1.0, 'center': 1.0, 'dragging': 0.0, 'last_x': 0.0, 'hovering': 0.0, 'hover_x': 0.0, 'hover_y': 0.0},
-            'swap': {'scale': 1.0, 'center': 1.0, 'dragging': 0.0, 'last_x': 0.0, 'hovering': 0.0, 'hover_x': 0.0, 'hover_y': 0.0},
-            'disk': {'scale': 1.0, 'center': 1.0, 'dragging': 0.0, 'last_x': 0.0, 'hovering': 0.0, 'hover_x': 0.0, 'hover_y': 0.0},
-            'net': {'scale': 1.0, 'center': 1.0, 'dragging': 0.0, 'last_x': 0.0, 'hovering': 0.0, 'hover_x': 0.0, 'hover_y': 0.0},
-            'keyboard': {'scale': 1.0, 'center': 1.0, 'dragging': 0.0, 'last_x': 0.0, 'hovering': 0.0, 'hover_x': 0.0, 'hover_y': 0.0},
-            'mouse': {'scale': 1.0, 'center': 1.0, 'dragging': 0.0, 'last_x': 0.0, 'hovering': 0.0, 'hover_x': 0.0, 'hover_y': 0.0},
+            key: {'scale': 1.0, 'center': 1.0, 'dragging': 0.0, 'last_x': 0.0, 'hovering': 0.0, 'hover_x': 0.0, 'hover_y': 0.0}
+            for key in self.graphs
         }
 
+        self.log_writer = LogWriter(LOG_FILE)
+        self.binary_log_writer = LogWriter(BIN_LOG_FILE, header=LOG_HEADER)
+        self._configure_log_writers()
+
         if self.visibility_settings.get('logging_enabled', True) and not LOG_FILE.exists():
             try:
                 LOG_FILE.write_text("", encoding="utf-8")
             except Exception as e:
                 print("Не удалось создать файл лога:", e)
 
+    def _configure_log_writers(self) -> None:
+        max_mb = int(self.visibility_settings.get('max_log_mb', 5))
+        max_mb = max(1, min(max_mb, 1024))
+        backups = int(self.visibility_settings.get('log_backups', LOG_BACKUPS_DEFAULT))
+        compression = self.visibility_settings.get('log_compression', 'gzip')
+        for writer in (self.log_writer, self.binary_log_writer):
+            writer.max_bytes = max_mb * 1024 * 1024
+            writer.backups = max(1, min(backups, LOG_BACKUPS_MAX))
+            writer.compression = compression if compression in LOG_COMPRESSIONS else 'gzip'
+
     @staticmethod
     def _thread(target, *args, **kwargs):
         t = threading.Thread(target=target, args=args, kwargs=kwargs, daemon=True)
         t.start()
 
-    def _enqueue_latest_notification(self, queue: Queue[Optional[str]], message: Optional[str]) -> None:
-        payload = None if message is None else str(message)
-        while True:
-            try:
-                queue.put_nowait(payload)
-                return
-            except Full:
-                try:
-                    queue.get_nowait()
-                    queue.task_done()
-                except Empty:
-                    return
-
-    def _notification_worker(self, queue: Queue[Optional[str]], sender, channel_name: str) -> None:
-        while not self._notification_stop_event.is_set():
-            try:
-                message = queue.get(timeout=0.5)
-            except Empty:
-                continue
-
-            try:
-                if message is None:
-                    return
-                sender(message)
-            except Exception as e:
-                logger.exception("Ошибка отправки уведомления (%s): %s", channel_name, e)
-            finally:
-                queue.task_done()
-
     def init_listeners(self):
         try:
             self.keyboard_listener = keyboard.Listener(on_press=self.on_key_press, daemon=True)
@@ -398,23 +394,32 @@ class SystemTrayApp:
         self._show_message(tr('system_info_title'), info_text)
 
     def create_menu(self):
+        self._build_label_templates()
+        self.label_cache.forget_applied()
         self.menu = Gtk.Menu()
+        self.menu.connect("show", self._on_menu_visibility_changed, True)
+        self.menu.connect("hide", self._on_menu_visibility_changed, False)
 
         self.cpu_temp_item = Gtk.MenuItem(label=f"{tr('cpu_info')}: N/A")
-        self.cpu_temp_item.connect("activate", self.show_cpu_graph)
+        self.cpu_temp_item.connect("activate", self.show_graph, 'cpu')
         self.ram_item = Gtk.MenuItem(label=f"{tr('ram_loading')}: N/A")
-        self.ram_item.connect("activate", self.show_ram_graph)
+        self.ram_item.connect("activate", self.show_graph, 'ram')
         self.swap_item = Gtk.MenuItem(label=f"{tr('swap_loading')}: N/A")
-        self.swap_item.connect("activate", self.show_swap_graph)
+        self.swap_item.connect("activate", self.show_graph, 'swap')
         self.disk_item = Gtk.MenuItem(label=f"{tr('disk_loading')}: N/A")
-        self.disk_item.connect("activate", self.show_disk_graph)
+        self.disk_item.connect("activate", self.show_graph, 'disk')
         self.net_item = Gtk.MenuItem(label=f"{tr('lan_speed')}: N/A")
-        self.net_item.connect("activate", self.show_net_graph)
+        self.net_item.connect("activate", self.show_graph, 'net')
         self.uptime_item = Gtk.MenuItem(label=f"{tr('uptime_label')}: N/A")
         self.keyboard_item = Gtk.MenuItem(label=f"{tr('keyboard_clicks')}: 0")
-        self.keyboard_item.connect("activate", self.show_keyboard_graph)
+        self.keyboard_item.connect("activate", self.show_graph, 'keyboard')
         self.mouse_item = Gtk.MenuItem(label=f"{tr('mouse_clicks')}: 0")
-        self.mouse_item.connect("activate", self.show_mouse_graph)
+        self.mouse_item.connect("activate", self.show_graph, 'mouse')
+        self.family_items: Dict[str, Gtk.MenuItem] = {}
+        for family_key in FAMILY_INTERVAL_KEYS:
+            item = Gtk.MenuItem(label=f"{self._family_label(family_key)}: N/A")
+            item.connect("activate", self.show_graph, family_key)
+            self.family_items[family_key] = item
 
         self.ping_item = Gtk.MenuItem(label=tr('ping_network'))
         self.ping_item.connect("activate", self.on_ping_click)
@@ -442,12 +447,10 @@ class SystemTrayApp:
         self.settings_item = Gtk.MenuItem(label=tr('settings_label'))
         self.settings_item.connect("activate", self.show_settings)
 
-        from .language import LANGUAGES
-
         self.language_menu = Gtk.Menu()
         group_root = None
         for code in SUPPORTED_LANGS:
-            language_name = (LANGUAGES.get(code) or LANGUAGES.get('en', {})).get('language_name', code)
+            language_name = LANGUAGE_NAMES.get(code, code)
             flag = LANGUAGE_FLAGS.get(code, '🏳️')
             item = Gtk.RadioMenuItem.new_with_label_from_widget(group_root, f"{flag} {language_name}")
             if group_root is None:
@@ -478,22 +481,21 @@ class SystemTrayApp:
             self.visibility_settings['language'] = lang_code
             self.save_settings()
             self.create_menu()
-            self._refresh_cpu_graph_texts()
-            self._refresh_ram_graph_texts()
-            self._refresh_swap_graph_texts()
-            self._refresh_disk_graph_texts()
-            self._refresh_net_graph_texts()
-            self._refresh_keyboard_graph_texts()
-            self._refresh_mouse_graph_texts()
+            for graph in self.graphs.values():
+                graph.refresh_texts()
 
     def load_settings(self) -> Dict:
         default = {
             'cpu': True, 'ram': True, 'swap': True, 'disk': True, 'net': True, 'uptime': True,
             'tray_cpu': True, 'tray_ram': True, 'keyboard_clicks': True, 'mouse_clicks': True,
-            'language': None, 'logging_enabled': True, 'show_graph_zoom_controls': True,
+            'cpu_cores': False, 'net_ifaces': False, 'mounts': False, 'disk_io': True,
+            'language': None, 'logging_enabled': True, 'binary_log_enabled': False, 'show_graph_zoom_controls': True,
             'show_power_off': True, 'show_reboot': True, 'show_lock': True, 'show_timer': True,
-            'max_log_mb': 5, 'ping_network': True, 'show_system_info': True,
+            'max_log_mb': 5, 'log_backups': LOG_BACKUPS_DEFAULT, 'log_compression': 'gzip',
+            'alerts_enabled': True, 'alert_rules': list(DEFAULT_ALERT_RULES),
+            'ping_network': True, 'show_system_info': True,
             'graph_history_minutes': GRAPH_HISTORY_MINUTES_DEFAULT,
+            'history_retention_days': HISTORY_RETENTION_DAYS_DEFAULT,
             'menu_order': MENU_ORDER_DEFAULT.copy(),
             'tray_cpu_interval_sec': POLL_INTERVAL_DEFAULT_SEC,
             'tray_ram_interval_sec': POLL_INTERVAL_DEFAULT_SEC,
@@ -502,7 +504,9 @@ class SystemTrayApp:
             'net_interval_sec': POLL_INTERVAL_DEFAULT_SEC,
             'disk_interval_sec': POLL_INTERVAL_DEFAULT_SEC,
             'swap_interval_sec': POLL_INTERVAL_DEFAULT_SEC,
+            'disk_io_interval_sec': POLL_INTERVAL_DEFAULT_SEC,
             'profiling_enabled': False,
+            'adaptive_sampling': True,
         }
         default.update(GRAPH_COLOR_DEFAULTS)
         try:
@@ -512,6 +516,7 @@ class SystemTrayApp:
         except Exception as e:
             print(f"Ошибка загрузки настроек из {self.settings_file}: {e}")
         default['graph_history_minutes'] = self._sanitize_graph_history_minutes(default.get('graph_history_minutes'))
+        default['history_retention_days'] = self._sanitize_history_retention_days(default.get('history_retention_days'))
         legacy_color = self._sanitize_graph_line_color(default.get('graph_line_color'))
         for key, fallback in GRAPH_COLOR_DEFAULTS.items():
             source = default.get(key, legacy_color if 'graph_line_color' in default else fallback)
@@ -529,6 +534,14 @@ class SystemTrayApp:
             minutes = GRAPH_HISTORY_MINUTES_DEFAULT
         return max(GRAPH_HISTORY_MINUTES_MIN, min(GRAPH_HISTORY_MINUTES_MAX, minutes))
 
+    @staticmethod
+    def _sanitize_history_retention_days(value) -> int:
+        try:
+            days = int(value)
+        except (TypeError, ValueError):
+            days = HISTORY_RETENTION_DAYS_DEFAULT
+        return max(HISTORY_RETENTION_DAYS_MIN, min(HISTORY_RETENTION_DAYS_MAX, days))
+
     @staticmethod
     def _graph_history_points(minutes: int) -> int:
         return max(1, minutes * 60 // TIME_UPDATE_SEC)
@@ -564,13 +577,130 @@ class SystemTrayApp:
         self.visibility_settings['graph_history_minutes'] = sanitized_minutes
         maxlen = self._graph_history_points(sanitized_minutes)
 
-        self.cpu_history = deque(self.cpu_history, maxlen=maxlen)
-        self.ram_history = deque(self.ram_history, maxlen=maxlen)
-        self.swap_history = deque(self.swap_history, maxlen=maxlen)
-        self.disk_history = deque(self.disk_history, maxlen=maxlen)
-        self.net_history = deque(self.net_history, maxlen=maxlen)
-        self.keyboard_history = deque(self.keyboard_history, maxlen=maxlen)
-        self.mouse_history = deque(self.mouse_history, maxlen=maxlen)
+        self.cpu_history.resize(maxlen)
+        self.ram_history.resize(maxlen)
+        self.swap_history.resize(maxlen)
+        self.disk_history.resize(maxlen)
+        self.net_history.resize(maxlen)
+        self.keyboard_history.resize(maxlen)
+        self.mouse_history.resize(maxlen)
+        self.disk_io_history.resize(maxlen)
+        # Family histories follow on the sampler thread, see _sync_metric_families.
+
+    def _restore_history(self) -> None:
+        """Refill graph history from the on-disk metrics store for the configured window."""
+        now = time.time()
+        window_sec = self.cpu_history.window_sec
+        try:
+            columns = self.metrics_store.read_columns(now - window_sec, now)
+            if not columns[0]:
+                return
+            pos = 1
+            for _, history in self._history_series:
+                width = len(history.fields)
+                history.extend(columns[0], *columns[pos:pos + width])
+                pos += width
+        except Exception as e:
+            print("Не удалось восстановить историю графиков:", e)
+
+    def _persist_history_sample(self) -> None:
+        values = []
+        timestamp = None
+        for _, history in self._history_series:
+            last = history.last()
+            if last is None:
+                return
+            timestamp = last[0] if timestamp is None else timestamp
+            values.extend(last[1:])
+        try:
+            self.metrics_store.append(timestamp, values)
+        except Exception as e:
+            print("Ошибка записи истории метрик:", e)
+
+    def _apply_metric_families(self) -> None:
+        """Request the enabled metric families; the sampler thread sets them up before its next read."""
+        self._requested_families = tuple(
+            key for key in FAMILY_INTERVAL_KEYS if self.visibility_settings.get(key, False)
+        )
+        self.sampler_engine.poke()
+
+    def _sync_metric_families(self) -> None:
+        """Sampler thread: resize, create, restore and drop family histories to match the request."""
+        graph_points = self._graph_history_points(self.visibility_settings['graph_history_minutes'])
+        for family in self.family_histories.values():
+            family.resize(graph_points)
+        enabled = self._requested_families
+        if enabled == self._active_families:
+            return
+        for key in list(self.family_histories):
+            if key not in enabled:
+                self.family_histories.pop(key, None)
+                store = self.family_stores.pop(key, None)
+                if store is not None:
+                    self._thread(store.flush)
+        for key in enabled:
+            if key in self.family_histories:
+                continue
+            family = SeriesFamily(graph_points, TIME_UPDATE_SEC)
+            store = MetricsStore(METRICS_DIR / key, (), self.visibility_settings['history_retention_days'])
+            self._restore_family(family, store)
+            self.family_stores[key] = store
+            self.family_histories[key] = family
+            self._thread(store.maintain)
+        self.metrics_sampler.set_families(enabled)
+        self._active_families = enabled
+
+    def _restore_family(self, family: SeriesFamily, store: MetricsStore) -> None:
+        now = time.time()
+        window_sec = family.history.window_sec
+        try:
+            fields = store.stored_fields()
+            if not fields:
+                return
+            store.set_fields(fields)
+            rows = list(store.read(now - window_sec, now))
+            if rows:
+                columns = list(zip(*rows))
+                family.extend(fields, columns[0], *columns[1:])
+        except Exception as e:
+            print("Не удалось восстановить историю графиков:", e)
+
+    @staticmethod
+    def _family_values(family_key: str, values: Dict) -> Dict[str, float]:
+        """Flatten a sampler family reading into ``{series: value}`` for its heatmap."""
+        if family_key == 'net_ifaces':
+            flat: Dict[str, float] = {}
+            for name, (recv, sent) in values.items():
+                flat[f"{name}.recv"] = recv
+                flat[f"{name}.sent"] = sent
+            return flat
+        if family_key == 'mounts':
+            return {
+                mount: max(0.0, min(100.0, used / total * 100.0)) if total > 0 else 0.0
+                for mount, (used, total) in values.items()
+            }
+        if family_key == 'disk_io':
+            return {disk: busy for disk, (_read, _write, _iops, busy) in values.items()}
+        return {name: max(0.0, min(100.0, float(value))) for name, value in values.items()}
+
+    def _append_family_samples(self, snapshot: MetricsSnapshot) -> None:
+        for key, values in snapshot.families.items():
+            family = self.family_histories.get(key)
+            if family is None or not values:
+                continue
+            family.append(snapshot.timestamp, self._family_values(key, values))
+            if key == 'disk_io':
+                read, write, iops, busy = zip(*values.values())
+                self.disk_io_history.append(snapshot.timestamp, sum(read), sum(write), sum(iops), max(busy))
+            store = self.family_stores.get(key)
+            last = family.history.last()
+            if store is None or last is None:
+                continue
+            try:
+                store.set_fields(family.fields)
+                store.append(last[0], last[1:])
+            except Exception as e:
+                print("Ошибка записи истории метрик:", e)
 
     def save_settings(self) -> None:
         try:
@@ -617,6 +747,7 @@ class SystemTrayApp:
             'net': self.net_item,
             'keyboard_clicks': self.keyboard_item,
             'mouse_clicks': self.mouse_item,
+            **self.family_items,
             'uptime': self.uptime_item,
             'show_power_off': self.power_off_item,
             'show_reboot': self.reboot_item,
@@ -654,7 +785,7 @@ class SystemTrayApp:
             self.settings_dialog.present()
             return
 
-        dialog = SettingsDialog(None, self.visibility_settings)
+        dialog = SettingsDialog(None, self.visibility_settings, self.log_writer)
         self.power_control.set_parent_window(dialog)
         self.settings_dialog = dialog
 
@@ -668,12 +799,28 @@ class SystemTrayApp:
                 vs['tray_cpu'] = dialog.tray_cpu_check.get_active()
                 vs['tray_ram'] = dialog.tray_ram_check.get_active()
                 vs['logging_enabled'] = dialog.logging_check.get_active()
+                if not vs['logging_enabled']:
+                    self._thread(self.log_writer.close)
+                vs['binary_log_enabled'] = dialog.binary_log_check.get_active()
+                if not vs['binary_log_enabled']:
+                    self._thread(self.binary_log_writer.close)
                 vs['show_graph_zoom_controls'] = dialog.show_zoom_controls_check.get_active()
                 for color_key, color_value in dialog.get_graph_line_colors().items():
                     vs[color_key] = self._sanitize_graph_line_color(color_value)
                 vs['menu_order'] = dialog.get_menu_order()
                 vs['max_log_mb'] = int(dialog.logsize_spin.get_value())
+                vs['log_backups'] = int(dialog.log_backups_spin.get_value())
+                vs['log_compression'] = dialog.get_log_compression()
+                vs['alerts_enabled'] = dialog.alerts_enable_check.get_active()
+                vs['alert_rules'] = dialog.get_alert_rules()
+                self._configure_alerts()
+                self._configure_log_writers()
                 self._set_graph_history_window(dialog.graph_history_spin.get_value_as_int())
+                vs['history_retention_days'] = self._sanitize_history_retention_days(
+                    dialog.history_retention_spin.get_value_as_int()
+                )
+                self.metrics_store.retention_days = vs['history_retention_days']
+                self._thread(self.metrics_store.maintain)
                 vs['tray_cpu_interval_sec'] = self._sanitize_poll_interval(dialog.tray_cpu_interval_spin.get_value_as_int())
                 vs['tray_ram_interval_sec'] = self._sanitize_poll_interval(dialog.tray_ram_interval_spin.get_value_as_int())
                 vs['cpu_interval_sec'] = self._sanitize_poll_interval(dialog.cpu_interval_spin.get_value_as_int())
@@ -681,6 +828,7 @@ class SystemTrayApp:
                 vs['net_interval_sec'] = self._sanitize_poll_interval(dialog.net_interval_spin.get_value_as_int())
                 vs['disk_interval_sec'] = self._sanitize_poll_interval(dialog.disk_interval_spin.get_value_as_int())
                 vs['swap_interval_sec'] = self._sanitize_poll_interval(dialog.swap_interval_spin.get_value_as_int())
+                vs['disk_io_interval_sec'] = self._sanitize_poll_interval(dialog.disk_io_interval_spin.get_value_as_int())
 
                 tel_enabled_before = getattr(self, 'telegram_notifier', TelegramNotifier()).enabled
                 if self.telegram_notifier.save_config(
@@ -692,7 +840,7 @@ class SystemTrayApp:
                 ):
                     self.telegram_notifier.load_config()
                     if self.telegram_notifier.enabled and not tel_enabled_before:
-                        self.last_telegram_notification_time = 0.0
+                        self.last_notification_time['telegram'] = 0.0
                         self.telegram_notifier.start_bot()
                     elif not self.telegram_notifier.enabled and tel_enabled_before:
                         self.telegram_notifier.stop_bot()
@@ -708,8 +856,9 @@ class SystemTrayApp:
                 ):
                     self.discord_notifier.load_config()
                     if self.discord_notifier.enabled and not disc_enabled_before:
-                        self.last_discord_notification_time = 0.0
+                        self.last_notification_time['discord'] = 0.0
 
+                self._apply_metric_families()
                 self.save_settings()
                 self.create_menu()
 
@@ -758,254 +907,234 @@ class SystemTrayApp:
         return f"{days} {day_label}, {time_part}"
 
     def update_info(self) -> bool:
-        cycle_start = time.perf_counter()
-        try:
-            kbd, ms = self._safe_call(get_counts, (0, 0))
-
-            metric_intervals = {
-                'cpu_temp': max(2, int(self.visibility_settings.get('cpu_interval_sec', POLL_INTERVAL_DEFAULT_SEC))),
-                'cpu_usage': int(self.visibility_settings.get('cpu_interval_sec', POLL_INTERVAL_DEFAULT_SEC)),
-                'ram': int(self.visibility_settings.get('ram_interval_sec', POLL_INTERVAL_DEFAULT_SEC)),
-                'disk': int(self.visibility_settings.get('disk_interval_sec', POLL_INTERVAL_DEFAULT_SEC)),
-                'swap': int(self.visibility_settings.get('swap_interval_sec', POLL_INTERVAL_DEFAULT_SEC)),
-                'net': int(self.visibility_settings.get('net_interval_sec', POLL_INTERVAL_DEFAULT_SEC)),
-                'uptime': POLL_INTERVAL_DEFAULT_SEC,
-            }
-            sample = self._safe_call(
-                lambda: self.metrics_sampler.collect(self.prev_net_data, metric_intervals),
-                {
-                    'cpu_temp': 0,
-                    'cpu_usage': 0.0,
-                    'ram': (0.0, 0.0),
-                    'disk': (0.0, 0.0),
-                    'swap': (0.0, 0.0),
-                    'net': (0.0, 0.0),
-                    'uptime': "00:00:00",
-                },
-            )
-            cpu_temp = int(sample.get('cpu_temp', 0))
-            cpu_usage = float(sample.get('cpu_usage', 0.0))
-            ram_used, ram_total = sample.get('ram', (0.0, 0.0))
-            disk_used, disk_total = sample.get('disk', (0.0, 0.0))
-            swap_used, swap_total = sample.get('swap', (0.0, 0.0))
-            net_recv_speed, net_sent_speed = sample.get('net', (0.0, 0.0))
-            uptime = str(sample.get('uptime', "00:00:00"))
-            uptime_display = self._format_uptime_localized(uptime)
-
-            self._update_ui(cpu_temp, cpu_usage,
-                            ram_used, ram_total,
-                            disk_used, disk_total,
-                            swap_used, swap_total,
-                            net_recv_speed, net_sent_speed,
-                            uptime_display, kbd, ms)
-
-            now = time.time()
-            if (self.telegram_notifier.enabled and
-                    now - self.last_telegram_notification_time >= self.telegram_notifier.notification_interval):
-                self._thread(self.send_telegram_notification,
-                             cpu_temp, cpu_usage, ram_used, ram_total,
-                             disk_used, disk_total, swap_used, swap_total,
-                             net_recv_speed, net_sent_speed, uptime_display, kbd, ms)
-                self.last_telegram_notification_time = now
-
-            if (self.discord_notifier.enabled and
-                    now - self.last_discord_notification_time >= self.discord_notifier.notification_interval):
-                self._thread(self.send_discord_notification,
-                             cpu_temp, cpu_usage, ram_used, ram_total,
-                             disk_used, disk_total, swap_used, swap_total,
-                             net_recv_speed, net_sent_speed, uptime_display, kbd, ms)
-                self.last_discord_notification_time = now
-
-            if self.visibility_settings.get('logging_enabled', True):
-                max_mb = int(self.visibility_settings.get('max_log_mb', 5))
-                max_mb = max(1, min(max_mb, 1024))
-                rotate_log_if_needed(max_mb * 1024 * 1024)
-
-                try:
-                    line = (f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] "
-                            f"CPU: {cpu_usage:.0f}% {cpu_temp}°C | "
-                            f"RAM: {ram_used:.1f}/{ram_total:.1f} GB | "
-                            f"SWAP: {swap_used:.1f}/{swap_total:.1f} GB | "
-                            f"Disk: {disk_used:.1f}/{disk_total:.1f} GB | "
-                            f"Net: ↓{net_recv_speed:.1f}/↑{net_sent_speed:.1f} {tr('mbps')} | "
-                            f"Uptime: {uptime_display} | "
-                            f"Keys: {kbd} | "
-                            f"Clicks: {ms}\n")
-
-                    with LOG_FILE.open("a", encoding="utf-8", buffering=1024 * 64) as f:
-                        f.write(line)
-
-                except Exception as e:
-                    print("Ошибка записи в лог:", e)
-
-            if self.visibility_settings.get('profiling_enabled', False):
-                cycle_ms = (time.perf_counter() - cycle_start) * 1000.0
-                self._profiling_cycle_count += 1
-                self._profiling_total_ms += cycle_ms
-                self._profiling_max_ms = max(self._profiling_max_ms, cycle_ms)
-                if self._profiling_cycle_count >= 60:
-                    avg_ms = self._profiling_total_ms / float(self._profiling_cycle_count)
-                    logger.info(
-                        "Profiling update_info: avg=%.2fms max=%.2fms samples=%d",
-                        avg_ms,
-                        self._profiling_max_ms,
-                        self._profiling_cycle_count,
-                    )
-                    self._profiling_cycle_count = 0
-                    self._profiling_total_ms = 0.0
-                    self._profiling_max_ms = 0.0
-
-            return True
-        except Exception as e:
-            print(f"Ошибка в update_info: {e}")
-            return True
+        """Run one sampling cycle on the calling thread (the initial snapshot before the sampler starts)."""
+        self.sampler_engine.run_once()
+        return True
 
-    def send_telegram_notification(self, cpu_temp, cpu_usage, ram_used, ram_total,
-                                   disk_used, disk_total, swap_used, swap_total,
-                                   net_recv_speed, net_sent_speed, uptime,
-                                   keyboard_clicks_val, mouse_clicks_val):
-        msg = (
-            f"<b>{tr('system_status')}</b>\n"
-            f"<b>{tr('cpu')}:</b> {cpu_usage:.0f}% ({cpu_temp}{tr('temperature')})\n"
-            f"<b>{tr('ram')}:</b> {ram_used:.1f}/{ram_total:.1f} {tr('gb')}\n"
-            f"<b>{tr('swap')}:</b> {swap_used:.1f}/{swap_total:.1f} {tr('gb')}\n"
-            f"<b>{tr('disk')}:</b> {disk_used:.1f}/{disk_total:.1f} {tr('gb')}\n"
-            f"<b>{tr('network')}:</b> ↓{net_recv_speed:.1f}/↑{net_sent_speed:.1f} {tr('mbps')}\n"
-            f"<b>{tr('uptime')}:</b> {uptime}\n"
-            f"<b>{tr('keyboard')}:</b> {keyboard_clicks_val} {tr('presses')}\n"
-            f"<b>{tr('mouse')}:</b> {mouse_clicks_val} {tr('clicks')}"
+    def _on_menu_visibility_changed(self, _menu, shown: bool) -> None:
+        self._menu_open = shown
+        if shown:
+            self.sampler_engine.poke()
+
+    def _watched_metrics(self) -> set:
+        """Sampler keys whose values are on screen right now: open graphs and the open menu."""
+        keys = set()
+        for graph in self.graphs.values():
+            if graph.area:
+                keys.update(graph.watched)
+        if self._menu_open:
+            keys.update(('cpu_usage', 'cpu_temp', 'ram', 'swap', 'disk', 'net', 'uptime'))
+            keys.update(self.metrics_sampler.families)
+        return keys
+
+    def _next_sample_delay(self) -> float:
+        """Seconds the sampler thread may sleep: until the next due metric or notification.
+
+        While the menu or a graph is open the click counters and graphs still
+        advance every ``TIME_UPDATE_SEC``.
+        """
+        delay = self.metrics_sampler.next_due() - time.monotonic()
+        if self._menu_open or self._open_graph_areas():
+            delay = min(delay, TIME_UPDATE_SEC)
+        now = time.time()
+        for name, channel in self.notification_channels.items():
+            if channel.enabled:
+                delay = min(delay, self.last_notification_time[name] + channel.notification_interval - now)
+        return self._clamp(delay, 0.0, MetricsSampler.ADAPTIVE_MAX_INTERVAL_SEC)
+
+    def _collect_snapshot(self) -> MetricsSnapshot:
+        """Sampler thread: read every due metric and pre-format the menu texts."""
+        self._sync_metric_families()
+        kbd, ms = self._safe_call(get_counts, (0, 0))
+
+        metric_intervals = {
+            'cpu_temp': max(2, int(self.visibility_settings.get('cpu_interval_sec', POLL_INTERVAL_DEFAULT_SEC))),
+            'cpu_usage': int(self.visibility_settings.get('cpu_interval_sec', POLL_INTERVAL_DEFAULT_SEC)),
+            'ram': int(self.visibility_settings.get('ram_interval_sec', POLL_INTERVAL_DEFAULT_SEC)),
+            'disk': int(self.visibility_settings.get('disk_interval_sec', POLL_INTERVAL_DEFAULT_SEC)),
+            'swap': int(self.visibility_settings.get('swap_interval_sec', POLL_INTERVAL_DEFAULT_SEC)),
+            'net': int(self.visibility_settings.get('net_interval_sec', POLL_INTERVAL_DEFAULT_SEC)),
+            'uptime': POLL_INTERVAL_DEFAULT_SEC,
+        }
+        for family_key, interval_key in FAMILY_INTERVAL_KEYS.items():
+            metric_intervals[family_key] = int(self.visibility_settings.get(interval_key, POLL_INTERVAL_DEFAULT_SEC))
+        self.metrics_sampler.adaptive = bool(self.visibility_settings.get('adaptive_sampling', True))
+        self.metrics_sampler.set_watched(self._watched_metrics())
+        sample = self._safe_call(
+            lambda: self.metrics_sampler.collect(self.prev_net_data, metric_intervals),
+            {
+                'cpu_temp': 0,
+                'cpu_usage': 0.0,
+                'ram': (0.0, 0.0),
+                'disk': (0.0, 0.0),
+                'swap': (0.0, 0.0),
+                'net': (0.0, 0.0),
+                'uptime': "00:00:00",
+            },
         )
-        self._enqueue_latest_notification(self._telegram_queue, msg)
-
-    def send_discord_notification(self, cpu_temp, cpu_usage, ram_used, ram_total,
-                                  disk_used, disk_total, swap_used, swap_total,
-                                  net_recv_speed, net_sent_speed, uptime,
-                                  keyboard_clicks_val, mouse_clicks_val):
-        msg = (
-            f"**{tr('system_status')}**\n"
-            f"**{tr('cpu')}**: {cpu_usage:.0f}% ({cpu_temp}{tr('temperature')})\n"
-            f"**{tr('ram')}**: {ram_used:.1f}/{ram_total:.1f} {tr('gb')}\n"
-            f"**{tr('swap')}**: {swap_used:.1f}/{swap_total:.1f} {tr('gb')}\n"
-            f"**{tr('disk')}**: {disk_used:.1f}/{disk_total:.1f} {tr('gb')}\n"
-            f"**{tr('network')}**: ↓{net_recv_speed:.1f}/↑{net_sent_speed:.1f} {tr('mbps')}\n"
-            f"**{tr('uptime')}**: {uptime}\n"
-            f"**{tr('keyboard')}**: {keyboard_clicks_val} {tr('presses')}\n"
-            f"**{tr('mouse')}**: {mouse_clicks_val} {tr('clicks')}"
+        ram_used, ram_total = sample.get('ram', (0.0, 0.0))
+        disk_used, disk_total = sample.get('disk', (0.0, 0.0))
+        swap_used, swap_total = sample.get('swap', (0.0, 0.0))
+        net_recv_speed, net_sent_speed = sample.get('net', (0.0, 0.0))
+        snapshot = MetricsSnapshot(
+            timestamp=time.time(),
+            cpu_temp=int(sample.get('cpu_temp', 0)),
+            cpu_usage=float(sample.get('cpu_usage', 0.0)),
+            ram_used=ram_used,
+            ram_total=ram_total,
+            disk_used=disk_used,
+            disk_total=disk_total,
+            swap_used=swap_used,
+            swap_total=swap_total,
+            net_recv=net_recv_speed,
+            net_sent=net_sent_speed,
+            uptime=self._format_uptime_localized(str(sample.get('uptime', "00:00:00"))),
+            keyboard_clicks=kbd,
+            mouse_clicks=ms,
+            families={key: sample[key] for key in self.metrics_sampler.families if key in sample},
+            texts={},
         )
-        self._enqueue_latest_notification(self._discord_queue, msg)
+        return snapshot._replace(texts=self._menu_texts(snapshot))
 
-    @staticmethod
-    def _normalize_cpu_sample(cpu_usage: object, cpu_temp: object) -> tuple[float, float]:
-        try:
-            usage = float(cpu_usage)
-        except (TypeError, ValueError):
-            usage = 0.0
-        try:
-            temp = float(cpu_temp)
-        except (TypeError, ValueError):
-            temp = 0.0
-        return max(0.0, min(100.0, usage)), max(0.0, min(150.0, temp))
+    def _on_snapshot(self, snapshot: MetricsSnapshot) -> bool:
+        """Sampler thread: record history, notify and log; return True when the UI must refresh."""
+        s = snapshot
+        for descriptor in METRIC_GRAPHS:
+            getattr(self, descriptor.history).append(s.timestamp, *descriptor.sample(s))
+        self._persist_history_sample()
+        self._append_family_samples(s)
 
-    def _append_cpu_sample(self, cpu_usage: object, cpu_temp: object) -> None:
-        usage, temp = self._normalize_cpu_sample(cpu_usage, cpu_temp)
-        self.cpu_history.append((time.time(), usage, temp))
+        self._notify_channels(s, time.time())
+        if self.visibility_settings.get('alerts_enabled', True):
+            self._dispatch_alerts(self.alert_engine.evaluate(s))
 
-    def show_cpu_graph(self, _w=None):
-        if self.cpu_graph_window and self.cpu_graph_window.get_visible():
-            self.cpu_graph_window.present()
-            return
-
-        window = Gtk.Window(title=f"{tr('cpu_info')} — {tr('system_status')}")
-        window.set_default_size(720, 380)
-        window.set_border_width(10)
-
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        area = Gtk.DrawingArea()
-        area.set_size_request(680, 320)
-        area.connect("draw", self._draw_cpu_graph)
-        self._connect_graph_zoom(area, 'cpu')
-        self._maybe_add_graph_zoom_controls(box, 'cpu', area)
-        box.pack_start(area, True, True, 0)
-
-        window.add(box)
-        window.connect("destroy", self._on_cpu_graph_destroy)
+        if self.visibility_settings.get('binary_log_enabled', False):
+            self.binary_log_writer.write_bytes(encode_snapshot(s))
 
-        self.cpu_graph_window = window
-        self.cpu_graph_area = area
-        self._refresh_cpu_graph_texts()
-
-        window.show_all()
-
-    def _on_cpu_graph_destroy(self, _w):
-        self.cpu_graph_window = None
-        self.cpu_graph_area = None
-        self.cpu_graph_hint_label = None
+        if self.visibility_settings.get('logging_enabled', True):
+            try:
+                line = (f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] "
+                        f"CPU: {s.cpu_usage:.0f}% {s.cpu_temp}°C | "
+                        f"RAM: {s.ram_used:.1f}/{s.ram_total:.1f} GB | "
+                        f"SWAP: {s.swap_used:.1f}/{s.swap_total:.1f} GB | "
+                        f"Disk: {s.disk_used:.1f}/{s.disk_total:.1f} GB | "
+                        f"Net: ↓{s.net_recv:.1f}/↑{s.net_sent:.1f} {tr('mbps')} | "
+                        f"Uptime: {s.uptime} | "
+                        f"Keys: {s.keyboard_clicks} | "
+                        f"Clicks: {s.mouse_clicks}\n")
+                self.log_writer.write(line)
 
-    def _refresh_cpu_graph_texts(self) -> None:
-        if self.cpu_graph_window:
-            self.cpu_graph_window.set_title(f"{tr('cpu_info')} — {tr('system_status')}")
-        if self.cpu_graph_area:
-            self.cpu_graph_area.queue_draw()
+            except Exception as e:
+                print("Ошибка записи в лог:", e)
+
+        if self.visibility_settings.get('profiling_enabled', False):
+            collect_stats = self.sampler_engine.collect_stats
+            ui_stats = self.sampler_engine.ui_stats
+            if collect_stats.count >= 60:
+                logger.info(
+                    "Profiling update_info: collect avg=%.2fms max=%.2fms, ui avg=%.2fms max=%.2fms samples=%d",
+                    collect_stats.avg_ms,
+                    collect_stats.max_ms,
+                    ui_stats.avg_ms,
+                    ui_stats.max_ms,
+                    collect_stats.count,
+                )
+                collect_stats.reset()
+                ui_stats.reset()
+                labels = self.label_cache
+                logger.info(
+                    "Profiling labels: suppressed=%d (formats %d/%d, set_label %d/%d)",
+                    labels.suppressed,
+                    labels.renders_skipped,
+                    labels.renders + labels.renders_skipped,
+                    labels.updates_skipped,
+                    labels.updates + labels.updates_skipped,
+                )
+                labels.reset_stats()
+                http_stats = get_transport().stats
+                if http_stats.requests:
+                    logger.info(
+                        "Profiling notifier HTTP: requests=%d handshakes=%d errors=%d avg=%.1fms max=%.1fms",
+                        http_stats.requests,
+                        http_stats.handshakes,
+                        http_stats.errors,
+                        http_stats.latency.avg_ms,
+                        http_stats.latency.max_ms,
+                    )
+                    http_stats.reset()
 
+        if self._open_graph_areas():
+            return True
+        if snapshot.texts == self._published_texts:
+            return False
+        self._published_texts = snapshot.texts
+        return True
 
-    @staticmethod
-    def _draw_no_data(widget, cr, message: str) -> None:
-        width = widget.get_allocated_width()
-        height = widget.get_allocated_height()
-
-        cr.set_source_rgb(0.09, 0.09, 0.09)
-        cr.paint()
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(14)
-        cr.set_source_rgb(0.78, 0.78, 0.78)
-        ext = cr.text_extents(message)
-        x = max(8, (width - _text_width(ext)) / 2)
-        y = max(20, height / 2)
-        cr.move_to(x, y)
-        cr.show_text(message)
+    def _open_graph_areas(self) -> list:
+        return [graph.area for graph in self.graphs.values() if graph.area]
+
+    def _configure_alerts(self) -> None:
+        rules = self.visibility_settings.get('alert_rules', DEFAULT_ALERT_RULES)
+        if not isinstance(rules, list):
+            rules = list(DEFAULT_ALERT_RULES)
+        for rule, error in self.alert_engine.set_rules(rules):
+            print(f"Неверное правило оповещения «{rule}»: {error}")
+
+    def _dispatch_alerts(self, events) -> None:
+        for event in events:
+            logger.warning("Оповещение %s: %s", "сработало" if event.firing else "снято", event.describe())
+            for name, channel in self.notification_channels.items():
+                if channel.enabled:
+                    self.notification_dispatcher.submit(name, channel.format_alert(event))
+
+    def _notify_channels(self, s: MetricsSnapshot, now: float) -> None:
+        """Fan one snapshot out to every enabled channel whose interval has passed."""
+        for name, channel in self.notification_channels.items():
+            if channel.enabled and now - self.last_notification_time[name] >= channel.notification_interval:
+                self.notification_dispatcher.submit(name, channel.format_status(s))
+                self.last_notification_time[name] = now
 
     @staticmethod
     def _clamp(value: float, min_value: float, max_value: float) -> float:
         return max(min_value, min(max_value, value))
 
-    def _visible_samples(self, graph_key: str, samples: list[tuple]) -> list[tuple]:
-        if len(samples) <= 2:
-            return samples
-        state = self.graph_zoom_state.get(graph_key)
-        if not state:
-            return samples
+    def _visible_range(self, graph_key: str, history: MetricHistory) -> Optional[Tuple[float, float]]:
+        """Return the ``(start, end)`` timestamps the zoom state of ``graph_key`` shows, or None when empty."""
+        span = history.span()
+        if span is None:
+            return None
+        first_ts, last_ts = span
+        total = last_ts - first_ts
+        state = self.graph_zoom_state.get(graph_key) or {}
 
         scale = self._clamp(float(state.get('scale', 1.0)), 1.0, 40.0)
-        if scale <= 1.0:
-            return samples
-
-        total = len(samples)
-        window_len = max(2, int(round(total / scale)))
+        window = total / scale
         center = self._clamp(float(state.get('center', 1.0)), 0.0, 1.0)
-        center_idx = int(round(center * (total - 1)))
+        start = first_ts + center * total - window / 2
+        start = min(max(first_ts, start), last_ts - window)
+        return start, start + window
 
-        start = center_idx - (window_len // 2)
-        max_start = max(0, total - window_len)
-        start = min(max(0, start), max_start)
-        end = start + window_len
-        return samples[start:end]
+    def _visible_samples(self, graph_key: str, history: MetricHistory, points: int) -> HistoryView:
+        """Return the zoomed time range from the coarsest history tier that still fills ``points`` pixels."""
+        visible = self._visible_range(graph_key, history)
+        if visible is None:
+            return history.view()
+        return history.select(visible[0], visible[1], points)
 
     @staticmethod
-    def _decimate_samples(samples: list[tuple], max_points: int) -> list[tuple]:
-        """Downsample samples to cap drawing cost on large histories."""
+    def _decimate_samples(samples: Sequence[tuple], max_points: int) -> Sequence[tuple]:
+        """Downsample samples to cap drawing cost while keeping per-pixel peaks.
+
+        History views are always copied out, so the result stays valid after the
+        history lock is released.
+        """
+        if isinstance(samples, HistoryView):
+            if max_points <= 0 or len(samples) <= max_points:
+                return list(samples)
+            return decimate_view(samples, max_points, MODE_MINMAX)
         if max_points <= 0 or len(samples) <= max_points:
             return samples
-        if max_points == 1:
-            return [samples[-1]]
-        step = (len(samples) - 1) / float(max_points - 1)
-        result: list[tuple] = []
-        for idx in range(max_points):
-            src_index = int(round(idx * step))
-            if src_index >= len(samples):
-                src_index = len(samples) - 1
-            result.append(samples[src_index])
-        return result
+        return [samples[idx] for idx in lttb_indices(range(len(samples)), [s[1] for s in samples], max_points)]
 
     def _connect_graph_zoom(self, area: Gtk.DrawingArea, graph_key: str) -> None:
         area.set_events(
@@ -1022,17 +1151,30 @@ class SystemTrayApp:
         area.connect('motion-notify-event', self._on_graph_motion_notify_event, graph_key)
         area.connect('button-release-event', self._on_graph_button_release_event, graph_key)
         area.connect('leave-notify-event', self._on_graph_leave_notify_event, graph_key)
-
-    def _graph_area_by_key(self, graph_key: str) -> Optional[Gtk.DrawingArea]:
-        return {
-            'cpu': self.cpu_graph_area,
-            'ram': self.ram_graph_area,
-            'swap': self.swap_graph_area,
-            'disk': self.disk_graph_area,
-            'net': self.net_graph_area,
-            'keyboard': self.keyboard_graph_area,
-            'mouse': self.mouse_graph_area,
-        }.get(graph_key)
+        area.connect('map', self._on_graph_mapped)
+
+    def _on_graph_mapped(self, _area) -> None:
+        # A graph just became visible: sample now instead of at the next backed-off deadline.
+        self.sampler_engine.poke()
+
+    def _queue_graph_draw(self, graph_key: str, area: Optional[Gtk.DrawingArea] = None) -> None:
+        """Redraw a graph through its frame-clock throttle; a bare ``area`` is redrawn directly."""
+        graph = self.graphs.get(graph_key)
+        if graph is not None and graph.area is not None:
+            graph.queue_draw()
+        elif area is not None:
+            area.queue_draw()
+
+    def show_graph(self, _w, graph_key: str) -> None:
+        self.graphs[graph_key].show()
+
+    def _queue_graph_hover_draw(self, graph_key: str, area: Gtk.DrawingArea) -> None:
+        """Redraw only the crosshair and tooltip; the lines and axes did not move."""
+        graph = self.graphs.get(graph_key)
+        if graph is not None and graph.area is area:
+            graph.queue_hover_draw()
+        else:
+            area.queue_draw()
 
     def _apply_graph_zoom_step(
             self,
@@ -1064,9 +1206,7 @@ class SystemTrayApp:
         state['scale'] = new_scale
         state['center'] = self._clamp(new_center, 0.0, 1.0)
 
-        target_area = area or self._graph_area_by_key(graph_key)
-        if target_area is not None:
-            target_area.queue_draw()
+        self._queue_graph_draw(graph_key, area)
 
     def _reset_graph_zoom(self, graph_key: str, area: Optional[Gtk.DrawingArea] = None) -> None:
         state = self.graph_zoom_state.get(graph_key)
@@ -1075,9 +1215,7 @@ class SystemTrayApp:
         state['scale'] = 1.0
         state['center'] = 1.0
         state['dragging'] = 0.0
-        target_area = area or self._graph_area_by_key(graph_key)
-        if target_area is not None:
-            target_area.queue_draw()
+        self._queue_graph_draw(graph_key, area)
 
     def _build_graph_zoom_controls(self, graph_key: str, area: Gtk.DrawingArea) -> Gtk.Box:
         controls = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -1151,7 +1289,7 @@ class SystemTrayApp:
         state['hover_y'] = float(getattr(event, 'y', 0.0))
 
         if state.get('dragging', 0.0) < 0.5:
-            widget.queue_draw()
+            self._queue_graph_hover_draw(graph_key, widget)
             return False
 
         width = max(1, widget.get_allocated_width())
@@ -1169,7 +1307,7 @@ class SystemTrayApp:
         old_center = self._clamp(float(state.get('center', 1.0)), 0.0, 1.0)
         new_center = old_center - (delta_x / width) * span
         state['center'] = self._clamp(new_center, span / 2, 1.0 - span / 2)
-        widget.queue_draw()
+        self._queue_graph_draw(graph_key, widget)
         return True
 
     def _on_graph_button_release_event(self, _widget, event, graph_key: str):
@@ -1186,1091 +1324,36 @@ class SystemTrayApp:
         if state is None:
             return False
         state['hovering'] = 0.0
-        widget.queue_draw()
+        self._queue_graph_hover_draw(graph_key, widget)
         return False
 
-    def _draw_graph_hover_info(self,
-                              widget,
-                              cr,
-                              graph_key: str,
-                              samples: list[tuple],
-                              margin_left: float,
-                              margin_top: float,
-                              plot_w: float,
-                              plot_h: float,
-                              formatter: Callable[[tuple], list[str]]) -> None:
-        state = self.graph_zoom_state.get(graph_key)
-        if not state or state.get('hovering', 0.0) < 0.5 or not samples:
-            return
-
-        width = widget.get_allocated_width()
-        height = widget.get_allocated_height()
-        hover_x = self._clamp(float(state.get('hover_x', 0.0)), 0.0, float(width))
-        hover_y = self._clamp(float(state.get('hover_y', 0.0)), 0.0, float(height))
-
-        left = margin_left
-        right = margin_left + plot_w
-        top = margin_top
-        bottom = margin_top + plot_h
-        if hover_x < left or hover_x > right or hover_y < top or hover_y > bottom:
-            return
-
-        if len(samples) <= 1:
-            idx = 0
-            point_x = left
-        else:
-            ratio = self._clamp((hover_x - left) / max(1.0, plot_w), 0.0, 1.0)
-            idx = int(round(ratio * (len(samples) - 1)))
-            idx = max(0, min(len(samples) - 1, idx))
-            point_x = left + plot_w * idx / (len(samples) - 1)
-
-        sample = samples[idx]
-        lines = formatter(sample)
-        if not lines:
-            return
-
-        cr.set_source_rgba(1.0, 1.0, 1.0, 0.22)
-        cr.set_line_width(1)
-        cr.move_to(point_x, top)
-        cr.line_to(point_x, bottom)
-        cr.stroke()
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(11)
-        padding = 6
-        line_height = 14
-        max_w = 0.0
-        for line in lines:
-            max_w = max(max_w, _text_width(cr.text_extents(line)))
-
-        box_w = max_w + padding * 2
-        box_h = line_height * len(lines) + padding * 2
-        box_x = self._clamp(hover_x + 12, 4.0, max(4.0, width - box_w - 4))
-        box_y = self._clamp(hover_y + 12, 4.0, max(4.0, height - box_h - 4))
-
-        cr.set_source_rgba(0.05, 0.05, 0.05, 0.88)
-        cr.rectangle(box_x, box_y, box_w, box_h)
-        cr.fill()
-
-        cr.set_source_rgb(0.96, 0.96, 0.96)
-        for i, line in enumerate(lines):
-            cr.move_to(box_x + padding, box_y + padding + line_height * (i + 1) - 3)
-            cr.show_text(line)
-
-    def _draw_cpu_graph(self, widget, cr):
-        width = widget.get_allocated_width()
-        height = widget.get_allocated_height()
-
-        margin_left = 48
-        margin_right = 16
-        margin_top = 16
-        margin_bottom = 36
-
-        plot_w = max(10, width - margin_left - margin_right)
-        plot_h = max(10, height - margin_top - margin_bottom)
-
-        cr.set_source_rgb(0.09, 0.09, 0.09)
-        cr.paint()
-
-        cr.set_source_rgb(0.2, 0.2, 0.2)
-        for i in range(5):
-            y = margin_top + (plot_h * i / 4)
-            cr.move_to(margin_left, y)
-            cr.line_to(margin_left + plot_w, y)
-        cr.stroke()
-
-        # Left-side numeric Y axis labels for CPU load (%)
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(10)
-        cr.set_source_rgb(0.72, 0.82, 0.9)
-        for i in range(5):
-            cpu_mark = 100 - (25 * i)
-            y = margin_top + (plot_h * i / 4)
-            label = f"{cpu_mark}%"
-            text_extents = cr.text_extents(label)
-            cr.move_to(max(2, margin_left - _text_width(text_extents) - 6), y + 4)
-            cr.show_text(label)
-
-        samples = self._decimate_samples(self._visible_samples('cpu', list(self.cpu_history)), max(200, width * 2))
-        if not samples:
-            self._draw_no_data(widget, cr, 'No data yet…')
-            return
-        if len(samples) == 1:
-            samples = [samples[0], samples[0]]
-
-        line_color = self._graph_line_color_rgb('graph_line_color_cpu')
-        temp_line_color = self._graph_line_color_rgb('graph_line_color_temp')
-        max_temp = max(100.0, max(temp for _, _, temp in samples) + 5.0)
-
-        def draw_line(selector, color, max_value):
-            cr.set_source_rgb(*color)
-            cr.set_line_width(2)
-            for idx, sample in enumerate(samples):
-                x = margin_left + plot_w * idx / (len(samples) - 1)
-                value = selector(sample)
-                y = margin_top + plot_h * (1.0 - (value / max_value))
-                if idx == 0:
-                    cr.move_to(x, y)
-                else:
-                    cr.line_to(x, y)
-            cr.stroke()
-
-        draw_line(lambda s: s[1], line_color, 100.0)
-        draw_line(lambda s: s[2], temp_line_color, max_temp)
-
-        # Legend/signatures for displayed data
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(12)
-
-        cr.set_source_rgb(*line_color)
-        cr.rectangle(margin_left, 4, 12, 8)
-        cr.fill()
-        cr.set_source_rgb(0.88, 0.92, 1.0)
-        cr.move_to(margin_left + 18, 12)
-        cr.show_text(f"{tr('cpu')} (%)")
-
-        cr.set_source_rgb(*temp_line_color)
-        cr.rectangle(margin_left + 150, 4, 12, 8)
-        cr.fill()
-        cr.set_source_rgb(1.0, 0.88, 0.82)
-        cr.move_to(margin_left + 168, 12)
-        cr.show_text(f"{tr('temperature')}")
-
-        last_usage = samples[-1][1]
-        last_temp = samples[-1][2]
-        values_text = f"{tr('cpu')}: {last_usage:.0f}%   {tr('temperature')}: {last_temp:.1f}°C"
-        cr.set_source_rgb(0.95, 0.95, 0.95)
-        cr.set_font_size(12)
-        ext = cr.text_extents(values_text)
-        cr.move_to(width - margin_right - _text_width(ext), 12)
-        cr.show_text(values_text)
-
-        self._draw_graph_hover_info(
-            widget,
-            cr,
-            'cpu',
-            samples,
-            margin_left,
-            margin_top,
-            plot_w,
-            plot_h,
-            lambda sample: [
-                datetime.fromtimestamp(sample[0]).strftime("%H:%M:%S"),
-                f"{tr('cpu')}: {sample[1]:.1f}%",
-                f"{tr('temperature')}: {sample[2]:.1f}°C",
-            ],
-        )
-
-        # Start and end time at the bottom
-        start_ts = datetime.fromtimestamp(samples[0][0]).strftime("%H:%M:%S")
-        end_ts = datetime.fromtimestamp(samples[-1][0]).strftime("%H:%M:%S")
-
-        cr.set_source_rgb(0.75, 0.75, 0.75)
-        cr.set_font_size(11)
-        cr.move_to(margin_left, height - 10)
-        cr.show_text(f"◀ {start_ts}")
-
-        end_text = f"{end_ts} ▶"
-        text_extents = cr.text_extents(end_text)
-        cr.move_to(width - margin_right - _text_width(text_extents), height - 10)
-        cr.show_text(end_text)
-
-    def _append_ram_sample(self, ram_used: object, ram_total: object) -> None:
-        try:
-            used = float(ram_used)
-            total = float(ram_total)
-            percent = (used / total * 100.0) if total > 0 else 0.0
-        except (TypeError, ValueError, ZeroDivisionError):
-            used, total, percent = 0.0, 0.0, 0.0
-        percent = max(0.0, min(100.0, percent))
-        self.ram_history.append((time.time(), used, total, percent))
-
-    def show_ram_graph(self, _w=None):
-        if self.ram_graph_window and self.ram_graph_window.get_visible():
-            self.ram_graph_window.present()
-            return
-
-        window = Gtk.Window(title=f"{tr('ram_loading')} — {tr('system_status')}")
-        window.set_default_size(720, 380)
-        window.set_border_width(10)
-
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        area = Gtk.DrawingArea()
-        area.set_size_request(680, 320)
-        area.connect("draw", self._draw_ram_graph)
-        self._connect_graph_zoom(area, 'ram')
-        self._maybe_add_graph_zoom_controls(box, 'ram', area)
-        box.pack_start(area, True, True, 0)
-
-        window.add(box)
-        window.connect("destroy", self._on_ram_graph_destroy)
-
-        self.ram_graph_window = window
-        self.ram_graph_area = area
-        self._refresh_ram_graph_texts()
-
-        window.show_all()
-
-    def _on_ram_graph_destroy(self, _w):
-        self.ram_graph_window = None
-        self.ram_graph_area = None
-        self.ram_graph_hint_label = None
-
-    def _refresh_ram_graph_texts(self) -> None:
-        if self.ram_graph_window:
-            self.ram_graph_window.set_title(f"{tr('ram_loading')} — {tr('system_status')}")
-        if self.ram_graph_area:
-            self.ram_graph_area.queue_draw()
-
-    def _draw_ram_graph(self, widget, cr):
-        width = widget.get_allocated_width()
-        height = widget.get_allocated_height()
-
-        margin_left = 48
-        margin_right = 16
-        margin_top = 16
-        margin_bottom = 36
-
-        plot_w = max(10, width - margin_left - margin_right)
-        plot_h = max(10, height - margin_top - margin_bottom)
-
-        cr.set_source_rgb(0.09, 0.09, 0.09)
-        cr.paint()
-
-        cr.set_source_rgb(0.2, 0.2, 0.2)
-        for i in range(5):
-            y = margin_top + (plot_h * i / 4)
-            cr.move_to(margin_left, y)
-            cr.line_to(margin_left + plot_w, y)
-        cr.stroke()
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(10)
-        cr.set_source_rgb(0.72, 0.9, 0.72)
-        for i in range(5):
-            mark = 100 - (25 * i)
-            y = margin_top + (plot_h * i / 4)
-            label = f"{mark}%"
-            text_extents = cr.text_extents(label)
-            cr.move_to(max(2, margin_left - _text_width(text_extents) - 6), y + 4)
-            cr.show_text(label)
-
-        samples = self._decimate_samples(self._visible_samples('ram', list(self.ram_history)), max(200, width * 2))
-        if not samples:
-            self._draw_no_data(widget, cr, 'No data yet…')
-            return
-        if len(samples) == 1:
-            samples = [samples[0], samples[0]]
-
-        line_color = self._graph_line_color_rgb('graph_line_color_ram')
-        cr.set_source_rgb(*line_color)
-        cr.set_line_width(2)
-        for idx, sample in enumerate(samples):
-            x = margin_left + plot_w * idx / (len(samples) - 1)
-            value = sample[3]
-            y = margin_top + plot_h * (1.0 - (value / 100.0))
-            if idx == 0:
-                cr.move_to(x, y)
-            else:
-                cr.line_to(x, y)
-        cr.stroke()
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(12)
-        cr.set_source_rgb(*line_color)
-        cr.rectangle(margin_left, 4, 12, 8)
-        cr.fill()
-        cr.set_source_rgb(0.9, 1.0, 0.9)
-        cr.move_to(margin_left + 18, 12)
-        cr.show_text(f"{tr('ram_loading')} (%)")
-
-        last_used = samples[-1][1]
-        last_total = samples[-1][2]
-        last_percent = samples[-1][3]
-        values_text = f"{tr('ram_loading')}: {last_used:.1f}/{last_total:.1f} GB ({last_percent:.0f}%)"
-        cr.set_source_rgb(0.95, 0.95, 0.95)
-        cr.set_font_size(12)
-        ext = cr.text_extents(values_text)
-        cr.move_to(width - margin_right - _text_width(ext), 12)
-        cr.show_text(values_text)
-
-        self._draw_graph_hover_info(
-            widget,
-            cr,
-            'ram',
-            samples,
-            margin_left,
-            margin_top,
-            plot_w,
-            plot_h,
-            lambda sample: [
-                datetime.fromtimestamp(sample[0]).strftime("%H:%M:%S"),
-                f"{tr('ram_loading')}: {sample[3]:.1f}%",
-                f"{sample[1]:.1f}/{sample[2]:.1f} GB",
-            ],
-        )
-
-        start_ts = datetime.fromtimestamp(samples[0][0]).strftime("%H:%M:%S")
-        end_ts = datetime.fromtimestamp(samples[-1][0]).strftime("%H:%M:%S")
-
-        cr.set_source_rgb(0.75, 0.75, 0.75)
-        cr.set_font_size(11)
-        cr.move_to(margin_left, height - 10)
-        cr.show_text(f"◀ {start_ts}")
-
-        end_text = f"{end_ts} ▶"
-        text_extents = cr.text_extents(end_text)
-        cr.move_to(width - margin_right - _text_width(text_extents), height - 10)
-        cr.show_text(end_text)
-
-    def _append_swap_sample(self, swap_used: object, swap_total: object) -> None:
-        try:
-            used = float(swap_used)
-            total = float(swap_total)
-            percent = (used / total * 100.0) if total > 0 else 0.0
-        except (TypeError, ValueError, ZeroDivisionError):
-            used, total, percent = 0.0, 0.0, 0.0
-        percent = max(0.0, min(100.0, percent))
-        self.swap_history.append((time.time(), used, total, percent))
-
-    def show_swap_graph(self, _w=None):
-        if self.swap_graph_window and self.swap_graph_window.get_visible():
-            self.swap_graph_window.present()
-            return
-
-        window = Gtk.Window(title=f"{tr('swap_loading')} — {tr('system_status')}")
-        window.set_default_size(720, 380)
-        window.set_border_width(10)
-
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        area = Gtk.DrawingArea()
-        area.set_size_request(680, 320)
-        area.connect("draw", self._draw_swap_graph)
-        self._connect_graph_zoom(area, 'swap')
-        self._maybe_add_graph_zoom_controls(box, 'swap', area)
-        box.pack_start(area, True, True, 0)
-
-        window.add(box)
-        window.connect("destroy", self._on_swap_graph_destroy)
-
-        self.swap_graph_window = window
-        self.swap_graph_area = area
-        self._refresh_swap_graph_texts()
-
-        window.show_all()
-
-    def _on_swap_graph_destroy(self, _w):
-        self.swap_graph_window = None
-        self.swap_graph_area = None
-        self.swap_graph_hint_label = None
-
-    def _refresh_swap_graph_texts(self) -> None:
-        if self.swap_graph_window:
-            self.swap_graph_window.set_title(f"{tr('swap_loading')} — {tr('system_status')}")
-        if self.swap_graph_area:
-            self.swap_graph_area.queue_draw()
-
-    def _draw_swap_graph(self, widget, cr):
-        width = widget.get_allocated_width()
-        height = widget.get_allocated_height()
-
-        margin_left = 48
-        margin_right = 16
-        margin_top = 16
-        margin_bottom = 36
-
-        plot_w = max(10, width - margin_left - margin_right)
-        plot_h = max(10, height - margin_top - margin_bottom)
-
-        cr.set_source_rgb(0.09, 0.09, 0.09)
-        cr.paint()
-
-        cr.set_source_rgb(0.2, 0.2, 0.2)
-        for i in range(5):
-            y = margin_top + (plot_h * i / 4)
-            cr.move_to(margin_left, y)
-            cr.line_to(margin_left + plot_w, y)
-        cr.stroke()
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(10)
-        cr.set_source_rgb(0.9, 0.72, 0.95)
-        for i in range(5):
-            mark = 100 - (25 * i)
-            y = margin_top + (plot_h * i / 4)
-            label = f"{mark}%"
-            text_extents = cr.text_extents(label)
-            cr.move_to(max(2, margin_left - _text_width(text_extents) - 6), y + 4)
-            cr.show_text(label)
-
-        samples = self._decimate_samples(self._visible_samples('swap', list(self.swap_history)), max(200, width * 2))
-        if not samples:
-            self._draw_no_data(widget, cr, 'No data yet…')
-            return
-        if len(samples) == 1:
-            samples = [samples[0], samples[0]]
-
-        line_color = self._graph_line_color_rgb('graph_line_color_swap')
-        cr.set_source_rgb(*line_color)
-        cr.set_line_width(2)
-        for idx, sample in enumerate(samples):
-            x = margin_left + plot_w * idx / (len(samples) - 1)
-            value = sample[3]
-            y = margin_top + plot_h * (1.0 - (value / 100.0))
-            if idx == 0:
-                cr.move_to(x, y)
-            else:
-                cr.line_to(x, y)
-        cr.stroke()
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(12)
-        cr.set_source_rgb(*line_color)
-        cr.rectangle(margin_left, 4, 12, 8)
-        cr.fill()
-        cr.set_source_rgb(0.98, 0.88, 1.0)
-        cr.move_to(margin_left + 18, 12)
-        cr.show_text(f"{tr('swap_loading')} (%)")
-
-        last_used = samples[-1][1]
-        last_total = samples[-1][2]
-        last_percent = samples[-1][3]
-        values_text = f"{tr('swap_loading')}: {last_used:.1f}/{last_total:.1f} GB ({last_percent:.0f}%)"
-        cr.set_source_rgb(0.95, 0.95, 0.95)
-        cr.set_font_size(12)
-        ext = cr.text_extents(values_text)
-        cr.move_to(width - margin_right - _text_width(ext), 12)
-        cr.show_text(values_text)
-
-        self._draw_graph_hover_info(
-            widget,
-            cr,
-            'swap',
-            samples,
-            margin_left,
-            margin_top,
-            plot_w,
-            plot_h,
-            lambda sample: [
-                datetime.fromtimestamp(sample[0]).strftime("%H:%M:%S"),
-                f"{tr('swap_loading')}: {sample[3]:.1f}%",
-                f"{sample[1]:.1f}/{sample[2]:.1f} GB",
-            ],
-        )
-
-        start_ts = datetime.fromtimestamp(samples[0][0]).strftime("%H:%M:%S")
-        end_ts = datetime.fromtimestamp(samples[-1][0]).strftime("%H:%M:%S")
-
-        cr.set_source_rgb(0.75, 0.75, 0.75)
-        cr.set_font_size(11)
-        cr.move_to(margin_left, height - 10)
-        cr.show_text(f"◀ {start_ts}")
-
-        end_text = f"{end_ts} ▶"
-        text_extents = cr.text_extents(end_text)
-        cr.move_to(width - margin_right - _text_width(text_extents), height - 10)
-        cr.show_text(end_text)
-
-    def _append_disk_sample(self, disk_used: object, disk_total: object) -> None:
-        try:
-            used = float(disk_used)
-            total = float(disk_total)
-            percent = (used / total * 100.0) if total > 0 else 0.0
-        except (TypeError, ValueError, ZeroDivisionError):
-            used, total, percent = 0.0, 0.0, 0.0
-        percent = max(0.0, min(100.0, percent))
-        self.disk_history.append((time.time(), used, total, percent))
-
-    def show_disk_graph(self, _w=None):
-        if self.disk_graph_window and self.disk_graph_window.get_visible():
-            self.disk_graph_window.present()
-            return
-
-        window = Gtk.Window(title=f"{tr('disk_loading')} — {tr('system_status')}")
-        window.set_default_size(720, 380)
-        window.set_border_width(10)
-
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        area = Gtk.DrawingArea()
-        area.set_size_request(680, 320)
-        area.connect("draw", self._draw_disk_graph)
-        self._connect_graph_zoom(area, 'disk')
-        self._maybe_add_graph_zoom_controls(box, 'disk', area)
-        box.pack_start(area, True, True, 0)
-
-        window.add(box)
-        window.connect("destroy", self._on_disk_graph_destroy)
-
-        self.disk_graph_window = window
-        self.disk_graph_area = area
-        self._refresh_disk_graph_texts()
-
-        window.show_all()
-
-    def _on_disk_graph_destroy(self, _w):
-        self.disk_graph_window = None
-        self.disk_graph_area = None
-        self.disk_graph_hint_label = None
-
-    def _refresh_disk_graph_texts(self) -> None:
-        if self.disk_graph_window:
-            self.disk_graph_window.set_title(f"{tr('disk_loading')} — {tr('system_status')}")
-        if self.disk_graph_area:
-            self.disk_graph_area.queue_draw()
-
-    def _draw_disk_graph(self, widget, cr):
-        width = widget.get_allocated_width()
-        height = widget.get_allocated_height()
-
-        margin_left = 48
-        margin_right = 16
-        margin_top = 16
-        margin_bottom = 36
-
-        plot_w = max(10, width - margin_left - margin_right)
-        plot_h = max(10, height - margin_top - margin_bottom)
-
-        cr.set_source_rgb(0.09, 0.09, 0.09)
-        cr.paint()
-
-        cr.set_source_rgb(0.2, 0.2, 0.2)
-        for i in range(5):
-            y = margin_top + (plot_h * i / 4)
-            cr.move_to(margin_left, y)
-            cr.line_to(margin_left + plot_w, y)
-        cr.stroke()
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(10)
-        cr.set_source_rgb(0.7, 0.85, 1.0)
-        for i in range(5):
-            mark = 100 - (25 * i)
-            y = margin_top + (plot_h * i / 4)
-            label = f"{mark}%"
-            text_extents = cr.text_extents(label)
-            cr.move_to(max(2, margin_left - _text_width(text_extents) - 6), y + 4)
-            cr.show_text(label)
-
-        samples = self._decimate_samples(self._visible_samples('disk', list(self.disk_history)), max(200, width * 2))
-        if not samples:
-            self._draw_no_data(widget, cr, 'No data yet…')
-            return
-        if len(samples) == 1:
-            samples = [samples[0], samples[0]]
-
-        line_color = self._graph_line_color_rgb('graph_line_color_disk')
-        cr.set_source_rgb(*line_color)
-        cr.set_line_width(2)
-        for idx, sample in enumerate(samples):
-            x = margin_left + plot_w * idx / (len(samples) - 1)
-            value = sample[3]
-            y = margin_top + plot_h * (1.0 - (value / 100.0))
-            if idx == 0:
-                cr.move_to(x, y)
-            else:
-                cr.line_to(x, y)
-        cr.stroke()
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(12)
-        cr.set_source_rgb(*line_color)
-        cr.rectangle(margin_left, 4, 12, 8)
-        cr.fill()
-        cr.set_source_rgb(0.88, 0.95, 1.0)
-        cr.move_to(margin_left + 18, 12)
-        cr.show_text(f"{tr('disk_loading')} (%)")
-
-        last_used = samples[-1][1]
-        last_total = samples[-1][2]
-        last_percent = samples[-1][3]
-        values_text = f"{tr('disk_loading')}: {last_used:.1f}/{last_total:.1f} GB ({last_percent:.0f}%)"
-        cr.set_source_rgb(0.95, 0.95, 0.95)
-        cr.set_font_size(12)
-        ext = cr.text_extents(values_text)
-        cr.move_to(width - margin_right - _text_width(ext), 12)
-        cr.show_text(values_text)
-
-        self._draw_graph_hover_info(
-            widget,
-            cr,
-            'disk',
-            samples,
-            margin_left,
-            margin_top,
-            plot_w,
-            plot_h,
-            lambda sample: [
-                datetime.fromtimestamp(sample[0]).strftime("%H:%M:%S"),
-                f"{tr('disk_loading')}: {sample[3]:.1f}%",
-                f"{sample[1]:.1f}/{sample[2]:.1f} GB",
-            ],
-        )
-
-        start_ts = datetime.fromtimestamp(samples[0][0]).strftime("%H:%M:%S")
-        end_ts = datetime.fromtimestamp(samples[-1][0]).strftime("%H:%M:%S")
-
-        cr.set_source_rgb(0.75, 0.75, 0.75)
-        cr.set_font_size(11)
-        cr.move_to(margin_left, height - 10)
-        cr.show_text(f"◀ {start_ts}")
-
-        end_text = f"{end_ts} ▶"
-        text_extents = cr.text_extents(end_text)
-        cr.move_to(width - margin_right - _text_width(text_extents), height - 10)
-        cr.show_text(end_text)
-
-    def _append_net_sample(self, recv_speed: object, sent_speed: object) -> None:
-        try:
-            recv = max(0.0, float(recv_speed))
-        except (TypeError, ValueError):
-            recv = 0.0
-        try:
-            sent = max(0.0, float(sent_speed))
-        except (TypeError, ValueError):
-            sent = 0.0
-        self.net_history.append((time.time(), recv, sent))
-
-    def show_net_graph(self, _w=None):
-        if self.net_graph_window and self.net_graph_window.get_visible():
-            self.net_graph_window.present()
-            return
-
-        window = Gtk.Window(title=f"{tr('lan_speed')} — {tr('system_status')}")
-        window.set_default_size(720, 380)
-        window.set_border_width(10)
-
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        area = Gtk.DrawingArea()
-        area.set_size_request(680, 320)
-        area.connect("draw", self._draw_net_graph)
-        self._connect_graph_zoom(area, 'net')
-        self._maybe_add_graph_zoom_controls(box, 'net', area)
-        box.pack_start(area, True, True, 0)
-
-        window.add(box)
-        window.connect("destroy", self._on_net_graph_destroy)
-
-        self.net_graph_window = window
-        self.net_graph_area = area
-        self._refresh_net_graph_texts()
-
-        window.show_all()
-
-    def _on_net_graph_destroy(self, _w):
-        self.net_graph_window = None
-        self.net_graph_area = None
-        self.net_graph_hint_label = None
-
-    def _refresh_net_graph_texts(self) -> None:
-        if self.net_graph_window:
-            self.net_graph_window.set_title(f"{tr('lan_speed')} — {tr('system_status')}")
-        if self.net_graph_area:
-            self.net_graph_area.queue_draw()
-
-    def _draw_net_graph(self, widget, cr):
-        width = widget.get_allocated_width()
-        height = widget.get_allocated_height()
-
-        margin_left = 58
-        margin_right = 16
-        margin_top = 16
-        margin_bottom = 36
-
-        plot_w = max(10, width - margin_left - margin_right)
-        plot_h = max(10, height - margin_top - margin_bottom)
-
-        cr.set_source_rgb(0.09, 0.09, 0.09)
-        cr.paint()
-
-        cr.set_source_rgb(0.2, 0.2, 0.2)
-        for i in range(5):
-            y = margin_top + (plot_h * i / 4)
-            cr.move_to(margin_left, y)
-            cr.line_to(margin_left + plot_w, y)
-        cr.stroke()
-
-        samples = self._decimate_samples(self._visible_samples('net', list(self.net_history)), max(200, width * 2))
-        if not samples:
-            self._draw_no_data(widget, cr, 'No data yet…')
-            return
-        if len(samples) == 1:
-            samples = [samples[0], samples[0]]
-
-        max_speed = max(1.0, max(max(s[1], s[2]) for s in samples) * 1.15)
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(10)
-        cr.set_source_rgb(0.8, 0.8, 0.8)
-        for i in range(5):
-            y = margin_top + (plot_h * i / 4)
-            mark = max_speed * (1 - i / 4)
-            label = f"{mark:.1f}"
-            ext = cr.text_extents(label)
-            cr.move_to(max(2, margin_left - _text_width(ext) - 8), y + 4)
-            cr.show_text(label)
-
-        def draw_line(selector, color):
-            cr.set_source_rgb(*color)
-            cr.set_line_width(2)
-            for idx, sample in enumerate(samples):
-                x = margin_left + plot_w * idx / (len(samples) - 1)
-                value = selector(sample)
-                y = margin_top + plot_h * (1.0 - (value / max_speed))
-                if idx == 0:
-                    cr.move_to(x, y)
-                else:
-                    cr.line_to(x, y)
-            cr.stroke()
-
-        line_color = self._graph_line_color_rgb('graph_line_color_net_recv')
-        net_sent_color = self._graph_line_color_rgb('graph_line_color_net_sent')
-        draw_line(lambda s: s[1], line_color)
-        draw_line(lambda s: s[2], net_sent_color)
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(12)
-
-        cr.set_source_rgb(*line_color)
-        cr.rectangle(margin_left, 4, 12, 8)
-        cr.fill()
-        cr.set_source_rgb(0.85, 1.0, 0.87)
-        cr.move_to(margin_left + 18, 12)
-        cr.show_text(f"↓ {tr('mbps')}")
-
-        cr.set_source_rgb(*net_sent_color)
-        cr.rectangle(margin_left + 95, 4, 12, 8)
-        cr.fill()
-        cr.set_source_rgb(1.0, 0.94, 0.8)
-        cr.move_to(margin_left + 113, 12)
-        cr.show_text(f"↑ {tr('mbps')}")
-
-        last_recv = samples[-1][1]
-        last_sent = samples[-1][2]
-        values_text = f"{tr('lan_speed')}: ↓{last_recv:.1f} / ↑{last_sent:.1f} {tr('mbps')}"
-        cr.set_source_rgb(0.95, 0.95, 0.95)
-        cr.set_font_size(12)
-        ext = cr.text_extents(values_text)
-        cr.move_to(width - margin_right - _text_width(ext), 12)
-        cr.show_text(values_text)
-
-        self._draw_graph_hover_info(
-            widget,
-            cr,
-            'net',
-            samples,
-            margin_left,
-            margin_top,
-            plot_w,
-            plot_h,
-            lambda sample: [
-                datetime.fromtimestamp(sample[0]).strftime("%H:%M:%S"),
-                f"↓ {sample[1]:.2f} {tr('mbps')}",
-                f"↑ {sample[2]:.2f} {tr('mbps')}",
-            ],
-        )
-
-        start_ts = datetime.fromtimestamp(samples[0][0]).strftime("%H:%M:%S")
-        end_ts = datetime.fromtimestamp(samples[-1][0]).strftime("%H:%M:%S")
-
-        cr.set_source_rgb(0.75, 0.75, 0.75)
-        cr.set_font_size(11)
-        cr.move_to(margin_left, height - 10)
-        cr.show_text(f"◀ {start_ts}")
-
-        end_text = f"{end_ts} ▶"
-        text_extents = cr.text_extents(end_text)
-        cr.move_to(width - margin_right - _text_width(text_extents), height - 10)
-        cr.show_text(end_text)
-
-    def _append_keyboard_sample(self, keyboard_clicks: object) -> None:
-        try:
-            count = max(0, int(keyboard_clicks))
-        except (TypeError, ValueError):
-            count = 0
-        self.keyboard_history.append((time.time(), count))
-
-    def show_keyboard_graph(self, _w=None):
-        if self.keyboard_graph_window and self.keyboard_graph_window.get_visible():
-            self.keyboard_graph_window.present()
-            return
-
-        window = Gtk.Window(title=f"{tr('keyboard_clicks')} — {tr('system_status')}")
-        window.set_default_size(720, 380)
-        window.set_border_width(10)
-
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        area = Gtk.DrawingArea()
-        area.set_size_request(680, 320)
-        area.connect("draw", self._draw_keyboard_graph)
-        self._connect_graph_zoom(area, 'keyboard')
-        self._maybe_add_graph_zoom_controls(box, 'keyboard', area)
-        box.pack_start(area, True, True, 0)
-
-        window.add(box)
-        window.connect("destroy", self._on_keyboard_graph_destroy)
-
-        self.keyboard_graph_window = window
-        self.keyboard_graph_area = area
-        self._refresh_keyboard_graph_texts()
-
-        window.show_all()
-
-    def _on_keyboard_graph_destroy(self, _w):
-        self.keyboard_graph_window = None
-        self.keyboard_graph_area = None
-        self.keyboard_graph_hint_label = None
-
-    def _refresh_keyboard_graph_texts(self) -> None:
-        if self.keyboard_graph_window:
-            self.keyboard_graph_window.set_title(f"{tr('keyboard_clicks')} — {tr('system_status')}")
-        if self.keyboard_graph_area:
-            self.keyboard_graph_area.queue_draw()
-
-    def _draw_keyboard_graph(self, widget, cr):
-        width = widget.get_allocated_width()
-        height = widget.get_allocated_height()
-
-        margin_left = 58
-        margin_right = 16
-        margin_top = 16
-        margin_bottom = 36
-
-        plot_w = max(10, width - margin_left - margin_right)
-        plot_h = max(10, height - margin_top - margin_bottom)
-
-        cr.set_source_rgb(0.09, 0.09, 0.09)
-        cr.paint()
-
-        cr.set_source_rgb(0.2, 0.2, 0.2)
-        for i in range(5):
-            y = margin_top + (plot_h * i / 4)
-            cr.move_to(margin_left, y)
-            cr.line_to(margin_left + plot_w, y)
-        cr.stroke()
-
-        samples = self._decimate_samples(self._visible_samples('keyboard', list(self.keyboard_history)), max(200, width * 2))
-        if not samples:
-            self._draw_no_data(widget, cr, 'No data yet…')
-            return
-        if len(samples) == 1:
-            samples = [samples[0], samples[0]]
-
-        max_count = max(1, max(s[1] for s in samples))
-        y_max = max_count * 1.05
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(10)
-        cr.set_source_rgb(0.85, 0.85, 0.85)
-        for i in range(5):
-            y = margin_top + (plot_h * i / 4)
-            mark = int(y_max * (1 - i / 4))
-            label = f"{mark}"
-            ext = cr.text_extents(label)
-            cr.move_to(max(2, margin_left - _text_width(ext) - 8), y + 4)
-            cr.show_text(label)
-
-        line_color = self._graph_line_color_rgb('graph_line_color_keyboard')
-        cr.set_source_rgb(*line_color)
-        cr.set_line_width(2)
-        for idx, sample in enumerate(samples):
-            x = margin_left + plot_w * idx / (len(samples) - 1)
-            value = sample[1]
-            y = margin_top + plot_h * (1.0 - (value / y_max))
-            if idx == 0:
-                cr.move_to(x, y)
-            else:
-                cr.line_to(x, y)
-        cr.stroke()
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(12)
-        cr.set_source_rgb(*line_color)
-        cr.rectangle(margin_left, 4, 12, 8)
-        cr.fill()
-        cr.set_source_rgb(1.0, 0.96, 0.78)
-        cr.move_to(margin_left + 18, 12)
-        cr.show_text(tr('keyboard_clicks'))
-
-        last_count = samples[-1][1]
-        values_text = f"{tr('keyboard_clicks')}: {last_count}"
-        cr.set_source_rgb(0.95, 0.95, 0.95)
-        cr.set_font_size(12)
-        ext = cr.text_extents(values_text)
-        cr.move_to(width - margin_right - _text_width(ext), 12)
-        cr.show_text(values_text)
-
-        self._draw_graph_hover_info(
-            widget,
-            cr,
-            'keyboard',
-            samples,
-            margin_left,
-            margin_top,
-            plot_w,
-            plot_h,
-            lambda sample: [
-                datetime.fromtimestamp(sample[0]).strftime("%H:%M:%S"),
-                f"{tr('keyboard_clicks')}: {sample[1]}",
-            ],
-        )
-
-        start_ts = datetime.fromtimestamp(samples[0][0]).strftime("%H:%M:%S")
-        end_ts = datetime.fromtimestamp(samples[-1][0]).strftime("%H:%M:%S")
-
-        cr.set_source_rgb(0.75, 0.75, 0.75)
-        cr.set_font_size(11)
-        cr.move_to(margin_left, height - 10)
-        cr.show_text(f"◀ {start_ts}")
-
-        end_text = f"{end_ts} ▶"
-        text_extents = cr.text_extents(end_text)
-        cr.move_to(width - margin_right - _text_width(text_extents), height - 10)
-        cr.show_text(end_text)
-
-    def _append_mouse_sample(self, mouse_clicks: object) -> None:
-        try:
-            count = max(0, int(mouse_clicks))
-        except (TypeError, ValueError):
-            count = 0
-        self.mouse_history.append((time.time(), count))
-
-    def show_mouse_graph(self, _w=None):
-        if self.mouse_graph_window and self.mouse_graph_window.get_visible():
-            self.mouse_graph_window.present()
-            return
-
-        window = Gtk.Window(title=f"{tr('mouse_clicks')} — {tr('system_status')}")
-        window.set_default_size(720, 380)
-        window.set_border_width(10)
-
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        area = Gtk.DrawingArea()
-        area.set_size_request(680, 320)
-        area.connect("draw", self._draw_mouse_graph)
-        self._connect_graph_zoom(area, 'mouse')
-        self._maybe_add_graph_zoom_controls(box, 'mouse', area)
-        box.pack_start(area, True, True, 0)
-
-        window.add(box)
-        window.connect("destroy", self._on_mouse_graph_destroy)
-
-        self.mouse_graph_window = window
-        self.mouse_graph_area = area
-        self._refresh_mouse_graph_texts()
-
-        window.show_all()
-
-    def _on_mouse_graph_destroy(self, _w):
-        self.mouse_graph_window = None
-        self.mouse_graph_area = None
-        self.mouse_graph_hint_label = None
-
-    def _refresh_mouse_graph_texts(self) -> None:
-        if self.mouse_graph_window:
-            self.mouse_graph_window.set_title(f"{tr('mouse_clicks')} — {tr('system_status')}")
-        if self.mouse_graph_area:
-            self.mouse_graph_area.queue_draw()
-
-    def _draw_mouse_graph(self, widget, cr):
-        width = widget.get_allocated_width()
-        height = widget.get_allocated_height()
-
-        margin_left = 58
-        margin_right = 16
-        margin_top = 16
-        margin_bottom = 36
-
-        plot_w = max(10, width - margin_left - margin_right)
-        plot_h = max(10, height - margin_top - margin_bottom)
-
-        cr.set_source_rgb(0.09, 0.09, 0.09)
-        cr.paint()
-
-        cr.set_source_rgb(0.2, 0.2, 0.2)
-        for i in range(5):
-            y = margin_top + (plot_h * i / 4)
-            cr.move_to(margin_left, y)
-            cr.line_to(margin_left + plot_w, y)
-        cr.stroke()
-
-        samples = self._decimate_samples(self._visible_samples('mouse', list(self.mouse_history)), max(200, width * 2))
-        if not samples:
-            self._draw_no_data(widget, cr, 'No data yet…')
-            return
-        if len(samples) == 1:
-            samples = [samples[0], samples[0]]
-
-        max_count = max(1, max(s[1] for s in samples))
-        y_max = max_count * 1.05
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(10)
-        cr.set_source_rgb(0.85, 0.85, 0.85)
-        for i in range(5):
-            y = margin_top + (plot_h * i / 4)
-            mark = int(y_max * (1 - i / 4))
-            label = f"{mark}"
-            ext = cr.text_extents(label)
-            cr.move_to(max(2, margin_left - _text_width(ext) - 8), y + 4)
-            cr.show_text(label)
-
-        line_color = self._graph_line_color_rgb('graph_line_color_mouse')
-        cr.set_source_rgb(*line_color)
-        cr.set_line_width(2)
-        for idx, sample in enumerate(samples):
-            x = margin_left + plot_w * idx / (len(samples) - 1)
-            value = sample[1]
-            y = margin_top + plot_h * (1.0 - (value / y_max))
-            if idx == 0:
-                cr.move_to(x, y)
-            else:
-                cr.line_to(x, y)
-        cr.stroke()
-
-        cr.select_font_face("Sans", 0, 0)
-        cr.set_font_size(12)
-        cr.set_source_rgb(*line_color)
-        cr.rectangle(margin_left, 4, 12, 8)
-        cr.fill()
-        cr.set_source_rgb(0.85, 0.98, 1.0)
-        cr.move_to(margin_left + 18, 12)
-        cr.show_text(tr('mouse_clicks'))
-
-        last_count = samples[-1][1]
-        values_text = f"{tr('mouse_clicks')}: {last_count}"
-        cr.set_source_rgb(0.95, 0.95, 0.95)
-        cr.set_font_size(12)
-        ext = cr.text_extents(values_text)
-        cr.move_to(width - margin_right - _text_width(ext), 12)
-        cr.show_text(values_text)
-
-        self._draw_graph_hover_info(
-            widget,
-            cr,
-            'mouse',
-            samples,
-            margin_left,
-            margin_top,
-            plot_w,
-            plot_h,
-            lambda sample: [
-                datetime.fromtimestamp(sample[0]).strftime("%H:%M:%S"),
-                f"{tr('mouse_clicks')}: {sample[1]}",
-            ],
-        )
-
-        start_ts = datetime.fromtimestamp(samples[0][0]).strftime("%H:%M:%S")
-        end_ts = datetime.fromtimestamp(samples[-1][0]).strftime("%H:%M:%S")
-
-        cr.set_source_rgb(0.75, 0.75, 0.75)
-        cr.set_font_size(11)
-        cr.move_to(margin_left, height - 10)
-        cr.show_text(f"◀ {start_ts}")
-
-        end_text = f"{end_ts} ▶"
-        text_extents = cr.text_extents(end_text)
-        cr.move_to(width - margin_right - _text_width(text_extents), height - 10)
-        cr.show_text(end_text)
+    @staticmethod
+    def _family_label(family_key: str) -> str:
+        return {
+            'cpu_cores': tr('cpu_cores_label'),
+            'net_ifaces': tr('net_interfaces_label'),
+            'mounts': tr('mounts_label'),
+            'disk_io': tr('disk_io_label'),
+        }.get(family_key, family_key)
+
+    def _family_summary(self, family_key: str, values: Dict) -> str:
+        render = self.label_cache.render
+        template = self._label_templates[family_key]
+        if family_key == 'cpu_cores':
+            loads = list(values.values())
+            return render(family_key, template, (len(loads), sum(loads) / len(loads), max(loads)))
+        if family_key == 'net_ifaces':
+            name, (recv, sent) = max(values.items(), key=lambda item: item[1][0] + item[1][1])
+            return render(family_key, template, (name, recv, sent))
+        if family_key == 'disk_io':
+            read = sum(value[0] for value in values.values())
+            write = sum(value[1] for value in values.values())
+            iops = sum(value[2] for value in values.values())
+            disk, busy = max(((name, value[3]) for name, value in values.items()), key=lambda item: item[1])
+            return render(family_key, template, (read, write, iops, disk, busy))
+        percents = self._family_values(family_key, values)
+        mount = max(percents, key=percents.get)
+        return render(family_key, template, (mount, percents[mount]))
 
     def _show_message(self, title: str, message: str):
         parent = self.settings_dialog if (self.settings_dialog and self.settings_dialog.get_mapped()) else None
@@ -2281,100 +1364,117 @@ class SystemTrayApp:
         d.run()
         d.destroy()
 
-    def _update_ui(self, cpu_temp, cpu_usage, ram_used, ram_total,
-                   disk_used, disk_total, swap_used, swap_total,
-                   net_recv_speed, net_sent_speed, uptime,
-                   keyboard_clicks_val, mouse_clicks_val):
-        try:
-            now = time.time()
-            if not hasattr(self, "_last_item_update_ts"):
-                self._last_item_update_ts = {}
-            if not hasattr(self, "_item_display_cache"):
-                self._item_display_cache = {}
-
-            def due(item_key: str, interval_key: str) -> bool:
-                interval = self._sanitize_poll_interval(self.visibility_settings.get(interval_key, POLL_INTERVAL_DEFAULT_SEC))
-                last_ts = float(self._last_item_update_ts.get(item_key, 0.0))
-                if (now - last_ts) >= interval:
-                    self._last_item_update_ts[item_key] = now
-                    return True
-                return False
+    def _build_label_templates(self) -> None:
+        """Label templates of the current language; ``LabelCache`` rounds values to their precision."""
+        mbps = tr('mbps')
+        self._label_templates = {
+            'cpu': f"{tr('cpu_info')}: {{:.0f}}%  🌡{{}}°C",
+            'ram': f"{tr('ram_loading')}: {{:.1f}}/{{:.1f}} GB",
+            'swap': f"{tr('swap_loading')}: {{:.1f}}/{{:.1f}} GB",
+            'disk': f"{tr('disk_loading')}: {{:.1f}}/{{:.1f}} GB",
+            'net': f"{tr('lan_speed')}: ↓{{:.1f}}/↑{{:.1f}} {mbps}",
+            'uptime': f"{tr('uptime_label')}: {{}}",
+            'keyboard_clicks': f"{tr('keyboard_clicks')}: {{}}",
+            'mouse_clicks': f"{tr('mouse_clicks')}: {{}}",
+            'tray_cpu': f"{tr('cpu_info')}: {{:.0f}}%",
+            'tray_ram': f"{tr('ram_loading')}: {{:.1f}}GB",
+            'cpu_cores': f"{self._family_label('cpu_cores')}: {{}} × {{:.0f}}%  ▲{{:.0f}}%",
+            'net_ifaces': f"{self._family_label('net_ifaces')}: {{}} ↓{{:.1f}}/↑{{:.1f}} {mbps}",
+            'disk_io': f"{self._family_label('disk_io')}: R {{:.1f}}/W {{:.1f}} {mbps}  {{:.0f}} IOPS  ▲{{}} {{:.0f}}%",
+            'mounts': f"{self._family_label('mounts')}: {{}} {{:.0f}}%",
+        }
+
+    def _menu_texts(self, snapshot: MetricsSnapshot) -> Dict[str, str]:
+        """Format the labels of visible menu items, honouring their per-item refresh intervals."""
+        s = snapshot
+        now = s.timestamp
+        texts: Dict[str, str] = {}
+        templates = self._label_templates
+        render = self.label_cache.render
+
+        def due(item_key: str, interval_key: str) -> bool:
+            interval = self._sanitize_poll_interval(self.visibility_settings.get(interval_key, POLL_INTERVAL_DEFAULT_SEC))
+            last_ts = float(self._last_item_update_ts.get(item_key, 0.0))
+            if (now - last_ts) >= interval:
+                self._last_item_update_ts[item_key] = now
+                return True
+            return False
 
-            self._append_cpu_sample(cpu_usage, cpu_temp)
-            self._append_ram_sample(ram_used, ram_total)
-            self._append_swap_sample(swap_used, swap_total)
-            self._append_disk_sample(disk_used, disk_total)
-            self._append_net_sample(net_recv_speed, net_sent_speed)
-            self._append_keyboard_sample(keyboard_clicks_val)
-            self._append_mouse_sample(mouse_clicks_val)
-            if self.cpu_graph_area:
-                self.cpu_graph_area.queue_draw()
-            if self.ram_graph_area:
-                self.ram_graph_area.queue_draw()
-            if self.swap_graph_area:
-                self.swap_graph_area.queue_draw()
-            if self.disk_graph_area:
-                self.disk_graph_area.queue_draw()
-            if self.net_graph_area:
-                self.net_graph_area.queue_draw()
-            if self.keyboard_graph_area:
-                self.keyboard_graph_area.queue_draw()
-            if self.mouse_graph_area:
-                self.mouse_graph_area.queue_draw()
-
-            if self.visibility_settings.get('cpu', True):
-                if due('cpu', 'cpu_interval_sec'):
-                    self._item_display_cache['cpu'] = f"{tr('cpu_info')}: {cpu_usage:.0f}%  🌡{cpu_temp}°C"
-                self.cpu_temp_item.set_label(self._item_display_cache.get('cpu', f"{tr('cpu_info')}: {cpu_usage:.0f}%  🌡{cpu_temp}°C"))
-            if self.visibility_settings.get('ram', True):
-                if due('ram', 'ram_interval_sec'):
-                    self._item_display_cache['ram'] = f"{tr('ram_loading')}: {ram_used:.1f}/{ram_total:.1f} GB"
-                self.ram_item.set_label(self._item_display_cache.get('ram', f"{tr('ram_loading')}: {ram_used:.1f}/{ram_total:.1f} GB"))
-            if self.visibility_settings.get('swap', True):
-                if due('swap', 'swap_interval_sec'):
-                    self._item_display_cache['swap'] = f"{tr('swap_loading')}: {swap_used:.1f}/{swap_total:.1f} GB"
-                self.swap_item.set_label(self._item_display_cache.get('swap', f"{tr('swap_loading')}: {swap_used:.1f}/{swap_total:.1f} GB"))
-            if self.visibility_settings.get('disk', True):
-                if due('disk', 'disk_interval_sec'):
-                    self._item_display_cache['disk'] = f"{tr('disk_loading')}: {disk_used:.1f}/{disk_total:.1f} GB"
-                self.disk_item.set_label(self._item_display_cache.get('disk', f"{tr('disk_loading')}: {disk_used:.1f}/{disk_total:.1f} GB"))
-            if self.visibility_settings.get('net', True):
-                if due('net', 'net_interval_sec'):
-                    self._item_display_cache['net'] = f"{tr('lan_speed')}: ↓{net_recv_speed:.1f}/↑{net_sent_speed:.1f} {tr('mbps')}"
-                self.net_item.set_label(self._item_display_cache.get('net', f"{tr('lan_speed')}: ↓{net_recv_speed:.1f}/↑{net_sent_speed:.1f} {tr('mbps')}"))
-            if self.visibility_settings.get('uptime', True):
-                self.uptime_item.set_label(f"{tr('uptime_label')}: {uptime}")
-            if self.visibility_settings.get('keyboard_clicks', True):
-                self.keyboard_item.set_label(f"{tr('keyboard_clicks')}: {keyboard_clicks_val}")
-            if self.visibility_settings.get('mouse_clicks', True):
-                self.mouse_item.set_label(f"{tr('mouse_clicks')}: {mouse_clicks_val}")
-
-            tray_parts = []
-            if self.visibility_settings.get('tray_cpu', True):
-                if due('tray_cpu', 'tray_cpu_interval_sec'):
-                    self._item_display_cache['tray_cpu'] = f"{tr('cpu_info')}: {cpu_usage:.0f}%"
-                tray_parts.append(self._item_display_cache.get('tray_cpu', f"{tr('cpu_info')}: {cpu_usage:.0f}%"))
-            if self.visibility_settings.get('tray_ram', True):
-                if due('tray_ram', 'tray_ram_interval_sec'):
-                    self._item_display_cache['tray_ram'] = f"{tr('ram_loading')}: {ram_used:.1f}GB"
-                tray_parts.append(self._item_display_cache.get('tray_ram', f"{tr('ram_loading')}: {ram_used:.1f}GB"))
-            tray_text = "  ".join(tray_parts)
-            if self.telegram_notifier.enabled or self.discord_notifier.enabled:
-                tray_text = "⤴  " + tray_text
-            self.indicator.set_label(tray_text, "")
+        def timed(item_key: str, interval_key: str, values) -> str:
+            if due(item_key, interval_key) or item_key not in self._item_display_cache:
+                self._item_display_cache[item_key] = render(item_key, templates[item_key], values)
+            return self._item_display_cache[item_key]
+
+        if self.visibility_settings.get('cpu', True):
+            texts['cpu'] = timed('cpu', 'cpu_interval_sec', (s.cpu_usage, s.cpu_temp))
+        if self.visibility_settings.get('ram', True):
+            texts['ram'] = timed('ram', 'ram_interval_sec', (s.ram_used, s.ram_total))
+        if self.visibility_settings.get('swap', True):
+            texts['swap'] = timed('swap', 'swap_interval_sec', (s.swap_used, s.swap_total))
+        if self.visibility_settings.get('disk', True):
+            texts['disk'] = timed('disk', 'disk_interval_sec', (s.disk_used, s.disk_total))
+        if self.visibility_settings.get('net', True):
+            texts['net'] = timed('net', 'net_interval_sec', (s.net_recv, s.net_sent))
+        if self.visibility_settings.get('uptime', True):
+            texts['uptime'] = render('uptime', templates['uptime'], (s.uptime,))
+        if self.visibility_settings.get('keyboard_clicks', True):
+            texts['keyboard_clicks'] = render('keyboard_clicks', templates['keyboard_clicks'], (s.keyboard_clicks,))
+        if self.visibility_settings.get('mouse_clicks', True):
+            texts['mouse_clicks'] = render('mouse_clicks', templates['mouse_clicks'], (s.mouse_clicks,))
+        for family_key, interval_key in FAMILY_INTERVAL_KEYS.items():
+            values = s.families.get(family_key)
+            if not values or not self.visibility_settings.get(family_key, False):
+                continue
+            if due(family_key, interval_key) or family_key not in self._item_display_cache:
+                self._item_display_cache[family_key] = self._family_summary(family_key, values)
+            texts[family_key] = self._item_display_cache[family_key]
+
+        tray_parts = []
+        if self.visibility_settings.get('tray_cpu', True):
+            tray_parts.append(timed('tray_cpu', 'tray_cpu_interval_sec', (s.cpu_usage,)))
+        if self.visibility_settings.get('tray_ram', True):
+            tray_parts.append(timed('tray_ram', 'tray_ram_interval_sec', (s.ram_used,)))
+        tray_text = "  ".join(tray_parts)
+        if any(channel.enabled for channel in self.notification_channels.values()):
+            tray_text = "⤴  " + tray_text
+        texts['tray'] = tray_text
+        return texts
+
+    def _update_ui(self, snapshot: MetricsSnapshot) -> None:
+        """UI thread: apply the latest snapshot to the menu, tray label and open graphs."""
+        try:
+            for graph in self.graphs.values():
+                graph.queue_draw()
+
+            texts = snapshot.texts
+            items = (
+                ('cpu', self.cpu_temp_item),
+                ('ram', self.ram_item),
+                ('swap', self.swap_item),
+                ('disk', self.disk_item),
+                ('net', self.net_item),
+                ('uptime', self.uptime_item),
+                ('keyboard_clicks', self.keyboard_item),
+                ('mouse_clicks', self.mouse_item),
+                *self.family_items.items(),
+            )
+            apply = self.label_cache.apply
+            for key, item in items:
+                if key in texts:
+                    apply(key, texts[key], item.set_label)
+            apply('tray', texts.get('tray', ""), self._set_tray_label)
         except Exception as e:
             print(f"Ошибка в _update_ui: {e}")
 
-    def quit(self, *args):
-        self._notification_stop_event.set()
-        self._enqueue_latest_notification(self._telegram_queue, None)
-        self._enqueue_latest_notification(self._discord_queue, None)
-        for worker in (getattr(self, "_telegram_worker", None), getattr(self, "_discord_worker", None)):
-            if worker and worker.is_alive():
-                worker.join(timeout=1.0)
+    def _set_tray_label(self, text: str) -> None:
+        self.indicator.set_label(text, "")
 
+    def quit(self, *args):
+        self.sampler_engine.stop()
         if self.telegram_notifier:
             self.telegram_notifier.stop_bot()
+        self.notification_dispatcher.stop()
+        close_transport()
 
         for tid in ("_update_timer_id", "_notify_timer_id", "_action_timer_id"):
             _id = getattr(self.power_control, tid, None)
@@ -2391,68 +1491,8 @@ class SystemTrayApp:
 
         self._close_progress_dialog()
 
-        if self.cpu_graph_window:
-            try:
-                self.cpu_graph_window.destroy()
-            except Exception:
-                pass
-            self.cpu_graph_window = None
-            self.cpu_graph_area = None
-            self.cpu_graph_hint_label = None
-
-        if self.ram_graph_window:
-            try:
-                self.ram_graph_window.destroy()
-            except Exception:
-                pass
-            self.ram_graph_window = None
-            self.ram_graph_area = None
-            self.ram_graph_hint_label = None
-
-        if self.swap_graph_window:
-            try:
-                self.swap_graph_window.destroy()
-            except Exception:
-                pass
-            self.swap_graph_window = None
-            self.swap_graph_area = None
-            self.swap_graph_hint_label = None
-
-        if self.disk_graph_window:
-            try:
-                self.disk_graph_window.destroy()
-            except Exception:
-                pass
-            self.disk_graph_window = None
-            self.disk_graph_area = None
-            self.disk_graph_hint_label = None
-
-        if self.net_graph_window:
-            try:
-                self.net_graph_window.destroy()
-            except Exception:
-                pass
-            self.net_graph_window = None
-            self.net_graph_area = None
-            self.net_graph_hint_label = None
-
-        if self.keyboard_graph_window:
-            try:
-                self.keyboard_graph_window.destroy()
-            except Exception:
-                pass
-            self.keyboard_graph_window = None
-            self.keyboard_graph_area = None
-            self.keyboard_graph_hint_label = None
-
-        if self.mouse_graph_window:
-            try:
-                self.mouse_graph_window.destroy()
-            except Exception:
-                pass
-            self.mouse_graph_window = None
-            self.mouse_graph_area = None
-            self.mouse_graph_hint_label = None
+        for graph in self.graphs.values():
+            graph.destroy()
 
         if self.settings_dialog:
             try:
@@ -2472,12 +1512,21 @@ class SystemTrayApp:
         except Exception:
             pass
 
+        self.log_writer.close()
+        self.binary_log_writer.close()
+
+        for store in (self.metrics_store, *self.family_stores.values()):
+            try:
+                store.flush()
+            except Exception as e:
+                print("Ошибка записи истории метрик:", e)
+
         Gtk.main_quit()
 
     def run(self):
         # Начальный снимок, чтобы графики не открывались полностью пустыми.
         self.update_info()
-        GLib.timeout_add_seconds(TIME_UPDATE_SEC, self.update_info)
+        self.sampler_engine.start()
         Gtk.main()
 
 
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import struct
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO
+
+from .constants import BIN_LOG_FILE
+from .logging_utils import EXPORT_CHUNK_BYTES, log_files, open_log
+from .metrics_store import Segment, SegmentFormatError, _project_rows
+
+# One record per sample: float64 timestamp + float32 per field (56 bytes vs ~150 for a text line).
+LOG_FIELDS = (
+    'cpu.usage',
+    'cpu.temp',
+    'ram.used',
+    'ram.total',
+    'swap.used',
+    'swap.total',
+    'disk.used',
+    'disk.total',
+    'net.recv',
+    'net.sent',
+    'keyboard.clicks',
+    'mouse.clicks',
+)
+LOG_HEADER = Segment.header(LOG_FIELDS)
+_RECORD = struct.Struct('<d' + 'f' * len(LOG_FIELDS))
+
+
+def encode_snapshot(s) -> bytes:
+    """Pack a ``MetricsSnapshot`` into one fixed-size log record."""
+    return _RECORD.pack(
+        s.timestamp,
+        s.cpu_usage, s.cpu_temp,
+        s.ram_used, s.ram_total,
+        s.swap_used, s.swap_total,
+        s.disk_used, s.disk_total,
+        s.net_recv, s.net_sent,
+        s.keyboard_clicks, s.mouse_clicks,
+    )
+
+
+def log_paths(path: Path = BIN_LOG_FILE) -> List[Path]:
+    """Existing log files oldest first: rotated (possibly compressed) generations, then the current file."""
+    return log_files(path)
+
+
+def _iter_compressed(path: Path, start_ts: float, end_ts: float, fields: Sequence[str]) -> Iterator[tuple]:
+    # Compressed generations cannot be bisected, so records are scanned in chunks.
+    with open_log(path) as f:
+        source_fields, _stats, _resolution, _offset = Segment.read_header(f, path)
+        record = struct.Struct('<d' + 'f' * len(source_fields))
+        positions = {name: idx for idx, name in enumerate(source_fields, 1)}
+        mapping = [positions.get(name) for name in fields]
+        chunk = max(1, EXPORT_CHUNK_BYTES // record.size) * record.size
+        while True:
+            data = f.read(chunk)
+            usable = len(data) - len(data) % record.size
+            if usable == 0:
+                return
+            for row in record.iter_unpack(data[:usable]):
+                if row[0] < start_ts:
+                    continue
+                if row[0] > end_ts:
+                    return
+                yield (row[0], *[row[idx] if idx is not None else 0.0 for idx in mapping])
+
+
+def iter_records(paths: Iterable[Path],
+                 start_ts: float = float('-inf'),
+                 end_ts: float = float('inf'),
+                 fields: Sequence[str] = LOG_FIELDS) -> Iterator[tuple]:
+    """Stream ``(timestamp, *values)`` in ``fields`` order from every log file, one chunk at a time."""
+    for path in paths:
+        try:
+            if str(path).endswith(('.gz', '.zst')):
+                yield from _iter_compressed(Path(path), start_ts, end_ts, fields)
+                continue
+            segment = Segment(Path(path))
+        except (OSError, EOFError, SegmentFormatError) as e:
+            print(f"Не удалось прочитать бинарный лог {path}: {e}", file=sys.stderr)
+            continue
+        yield from _project_rows(segment, segment.iter_rows(start_ts, end_ts), fields)
+
+
+def format_text(row: tuple) -> str:
+    """Render a record like a line of the text log."""
+    (ts, cpu, temp, ram_used, ram_total, swap_used, swap_total,
+     disk_used, disk_total, recv, sent, keys, clicks) = row
+    return (f"[{datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')}] "
+            f"CPU: {cpu:.0f}% {temp:.0f}°C | "
+            f"RAM: {ram_used:.1f}/{ram_total:.1f} GB | "
+            f"SWAP: {swap_used:.1f}/{swap_total:.1f} GB | "
+            f"Disk: {disk_used:.1f}/{disk_total:.1f} GB | "
+            f"Net: ↓{recv:.1f}/↑{sent:.1f} MB/s | "
+            f"Keys: {keys:.0f} | "
+            f"Clicks: {clicks:.0f}\n")
+
+
+def export(records: Iterable[tuple], out: TextIO, fmt: str = 'csv') -> int:
+    """Write records to ``out`` as CSV or text log lines; returns the number written."""
+    count = 0
+    if fmt == 'csv':
+        writer = csv.writer(out)
+        writer.writerow(('timestamp', 'time', *LOG_FIELDS))
+        for row in records:
+            writer.writerow((f"{row[0]:.3f}", datetime.fromtimestamp(row[0]).isoformat(timespec='seconds'),
+                             *(f"{value:.6g}" for value in row[1:])))
+            count += 1
+    else:
+        for row in records:
+            out.write(format_text(row))
+            count += 1
+    return count
+
+
+def _parse_time(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='symo-log', description='Query the SyMo binary metrics log.')
+    parser.add_argument('--file', type=Path, default=BIN_LOG_FILE, help='log file (default: %(default)s)')
+    parser.add_argument('--from', dest='start', type=_parse_time, default=float('-inf'),
+                        help='start time: Unix timestamp or ISO date/time')
+    parser.add_argument('--to', dest='end', type=_parse_time, default=float('inf'),
+                        help='end time: Unix timestamp or ISO date/time')
+    parser.add_argument('--format', choices=('csv', 'text'), default='csv')
+    parser.add_argument('--output', type=Path, help='write to a file instead of stdout')
+    args = parser.parse_args(argv)
+
+    paths = log_paths(args.file)
+    if not paths:
+        print(f"Бинарный лог не найден: {args.file}", file=sys.stderr)
+        return 1
+    records = iter_records(paths, args.start, args.end)
+    if args.output is None:
+        export(records, sys.stdout, args.format)
+    else:
+        with args.output.open('w', encoding='utf-8', newline='') as out:
+            export(records, out, args.format)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
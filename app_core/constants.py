@@ -9,13 +9,19 @@ ICON_FALLBACK = "system-run-symbolic"
 TIME_UPDATE_SEC = 1
 GRAPH_HISTORY_MINUTES_DEFAULT = 5
 GRAPH_HISTORY_MINUTES_MIN = 1
-GRAPH_HISTORY_MINUTES_MAX = 480
+GRAPH_HISTORY_MINUTES_MAX = 7 * 24 * 60
+HISTORY_RETENTION_DAYS_DEFAULT = 7
+HISTORY_RETENTION_DAYS_MIN = 1
+HISTORY_RETENTION_DAYS_MAX = 365
 
 HOME = Path.home()
 LOG_FILE = HOME / ".symo_log.txt"
+BIN_LOG_FILE = HOME / ".symo_log.bin"
 SETTINGS_FILE = HOME / ".symo_settings.json"
 TELEGRAM_CONFIG_FILE = HOME / ".symo_telegram.json"
 DISCORD_CONFIG_FILE = HOME / ".symo_discord.json"
+WEBHOOK_CONFIG_FILE = HOME / ".symo_webhook.json"
+METRICS_DIR = HOME / ".local" / "share" / "symo"
 
 MENU_ORDER_DEFAULT = [
     'cpu',
@@ -23,6 +29,10 @@ MENU_ORDER_DEFAULT = [
     'swap',
     'disk',
     'net',
+    'cpu_cores',
+    'net_ifaces',
+    'mounts',
+    'disk_io',
     'keyboard_clicks',
     'mouse_clicks',
     'uptime',
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from itertools import accumulate
+from typing import List, Sequence
+
+try:
+    import numpy as _np
+except ImportError:  # slow pure-Python fallback; numpy is in requirements.txt
+    _np = None
+
+MODE_MINMAX = 'minmax'
+MODE_LTTB = 'lttb'
+
+
+def _bucket_bounds(size: int, buckets: int) -> List[int]:
+    return [(size * i) // buckets for i in range(buckets + 1)]
+
+
+def minmax_indices(values: Sequence[float], buckets: int) -> List[List[int]]:
+    """Return ``[argmin, argmax]`` per bucket, so every spike survives downsampling."""
+    size = len(values)
+    if size == 0 or buckets <= 0:
+        return []
+    buckets = min(buckets, size)
+
+    if _np is not None:
+        mins, maxs = _bucket_extremes_numpy(_np.asarray(values, dtype=_np.float64), buckets)
+        return _np.stack((mins, maxs), axis=1).tolist()
+
+    data = values.tolist() if hasattr(values, 'tolist') else list(values)
+    bounds = _bucket_bounds(size, buckets)
+    result: List[List[int]] = []
+    for idx in range(buckets):
+        start, stop = bounds[idx], bounds[idx + 1]
+        chunk = data[start:stop]
+        result.append([start + chunk.index(min(chunk)), start + chunk.index(max(chunk))])
+    return result
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """Largest-Triangle-Three-Buckets: pick ``threshold`` indices that preserve the visual shape.
+
+    With numpy the triangle test only considers each bucket's minimum and maximum
+    (MinMaxLTTB), which keeps every spike and lets the whole pass run vectorized.
+    """
+    size = len(ys)
+    if threshold >= size or threshold <= 2:
+        if threshold <= 0 or size == 0:
+            return []
+        if threshold >= size:
+            return list(range(size))
+        return [0, size - 1][:threshold]
+
+    if _np is not None:
+        return _lttb_numpy(xs, ys, threshold).tolist()
+
+    xs = xs.tolist() if hasattr(xs, 'tolist') else list(xs)
+    ys = ys.tolist() if hasattr(ys, 'tolist') else list(ys)
+    # Prefix sums give every bucket average in O(1).
+    sum_x = [0.0, *accumulate(xs)]
+    sum_y = [0.0, *accumulate(ys)]
+
+    every = (size - 2) / float(threshold - 2)
+    selected = [0]
+    prev = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * every) + 1
+        stop = int((bucket + 1) * every) + 1
+        next_start = stop
+        next_stop = min(int((bucket + 2) * every) + 1, size)
+        if next_start >= next_stop:
+            avg_x, avg_y = xs[size - 1], ys[size - 1]
+        else:
+            count = next_stop - next_start
+            avg_x = (sum_x[next_stop] - sum_x[next_start]) / count
+            avg_y = (sum_y[next_stop] - sum_y[next_start]) / count
+        px, py = xs[prev], ys[prev]
+        dx = px - avg_x
+        dy = avg_y - py
+        best_area = -1.0
+        best_idx = start
+        for idx in range(start, stop):
+            area = abs(dx * (ys[idx] - py) - (px - xs[idx]) * dy)
+            if area > best_area:
+                best_area = area
+                best_idx = idx
+        prev = best_idx
+        selected.append(prev)
+    selected.append(size - 1)
+    return selected
+
+
+def decimate_view(view, max_points: int, mode: str = MODE_MINMAX) -> Sequence[tuple]:
+    """Downsample a HistoryView to at most ``max_points`` rows.
+
+    ``minmax`` emits two rows per pixel bucket carrying each series' minimum and
+    maximum, in the order they occurred (rollup views contribute their bucket
+    min/max columns); ``lttb`` keeps real rows chosen by the first series' shape.
+    """
+    size = len(view)
+    if max_points <= 0 or size <= max_points:
+        return view
+    if max_points == 1:
+        return [view[-1]]
+
+    timestamps = view.column(0)
+    series_count = len(view.fields)
+
+    if mode == MODE_LTTB:
+        if _np is not None and max_points > 2:
+            indices = _lttb_numpy(view.array(0), view.array(1), max_points)
+            columns = [view.array(idx)[indices] for idx in range(series_count + 1)]
+            return _np.stack(columns, axis=1).tolist()
+        return [view[idx] for idx in lttb_indices(timestamps, view.column(1), max_points)]
+
+    buckets = max(1, max_points // 2)
+    if _np is not None:
+        return _minmax_rows_numpy(view, buckets)
+
+    series = [_series_extremes(view, idx, buckets) for idx in range(1, series_count + 1)]
+    rows: List[tuple] = []
+    for bucket, primary in enumerate(series[0][2]):
+        lead = min(primary)
+        trail = max(primary)
+        first = [timestamps[lead]]
+        second = [timestamps[trail]]
+        for lows, highs, extremes in series:
+            lo, hi = extremes[bucket]
+            if lo > hi:
+                first.append(highs[hi])
+                second.append(lows[lo])
+            else:
+                first.append(lows[lo])
+                second.append(highs[hi])
+        rows.append(tuple(first))
+        rows.append(tuple(second))
+    return rows
+
+
+def _series_extremes(view, index: int, buckets: int):
+    """Return ``(lows, highs, [[argmin, argmax], ...])``; rollup views use their min/max columns."""
+    if not view.stats:
+        column = view.column(index)
+        return column, column, minmax_indices(column, buckets)
+    lows = view.column(index, 'min')
+    highs = view.column(index, 'max')
+    extremes = [
+        [lo[0], hi[1]]
+        for lo, hi in zip(minmax_indices(lows, buckets), minmax_indices(highs, buckets))
+    ]
+    return lows, highs, extremes
+
+
+def _bucket_extremes_numpy(data, buckets: int):
+    size = len(data)
+    buckets = min(buckets, size)
+    width = size // buckets
+    full = width * buckets
+    block = data[:full].reshape(buckets, width)
+    offsets = _np.arange(buckets) * width
+    mins = block.argmin(axis=1) + offsets
+    maxs = block.argmax(axis=1) + offsets
+    if full < size:
+        tail_start = full - width
+        tail = data[tail_start:]
+        mins[-1] = tail_start + int(tail.argmin())
+        maxs[-1] = tail_start + int(tail.argmax())
+    return mins, maxs
+
+
+def _minmax_rows_numpy(view, buckets: int) -> List[list]:
+    timestamps = view.array(0)
+    out = None
+    for idx in range(1, len(view.fields) + 1):
+        lows = view.array(idx, 'min')
+        if view.stats:
+            highs = view.array(idx, 'max')
+            mins = _bucket_extremes_numpy(lows, buckets)[0]
+            maxs = _bucket_extremes_numpy(highs, buckets)[1]
+        else:
+            highs = lows
+            mins, maxs = _bucket_extremes_numpy(lows, buckets)
+        swapped = mins > maxs
+        lead = _np.where(swapped, maxs, mins)
+        trail = _np.where(swapped, mins, maxs)
+        if out is None:
+            out = _np.empty((len(lead) * 2, len(view.fields) + 1), dtype=_np.float64)
+            out[0::2, 0] = timestamps[lead]
+            out[1::2, 0] = timestamps[trail]
+        out[0::2, idx] = _np.where(swapped, highs[maxs], lows[mins])
+        out[1::2, idx] = _np.where(swapped, lows[mins], highs[maxs])
+    return out.tolist()
+
+
+def _lttb_numpy(xs, ys, threshold: int):
+    x = _np.asarray(xs, dtype=_np.float64)
+    y = _np.asarray(ys, dtype=_np.float64)
+    size = len(y)
+    buckets = threshold - 2
+    cols = _np.arange(buckets)
+    edges = (_np.arange(buckets + 1) * ((size - 2) / float(buckets))).astype(_np.intp)
+    edges[-1] = size - 2
+    counts = _np.diff(edges)
+    body_x = x[1:size - 1]
+    body_y = y[1:size - 1]
+    starts = edges[:-1]
+
+    def first_hit(reduce):
+        extremes = reduce.reduceat(body_y, starts)
+        hits = _np.flatnonzero(body_y == _np.repeat(extremes, counts))
+        # Every bucket holds at least one hit, so the first hit at or after its start is its own.
+        return hits[_np.searchsorted(hits, starts)] + 1
+
+    # Candidates are each bucket's first argmin and argmax.
+    cand = _np.stack((first_hit(_np.minimum), first_hit(_np.maximum)))
+
+    avg_x = _np.empty(buckets)
+    avg_y = _np.empty(buckets)
+    avg_x[:-1] = _np.add.reduceat(body_x, starts)[1:] / counts[1:]
+    avg_y[:-1] = _np.add.reduceat(body_y, starts)[1:] / counts[1:]
+    avg_x[-1] = x[-1]
+    avg_y[-1] = y[-1]
+
+    # Triangle areas for both candidates against both possible previous picks.
+    cand_x = x[cand]
+    cand_y = y[cand]
+    prev_x = _np.empty_like(cand_x)
+    prev_y = _np.empty_like(cand_y)
+    prev_x[:, 1:] = cand_x[:, :-1]
+    prev_y[:, 1:] = cand_y[:, :-1]
+    prev_x[:, 0] = x[0]
+    prev_y[:, 0] = y[0]
+    dx = prev_x - avg_x
+    dy = avg_y - prev_y
+    area_low = _np.abs(dx * (cand_y[0] - prev_y) - (prev_x - cand_x[0]) * dy)
+    area_high = _np.abs(dx * (cand_y[1] - prev_y) - (prev_x - cand_x[1]) * dy)
+    take_high = area_high > area_low
+
+    # Each bucket maps the previous pick to its own as a constant, the identity or
+    # a swap, so the sequential walk reduces to "last constant bucket, then the
+    # parity of the swaps since".
+    fixed = take_high[0] == take_high[1]
+    swaps = _np.cumsum(~fixed & take_high[0])
+    last = _np.maximum.accumulate(_np.where(fixed, cols, 0))
+    pick_high = take_high[0][last] ^ ((swaps - swaps[last]) & 1).astype(bool)
+    indices = _np.empty(threshold, dtype=_np.intp)
+    indices[0] = 0
+    indices[1:-1] = _np.where(pick_high, cand[1], cand[0])
+    indices[-1] = size - 1
+    return indices
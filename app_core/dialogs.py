@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from pathlib import Path
 from typing import Dict, Optional
 
-from gi.repository import Gtk, Gdk
+from gi.repository import Gtk, Gdk, GLib
 
+from .alerts import DEFAULT_ALERT_RULES
 from .click_tracker import get_counts
 from .constants import (
     LOG_FILE,
@@ -15,8 +18,12 @@ from .constants import (
     GRAPH_HISTORY_MINUTES_DEFAULT,
     GRAPH_HISTORY_MINUTES_MIN,
     GRAPH_HISTORY_MINUTES_MAX,
+    HISTORY_RETENTION_DAYS_DEFAULT,
+    HISTORY_RETENTION_DAYS_MIN,
+    HISTORY_RETENTION_DAYS_MAX,
 )
 from .localization import tr
+from .logging_utils import LOG_BACKUPS_DEFAULT, LOG_BACKUPS_MAX, LogWriter, available_compressions, export_log, log_files
 from notifications import TelegramNotifier, DiscordNotifier
 
 POLL_INTERVAL_MIN_SEC = 1
@@ -29,7 +36,7 @@ MENU_ORDER_KEY_COLUMN = 2
 
 
 class SettingsDialog(Gtk.Dialog):
-    def __init__(self, parent: Optional[Gtk.Widget], visibility: Dict):
+    def __init__(self, parent: Optional[Gtk.Widget], visibility: Dict, log_writer: Optional[LogWriter] = None):
         super().__init__(title=tr('settings_label'),
                          transient_for=parent if (parent and parent.get_mapped()) else None,
                          flags=0)
@@ -39,6 +46,10 @@ class SettingsDialog(Gtk.Dialog):
         self.add_buttons(tr('cancel_label'), Gtk.ResponseType.CANCEL,
                          tr('apply_label'), Gtk.ResponseType.OK)
         self.visibility_settings = visibility
+        self.log_writer = log_writer
+        self._export_percent = -1
+        self._destroyed = False
+        self.connect('destroy', self._on_destroy)
 
         box = self.get_content_area()
         box.set_border_width(10)
@@ -121,6 +132,7 @@ class SettingsDialog(Gtk.Dialog):
         self.net_interval_spin = add_interval_row(tr('lan_speed'), 'net_interval_sec')
         self.disk_interval_spin = add_interval_row(tr('disk_loading'), 'disk_interval_sec')
         self.swap_interval_spin = add_interval_row(tr('swap_loading'), 'swap_interval_sec')
+        self.disk_io_interval_spin = add_interval_row(tr('disk_io_label'), 'disk_io_interval_sec')
 
         order_card, order_content = card(tr('menu_order_title'))
         general_content.add(order_card)
@@ -133,6 +145,10 @@ class SettingsDialog(Gtk.Dialog):
             ('swap_loading', 'swap'),
             ('disk_loading', 'disk'),
             ('lan_speed', 'net'),
+            ('cpu_cores_label', 'cpu_cores'),
+            ('net_interfaces_label', 'net_ifaces'),
+            ('mounts_label', 'mounts'),
+            ('disk_io_label', 'disk_io'),
             ('keyboard_clicks', 'keyboard_clicks'),
             ('mouse_clicks', 'mouse_clicks'),
             ('uptime_label', 'uptime'),
@@ -203,6 +219,16 @@ class SettingsDialog(Gtk.Dialog):
         logging_box.pack_end(self.download_button, False, False, 0)
         logging_card_content.add(logging_box)
 
+        self.export_progress = Gtk.ProgressBar()
+        self.export_progress.set_show_text(True)
+        self.export_progress.set_no_show_all(True)
+        logging_card_content.add(self.export_progress)
+
+        self.binary_log_check = Gtk.CheckButton(label=tr('enable_binary_log'))
+        self.binary_log_check.set_active(self.visibility_settings.get('binary_log_enabled', False))
+        self.binary_log_check.set_margin_bottom(2)
+        logging_card_content.add(self.binary_log_check)
+
         logsize_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         logsize_label = Gtk.Label(label=tr('max_log_size_mb'))
         logsize_label.set_xalign(0)
@@ -214,6 +240,24 @@ class SettingsDialog(Gtk.Dialog):
         logsize_box.pack_start(self.logsize_spin, False, False, 0)
         logging_card_content.add(logsize_box)
 
+        rotation_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        backups_label = Gtk.Label(label=tr('log_backups'))
+        backups_label.set_xalign(0)
+        backups_label.set_width_chars(28)
+        self.log_backups_spin = Gtk.SpinButton.new_with_range(1, LOG_BACKUPS_MAX, 1)
+        self.log_backups_spin.set_value(int(self.visibility_settings.get('log_backups', LOG_BACKUPS_DEFAULT)))
+        self.log_backups_spin.set_width_chars(8)
+        self.log_compression_combo = Gtk.ComboBoxText()
+        compressions = available_compressions()
+        for name in compressions:
+            self.log_compression_combo.append(name, name if name != 'none' else tr('log_compression_none'))
+        current = self.visibility_settings.get('log_compression', 'gzip')
+        self.log_compression_combo.set_active_id(current if current in compressions else 'gzip')
+        rotation_box.pack_start(backups_label, False, False, 0)
+        rotation_box.pack_start(self.log_backups_spin, False, False, 0)
+        rotation_box.pack_start(self.log_compression_combo, False, False, 0)
+        logging_card_content.add(rotation_box)
+
         self.show_zoom_controls_check = Gtk.CheckButton(label=tr('show_graph_zoom_controls'))
         self.show_zoom_controls_check.set_active(self.visibility_settings.get('show_graph_zoom_controls', True))
         self.show_zoom_controls_check.set_margin_bottom(2)
@@ -243,6 +287,23 @@ class SettingsDialog(Gtk.Dialog):
         graph_history_box.pack_start(self.graph_history_spin, False, False, 0)
         logging_card_content.add(graph_history_box)
 
+        history_retention_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        history_retention_label = Gtk.Label(label=tr('history_retention_days'))
+        history_retention_label.set_xalign(0)
+        history_retention_label.set_width_chars(28)
+        self.history_retention_spin = Gtk.SpinButton.new_with_range(
+            HISTORY_RETENTION_DAYS_MIN,
+            HISTORY_RETENTION_DAYS_MAX,
+            1,
+        )
+        self.history_retention_spin.set_value(
+            int(self.visibility_settings.get('history_retention_days', HISTORY_RETENTION_DAYS_DEFAULT))
+        )
+        self.history_retention_spin.set_width_chars(8)
+        history_retention_box.pack_start(history_retention_label, False, False, 0)
+        history_retention_box.pack_start(self.history_retention_spin, False, False, 0)
+        logging_card_content.add(history_retention_box)
+
         graph_colors_card, graph_colors_content = card(tr('graph_colors_title'))
         logging_card_content.add(graph_colors_card)
 
@@ -393,6 +454,29 @@ class SettingsDialog(Gtk.Dialog):
         discord_interval_box.set_margin_bottom(8)
         discord_content.add(discord_interval_box)
 
+        alerts_card, alerts_content = card(tr('alerts_section'))
+        notification_content.add(alerts_card)
+
+        self.alerts_enable_check = Gtk.CheckButton(label=tr('alerts_enabled'))
+        self.alerts_enable_check.set_active(self.visibility_settings.get('alerts_enabled', True))
+        alerts_content.add(self.alerts_enable_check)
+
+        alert_rules_hint = Gtk.Label(label=tr('alert_rules_hint'))
+        alert_rules_hint.set_xalign(0)
+        alert_rules_hint.set_line_wrap(True)
+        alerts_content.add(alert_rules_hint)
+
+        self.alert_rules_view = Gtk.TextView()
+        self.alert_rules_view.set_monospace(True)
+        self.alert_rules_view.set_wrap_mode(Gtk.WrapMode.NONE)
+        self.alert_rules_view.get_buffer().set_text(
+            "\n".join(self.visibility_settings.get('alert_rules', DEFAULT_ALERT_RULES)))
+        rules_scroller = Gtk.ScrolledWindow()
+        rules_scroller.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+        rules_scroller.set_min_content_height(90)
+        rules_scroller.add(self.alert_rules_view)
+        alerts_content.add(rules_scroller)
+
         self._prefill_configs()
         self.show_all()
 
@@ -503,6 +587,14 @@ class SettingsDialog(Gtk.Dialog):
         else:
             self._message(tr('error'), tr('setting_discord_error'))
 
+    def get_alert_rules(self) -> list[str]:
+        buffer = self.alert_rules_view.get_buffer()
+        text = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), False)
+        return [line.strip() for line in text.splitlines() if line.strip()]
+
+    def get_log_compression(self) -> str:
+        return self.log_compression_combo.get_active_id() or 'gzip'
+
     def download_log_file(self, _w):
         dialog = Gtk.FileChooserDialog(
             title=tr('download_log'),
@@ -511,18 +603,86 @@ class SettingsDialog(Gtk.Dialog):
         )
         dialog.add_buttons(tr('cancel_label'), Gtk.ResponseType.CANCEL,
                            tr('apply_label'), Gtk.ResponseType.OK)
+        ranges = (
+            (tr('export_range_all'), None),
+            (tr('export_range_hour'), 3600),
+            (tr('export_range_day'), 24 * 3600),
+            (tr('export_range_week'), 7 * 24 * 3600),
+        )
+        options = Gtk.Box(spacing=8)
+        range_combo = Gtk.ComboBoxText()
+        for label, _seconds in ranges:
+            range_combo.append_text(label)
+        range_combo.set_active(0)
+        gzip_check = Gtk.CheckButton(label=tr('export_compress'))
+        options.pack_start(range_combo, False, False, 0)
+        options.pack_start(gzip_check, False, False, 0)
+        options.show_all()
+        dialog.set_extra_widget(options)
         dialog.set_current_name("info_log.txt")
         response = dialog.run()
         if response == Gtk.ResponseType.OK:
             dest = Path(dialog.get_filename())
-            try:
-                if not LOG_FILE.exists():
-                    raise FileNotFoundError(LOG_FILE)
-                dest.write_text(LOG_FILE.read_text(encoding="utf-8"), encoding="utf-8")
-            except Exception as e:
-                print("Ошибка сохранения лога:", e)
+            compress = gzip_check.get_active()
+            if compress and dest.suffix != '.gz':
+                dest = dest.with_name(dest.name + '.gz')
+            seconds = ranges[max(0, range_combo.get_active())][1]
+            self._start_log_export(dest, compress, time.time() - seconds if seconds else None)
         dialog.destroy()
 
+    def _start_log_export(self, dest: Path, compress: bool, start_ts: Optional[float]) -> None:
+        """Copy the log on a worker thread; the GTK loop only receives progress updates."""
+        self.download_button.set_sensitive(False)
+        self._export_percent = -1
+        self._set_export_progress(0.0)
+        self.export_progress.show()
+        threading.Thread(
+            target=self._export_log_worker, args=(dest, compress, start_ts), name="symo-log-export", daemon=True
+        ).start()
+
+    def _export_log_worker(self, dest: Path, compress: bool, start_ts: Optional[float]) -> None:
+        error = None
+        try:
+            if self.log_writer is not None:
+                self.log_writer.flush()
+            paths = log_files(LOG_FILE)
+            if not paths:
+                raise FileNotFoundError(LOG_FILE)
+            export_log(paths, dest, compress, start_ts, progress=self._report_export_progress)
+        except Exception as e:
+            print("Ошибка сохранения лога:", e)
+            error = e
+        GLib.idle_add(self._finish_log_export, error)
+
+    def _on_destroy(self, _widget: Gtk.Widget) -> None:
+        # The export thread keeps running; its idle callbacks must not touch dead widgets.
+        self._destroyed = True
+
+    def _report_export_progress(self, done: int, total: int) -> None:
+        if self._destroyed:
+            return
+        fraction = done / total if total else 1.0
+        percent = int(fraction * 100)
+        if percent != self._export_percent:
+            self._export_percent = percent
+            GLib.idle_add(self._set_export_progress, fraction)
+
+    def _set_export_progress(self, fraction: float) -> bool:
+        if self._destroyed:
+            return False
+        self.export_progress.set_fraction(fraction)
+        self.export_progress.set_text(f"{fraction * 100:.0f}%")
+        return False
+
+    def _finish_log_export(self, error: Optional[Exception]) -> bool:
+        if self._destroyed:
+            return False
+        self.download_button.set_sensitive(True)
+        if error is None:
+            self.export_progress.set_fraction(1.0)
+        self.export_progress.set_text(tr('export_failed') if error else tr('export_done'))
+        return False
+
     def refresh_clicks(self) -> None:
         kbd, ms = get_counts()
         self.keyboard_check.set_label(f"{tr('keyboard_clicks')}: {kbd}")
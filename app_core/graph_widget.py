@@ -0,0 +1,742 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Deque, Iterable, List, Optional, Sequence, Tuple
+
+import cairo
+from gi.repository import Gtk
+
+from .heatmap import heatmap_levels, heatmap_pixels
+from .history import MetricHistory
+from .localization import get_language, tr
+from .metric_graphs import MetricDescriptor
+
+if TYPE_CHECKING:
+    from .app import SystemTrayApp
+
+BACKGROUND_RGB = (0.09, 0.09, 0.09)
+GRID_RGB = (0.2, 0.2, 0.2)
+GRID_LINES = 5
+
+Rect = Tuple[float, float, float, float]  # x, y, width, height
+
+
+def _text_width(text_extents) -> float:
+    """Return cairo text extents width for both object- and tuple-based APIs."""
+    width = getattr(text_extents, "width", None)
+    if width is not None:
+        return float(width)
+    try:
+        # tuple API: (x_bearing, y_bearing, width, height, x_advance, y_advance)
+        return float(text_extents[2])
+    except Exception:
+        return 0.0
+
+
+def _clamp(value: float, min_value: float, max_value: float) -> float:
+    return max(min_value, min(max_value, value))
+
+
+def _pixel_rect(rect: Rect, pad: int = 2) -> Tuple[int, int, int, int]:
+    """Whole-pixel rectangle around ``rect`` for ``queue_draw_area`` (antialiasing spills a pixel)."""
+    x, y, w, h = rect
+    left = int(math.floor(x)) - pad
+    top = int(math.floor(y)) - pad
+    return left, top, int(math.ceil(x + w)) + pad - left, int(math.ceil(y + h)) + pad - top
+
+
+def _tooltip_origin(hover_x: float, hover_y: float, box_w: float, box_h: float,
+                    width: float, height: float) -> Tuple[float, float]:
+    return (
+        _clamp(hover_x + 12, 4.0, max(4.0, width - box_w - 4)),
+        _clamp(hover_y + 12, 4.0, max(4.0, height - box_h - 4)),
+    )
+
+
+class PlotArea:
+    """Pixel layout of a graph: the plot rectangle inside the widget margins."""
+
+    __slots__ = ('width', 'height', 'left', 'top', 'plot_w', 'plot_h', 'margin_right')
+
+    def __init__(self, width: int, height: int, left: float, top: float = 16, right: float = 16, bottom: float = 36):
+        self.width = width
+        self.height = height
+        self.left = left
+        self.top = top
+        self.margin_right = right
+        self.plot_w = max(10, width - left - right)
+        self.plot_h = max(10, height - top - bottom)
+
+
+def draw_no_data(widget, cr, message: str) -> None:
+    width = widget.get_allocated_width()
+    height = widget.get_allocated_height()
+
+    cr.set_source_rgb(*BACKGROUND_RGB)
+    cr.paint()
+
+    cr.select_font_face("Sans", 0, 0)
+    cr.set_font_size(14)
+    cr.set_source_rgb(0.78, 0.78, 0.78)
+    ext = cr.text_extents(message)
+    x = max(8, (width - _text_width(ext)) / 2)
+    y = max(20, height / 2)
+    cr.move_to(x, y)
+    cr.show_text(message)
+
+
+def draw_time_axis(cr, plot: PlotArea, first_ts: float, last_ts: float) -> None:
+    """Start and end time under the plot."""
+    start_ts = datetime.fromtimestamp(first_ts).strftime("%H:%M:%S")
+    end_ts = datetime.fromtimestamp(last_ts).strftime("%H:%M:%S")
+
+    cr.set_source_rgb(0.75, 0.75, 0.75)
+    cr.set_font_size(11)
+    cr.move_to(plot.left, plot.height - 10)
+    cr.show_text(f"◀ {start_ts}")
+
+    end_text = f"{end_ts} ▶"
+    text_extents = cr.text_extents(end_text)
+    cr.move_to(plot.width - plot.margin_right - _text_width(text_extents), plot.height - 10)
+    cr.show_text(end_text)
+
+
+def draw_hover_info(cr,
+                    state: Optional[dict],
+                    plot: PlotArea,
+                    locate: Callable[[float], Optional[Tuple[float, List[str]]]]) -> List[Rect]:
+    """Crosshair and tooltip under the pointer; returns the rectangles painted.
+
+    ``locate(hover_x)`` returns the x of the sample to mark and the tooltip
+    lines, or None when there is nothing to show.
+    """
+    if not state or state.get('hovering', 0.0) < 0.5:
+        return []
+
+    width = plot.width
+    height = plot.height
+    hover_x = _clamp(float(state.get('hover_x', 0.0)), 0.0, float(width))
+    hover_y = _clamp(float(state.get('hover_y', 0.0)), 0.0, float(height))
+
+    left = plot.left
+    right = plot.left + plot.plot_w
+    top = plot.top
+    bottom = plot.top + plot.plot_h
+    if hover_x < left or hover_x > right or hover_y < top or hover_y > bottom:
+        return []
+
+    found = locate(hover_x)
+    if found is None or not found[1]:
+        return []
+    point_x = _clamp(found[0], left, right)
+    lines = found[1]
+
+    cr.set_source_rgba(1.0, 1.0, 1.0, 0.22)
+    cr.set_line_width(1)
+    cr.move_to(point_x, top)
+    cr.line_to(point_x, bottom)
+    cr.stroke()
+
+    cr.select_font_face("Sans", 0, 0)
+    cr.set_font_size(11)
+    padding = 6
+    line_height = 14
+    max_w = 0.0
+    for line in lines:
+        max_w = max(max_w, _text_width(cr.text_extents(line)))
+
+    box_w = max_w + padding * 2
+    box_h = line_height * len(lines) + padding * 2
+    box_x, box_y = _tooltip_origin(hover_x, hover_y, box_w, box_h, width, height)
+
+    cr.set_source_rgba(0.05, 0.05, 0.05, 0.88)
+    cr.rectangle(box_x, box_y, box_w, box_h)
+    cr.fill()
+
+    cr.set_source_rgb(0.96, 0.96, 0.96)
+    for i, line in enumerate(lines):
+        cr.move_to(box_x + padding, box_y + padding + line_height * (i + 1) - 3)
+        cr.show_text(line)
+    return [(point_x - 0.5, top, 1.0, bottom - top), (box_x, box_y, box_w, box_h)]
+
+
+class ScrollingCanvas:
+    """Persistent layer with the plotted lines of a ``MetricGraph``.
+
+    Time maps to x with ``end_ts`` on the right plot edge. While the visible
+    window keeps its length, ``scroll`` shifts the pixels left by whole pixels
+    (a copy into a spare surface) and only the rows that arrived since the
+    previous frame are stroked, so a tick costs the same however many samples
+    the window holds. ``peaks`` keeps one max row per pixel column, enough to
+    re-check auto y ranges without rescanning the history.
+    """
+
+    def __init__(self, plot: PlotArea, scale: int):
+        self.plot = plot
+        self.scale = scale
+        self.surface = self._new_surface()
+        self._spare = None
+        self.colors: tuple = ()
+        self.tops: tuple = ()
+        self.window = 1.0
+        self.end_ts = 0.0
+        self.resolution = 0.0
+        self.last_row: Optional[tuple] = None
+        self.peaks: Deque[Tuple[int, tuple]] = deque()
+
+    def _new_surface(self):
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, self.plot.width * self.scale, self.plot.height * self.scale)
+        surface.set_device_scale(self.scale, self.scale)
+        return surface
+
+    def fits(self, plot: PlotArea, scale: int) -> bool:
+        return (plot.width, plot.height, plot.left, scale) == (self.plot.width, self.plot.height, self.plot.left, self.scale)
+
+    def follows(self, window: float, slack: float) -> bool:
+        """True while ``window`` differs from the drawn one by at most ``slack`` seconds or half a pixel.
+
+        The history span jitters by a sample as rollup buckets roll over, which
+        would otherwise force a full redraw every few ticks.
+        """
+        return abs(window - self.window) <= max(slack, self.window / self.plot.plot_w / 2)
+
+    @property
+    def px_per_sec(self) -> float:
+        return self.plot.plot_w / self.window
+
+    def reset(self, colors: tuple, window: float, end_ts: float, resolution: float) -> None:
+        cr = cairo.Context(self.surface)
+        cr.set_operator(cairo.OPERATOR_CLEAR)
+        cr.paint()
+        self.colors = colors
+        self.window = window
+        self.end_ts = end_ts
+        self.resolution = resolution
+        self.last_row = None
+        self.peaks.clear()
+
+    def track(self, rows: Iterable[tuple]) -> None:
+        px_per_sec = self.px_per_sec
+        peaks = self.peaks
+        for row in rows:
+            column = int(row[0] * px_per_sec)
+            if peaks and peaks[-1][0] == column:
+                peaks[-1] = (column, tuple(map(max, peaks[-1][1], row)))
+            else:
+                peaks.append((column, tuple(row)))
+
+    def expire(self, start_ts: float) -> None:
+        while self.peaks and self.peaks[0][1][0] < start_ts:
+            self.peaks.popleft()
+
+    def scroll(self, pixels: int) -> None:
+        spare = self._spare or self._new_surface()
+        cr = cairo.Context(spare)
+        cr.set_operator(cairo.OPERATOR_SOURCE)
+        cr.set_source_surface(self.surface, -pixels, 0)
+        cr.paint()
+        self.surface, self._spare = spare, self.surface
+        self.end_ts += pixels / self.px_per_sec
+
+    def stroke(self, rows: Sequence[tuple], columns: Sequence[int]) -> None:
+        plot = self.plot
+        right = plot.left + plot.plot_w
+        px_per_sec = self.px_per_sec
+        cr = cairo.Context(self.surface)
+        cr.set_line_width(2)
+        for column, top, color in zip(columns, self.tops[1:], self.colors):
+            cr.set_source_rgb(*color)
+            for idx, row in enumerate(rows):
+                x = right - (self.end_ts - row[0]) * px_per_sec
+                y = plot.top + plot.plot_h * (1.0 - (row[column] / top))
+                if idx == 0:
+                    cr.move_to(x, y)
+                else:
+                    cr.line_to(x, y)
+            cr.stroke()
+        self.last_row = rows[-1]
+
+    def blit(self, cr) -> None:
+        # Lines spill one pixel past the plot; anything scrolled into the margins stays hidden.
+        plot = self.plot
+        cr.save()
+        cr.rectangle(plot.left - 1, 0, plot.plot_w + 2, plot.height)
+        cr.clip()
+        cr.set_source_surface(self.surface, 0, 0)
+        cr.paint()
+        cr.restore()
+
+
+class MetricGraph:
+    """Graph window of one metric, drawn from its ``MetricDescriptor``.
+
+    Window lifecycle, zoom wiring, grid, axis, legend, time axis and hover are
+    shared by every metric, so drawing changes apply to all graphs at once.
+    Zoom/pan state and the zoom event handlers stay on the app
+    (``graph_zoom_state``), like the history the graph reads.
+    """
+
+    WINDOW_SIZE = (720, 380)
+    AREA_SIZE = (680, 320)
+    MAX_FPS = 30
+
+    def __init__(self, app: "SystemTrayApp", key: str, descriptor: Optional[MetricDescriptor] = None):
+        self.app = app
+        self.key = key
+        self.descriptor = descriptor
+        self.window: Optional[Gtk.Window] = None
+        self.area: Optional[Gtk.DrawingArea] = None
+        self._background = None
+        self._background_key: Optional[tuple] = None
+        self.background_renders = 0
+        self._canvas: Optional[ScrollingCanvas] = None
+        self.canvas_renders = 0
+        self.canvas_scrolls = 0
+        self._redraw_pending = False
+        self._damage: Optional[List[Rect]] = []  # None: the whole area
+        self._last_frame = 0.0
+        self._hover_rects: List[Rect] = []
+
+    @property
+    def watched(self) -> Tuple[str, ...]:
+        return self.descriptor.watched
+
+    def history(self) -> Optional[MetricHistory]:
+        return getattr(self.app, self.descriptor.history)
+
+    def title(self) -> str:
+        return f"{self.descriptor.title()} — {tr('system_status')}"
+
+    def show(self, _w=None) -> None:
+        if self.window and self.window.get_visible():
+            self.window.present()
+            return
+
+        window = Gtk.Window(title=self.title())
+        window.set_default_size(*self.WINDOW_SIZE)
+        window.set_border_width(10)
+
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        area = Gtk.DrawingArea()
+        area.set_size_request(*self.AREA_SIZE)
+        area.connect("draw", self.draw)
+        self.app._connect_graph_zoom(area, self.key)
+        self.app._maybe_add_graph_zoom_controls(box, self.key, area)
+        box.pack_start(area, True, True, 0)
+
+        window.add(box)
+        window.connect("destroy", self._on_destroy)
+
+        self.window = window
+        self.area = area
+        window.show_all()
+
+    def _on_destroy(self, _w) -> None:
+        self.window = None
+        self.area = None
+        self.invalidate_background()
+        self._canvas = None
+        self._redraw_pending = False
+        self._damage = []
+        self._hover_rects = []
+
+    def destroy(self) -> None:
+        if self.window:
+            try:
+                self.window.destroy()
+            except Exception:
+                pass
+        self._on_destroy(None)
+
+    def refresh_texts(self) -> None:
+        self.invalidate_background()
+        if self.window:
+            self.window.set_title(self.title())
+        if self.area:
+            self.area.queue_draw()
+
+    def invalidate_background(self) -> None:
+        self._background = None
+        self._background_key = None
+
+    def _blit_background(self, widget, cr, plot: PlotArea, key: tuple, paint: Callable) -> None:
+        """Paint the static chrome (background, grid, axis labels, legend) from an offscreen surface.
+
+        The surface is rendered by ``paint(context, plot)`` only when the widget
+        size, scale factor, language or ``key`` (colours, axis labels) changed,
+        so text measurement and font selection stay out of the per-frame cost.
+        """
+        scale = max(1, int(widget.get_scale_factor()))
+        key = (plot.width, plot.height, scale, get_language(), *key)
+        if self._background is None or self._background_key != key:
+            surface = cairo.ImageSurface(cairo.FORMAT_RGB24, plot.width * scale, plot.height * scale)
+            surface.set_device_scale(scale, scale)
+            paint(cairo.Context(surface), plot)
+            surface.flush()
+            self._background = surface
+            self._background_key = key
+            self.background_renders += 1
+        cr.set_source_surface(self._background, 0, 0)
+        cr.paint()
+
+    def queue_draw(self, *rects: Rect) -> None:
+        """Request a redraw of ``rects``, or of the whole area when none are given.
+
+        Requests are merged and flushed from a frame-clock tick at most
+        ``MAX_FPS`` times per second, so sampler ticks, zoom steps and pointer
+        motion arriving within one frame cost a single draw.
+        """
+        if not self.area:
+            return
+        if not rects:
+            self._damage = None
+        elif self._damage is not None:
+            self._damage.extend(rects)
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.area.add_tick_callback(self._on_frame_tick)
+
+    def _on_frame_tick(self, area, frame_clock) -> bool:
+        now = frame_clock.get_frame_time() / 1_000_000
+        # 10% slack so frame-time jitter on a 60 Hz clock does not halve the rate.
+        if now - self._last_frame < 0.9 / self.MAX_FPS:
+            return True
+        self._last_frame = now
+        self._redraw_pending = False
+        damage, self._damage = self._damage, []
+        if damage is None:
+            area.queue_draw()
+        else:
+            for rect in damage:
+                area.queue_draw_area(*_pixel_rect(rect))
+        return False
+
+    def queue_hover_draw(self) -> None:
+        """Redraw only the crosshair and tooltip: where they were painted and around the pointer now."""
+        rects = list(self._hover_rects)
+        state = self.app.graph_zoom_state.get(self.key) or {}
+        if self.area and state.get('hovering', 0.0) >= 0.5:
+            width = self.area.get_allocated_width()
+            height = self.area.get_allocated_height()
+            hover_x = float(state.get('hover_x', 0.0))
+            hover_y = float(state.get('hover_y', 0.0))
+            rects.append((hover_x - 0.5, 0.0, 1.0, float(height)))
+            if len(self._hover_rects) == 2:
+                _x, _y, box_w, box_h = self._hover_rects[1]
+                rects.append((*_tooltip_origin(hover_x, hover_y, box_w, box_h, width, height), box_w, box_h))
+        if rects:
+            self.queue_draw(*rects)
+
+    def _track_hover(self, widget, cr, rects: List[Rect]) -> None:
+        """Remember the painted hover rectangles and damage whatever part of them the clip cut off.
+
+        ``queue_hover_draw`` only guesses where the crosshair snaps and how wide
+        the tooltip gets; a wrong guess is repainted on the next frame.
+        """
+        self._hover_rects = rects
+        x1, y1, x2, y2 = cr.clip_extents()
+        width = widget.get_allocated_width()
+        height = widget.get_allocated_height()
+        missed = []
+        for x, y, w, h in rects:
+            left, top = max(0.0, x), max(0.0, y)
+            right, bottom = min(float(width), x + w), min(float(height), y + h)
+            if left < x1 or top < y1 or right > x2 or bottom > y2:
+                missed.append((left, top, right - left, bottom - top))
+        if missed:
+            self.queue_draw(*missed)
+
+    def samples(self, width: int) -> Sequence[tuple]:
+        history = self.history()
+        with history.lock:
+            return self.app._decimate_samples(
+                self.app._visible_samples(self.key, history, width), max(200, width * 2)
+            )
+
+    def draw(self, widget, cr) -> None:
+        d = self.descriptor
+        plot = PlotArea(widget.get_allocated_width(), widget.get_allocated_height(), d.margin_left)
+        scale = max(1, int(widget.get_scale_factor()))
+        colors = tuple(self.app._graph_line_color_rgb(series.color_key) for series in d.series)
+
+        history = self.history()
+        with history.lock:
+            visible = self.app._visible_range(self.key, history)
+            resolution = history.resolution(visible[0], visible[1], plot.width) if visible else 0.0
+            scrolled = visible is not None and self._scroll_canvas(plot, scale, colors, history, visible, resolution)
+        if not scrolled and not self._render_canvas(plot, scale, colors, visible, resolution):
+            self._canvas = None
+            self._hover_rects = []
+            draw_no_data(widget, cr, 'No data yet…')
+            return
+
+        canvas = self._canvas
+        y_max = canvas.tops[0]
+        axis_labels = tuple(d.axis_label(y_max * (1 - i / (GRID_LINES - 1))) for i in range(GRID_LINES))
+        self._blit_background(
+            widget, cr, plot, (colors, axis_labels),
+            lambda bg, area: self._paint_chrome(bg, area, colors, axis_labels),
+        )
+        canvas.blit(cr)
+
+        summary = d.summary(canvas.last_row)
+        cr.set_source_rgb(0.95, 0.95, 0.95)
+        cr.set_font_size(12)
+        ext = cr.text_extents(summary)
+        cr.move_to(plot.width - plot.margin_right - _text_width(ext), 12)
+        cr.show_text(summary)
+
+        hover_rects = draw_hover_info(
+            cr, self.app.graph_zoom_state.get(self.key), plot, lambda hover_x: self._hover_at(plot, hover_x)
+        )
+        self._track_hover(widget, cr, hover_rects)
+        draw_time_axis(cr, plot, canvas.end_ts - canvas.window, canvas.end_ts)
+
+    def _hover_at(self, plot: PlotArea, hover_x: float) -> Optional[Tuple[float, List[str]]]:
+        """Tooltip for the real sample nearest to the time under ``hover_x``.
+
+        Binary search on the finest history level still holding that time, so a
+        motion event costs O(log n) and sees raw values even where the screen
+        shows decimated points or a gap. The min/max of the rows under that
+        pixel column are added when they differ.
+        """
+        d = self.descriptor
+        canvas = self._canvas
+        right = plot.left + plot.plot_w
+        px_per_sec = canvas.px_per_sec
+        timestamp = canvas.end_ts - (right - hover_x) / px_per_sec
+        half = 0.5 / px_per_sec
+
+        history = self.history()
+        with history.lock:
+            view = history.finest(timestamp)
+            row = view.nearest(timestamp)
+            if row is None:
+                return None
+            bucket = view.between(timestamp - half, timestamp + half)
+            spreads = [
+                (series, min(bucket.column(series.column, 'min')), max(bucket.column(series.column, 'max')))
+                for series in d.series
+            ] if bucket else []
+
+        lines = list(d.hover(row))
+        for series, low, high in spreads:
+            label = series.value_label or d.axis_label
+            if label(low) != label(high):
+                lines.append(f"{series.legend()}: {label(low)} – {label(high)}")
+        return right - (canvas.end_ts - row[0]) * px_per_sec, lines
+
+    def _series_tops(self, rows: Sequence[tuple]) -> tuple:
+        """Axis top followed by the top of every series (own scale or the axis)."""
+        y_max = self.descriptor.y_max(rows)
+        return (y_max, *(series.y_max(rows) if series.y_max else y_max for series in self.descriptor.series))
+
+    def _scroll_canvas(self, plot: PlotArea, scale: int, colors: tuple, history: MetricHistory,
+                       visible: Tuple[float, float], resolution: float) -> bool:
+        """Advance the canvas by the raw rows that arrived since the last frame (history lock held).
+
+        Returns False when the previous frame cannot be reused: new size or
+        colours, zoom or pan changing the window length, rows served by a
+        rollup tier, or a y range that moved.
+        """
+        canvas = self._canvas
+        start, end = visible
+        if (canvas is None or canvas.last_row is None or not canvas.fits(plot, scale)
+                or canvas.colors != colors or not canvas.follows(end - start, history.sample_interval) or end < canvas.end_ts
+                or not resolution == canvas.resolution == history.sample_interval):
+            return False
+
+        rows = list(history.view().between(canvas.last_row[0], end))
+        canvas.track(rows)
+        canvas.expire(start)
+        if not canvas.peaks or self._series_tops([peak for _column, peak in canvas.peaks]) != canvas.tops:
+            return False
+
+        pixels = int((end - canvas.end_ts) * canvas.px_per_sec)
+        if pixels > 0:
+            canvas.scroll(pixels)
+        if len(rows) > 1:
+            canvas.stroke(rows, [series.column for series in self.descriptor.series])
+        self.canvas_scrolls += 1
+        return True
+
+    def _render_canvas(self, plot: PlotArea, scale: int, colors: tuple,
+                       visible: Optional[Tuple[float, float]], resolution: float) -> bool:
+        """Redraw every visible line from the decimated samples; False when there is nothing to draw."""
+        samples = self.samples(plot.width)
+        if not samples or visible is None:
+            return False
+        start, end = visible
+        window = end - start
+        if window <= 0:
+            window = self.history().sample_interval
+        if len(samples) == 1:
+            samples = [(end - window, *samples[0][1:]), samples[0]]
+
+        canvas = self._canvas
+        if canvas is None or not canvas.fits(plot, scale):
+            canvas = self._canvas = ScrollingCanvas(plot, scale)
+        canvas.reset(colors, window, end, resolution)
+        canvas.track(samples)
+        canvas.tops = self._series_tops(samples)
+        canvas.stroke(samples, [series.column for series in self.descriptor.series])
+        self.canvas_renders += 1
+        return True
+
+    def _paint_chrome(self, cr, plot: PlotArea, colors: Sequence, axis_labels: Sequence[str]) -> None:
+        cr.set_source_rgb(*BACKGROUND_RGB)
+        cr.paint()
+
+        cr.set_source_rgb(*GRID_RGB)
+        for i in range(GRID_LINES):
+            y = plot.top + (plot.plot_h * i / (GRID_LINES - 1))
+            cr.move_to(plot.left, y)
+            cr.line_to(plot.left + plot.plot_w, y)
+        cr.stroke()
+
+        cr.select_font_face("Sans", 0, 0)
+        cr.set_font_size(10)
+        cr.set_source_rgb(*self.descriptor.axis_rgb)
+        for i, label in enumerate(axis_labels):
+            y = plot.top + (plot.plot_h * i / (GRID_LINES - 1))
+            text_extents = cr.text_extents(label)
+            cr.move_to(max(2, plot.left - _text_width(text_extents) - 6), y + 4)
+            cr.show_text(label)
+
+        self._draw_legend(cr, plot, colors)
+
+    def _draw_legend(self, cr, plot: PlotArea, colors) -> None:
+        cr.select_font_face("Sans", 0, 0)
+        cr.set_font_size(12)
+        x = plot.left
+        for series, color in zip(self.descriptor.series, colors):
+            text = series.legend()
+            cr.set_source_rgb(*color)
+            cr.rectangle(x, 4, 12, 8)
+            cr.fill()
+            cr.set_source_rgb(*series.legend_rgb)
+            cr.move_to(x + 18, 12)
+            cr.show_text(text)
+            x += 18 + _text_width(cr.text_extents(text)) + 24
+
+
+class HeatmapGraph(MetricGraph):
+    """Graph window of a metric family: one heatmap row per series."""
+
+    WINDOW_SIZE = (720, 420)
+    AREA_SIZE = (680, 360)
+
+    def __init__(self, app: "SystemTrayApp", key: str):
+        super().__init__(app, key)
+        self._levels_key: Optional[tuple] = None
+        self._levels: Optional[tuple] = None
+
+    @property
+    def watched(self) -> Tuple[str, ...]:
+        return self.key,
+
+    def history(self) -> Optional[MetricHistory]:
+        family = self.app.family_histories.get(self.key)
+        return family.history if family is not None and len(family) else None
+
+    def title(self) -> str:
+        return f"{self.app._family_label(self.key)} — {tr('system_status')}"
+
+    def draw(self, widget, cr) -> None:
+        """Draw one heatmap row per series, painted as a single image so cost does not grow per series."""
+        family_key = self.key
+        plot = PlotArea(widget.get_allocated_width(), widget.get_allocated_height(), 110, top=24)
+        plot_w, plot_h = plot.plot_w, plot.plot_h
+
+        history = self.history()
+        if history is None:
+            self._hover_rects = []
+            draw_no_data(widget, cr, 'No data yet…')
+            return
+
+        percent = family_key != 'net_ifaces'
+        state = self.app.graph_zoom_state.get(family_key) or {}
+        with history.lock:
+            # Hover and partial redraws reuse the levels until new rows arrive or the zoom changes.
+            levels_key = (history, len(history), history.last(), plot_w, state.get('scale'), state.get('center'))
+            if levels_key != self._levels_key:
+                view = self.app._visible_samples(family_key, history, plot_w)
+                levels, scale = heatmap_levels(view, plot_w, 100.0 if percent else None)
+                self._levels = (view.fields, levels, scale, heatmap_pixels(levels), view.column(0).tolist())
+                self._levels_key = levels_key
+            fields, levels, scale, (pixels, stride), timestamps = self._levels
+        if not levels:
+            self._hover_rects = []
+            draw_no_data(widget, cr, 'No data yet…')
+            return
+
+        columns = len(levels[0])
+        rows = len(levels)
+        row_h = plot_h / rows
+
+        def series_label(name: str) -> str:
+            if name.endswith('.recv'):
+                return f"{name[:-5]} ↓"
+            if name.endswith('.sent'):
+                return f"{name[:-5]} ↑"
+            return name
+
+        def paint_chrome(bg, area: PlotArea) -> None:
+            bg.set_source_rgb(*BACKGROUND_RGB)
+            bg.paint()
+            # Label at most one row per 12 px, so text cost is bounded by height, not by series.
+            step = max(1, int(12 / row_h + 0.999))
+            bg.select_font_face("Sans", 0, 0)
+            bg.set_font_size(10)
+            bg.set_source_rgb(0.78, 0.82, 0.88)
+            for idx in range(0, rows, step):
+                label = series_label(fields[idx])
+                if len(label) > 16:
+                    label = "…" + label[-15:]
+                text_extents = bg.text_extents(label)
+                bg.move_to(max(2, area.left - _text_width(text_extents) - 6), area.top + row_h * (idx + 0.5) + 4)
+                bg.show_text(label)
+            bg.set_source_rgb(0.95, 0.95, 0.95)
+            bg.set_font_size(12)
+            bg.move_to(area.left, 16)
+            bg.show_text(f"{self.app._family_label(family_key)} ({rows})")
+
+        self._blit_background(widget, cr, plot, tuple(fields), paint_chrome)
+
+        surface = cairo.ImageSurface.create_for_data(pixels, cairo.FORMAT_ARGB32, columns, rows, stride)
+        cr.save()
+        cr.translate(plot.left, plot.top)
+        cr.scale(plot_w / columns, plot_h / rows)
+        cr.set_source_surface(surface, 0, 0)
+        cr.get_source().set_filter(cairo.FILTER_NEAREST)
+        cr.rectangle(0, 0, columns, rows)
+        cr.fill()
+        cr.restore()
+
+        unit = "%" if percent else f" {tr('mbps')}"
+        scale_text = f"0 – {scale:.0f}{unit}" if percent else f"0 – {scale:.1f}{unit}"
+        cr.select_font_face("Sans", 0, 0)
+        cr.set_source_rgb(0.95, 0.95, 0.95)
+        cr.set_font_size(12)
+        ext = cr.text_extents(scale_text)
+        cr.move_to(plot.width - plot.margin_right - _text_width(ext), 16)
+        cr.show_text(scale_text)
+
+        size = len(timestamps)
+
+        def locate(hover_x: float) -> Tuple[float, List[str]]:
+            # Heatmap columns are equal shares of the visible rows, so the column is proportional.
+            ratio = _clamp((hover_x - plot.left) / plot_w, 0.0, 1.0)
+            col = int(round(ratio * (columns - 1)))
+            row = int(_clamp((float(state.get('hover_y', 0.0)) - plot.top) / row_h, 0, rows - 1))
+            value = levels[row][col] * scale / 255.0
+            return plot.left + plot_w * col / max(1, columns - 1), [
+                datetime.fromtimestamp(timestamps[(size * col) // columns]).strftime("%H:%M:%S"),
+                f"{series_label(fields[row])}: {value:.1f}{unit}",
+            ]
+
+        hover_rects = draw_hover_info(cr, state, plot, locate)
+        self._track_hover(widget, cr, hover_rects)
+        draw_time_axis(cr, plot, timestamps[0], timestamps[-1])
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as _np
+except ImportError:  # slow pure-Python fallback; numpy is in requirements.txt
+    _np = None
+
+# Gradient stops (level, r, g, b) from idle to saturated.
+_GRADIENT = (
+    (0, 0.09, 0.11, 0.20),
+    (64, 0.10, 0.35, 0.65),
+    (128, 0.10, 0.75, 0.70),
+    (192, 0.95, 0.85, 0.20),
+    (255, 0.95, 0.25, 0.15),
+)
+
+
+def heatmap_palette() -> List[bytes]:
+    """256 premultiplied ARGB32 pixels (native little-endian byte order) for levels 0..255."""
+    palette = []
+    for level in range(256):
+        for (lo, *lo_rgb), (hi, *hi_rgb) in zip(_GRADIENT, _GRADIENT[1:]):
+            if lo <= level <= hi:
+                t = (level - lo) / float(hi - lo)
+                r, g, b = (a + (c - a) * t for a, c in zip(lo_rgb, hi_rgb))
+                break
+        palette.append(bytes((int(b * 255), int(g * 255), int(r * 255), 255)))
+    return palette
+
+
+PALETTE = heatmap_palette()
+
+
+def heatmap_levels(view, columns: int, max_value: Optional[float] = None) -> Tuple[List[bytes], float]:
+    """Reduce every series of a HistoryView to ``columns`` peak levels (0..255).
+
+    Rows are bucketed by index like the line graphs; each cell keeps the bucket
+    maximum (rollup views use their max column), so short spikes stay visible.
+    ``max_value`` fixes the scale (percentages); otherwise the largest value
+    in the view is used. Returns one ``bytes`` row per series and the scale.
+    """
+    size = len(view)
+    series = len(view.fields)
+    columns = max(1, min(int(columns), size))
+    if size == 0 or series == 0:
+        return [], float(max_value or 0.0)
+    bounds = [(size * i) // columns for i in range(columns + 1)]
+
+    if _np is not None:
+        data = _np.empty((series, size), dtype=_np.float64)
+        for idx in range(series):
+            data[idx] = view.array(idx + 1, 'max')
+        peaks = _np.maximum.reduceat(data, bounds[:-1], axis=1)
+        scale = float(max_value) if max_value else float(peaks.max(initial=0.0))
+        if scale <= 0:
+            scale = 1.0
+        levels = _np.clip(peaks * 255.0 / scale, 0, 255).astype(_np.uint8)
+        return [row.tobytes() for row in levels], scale
+
+    peaks_rows = []
+    for idx in range(series):
+        values = view.column(idx + 1, 'max').tolist()
+        peaks_rows.append([max(values[bounds[col]:bounds[col + 1]]) for col in range(columns)])
+    scale = float(max_value) if max_value else max((max(row) for row in peaks_rows), default=0.0)
+    if scale <= 0:
+        scale = 1.0
+    rows = [bytes(min(255, max(0, int(value * 255.0 / scale))) for value in row) for row in peaks_rows]
+    return rows, scale
+
+
+def heatmap_pixels(levels: Sequence[bytes], palette: Sequence[bytes] = PALETTE) -> Tuple[bytearray, int]:
+    """Map level rows to an ARGB32 pixel buffer; returns ``(buffer, stride)``."""
+    if not levels:
+        return bytearray(), 0
+    width = len(levels[0])
+    stride = width * 4
+    if _np is not None:
+        lut = _np.frombuffer(b''.join(palette), dtype=_np.uint32)
+        pixels = lut[_np.frombuffer(b''.join(levels), dtype=_np.uint8)]
+        return bytearray(pixels.tobytes()), stride
+    return bytearray(b''.join(b''.join(palette[v] for v in row) for row in levels)), stride
@@ -0,0 +1,564 @@
+from __future__ import annotations
+
+import math
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as _np
+except ImportError:  # slow pure-Python fallback; numpy is in requirements.txt
+    _np = None
+
+# Rollup tiers kept next to the raw samples, in seconds per row.
+ROLLUP_RESOLUTIONS = (10, 60, 600)
+# Order of the per-field aggregate groups in a rollup row.
+ROLLUP_STATS = ('mean', 'min', 'max', 'last')
+# Upper bound of rows per level: 8 hours of 1-second samples.
+RAW_POINTS_MAX = 8 * 60 * 60
+
+
+def _allocate(size: int, typecode: str = 'd') -> array:
+    return array(typecode, bytes(array(typecode).itemsize * size))
+
+
+class HistoryView:
+    """Read-only window over a contiguous range of a MetricHistory.
+
+    Rows are returned as ``(timestamp, value1, value2, ...)`` tuples, columns as
+    zero-copy memoryviews. Views over a rollup tier carry the per-field ``stats``
+    columns as well; their rows hold the bucket means. A view is valid until the
+    next append to its history.
+    """
+
+    __slots__ = ('_columns', '_start', '_stop', 'fields', 'stats')
+
+    def __init__(self,
+                 columns: Sequence[array],
+                 start: int,
+                 stop: int,
+                 fields: Tuple[str, ...],
+                 stats: Tuple[str, ...] = ()):
+        self._columns = columns
+        self._start = start
+        self._stop = max(start, stop)
+        self.fields = fields
+        self.stats = stats
+
+    def _slice(self, start: int, stop: int) -> "HistoryView":
+        return HistoryView(self._columns, start, stop, self.fields, self.stats)
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __bool__(self) -> bool:
+        return self._stop > self._start
+
+    def __getitem__(self, key: Union[int, slice]):
+        size = self._stop - self._start
+        if isinstance(key, slice):
+            start, stop, step = key.indices(size)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self._slice(self._start + start, self._start + max(start, stop))
+        index = int(key)
+        if index < 0:
+            index += size
+        if index < 0 or index >= size:
+            raise IndexError("history index out of range")
+        pos = self._start + index
+        return tuple(col[pos] for col in self._columns[:len(self.fields) + 1])
+
+    def __iter__(self) -> Iterator[tuple]:
+        columns = [memoryview(col)[self._start:self._stop] for col in self._columns[:len(self.fields) + 1]]
+        return zip(*columns)
+
+    def _column_index(self, index: int, stat: Optional[str]) -> int:
+        if stat is None or index == 0 or not self.stats:
+            return index
+        return index + self.stats.index(stat) * len(self.fields)
+
+    def column(self, index: int, stat: Optional[str] = None) -> memoryview:
+        """Return column ``index`` (0 = timestamps) without copying.
+
+        ``stat`` picks an aggregate (``'min'``, ``'max'``, ...) on rollup views; raw
+        views return the samples themselves, which are their own min and max.
+        """
+        return memoryview(self._columns[self._column_index(index, stat)])[self._start:self._stop]
+
+    def array(self, index: int, stat: Optional[str] = None):
+        """Return column ``index`` as a zero-copy numpy array, or a memoryview without numpy."""
+        if _np is None:
+            return self.column(index, stat)
+        col = self._columns[self._column_index(index, stat)]
+        return _np.frombuffer(col, dtype=col.typecode)[self._start:self._stop]
+
+    @property
+    def timestamps(self) -> memoryview:
+        return self.column(0)
+
+    def between(self, start_ts: float, end_ts: float) -> "HistoryView":
+        """Return the sub-view with ``start_ts <= timestamp <= end_ts`` using binary search."""
+        ts = self.column(0)
+        lo = bisect_left(ts, start_ts)
+        hi = bisect_right(ts, end_ts, lo)
+        return self._slice(self._start + lo, self._start + hi)
+
+    def nearest(self, timestamp: float) -> Optional[tuple]:
+        """Return the row closest in time to ``timestamp`` using binary search, or None when empty."""
+        ts = self.column(0)
+        size = len(ts)
+        if not size:
+            return None
+        idx = bisect_left(ts, timestamp)
+        if idx == size or (idx > 0 and timestamp - ts[idx - 1] <= ts[idx] - timestamp):
+            idx -= 1
+        return self[idx]
+
+
+class RingBuffer:
+    """Preallocated columnar ring buffer: a timestamp column plus ``width - 1`` value columns.
+
+    Rows are kept contiguous so every window is a zero-copy slice; the buffer carries a
+    slack region and slides the live rows back to the front once it is exhausted, which
+    keeps appends amortized O(1).
+    """
+
+    def __init__(self, width: int, maxlen: int, typecode: str = 'd'):
+        self._typecodes = ('d',) + (typecode,) * (width - 1)
+        self._maxlen = max(1, int(maxlen))
+        self._capacity = self._maxlen + self._slack(self._maxlen)
+        self._columns = [_allocate(self._capacity, code) for code in self._typecodes]
+        self._start = 0
+        self._end = 0
+
+    @staticmethod
+    def _slack(maxlen: int) -> int:
+        return max(64, maxlen // 4)
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def nbytes(self) -> int:
+        return sum(col.itemsize * len(col) for col in self._columns)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def append(self, row: Sequence[float]) -> None:
+        if self._end >= self._capacity:
+            self._compact()
+        pos = self._end
+        for col, value in zip(self._columns, row):
+            col[pos] = value
+        self._end = pos + 1
+        if self._end - self._start > self._maxlen:
+            self._start += 1
+
+    def extend(self, columns: Sequence[Sequence[float]]) -> None:
+        """Append many rows given column-wise, keeping only the newest ``maxlen``."""
+        take = min(len(columns[0]), self._maxlen)
+        if take == 0:
+            return
+        keep = min(self._end - self._start, self._maxlen - take)
+        if self._end + take > self._capacity:
+            for col in self._columns:
+                col[0:keep] = col[self._end - keep:self._end]
+            self._start = 0
+            self._end = keep
+        pos = self._end
+        for col, values in zip(self._columns, columns):
+            col[pos:pos + take] = array(col.typecode, values[len(values) - take:])
+        self._end = pos + take
+        self._start = max(self._start, self._end - self._maxlen)
+
+    def replace_last(self, row: Sequence[float]) -> None:
+        pos = self._end - 1
+        for col, value in zip(self._columns, row):
+            col[pos] = value
+
+    def _compact(self) -> None:
+        size = self._end - self._start
+        if self._start == 0:
+            return
+        for col in self._columns:
+            col[0:size] = col[self._start:self._end]
+        self._start = 0
+        self._end = size
+
+    def resize(self, maxlen: int) -> None:
+        """Change capacity in place, keeping the newest rows."""
+        new_maxlen = max(1, int(maxlen))
+        if new_maxlen == self._maxlen:
+            return
+        keep = min(self._end - self._start, new_maxlen)
+        capacity = new_maxlen + self._slack(new_maxlen)
+        columns = []
+        for col, code in zip(self._columns, self._typecodes):
+            new_col = _allocate(capacity, code)
+            if keep:
+                new_col[0:keep] = col[self._end - keep:self._end]
+            columns.append(new_col)
+        self._columns = columns
+        self._maxlen = new_maxlen
+        self._capacity = capacity
+        self._start = 0
+        self._end = keep
+
+    def clear(self) -> None:
+        self._start = 0
+        self._end = 0
+
+    def view(self, fields: Tuple[str, ...], stats: Tuple[str, ...] = ()) -> HistoryView:
+        return HistoryView(self._columns, self._start, self._end, fields, stats)
+
+    def last(self, width: int) -> Optional[tuple]:
+        if self._end == self._start:
+            return None
+        pos = self._end - 1
+        return tuple(col[pos] for col in self._columns[:width])
+
+    def first_timestamp(self) -> Optional[float]:
+        if self._end == self._start:
+            return None
+        return self._columns[0][self._start]
+
+    def drop_before(self, timestamp: float) -> None:
+        """Forget rows older than ``timestamp``; O(1) when there is nothing to drop."""
+        ts = self._columns[0]
+        if self._end > self._start and ts[self._start] < timestamp:
+            self._start = bisect_left(ts, timestamp, self._start, self._end)
+
+
+class RollupTier:
+    """Fixed-resolution aggregate: one row per bucket with mean/min/max/last of every field.
+
+    The newest row is the open bucket and is rewritten in place on every sample, so
+    each append costs O(number of fields) and the tier is always up to date.
+    """
+
+    def __init__(self, fields: Tuple[str, ...], resolution: float, maxlen: int):
+        self.fields = fields
+        self.resolution = float(resolution)
+        self._rows = RingBuffer(1 + len(fields) * len(ROLLUP_STATS), maxlen, 'f')
+        self._bucket: Optional[int] = None
+        self._count = 0
+        self._sums: List[float] = []
+        self._mins: List[float] = []
+        self._maxs: List[float] = []
+
+    def add(self, timestamp: float, values: Sequence[float]) -> None:
+        bucket = int(timestamp // self.resolution)
+        if bucket != self._bucket:
+            self._bucket = bucket
+            self._count = 1
+            self._sums = list(values)
+            self._mins = list(values)
+            self._maxs = list(values)
+            self._rows.append((timestamp, *values, *values, *values, *values))
+            return
+
+        self._count += 1
+        for idx, value in enumerate(values):
+            self._sums[idx] += value
+            if value < self._mins[idx]:
+                self._mins[idx] = value
+            if value > self._maxs[idx]:
+                self._maxs[idx] = value
+        count = self._count
+        self._rows.replace_last(
+            (timestamp, *[total / count for total in self._sums], *self._mins, *self._maxs, *values)
+        )
+
+    def extend(self, columns: Sequence[Sequence[float]]) -> None:
+        """Fold column-wise rows into the tier, reducing whole buckets at a time."""
+        timestamps = columns[0]
+        values = columns[1:]
+        size = len(timestamps)
+        if size == 0:
+            return
+        resolution = self.resolution
+        starts = [0]
+        while True:
+            bucket = int(timestamps[starts[-1]] // resolution)
+            stop = bisect_left(timestamps, (bucket + 1) * resolution, starts[-1] + 1)
+            if stop >= size:
+                break
+            starts.append(stop)
+        stops = starts[1:] + [size]
+
+        counts = [stop - start for start, stop in zip(starts, stops)]
+        if _np is not None:
+            data = [_np.asarray(col, dtype=_np.float64) for col in values]
+            sums = [_np.add.reduceat(col, starts).tolist() for col in data]
+            mins = [_np.minimum.reduceat(col, starts).tolist() for col in data]
+            maxs = [_np.maximum.reduceat(col, starts).tolist() for col in data]
+        else:
+            spans = list(zip(starts, stops))
+            sums = [[sum(col[a:b]) for a, b in spans] for col in values]
+            mins = [[min(col[a:b]) for a, b in spans] for col in values]
+            maxs = [[max(col[a:b]) for a, b in spans] for col in values]
+        lasts = [[col[stop - 1] for stop in stops] for col in values]
+        bucket_ts = [timestamps[stop - 1] for stop in stops]
+
+        merge_open = int(timestamps[0] // resolution) == self._bucket
+        if merge_open:
+            counts[0] += self._count
+            for idx in range(len(values)):
+                sums[idx][0] += self._sums[idx]
+                mins[idx][0] = min(mins[idx][0], self._mins[idx])
+                maxs[idx][0] = max(maxs[idx][0], self._maxs[idx])
+
+        means = [[total / count for total, count in zip(col, counts)] for col in sums]
+        rows = [bucket_ts, *means, *mins, *maxs, *lasts]
+        if merge_open:
+            self._rows.replace_last([col[0] for col in rows])
+            rows = [col[1:] for col in rows]
+        if rows[0]:
+            self._rows.extend(rows)
+
+        self._bucket = int(timestamps[-1] // resolution)
+        self._count = counts[-1]
+        self._sums = [col[-1] for col in sums]
+        self._mins = [col[-1] for col in mins]
+        self._maxs = [col[-1] for col in maxs]
+
+    def resize(self, maxlen: int) -> None:
+        self._rows.resize(maxlen)
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self._bucket = None
+
+    @property
+    def nbytes(self) -> int:
+        return self._rows.nbytes
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def view(self) -> HistoryView:
+        return self._rows.view(self.fields, ROLLUP_STATS)
+
+    def first_timestamp(self) -> Optional[float]:
+        return self._rows.first_timestamp()
+
+    def drop_before(self, timestamp: float) -> None:
+        # A row carries its bucket's last timestamp, so the bucket holding ``timestamp`` stays.
+        self._rows.drop_before(timestamp)
+
+
+class MetricHistory:
+    """Raw samples of one metric plus incremental rollup tiers for long windows.
+
+    The window is ``maxlen * sample_interval`` seconds back from the newest
+    timestamp: every level drops rows older than that, so adaptive sampling gaps
+    or restored history never stretch it. Row counts only bound memory: the raw
+    level is capped at ``RAW_POINTS_MAX`` rows and the tiers cover the rest of
+    the window, for windows of days or weeks. ``view()`` returns the raw level,
+    ``select()`` the coarsest level that still resolves the requested range.
+    """
+
+    def __init__(self,
+                 fields: Sequence[str],
+                 maxlen: int,
+                 sample_interval: float = 1.0,
+                 resolutions: Sequence[float] = ROLLUP_RESOLUTIONS):
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.lock = threading.Lock()
+        self.sample_interval = float(sample_interval)
+        self._maxlen = max(1, int(maxlen))
+        self._raw = RingBuffer(len(self.fields) + 1, min(self._maxlen, RAW_POINTS_MAX))
+        self._tiers = [
+            RollupTier(self.fields, resolution, self._tier_len(resolution))
+            for resolution in sorted(resolutions)
+            if resolution > self.sample_interval
+        ]
+
+    def _tier_len(self, resolution: float) -> int:
+        return min(RAW_POINTS_MAX, int(math.ceil(self.window_sec / resolution)) + 1)
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def window_sec(self) -> float:
+        return self._maxlen * self.sample_interval
+
+    def _expire(self, newest: float) -> None:
+        cutoff = newest - self.window_sec
+        self._raw.drop_before(cutoff)
+        for tier in self._tiers:
+            tier.drop_before(cutoff)
+
+    @property
+    def resolutions(self) -> Tuple[float, ...]:
+        return tuple(tier.resolution for tier in self._tiers)
+
+    @property
+    def nbytes(self) -> int:
+        return self._raw.nbytes + sum(tier.nbytes for tier in self._tiers)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __bool__(self) -> bool:
+        return len(self._raw) > 0
+
+    def append(self, timestamp: float, *values: float) -> None:
+        if len(values) != len(self.fields):
+            raise ValueError(f"expected {len(self.fields)} values, got {len(values)}")
+        with self.lock:
+            self._raw.append((timestamp, *values))
+            for tier in self._tiers:
+                tier.add(timestamp, values)
+            self._expire(timestamp)
+
+    def extend(self, timestamps: Sequence[float], *columns: Sequence[float]) -> None:
+        """Bulk-append rows given column-wise in time order, e.g. when restoring saved history."""
+        if len(columns) != len(self.fields):
+            raise ValueError(f"expected {len(self.fields)} columns, got {len(columns)}")
+        if any(len(col) != len(timestamps) for col in columns):
+            raise ValueError("columns must have the same length")
+        if not timestamps:
+            return
+        with self.lock:
+            self._raw.extend((timestamps, *columns))
+            for tier in self._tiers:
+                tier.extend((timestamps, *columns))
+            self._expire(timestamps[-1])
+
+    def resize(self, maxlen: int) -> None:
+        """Change the window in place, keeping the newest rows of every level."""
+        new_maxlen = max(1, int(maxlen))
+        with self.lock:
+            if new_maxlen == self._maxlen:
+                return
+            self._maxlen = new_maxlen
+            self._raw.resize(min(new_maxlen, RAW_POINTS_MAX))
+            for tier in self._tiers:
+                tier.resize(self._tier_len(tier.resolution))
+            last = self._raw.last(1)
+            if last is not None:
+                self._expire(last[0])
+
+    def clear(self) -> None:
+        with self.lock:
+            self._raw.clear()
+            for tier in self._tiers:
+                tier.clear()
+
+    def view(self) -> HistoryView:
+        return self._raw.view(self.fields)
+
+    def last(self) -> Optional[tuple]:
+        return self._raw.last(len(self.fields) + 1)
+
+    def finest(self, timestamp: float) -> HistoryView:
+        """Return the finest level still holding ``timestamp``: raw rows unless it is older than them."""
+        levels = [(self._raw.first_timestamp(), self.view)]
+        levels.extend((tier.first_timestamp(), tier.view) for tier in self._tiers)
+        oldest = None
+        for first_ts, make_view in levels:
+            if first_ts is None:
+                continue
+            if first_ts <= timestamp:
+                return make_view()
+            if oldest is None or first_ts < oldest[0]:
+                oldest = (first_ts, make_view)
+        return oldest[1]() if oldest is not None else self.view()
+
+    def span(self) -> Optional[Tuple[float, float]]:
+        """Return ``(oldest, newest)`` timestamps kept by any level, or None when empty."""
+        last = self.last()
+        if last is None:
+            return None
+        firsts = [self._raw.first_timestamp()]
+        firsts.extend(tier.first_timestamp() for tier in self._tiers)
+        return min(ts for ts in firsts if ts is not None), last[0]
+
+    def _level(self, start_ts: float, end_ts: float, points: int) -> Optional[tuple]:
+        target = (end_ts - start_ts) / max(1, int(points))
+        levels = [(self.sample_interval, self._raw.first_timestamp(), self.view)]
+        levels.extend((tier.resolution, tier.first_timestamp(), tier.view) for tier in self._tiers)
+
+        chosen = None
+        for resolution, first_ts, make_view in levels:
+            if first_ts is None:
+                continue
+            covers = first_ts <= start_ts + resolution
+            if chosen is None or resolution <= target or not chosen[1]:
+                chosen = (resolution, covers, make_view)
+        return chosen
+
+    def resolution(self, start_ts: float, end_ts: float, points: int) -> float:
+        """Sample spacing of the level ``select`` reads for the same arguments."""
+        level = self._level(start_ts, end_ts, points)
+        return self.sample_interval if level is None else level[0]
+
+    def select(self, start_ts: float, end_ts: float, points: int) -> HistoryView:
+        """Return rows in ``[start_ts, end_ts]`` from the coarsest level with at least one row per point.
+
+        Finer levels are skipped when they no longer reach back to ``start_ts``.
+        """
+        level = self._level(start_ts, end_ts, points)
+        if level is None:
+            return self.view()
+        return level[2]().between(start_ts, end_ts)
+
+
+class SeriesFamily:
+    """A variable set of same-kind series (per core, per interface, per mount) in one MetricHistory.
+
+    Each sample is a ``{series name: value}`` mapping. An unseen name widens the
+    table: the history is rebuilt from the raw level of the existing series (older
+    rollups are dropped) with zeros for the new one. Names that stop reporting
+    keep their column and read 0. Readers take ``family.history`` once and lock
+    that object, so a rebuild never invalidates a view in use.
+    """
+
+    def __init__(self, maxlen: int, sample_interval: float = 1.0, fields: Sequence[str] = ()):
+        self.sample_interval = float(sample_interval)
+        self.history = MetricHistory(tuple(fields), maxlen, self.sample_interval)
+        self._names = set(self.history.fields)
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return self.history.fields
+
+    def __len__(self) -> int:
+        return len(self.history)
+
+    def _widen(self, names: Sequence[str]) -> None:
+        old = self.history
+        fields = old.fields + tuple(name for name in names if name not in old.fields)
+        history = MetricHistory(fields, old.maxlen, self.sample_interval)
+        with old.lock:
+            view = old.view()
+            if len(view):
+                zeros = [0.0] * len(view)
+                columns = [view.column(idx) for idx in range(1, len(old.fields) + 1)]
+                columns.extend(zeros for _ in range(len(fields) - len(old.fields)))
+                history.extend(view.column(0), *columns)
+        self.history = history
+        self._names = set(fields)
+
+    def append(self, timestamp: float, values: Dict[str, float]) -> None:
+        if not self._names.issuperset(values):
+            self._widen(list(values))
+        fields = self.history.fields
+        self.history.append(timestamp, *[float(values.get(name, 0.0)) for name in fields])
+
+    def extend(self, fields: Sequence[str], timestamps: Sequence[float], *columns: Sequence[float]) -> None:
+        """Bulk-load rows of ``fields`` (e.g. restored from disk) into an empty family."""
+        history = MetricHistory(tuple(fields), self.history.maxlen, self.sample_interval)
+        history.extend(timestamps, *columns)
+        self.history = history
+        self._names = set(history.fields)
+
+    def resize(self, maxlen: int) -> None:
+        self.history.resize(maxlen)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .sampler import TimingStats
+
+# Telegram keeps one connection busy with a 30 s getUpdates long poll while
+# messages and photos go out on another, so each host gets a few slots.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 4
+CONNECT_RETRIES = 2
+RETRY_BACKOFF_SEC = 0.5
+
+
+class TransportStats:
+    """Request, handshake and latency counters of an ``HttpTransport`` (thread-safe)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.latency = TimingStats()
+        self.reset()
+
+    def add_request(self, ms: float, ok: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            if not ok:
+                self.errors += 1
+            self.latency.add(ms)
+
+    def add_handshake(self) -> None:
+        with self._lock:
+            self.handshakes += 1
+
+    @property
+    def reused(self) -> int:
+        """Requests served over an already open keep-alive connection."""
+        return max(0, self.requests - self.handshakes)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.errors = 0
+            self.handshakes = 0
+            self.latency.reset()
+
+
+def _counting_pool(pool_cls, on_connect):
+    # Every TCP (+TLS) connect goes through ConnectionCls.connect(), including
+    # reconnects of dropped keep-alive connections.
+    base_conn = pool_cls.ConnectionCls
+
+    class CountingConnection(base_conn):
+        def connect(self):
+            super().connect()
+            on_connect()
+
+    return type(pool_cls.__name__, (pool_cls,), {'ConnectionCls': CountingConnection})
+
+
+class _CountingAdapter(HTTPAdapter):
+    def __init__(self, on_connect, **kwargs):
+        self._on_connect = on_connect
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool(pool_cls, self._on_connect)
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+class HttpTransport:
+    """Pooled keep-alive HTTP client shared by the notifiers.
+
+    One ``requests.Session`` keeps connections to api.telegram.org and the
+    Discord webhook open between messages, so only the first request per
+    connection pays for the TCP/TLS handshake. The adapter retries only
+    connection failures (nothing was sent yet); HTTP-level retries with
+    ``Retry-After`` handling stay in the notifiers. ``stats`` counts requests,
+    handshakes and latency.
+    """
+
+    def __init__(self,
+                 pool_connections: int = POOL_CONNECTIONS,
+                 pool_maxsize: int = POOL_MAXSIZE,
+                 connect_retries: int = CONNECT_RETRIES,
+                 backoff: float = RETRY_BACKOFF_SEC):
+        self.stats = TransportStats()
+        retry = Retry(
+            total=connect_retries,
+            connect=connect_retries,
+            read=False,
+            status=0,
+            other=0,
+            backoff_factor=backoff,
+            raise_on_status=False,
+        )
+        adapter = _CountingAdapter(
+            self.stats.add_handshake,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'SyMo'
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = self.session.request(method, url, **kwargs)
+            ok = response.status_code < 500
+            return response
+        finally:
+            self.stats.add_request((time.perf_counter() - start) * 1000.0, ok)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_shared: Optional[HttpTransport] = None
+_shared_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """The process-wide transport, created on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = HttpTransport()
+        return _shared
+
+
+def close_transport() -> None:
+    global _shared
+    with _shared_lock:
+        transport, _shared = _shared, None
+    if transport is not None:
+        transport.close()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import re
+from string import Formatter
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+_FIXED_PRECISION_RE = re.compile(r'\.(\d+)f$')
+
+
+def _field_precisions(template: str) -> Tuple[Optional[int], ...]:
+    """Digits shown by each replacement field (``{:.1f}`` → 1), None when not a fixed-point field."""
+    precisions = []
+    for _literal, field, spec, _conversion in Formatter().parse(template):
+        if field is None:
+            continue
+        match = _FIXED_PRECISION_RE.search(spec or '')
+        precisions.append(int(match.group(1)) if match else None)
+    return tuple(precisions)
+
+
+class LabelCache:
+    """Diffing layer between sampled values and GTK labels.
+
+    ``render`` rounds every value to the precision its template displays and
+    only formats the text when the rounded values (or the template, e.g. after
+    a language switch) differ from the previous call for that key. ``apply``
+    calls the widget setter only when the text differs from what that widget
+    already shows, so unchanged labels cost neither a GTK call nor D-Bus
+    traffic to the AppIndicator host.
+
+    ``render`` runs on the sampler thread and ``apply`` on the UI thread; each
+    side only touches its own dict and counters.
+    """
+
+    def __init__(self) -> None:
+        self._precisions: Dict[str, Tuple[Optional[int], ...]] = {}
+        self._rendered: Dict[Hashable, Tuple[str, Tuple[Any, ...], str]] = {}
+        self._applied: Dict[Hashable, str] = {}
+        self.reset_stats()
+
+    def render(self, key: Hashable, template: str, values: Sequence[Any]) -> str:
+        precisions = self._precisions.get(template)
+        if precisions is None:
+            precisions = self._precisions[template] = _field_precisions(template)
+        quantized = tuple(
+            value if digits is None else round(value, digits)
+            for value, digits in zip(values, precisions)
+        )
+        entry = self._rendered.get(key)
+        if entry is not None and entry[0] == template and entry[1] == quantized:
+            self.renders_skipped += 1
+            return entry[2]
+        text = template.format(*quantized)
+        self._rendered[key] = (template, quantized, text)
+        self.renders += 1
+        return text
+
+    def apply(self, key: Hashable, text: str, setter: Callable[[str], Any]) -> bool:
+        """Call ``setter(text)`` unless ``text`` is already shown for ``key``; True when it was called."""
+        if self._applied.get(key) == text:
+            self.updates_skipped += 1
+            return False
+        setter(text)
+        self._applied[key] = text
+        self.updates += 1
+        return True
+
+    def forget_applied(self, key: Optional[Hashable] = None) -> None:
+        """Drop what is known to be on screen (widgets recreated or changed elsewhere)."""
+        if key is None:
+            self._applied.clear()
+        else:
+            self._applied.pop(key, None)
+
+    @property
+    def suppressed(self) -> int:
+        return self.renders_skipped + self.updates_skipped
+
+    def reset_stats(self) -> None:
+        self.renders = 0
+        self.renders_skipped = 0
+        self.updates = 0
+        self.updates_skipped = 0
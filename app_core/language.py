@@ -1,1122 +1,42 @@
-LANGUAGES = {
-    'ru': {
-        'cpu_tray': "ЦПУ в трее",
-        'ram_tray': "ОЗУ в трее",
-        'cpu_info': " ЦПУ",
-        'ram_loading': "ОЗУ",
-        'swap_loading': "Подкачка",
-        'disk_loading': "Диск",
-        'lan_speed': "Сеть",
-        'uptime_label': "Время работы",
-        'settings_label': "Настройки",
-        'exit_app': "Выход",
-        'apply_label': "Применить",
-        'cancel_label': "Отмена",
-        'download_log': " Скачать ",
-        'language': "Язык",
-        'language_name': "Русский",
-        'enable_logging': "Запись логирования",
-        'show_graph_zoom_controls': "Показывать кнопки масштаба графиков",
-        'zoom_out': "Уменьшить масштаб",
-        'reset_zoom': "Сбросить масштаб",
-        'zoom_in': "Увеличить масштаб",
-        'graph_commands_title': "Команды графиков",
-        'graph_unavailable': "График недоступен",
-        'graph_send_failed': "Не удалось отправить изображение графика",
-        'unknown_command': "Неизвестная команда",
-        'unknown_command_help': "Используйте /help",
-        'keyboard_clicks': "Нажатия клавиш",
-        'mouse_clicks': "Клики мыши",
-        'power_off': "Выключение",
-        'reboot': "Перезагрузка",
-        'lock': "Блокировка",
-        'settings': "Планировщик",
-        'minutes': "Минуты:",
-        'action': "Действие:",
-        'apply': "Применить",
-        'cancel': "Отмена",
-        'reset': "Сбросить",
-        'confirm_title': "Подтверждение действия",
-        'confirm_text_power_off': "Выключить компьютер?",
-        'confirm_text_reboot': "Перезагрузить компьютер?",
-        'confirm_text_lock': "Заблокировать экран?",
-        'scheduled': "Запланировано",
-        'error': "Ошибка",
-        'error_minutes_positive': "Введите значение больше 0.",
-        'notification': "Предупреждение",
-        'action_in_1_min': "{} через 1 минуту.",
-        'action_in_time': "{} через {} минут.",
-        'cancelled': "Отменено",
-        'cancelled_text': "Запланированное действие сброшено.",
-
-        'token_bot': "Токен:",
-        'id_chat': "ID чат:",
-        'time_send': "Время уведомления (сек.):",
-        'screenshot_quality': "Качество скриншота:",
-        'quality_low': "Низкое",
-        'quality_medium': "Среднее",
-        'quality_max': "Максимальное",
-        'check_telegram': "Проверить",
-        'bot_message': "Пожалуйста, введите токен бота и ID чата",
-        'test_message': "Тестовое уведомление",
-        'test_message_ok': "Тестовое сообщение успешно отправлено.",
-        'test_message_error': "Не удалось отправить тестовое сообщение. Проверьте ваши данные.",
-        'setting_telegram_error': "Не удалось сохранить конфигурацию Telegram.",
-        'telegram_notification': "Уведомления в Telegram",
-        'ok': "Успех",
-
-        'discord_notification': 'Уведомления в Discord',
-        'webhook_url': 'Webhook URL',
-        'check_discord': 'Проверить',
-        'webhook_required': 'Введите URL webhook Discord.',
-        'setting_discord_error': 'Ошибка сохранения настроек Discord.',
-
-        'system_status': 'Статус системы',
-        'cpu': 'ЦПУ',
-        'ram': 'ОЗУ',
-        'swap': 'Подкачка',
-        'disk': 'Диск',
-        'network': 'Сеть',
-        'uptime': 'Время работы',
-        'keyboard': 'Клавиши',
-        'mouse': 'Мышь',
-        'clicks': 'кликов',
-        'presses': 'нажатий',
-        'gb': 'ГБ',
-        'mbps': 'МБ/с',
-        'temperature': '°C',
-
-        'max_log_size_mb': 'Размер файла логов (МБ)',
-        'graph_history_minutes': 'История графиков (мин.)',
-        'graph_history_hint': 'Диапазон: {}–{} мин (до {} часов).',
-        'graph_colors_title': 'Цвета графиков',
-        'graph_colors_info': 'Выберите цвета линий для каждого графика.',
-
-        'ping_network': 'Проверить сеть',
-        'ping_running': 'Выполняется проверка сети…',
-        'ping_done': 'Проверка завершена для',
-        'ping_error': 'Ошибка при выполнении ping',
-        'system_info': 'Информация о системе',
-        'menu_order_title': 'Порядок отображения пунктов',
-        'display_section': 'Отображение в трее',
-        'display_tab': 'Отображение',
-        'poll_interval_tab': 'Задержка',
-        'poll_interval_section': 'Интервал опроса (сек.)',
-        'logging_section': 'Логи и графики',
-        'logging_tab': 'Логирование',
-        'license_tab': 'Лицензия',
-        'license_info': 'Лицензия проекта и условия использования доступны в репозитории SyMo на GitHub.',
-        'notification_section': 'Уведомления',
-        'system_info_title': 'Характеристики ПК',
-        'system_info_error': 'Не удалось получить информацию о системе',
-        'unknown_value': 'Неизвестно',
-        'system_label': 'Система',
-        'hostname_label': 'Имя хоста',
-        'architecture_label': 'Архитектура',
-        'python_version_label': 'Версия Python',
-        'cpu_label': 'Процессор',
-        'cores_label': 'Физические ядра',
-        'threads_label': 'Потоки',
-        'cpu_frequency_label': 'Частота CPU',
-        'ram_total_label': 'ОЗУ всего',
-        'ram_available_label': 'ОЗУ доступно',
-        'swap_total_label': 'Подкачка всего',
-        'disk_total_label': 'Диск всего',
-        'disk_free_label': 'Диск свободно',
-        'boot_time_label': 'Время загрузки',
-        'uptime_day_one': 'день',
-        'uptime_day_few': 'дня',
-        'uptime_day_many': 'дней',
-
-        'bot_shutdown_message': "🔌 Выполняется выключение системы...",
-        'bot_reboot_message': "🔄 Выполняется перезагрузка системы...",
-        'bot_lock_message': "🔒 Выполняется блокировка экрана...",
-        'bot_help_message': "🤖 Доступные команды:\n/status - текущий статус системы\n/screenshot - сделать скриншот экрана\n/poweroff - выключить компьютер\n/reboot - перезагрузить компьютер\n/lock - заблокировать компьютер\n/help - эта справка",
-        'bot_screenshot_processing': "📸 Делаю скриншот, подождите...",
-        'bot_screenshot_caption': "Скриншот рабочего стола",
-        'bot_screenshot_sent': "Скриншот отправлен.",
-        'bot_screenshot_failed': "Не удалось сделать скриншот. Проверьте графическую сессию (не headless), разрешения Wayland/X11 и наличие gnome-screenshot/scrot/grim/import.",
-        'bot_screenshot_send_error': "Скриншот сделан, но отправка в Telegram не удалась.",
-        'bot_screenshot_howto': "Как исправить: 1) Запустите SyMo в обычной пользовательской графической сессии (не через sudo/systemd). 2) Установите утилиту: sudo apt install gnome-screenshot. 3) Повторите команду /screenshot.",
-    },
-    'en': {
-        'cpu_tray': "CPU in tray",
-        'ram_tray': "RAM in tray",
-        'cpu_info': " CPU",
-        'ram_loading': "RAM",
-        'swap_loading': "Swap",
-        'disk_loading': "Disk",
-        'lan_speed': "Network",
-        'uptime_label': "Uptime",
-        'settings_label': "Settings",
-        'exit_app': "Exit",
-        'apply_label': "Apply",
-        'cancel_label': "Cancel",
-        'download_log': "Download",
-        'language': "Language",
-        'language_name': "English",
-        'enable_logging': "Enable logging",
-        'show_graph_zoom_controls': "Show graph zoom buttons",
-        'zoom_out': "Zoom out",
-        'reset_zoom': "Reset zoom",
-        'zoom_in': "Zoom in",
-        'graph_commands_title': "Graph commands",
-        'graph_unavailable': "Graph is unavailable",
-        'graph_send_failed': "Failed to send graph image",
-        'unknown_command': "Unknown command",
-        'unknown_command_help': "Use /help",
-        'keyboard_clicks': "Keyboard clicks",
-        'mouse_clicks': "Mouse clicks",
-        'power_off': "Power Off",
-        'reboot': "Reboot",
-        'lock': "Lock",
-        'settings': "Settings",
-        'minutes': "Minutes:",
-        'action': "Action:",
-        'apply': "Apply",
-        'cancel': "Cancel",
-        'reset': "Reset",
-        'confirm_title': "Confirm Action",
-        'confirm_text_power_off': "Power off the computer?",
-        'confirm_text_reboot': "Reboot the computer?",
-        'confirm_text_lock': "Lock the screen?",
-        'scheduled': "Scheduled",
-        'error': "Error",
-        'error_minutes_positive': "Please enter a value greater than 0.",
-        'notification': "Notification",
-        'action_in_1_min': "{} in 1 minute.",
-        'action_in_time': "{} in {} minutes.",
-        'cancelled': "Cancelled",
-        'cancelled_text': "Scheduled action cancelled.",
-
-        'token_bot': "Token:",
-        'id_chat': "ID:",
-        'time_send': "Interval (sec.):",
-        'screenshot_quality': "Screenshot quality:",
-        'quality_low': "Low",
-        'quality_medium': "Medium",
-        'quality_max': "Maximum",
-        'check_telegram': "Check",
-        'bot_message': "Please enter the bot token and chat ID",
-        'test_message': "Test notification",
-        'test_message_ok': "Test message was sent successfully.",
-        'test_message_error': "Failed to send test message. Please check your data.",
-        'setting_telegram_error': "Failed to save Telegram configuration.",
-        'telegram_notification': "Telegram notifications",
-        'ok': "Success",
-
-        'discord_notification': 'Discord Notifications',
-        'webhook_url': 'Webhook URL',
-        'check_discord': 'Test',
-        'webhook_required': 'Please enter Discord webhook URL.',
-        'setting_discord_error': 'Failed to save Discord settings.',
-
-        'system_status': 'System Status',
-        'cpu': 'CPU',
-        'ram': 'RAM',
-        'swap': 'Swap',
-        'disk': 'Disk',
-        'network': 'Network',
-        'uptime': 'Uptime',
-        'keyboard': 'Keyboard',
-        'mouse': 'Mouse',
-        'clicks': 'clicks',
-        'presses': 'presses',
-        'gb': 'GB',
-        'mbps': 'MB/s',
-        'temperature': '°C',
-
-        'max_log_size_mb': 'Maximum log file size (MB)',
-        'graph_history_minutes': 'Graph history (min)',
-        'graph_history_hint': 'Range: {}–{} min (up to {} hours).',
-        'graph_colors_title': 'Graph colors',
-        'graph_colors_info': 'Choose line colors for each graph.',
-
-        'ping_network': 'Ping network',
-        'ping_running': 'Running network check…',
-        'ping_done': 'Ping finished for',
-        'ping_error': 'Error running ping',
-        'system_info': 'System information',
-        'menu_order_title': 'Menu item order',
-        'display_section': 'Display',
-        'display_tab': 'Display',
-        'poll_interval_tab': 'Delay',
-        'poll_interval_section': 'Polling interval (sec.)',
-        'logging_section': 'Logs and charts',
-        'logging_tab': 'Logging',
-        'license_tab': 'License',
-        'license_info': 'Project license and usage terms are available in the SyMo GitHub repository.',
-        'notification_section': 'Notifications',
-        'system_info_title': 'PC specifications',
-        'system_info_error': 'Failed to collect system information',
-        'unknown_value': 'Unknown',
-        'system_label': 'System',
-        'hostname_label': 'Hostname',
-        'architecture_label': 'Architecture',
-        'python_version_label': 'Python version',
-        'cpu_label': 'CPU',
-        'cores_label': 'Physical cores',
-        'threads_label': 'Threads',
-        'cpu_frequency_label': 'CPU frequency',
-        'ram_total_label': 'RAM total',
-        'ram_available_label': 'RAM available',
-        'swap_total_label': 'Swap total',
-        'disk_total_label': 'Disk total',
-        'disk_free_label': 'Disk free',
-        'boot_time_label': 'Boot time',
-        'uptime_day_one': 'day',
-        'uptime_day_few': 'days',
-        'uptime_day_many': 'days',
-
-        'bot_shutdown_message': "🔌 Shutting down system...",
-        'bot_reboot_message': "🔄 Rebooting system...",
-        'bot_lock_message': "🔒 Locking screen...",
-        'bot_help_message': "🤖 Available commands:\n/status - current system status\n/screenshot - capture desktop screenshot\n/poweroff - shutdown computer\n/reboot - reboot computer\n/lock - lock computer\n/help - this help",
-        'bot_screenshot_processing': "📸 Taking screenshot, please wait...",
-        'bot_screenshot_caption': "Desktop screenshot",
-        'bot_screenshot_sent': "Screenshot sent.",
-        'bot_screenshot_failed': "Could not take screenshot. Check graphical session (not headless), Wayland/X11 permissions, and gnome-screenshot/scrot/grim/import availability.",
-        'bot_screenshot_send_error': "Screenshot captured, but failed to send it to Telegram.",
-        'bot_screenshot_howto': "How to fix: 1) Run SyMo in your regular user GUI session (not via sudo/systemd). 2) Install a tool: sudo apt install gnome-screenshot. 3) Run /screenshot again.",
-    },
-    'cn': {
-        'cpu_tray': "CPU在托盘",
-        'ram_tray': "内存托盘显示",
-        'cpu_info': " 处理器",
-        'ram_loading': "内存",
-        'swap_loading': "交换分区",
-        'disk_loading': "磁盘",
-        'lan_speed': "网络",
-        'uptime_label': "运行时间",
-        'settings_label': "设置",
-        'exit_app': "退出",
-        'apply_label': "应用",
-        'cancel_label': "取消",
-        'download_log': "下载日志",
-        'language': "语言",
-        'language_name': "中文",
-        'enable_logging': "启用日志记录",
-        'show_graph_zoom_controls': "显示图表缩放按钮",
-        'zoom_out': "缩小",
-        'reset_zoom': "重置缩放",
-        'zoom_in': "放大",
-        'graph_commands_title': "图表命令",
-        'graph_unavailable': "图表不可用",
-        'graph_send_failed': "发送图表图片失败",
-        'unknown_command': "未知命令",
-        'unknown_command_help': "请使用 /help",
-        'keyboard_clicks': "键盘点击",
-        'mouse_clicks': "鼠标点击",
-        'power_off': "关闭电源",
-        'reboot': "重启",
-        'lock': "锁屏",
-        'settings': "设置",
-        'minutes': "分钟:",
-        'action': "操作:",
-        'apply': "应用",
-        'cancel': "取消",
-        'reset': "重置",
-        'confirm_title': "确认操作",
-        'confirm_text_power_off': "关闭计算机？",
-        'confirm_text_reboot': "重启计算机？",
-        'confirm_text_lock': "锁定屏幕？",
-        'scheduled': "已安排",
-        'error': "错误",
-        'error_minutes_positive': "请输入大于0的值。",
-        'notification': "通知",
-        'action_in_1_min': "{} 还有1分钟。",
-        'action_in_time': "{} 还有{}分钟。",
-        'cancelled': "已取消",
-        'cancelled_text': "已取消计划操作。",
-
-        'token_bot': "机器人令牌:",
-        'id_chat': "聊天ID:",
-        'time_send': "发送间隔（秒）:",
-        'screenshot_quality': "截图质量：",
-        'quality_low': "低",
-        'quality_medium': "中",
-        'quality_max': "高",
-        'check_telegram': "检查",
-        'bot_message': "请输入机器人令牌和聊天ID",
-        'test_message': "测试通知",
-        'test_message_ok': "测试消息已成功发送。",
-        'test_message_error': "无法发送测试消息。请检查您的信息。",
-        'setting_telegram_error': "无法保存Telegram配置。",
-        'telegram_notification': "Telegram 通知",
-        'ok': "成功",
-
-        'discord_notification': 'Discord 通知',
-        'webhook_url': 'Webhook URL',
-        'check_discord': '检查',
-        'webhook_required': '请输入 Discord 的 Webhook URL',
-        'setting_discord_error': '保存 Discord 设置时出错',
-
-        'system_status': '系统状态',
-        'cpu': 'CPU',
-        'ram': '内存',
-        'swap': '交换空间',
-        'disk': '磁盘',
-        'network': '网络',
-        'uptime': '运行时间',
-        'keyboard': '键盘',
-        'mouse': '鼠标',
-        'clicks': '次点击',
-        'presses': '次按键',
-        'gb': 'GB',
-        'mbps': 'MB/s',
-        'temperature': '°C',
-
-        'max_log_size_mb': '日志文件的最大大小 (MB)',
-        'graph_history_minutes': '图表历史记录（分钟）',
-        'graph_history_hint': '范围：{}–{} 分钟（最多 {} 小时）。',
-        'graph_colors_title': '图表颜色',
-        'graph_colors_info': '为每个图表选择线条颜色。',
-
-        'ping_network': '网络连通性测试（ping）',
-        'ping_running': '正在进行网络测试…',
-        'ping_done': '已完成测试：',
-        'ping_error': '执行 ping 时出错',
-        'system_info': '系统信息',
-        'menu_order_title': '菜单项顺序',
-        'display_section': '显示',
-        'display_tab': '显示',
-        'poll_interval_tab': '延迟',
-        'poll_interval_section': '轮询间隔（秒）',
-        'logging_section': '日志和图表',
-        'logging_tab': '日志',
-        'license_tab': '许可证',
-        'license_info': '项目许可证和使用条款可在 SyMo 的 GitHub 仓库中查看。',
-        'notification_section': '通知',
-        'system_info_title': '电脑配置',
-        'system_info_error': '无法获取系统信息',
-        'unknown_value': '未知',
-        'system_label': '系统',
-        'hostname_label': '主机名',
-        'architecture_label': '架构',
-        'python_version_label': 'Python 版本',
-        'cpu_label': '处理器',
-        'cores_label': '物理核心',
-        'threads_label': '线程',
-        'cpu_frequency_label': 'CPU 频率',
-        'ram_total_label': '内存总量',
-        'ram_available_label': '可用内存',
-        'swap_total_label': '交换分区总量',
-        'disk_total_label': '磁盘总量',
-        'disk_free_label': '可用磁盘',
-        'boot_time_label': '启动时间',
-        'uptime_day_one': '天',
-        'uptime_day_few': '天',
-        'uptime_day_many': '天',
-
-        'bot_shutdown_message': "🔌 正在关闭系统...",
-        'bot_reboot_message': "🔄 正在重启系统...",
-        'bot_lock_message': "🔒 正在锁定屏幕...",
-        'bot_help_message': "🤖 可用命令:\n/status - 当前系统状态\n/screenshot - 捕获桌面截图\n/poweroff - 关闭计算机\n/reboot - 重启计算机\n/lock - 锁定计算机\n/help - 帮助信息",
-        'bot_screenshot_processing': "📸 正在截图，请稍候...",
-        'bot_screenshot_caption': "桌面截图",
-        'bot_screenshot_sent': "截图已发送。",
-        'bot_screenshot_failed': "无法截图。请检查图形会话（非 headless）、Wayland/X11 权限，并确认已安装 gnome-screenshot/scrot/grim/import。",
-        'bot_screenshot_send_error': "截图已创建，但发送到 Telegram 失败。",
-        'bot_screenshot_howto': "修复方法：1）在普通用户图形会话中运行 SyMo（不要使用 sudo/systemd）。2）安装工具：sudo apt install gnome-screenshot。3）再次执行 /screenshot。",
-    },
-    'de': {
-        'cpu_tray': "CPU im Tray",
-        'ram_tray': "RAM im Tray",
-        'cpu_info': " CPU",
-        'ram_loading': "RAM",
-        'swap_loading': "Auslagerung",
-        'disk_loading': "Festplatte",
-        'lan_speed': "Netzwerk",
-        'uptime_label': "Betriebszeit",
-        'settings_label': "Einstellungen",
-        'exit_app': "Beenden",
-        'apply_label': "Übernehmen",
-        'cancel_label': "Abbrechen",
-        'download_log': "Herunterladen",
-        'language': "Sprache",
-        'language_name': "Deutsch",
-        'enable_logging': "Protokolle",
-        'show_graph_zoom_controls': "Graph-Zoom-Schaltflächen anzeigen",
-        'zoom_out': "Verkleinern",
-        'reset_zoom': "Zoom zurücksetzen",
-        'zoom_in': "Vergrößern",
-        'graph_commands_title': "Graph-Befehle",
-        'graph_unavailable': "Graph nicht verfügbar",
-        'graph_send_failed': "Graphbild konnte nicht gesendet werden",
-        'unknown_command': "Unbekannter Befehl",
-        'unknown_command_help': "Verwenden Sie /help",
-        'keyboard_clicks': "Tastenklicks",
-        'mouse_clicks': "Mausklicks",
-        'power_off': "Herunterfahren",
-        'reboot': "Neustart",
-        'lock': "Sperren",
-        'settings': "Einstellungen",
-        'minutes': "Minuten:",
-        'action': "Aktion:",
-        'apply': "Übernehmen",
-        'cancel': "Abbrechen",
-        'reset': "Zurücksetzen",
-        'confirm_title': "Aktion bestätigen",
-        'confirm_text_power_off': "Computer ausschalten?",
-        'confirm_text_reboot': "Computer neu starten?",
-        'confirm_text_lock': "Bildschirm sperren?",
-        'scheduled': "Geplant",
-        'error': "Fehler",
-        'error_minutes_positive': "Bitte geben Sie einen Wert größer als 0 ein.",
-        'notification': "Benachrichtigung",
-        'action_in_1_min': "{} in 1 Minute.",
-        'action_in_time': "{} in {} Minuten.",
-        'cancelled': "Abgebrochen",
-        'cancelled_text': "Geplante Aktion abgebrochen.",
-
-        'token_bot': "Token:",
-        'id_chat': "ID:",
-        'time_send': "Intervall (sek.):",
-        'screenshot_quality': "Screenshot-Qualität:",
-        'quality_low': "Niedrig",
-        'quality_medium': "Mittel",
-        'quality_max': "Maximal",
-        'check_telegram': "Prüfen",
-        'bot_message': "Bitte geben Sie den Bot-Token und die Chat-ID ein",
-        'test_message': "Testbenachrichtigung",
-        'test_message_ok': "Testnachricht wurde erfolgreich gesendet.",
-        'test_message_error': "Testnachricht konnte nicht gesendet werden. Bitte überprüfen Sie Ihre Angaben.",
-        'setting_telegram_error': "Telegram Konfiguration konnte nicht gespeichert werden.",
-        'telegram_notification': "Telegram Benachrichtigungen",
-        'ok': "Erfolg",
-
-        'discord_notification': 'Discord Benachrichtigungen',
-        'webhook_url': 'Webhook-URL',
-        'check_discord': 'Überprüfen',
-        'webhook_required': 'Bitte geben Sie die Discord Webhook-URL ein.',
-        'setting_discord_error': 'Fehler beim Speichern der Discord-Einstellungen.',
-
-        'system_status': 'Systemstatus',
-        'cpu': 'CPU',
-        'ram': 'RAM',
-        'swap': 'Swap',
-        'disk': 'Festplatte',
-        'network': 'Netzwerk',
-        'uptime': 'Laufzeit',
-        'keyboard': 'Tastatur',
-        'mouse': 'Maus',
-        'clicks': 'Klicks',
-        'presses': 'Tastendrücke',
-        'gb': 'GB',
-        'mbps': 'MB/s',
-        'temperature': '°C',
-
-        'max_log_size_mb': 'Maximale Protokolldateigröße (MB)',
-        'graph_history_minutes': 'Diagrammverlauf (Min.)',
-        'graph_history_hint': 'Bereich: {}–{} Min (bis zu {} Stunden).',
-        'graph_colors_title': 'Diagrammfarben',
-        'graph_colors_info': 'Wählen Sie Linienfarben für jedes Diagramm.',
-
-        'ping_network': 'Netzwerk prüfen (Ping)',
-        'ping_running': 'Netzwerkprüfung läuft…',
-        'ping_done': 'Prüfung abgeschlossen für',
-        'ping_error': 'Fehler beim Ausführen von Ping',
-        'system_info': 'Systeminformationen',
-        'menu_order_title': 'Reihenfolge der Menüpunkte',
-        'display_section': 'Anzeige',
-        'display_tab': 'Anzeige',
-        'poll_interval_tab': 'Verzögerung',
-        'poll_interval_section': 'Abfrageintervall (Sek.)',
-        'logging_section': 'Protokolle und Diagramme',
-        'logging_tab': 'Protokollierung',
-        'license_tab': 'Lizenz',
-        'license_info': 'Projektlizenz und Nutzungsbedingungen sind im SyMo-GitHub-Repository verfügbar.',
-        'notification_section': 'Benachrichtigungen',
-        'system_info_title': 'PC-Spezifikationen',
-        'system_info_error': 'Systeminformationen konnten nicht ermittelt werden',
-        'unknown_value': 'Unbekannt',
-        'system_label': 'System',
-        'hostname_label': 'Hostname',
-        'architecture_label': 'Architektur',
-        'python_version_label': 'Python-Version',
-        'cpu_label': 'Prozessor',
-        'cores_label': 'Physische Kerne',
-        'threads_label': 'Threads',
-        'cpu_frequency_label': 'CPU-Takt',
-        'ram_total_label': 'RAM gesamt',
-        'ram_available_label': 'RAM verfügbar',
-        'swap_total_label': 'Swap gesamt',
-        'disk_total_label': 'Festplatte gesamt',
-        'disk_free_label': 'Festplatte frei',
-        'boot_time_label': 'Startzeit',
-        'uptime_day_one': 'Tag',
-        'uptime_day_few': 'Tage',
-        'uptime_day_many': 'Tage',
-
-        'bot_shutdown_message': "🔌 System wird heruntergefahren...",
-        'bot_reboot_message': "🔄 System wird neu gestartet...",
-        'bot_lock_message': "🔒 Bildschirm wird gesperrt...",
-        'bot_help_message': "🤖 Verfügbare Befehle:\n/status - aktueller Systemstatus\n/screenshot - Desktop-Screenshot erstellen\n/poweroff - Computer ausschalten\n/reboot - Computer neu starten\n/lock - Computer sperren\n/help - diese Hilfe",
-        'bot_screenshot_processing': "📸 Screenshot wird erstellt, bitte warten...",
-        'bot_screenshot_caption': "Desktop-Screenshot",
-        'bot_screenshot_sent': "Screenshot gesendet.",
-        'bot_screenshot_failed': "Screenshot konnte nicht erstellt werden. Bitte prüfen Sie die grafische Sitzung (nicht headless), Wayland/X11-Berechtigungen und ob gnome-screenshot/scrot/grim/import installiert ist.",
-        'bot_screenshot_send_error': "Screenshot wurde erstellt, aber das Senden an Telegram ist fehlgeschlagen.",
-        'bot_screenshot_howto': "So beheben Sie das Problem: 1) SyMo in einer normalen grafischen Benutzersitzung starten (nicht via sudo/systemd). 2) Tool installieren: sudo apt install gnome-screenshot. 3) /screenshot erneut ausführen.",
-    },
-    'it': {
-        'cpu_tray': "CPU in tray",
-        'ram_tray': "RAM in tray",
-        'cpu_info': " CPU",
-        'ram_loading': "RAM",
-        'swap_loading': "Swap",
-        'disk_loading': "Disco",
-        'lan_speed': "Rete",
-        'uptime_label': "Tempo di attività",
-        'settings_label': "Impostazioni",
-        'exit_app': "Esci",
-        'apply_label': "Applica",
-        'cancel_label': "Annulla",
-        'download_log': " Scarica ",
-        'language': "Lingua",
-        'language_name': "Italiano",
-        'enable_logging': "Registrazione log",
-        'show_graph_zoom_controls': "Mostra pulsanti zoom grafico",
-        'zoom_out': "Riduci zoom",
-        'reset_zoom': "Reimposta zoom",
-        'zoom_in': "Aumenta zoom",
-        'graph_commands_title': "Comandi grafici",
-        'graph_unavailable': "Grafico non disponibile",
-        'graph_send_failed': "Impossibile inviare l'immagine del grafico",
-        'unknown_command': "Comando sconosciuto",
-        'unknown_command_help': "Usa /help",
-        'keyboard_clicks': "Tasti premuti",
-        'mouse_clicks': "Clic del mouse",
-        'power_off': "Spegnimento",
-        'reboot': "Riavvio",
-        'lock': "Blocco schermo",
-        'settings': "Timer",
-        'minutes': "Minuti:",
-        'action': "Azione:",
-        'apply': "Applica",
-        'cancel': "Annulla",
-        'reset': "Resetta",
-        'confirm_title': "Conferma azione",
-        'confirm_text_power_off': "Spegnere il computer?",
-        'confirm_text_reboot': "Riavviare il computer?",
-        'confirm_text_lock': "Bloccare lo schermo?",
-        'scheduled': "Pianificato",
-        'error': "Errore",
-        'error_minutes_positive': "Inserisci un valore maggiore di 0.",
-        'notification': "Avviso",
-        'action_in_1_min': "{} tra 1 minuto.",
-        'action_in_time': "{} tra {} minuti.",
-        'cancelled': "Annullato",
-        'cancelled_text': "Azione pianificata annullata.",
-
-        'token_bot': "Token:",
-        'id_chat': "ID chat:",
-        'time_send': "Tempo notifica (sec.):",
-        'screenshot_quality': "Qualità screenshot:",
-        'quality_low': "Bassa",
-        'quality_medium': "Media",
-        'quality_max': "Massima",
-        'check_telegram': "Controlla",
-        'bot_message': "Inserisci il token del bot e l'ID della chat",
-        'test_message': "Notifica di test",
-        'test_message_ok': "Messaggio di test inviato con successo.",
-        'test_message_error': "Impossibile inviare il messaggio di test. Verifica i dati.",
-        'setting_telegram_error': "Impossibile salvare la configurazione Telegram.",
-        'telegram_notification': "Notifiche Telegram",
-        'ok': "Successo",
-
-        'discord_notification': 'Notifiche Discord',
-        'webhook_url': 'URL Webhook',
-        'check_discord': 'Controlla',
-        'webhook_required': 'Inserisci URL webhook Discord.',
-        'setting_discord_error': 'Errore nel salvare le impostazioni Discord.',
-
-        'system_status': 'Stato del sistema',
-        'cpu': 'CPU',
-        'ram': 'RAM',
-        'swap': 'Swap',
-        'disk': 'Disco',
-        'network': 'Rete',
-        'uptime': 'Tempo di attività',
-        'keyboard': 'Tastiera',
-        'mouse': 'Mouse',
-        'clicks': 'clic',
-        'presses': 'pressioni',
-        'gb': 'GB',
-        'mbps': 'MB/s',
-        'temperature': '°C',
-
-        'max_log_size_mb': 'Dimensione massima del file di log (MB)',
-        'graph_history_minutes': 'Cronologia grafici (min)',
-        'graph_history_hint': 'Intervallo: {}–{} min (fino a {} ore).',
-        'graph_colors_title': 'Colori dei grafici',
-        'graph_colors_info': 'Scegli i colori delle linee per ogni grafico.',
-
-        'ping_network': 'Verifica rete (ping)',
-        'ping_running': 'Verifica della rete in corso…',
-        'ping_done': 'Verifica completata per',
-        'ping_error': 'Errore durante l\'esecuzione di ping',
-        'system_info': 'Informazioni di sistema',
-        'menu_order_title': 'Ordine delle voci del menu',
-        'display_section': 'Visualizzazione',
-        'display_tab': 'Visualizzazione',
-        'poll_interval_tab': 'Ritardo',
-        'poll_interval_section': 'Intervallo di polling (sec.)',
-        'logging_section': 'Log e grafici',
-        'logging_tab': 'Registrazione',
-        'license_tab': 'Licenza',
-        'license_info': 'La licenza del progetto e i termini d’uso sono disponibili nel repository GitHub di SyMo.',
-        'notification_section': 'Notifiche',
-        'system_info_title': 'Specifiche del PC',
-        'system_info_error': 'Impossibile ottenere le informazioni di sistema',
-        'unknown_value': 'Sconosciuto',
-        'system_label': 'Sistema',
-        'hostname_label': 'Nome host',
-        'architecture_label': 'Architettura',
-        'python_version_label': 'Versione di Python',
-        'cpu_label': 'CPU',
-        'cores_label': 'Core fisici',
-        'threads_label': 'Thread',
-        'cpu_frequency_label': 'Frequenza CPU',
-        'ram_total_label': 'RAM totale',
-        'ram_available_label': 'RAM disponibile',
-        'swap_total_label': 'Swap totale',
-        'disk_total_label': 'Disco totale',
-        'disk_free_label': 'Disco libero',
-        'boot_time_label': 'Ora di avvio',
-        'uptime_day_one': 'giorno',
-        'uptime_day_few': 'giorni',
-        'uptime_day_many': 'giorni',
-
-        'bot_shutdown_message': "🔌 Spegnimento del sistema in corso...",
-        'bot_reboot_message': "🔄 Riavvio del sistema in corso...",
-        'bot_lock_message': "🔒 Blocco dello schermo...",
-        'bot_help_message': "🤖 Comandi disponibili:\n/status - stato attuale del sistema\n/screenshot - cattura screenshot del desktop\n/poweroff - spegni computer\n/reboot - riavvia computer\n/lock - blocca computer\n/help - questo aiuto",
-        'bot_screenshot_processing': "📸 Catturo lo screenshot, attendi...",
-        'bot_screenshot_caption': "Screenshot desktop",
-        'bot_screenshot_sent': "Screenshot inviato.",
-        'bot_screenshot_failed': "Impossibile acquisire lo screenshot. Controlla la sessione grafica (non headless), i permessi Wayland/X11 e la presenza di gnome-screenshot/scrot/grim/import.",
-        'bot_screenshot_send_error': "Screenshot acquisito, ma invio su Telegram non riuscito.",
-        'bot_screenshot_howto': "Come risolvere: 1) Avvia SyMo in una normale sessione grafica utente (non via sudo/systemd). 2) Installa: sudo apt install gnome-screenshot. 3) Riprova /screenshot.",
-    },
-    'es': {
-        'cpu_tray': "CPU en bandeja",
-        'ram_tray': "RAM en bandeja",
-        'cpu_info': " CPU",
-        'ram_loading': "RAM",
-        'swap_loading': "Swap",
-        'disk_loading': "Disco",
-        'lan_speed': "Red",
-        'uptime_label': "Tiempo de actividad",
-        'settings_label': "Configuración",
-        'exit_app': "Salir",
-        'apply_label': "Aplicar",
-        'cancel_label': "Cancelar",
-        'download_log': " Descargar ",
-        'language': "Idioma",
-        'language_name': "Español",
-        'enable_logging': "Registro de logs",
-        'show_graph_zoom_controls': "Mostrar botones de zoom del gráfico",
-        'zoom_out': "Alejar",
-        'reset_zoom': "Restablecer zoom",
-        'zoom_in': "Acercar",
-        'graph_commands_title': "Comandos de gráficos",
-        'graph_unavailable': "Gráfico no disponible",
-        'graph_send_failed': "No se pudo enviar la imagen del gráfico",
-        'unknown_command': "Comando desconocido",
-        'unknown_command_help': "Usa /help",
-        'keyboard_clicks': "Pulsaciones de teclas",
-        'mouse_clicks': "Clics del ratón",
-        'power_off': "Apagar",
-        'reboot': "Reiniciar",
-        'lock': "Bloquear pantalla",
-        'settings': "Temporizador",
-        'minutes': "Minutos:",
-        'action': "Acción:",
-        'apply': "Aplicar",
-        'cancel': "Cancelar",
-        'reset': "Restablecer",
-        'confirm_title': "Confirmar acción",
-        'confirm_text_power_off': "¿Apagar el equipo?",
-        'confirm_text_reboot': "¿Reiniciar el equipo?",
-        'confirm_text_lock': "¿Bloquear la pantalla?",
-        'scheduled': "Programado",
-        'error': "Error",
-        'error_minutes_positive': "Introduce un valor mayor que 0.",
-        'notification': "Advertencia",
-        'action_in_1_min': "{} en 1 minuto.",
-        'action_in_time': "{} en {} minutos.",
-        'cancelled': "Cancelado",
-        'cancelled_text': "Acción programada cancelada.",
-
-        'token_bot': "Token:",
-        'id_chat': "ID de chat:",
-        'time_send': "Tiempo notificación (seg.):",
-        'screenshot_quality': "Calidad de captura:",
-        'quality_low': "Baja",
-        'quality_medium': "Media",
-        'quality_max': "Máxima",
-        'check_telegram': "Comprobar",
-        'bot_message': "Introduce el token del bot y el ID del chat",
-        'test_message': "Notificación de prueba",
-        'test_message_ok': "Mensaje de prueba enviado con éxito.",
-        'test_message_error': "No se pudo enviar el mensaje de prueba. Verifica los datos.",
-        'setting_telegram_error': "No se pudo guardar la configuración de Telegram.",
-        'telegram_notification': "Notificaciones Telegram",
-        'ok': "Éxito",
-
-        'discord_notification': 'Notificaciones Discord',
-        'webhook_url': 'URL Webhook',
-        'check_discord': 'Comprobar',
-        'webhook_required': 'Introduce la URL del webhook de Discord.',
-        'setting_discord_error': 'Error al guardar la configuración de Discord.',
-
-        'system_status': 'Estado del sistema',
-        'cpu': 'CPU',
-        'ram': 'RAM',
-        'swap': 'Swap',
-        'disk': 'Disco',
-        'network': 'Red',
-        'uptime': 'Tiempo de actividad',
-        'keyboard': 'Teclado',
-        'mouse': 'Ratón',
-        'clicks': 'clics',
-        'presses': 'pulsaciones',
-        'gb': 'GB',
-        'mbps': 'MB/s',
-        'temperature': '°C',
-
-        'max_log_size_mb': 'Tamaño máximo del archivo de registro (MB)',
-        'graph_history_minutes': 'Historial de gráficos (min)',
-        'graph_history_hint': 'Rango: {}–{} min (hasta {} horas).',
-        'graph_colors_title': 'Colores de gráficos',
-        'graph_colors_info': 'Elige los colores de línea para cada gráfico.',
-
-        'ping_network': 'Probar red (ping)',
-        'ping_running': 'Comprobando la red…',
-        'ping_done': 'Comprobación finalizada para',
-        'ping_error': 'Error al ejecutar ping',
-        'system_info': 'Información del sistema',
-        'menu_order_title': 'Orden de elementos del menú',
-        'display_section': 'Visualización',
-        'display_tab': 'Visualización',
-        'poll_interval_tab': 'Retraso',
-        'poll_interval_section': 'Intervalo de sondeo (seg.)',
-        'logging_section': 'Registros y gráficos',
-        'logging_tab': 'Registro',
-        'license_tab': 'Licencia',
-        'license_info': 'La licencia del proyecto y las condiciones de uso están disponibles en el repositorio de SyMo en GitHub.',
-        'notification_section': 'Notificaciones',
-        'system_info_title': 'Especificaciones del PC',
-        'system_info_error': 'No se pudo obtener la información del sistema',
-        'unknown_value': 'Desconocido',
-        'system_label': 'Sistema',
-        'hostname_label': 'Nombre del host',
-        'architecture_label': 'Arquitectura',
-        'python_version_label': 'Versión de Python',
-        'cpu_label': 'CPU',
-        'cores_label': 'Núcleos físicos',
-        'threads_label': 'Hilos',
-        'cpu_frequency_label': 'Frecuencia de CPU',
-        'ram_total_label': 'RAM total',
-        'ram_available_label': 'RAM disponible',
-        'swap_total_label': 'Swap total',
-        'disk_total_label': 'Disco total',
-        'disk_free_label': 'Disco libre',
-        'boot_time_label': 'Hora de inicio',
-        'uptime_day_one': 'día',
-        'uptime_day_few': 'días',
-        'uptime_day_many': 'días',
-
-        'bot_shutdown_message': "🔌 Apagando el sistema...",
-        'bot_reboot_message': "🔄 Reiniciando el sistema...",
-        'bot_lock_message': "🔒 Bloqueando la pantalla...",
-        'bot_help_message': "🤖 Comandos disponibles:\n/status - estado actual del sistema\n/screenshot - capturar pantalla del escritorio\n/poweroff - apagar computadora\n/reboot - reiniciar computadora\n/lock - bloquear computadora\n/help - esta ayuda",
-        'bot_screenshot_processing': "📸 Tomando captura, por favor espera...",
-        'bot_screenshot_caption': "Captura del escritorio",
-        'bot_screenshot_sent': "Captura enviada.",
-        'bot_screenshot_failed': "No se pudo tomar la captura. Verifica la sesión gráfica (no headless), permisos Wayland/X11 y la instalación de gnome-screenshot/scrot/grim/import.",
-        'bot_screenshot_send_error': "Se tomó la captura, pero falló el envío a Telegram.",
-        'bot_screenshot_howto': "Cómo solucionarlo: 1) Ejecuta SyMo en una sesión gráfica de usuario normal (no con sudo/systemd). 2) Instala: sudo apt install gnome-screenshot. 3) Repite /screenshot.",
-    },
-    'tr': {
-        'cpu_tray': "Sistem çekmecesinde CPU",
-        'ram_tray': "Sistem çekmecesinde RAM",
-        'cpu_info': " CPU",
-        'ram_loading': "RAM",
-        'swap_loading': "Takas",
-        'disk_loading': "Disk",
-        'lan_speed': "Ağ",
-        'uptime_label': "Çalışma süresi",
-        'settings_label': "Ayarlar",
-        'exit_app': "Çıkış",
-        'apply_label': "Uygula",
-        'cancel_label': "İptal",
-        'download_log': " İndir ",
-        'language': "Dil",
-        'language_name': "Türkçe",
-        'enable_logging': "Günlük kaydı",
-        'show_graph_zoom_controls': "Grafik yakınlaştırma düğmelerini göster",
-        'zoom_out': "Uzaklaştır",
-        'reset_zoom': "Yakınlaştırmayı sıfırla",
-        'zoom_in': "Yakınlaştır",
-        'graph_commands_title': "Grafik komutları",
-        'graph_unavailable': "Grafik kullanılamıyor",
-        'graph_send_failed': "Grafik görseli gönderilemedi",
-        'unknown_command': "Bilinmeyen komut",
-        'unknown_command_help': "/help kullanın",
-        'keyboard_clicks': "Tuş vuruşları",
-        'mouse_clicks': "Fare tıklamaları",
-        'power_off': "Kapat",
-        'reboot': "Yeniden başlat",
-        'lock': "Ekranı kilitle",
-        'settings': "Zamanlayıcı",
-        'minutes': "Dakika:",
-        'action': "Eylem:",
-        'apply': "Uygula",
-        'cancel': "İptal",
-        'reset': "Sıfırla",
-        'confirm_title': "Eylemi onayla",
-        'confirm_text_power_off': "Bilgisayar kapatılsın mı?",
-        'confirm_text_reboot': "Bilgisayar yeniden başlatılsın mı?",
-        'confirm_text_lock': "Ekran kilitlensin mi?",
-        'scheduled': "Planlandı",
-        'error': "Hata",
-        'error_minutes_positive': "0'dan büyük bir değer girin.",
-        'notification': "Uyarı",
-        'action_in_1_min': "{} 1 dakika içinde.",
-        'action_in_time': "{} {} dakika içinde.",
-        'cancelled': "İptal edildi",
-        'cancelled_text': "Planlanan eylem iptal edildi.",
-
-        'token_bot': "Token:",
-        'id_chat': "Sohbet ID:",
-        'time_send': "Bildirim zamanı (sn.):",
-        'screenshot_quality': "Ekran görüntüsü kalitesi:",
-        'quality_low': "Düşük",
-        'quality_medium': "Orta",
-        'quality_max': "Maksimum",
-        'check_telegram': "Kontrol et",
-        'bot_message': "Bot token'ını ve sohbet ID'sini girin",
-        'test_message': "Test bildirimi",
-        'test_message_ok': "Test mesajı başarıyla gönderildi.",
-        'test_message_error': "Test mesajı gönderilemedi. Verilerinizi kontrol edin.",
-        'setting_telegram_error': "Telegram yapılandırması kaydedilemedi.",
-        'telegram_notification': "Telegram Bildirimleri",
-        'ok': "Başarılı",
-
-        'discord_notification': 'Discord Bildirimleri',
-        'webhook_url': 'Webhook URL',
-        'check_discord': 'Kontrol et',
-        'webhook_required': 'Discord webhook URL\'sini girin.',
-        'setting_discord_error': 'Discord ayarları kaydedilirken hata.',
-
-        'system_status': 'Sistem durumu',
-        'cpu': 'CPU',
-        'ram': 'RAM',
-        'swap': 'Swap',
-        'disk': 'Disk',
-        'network': 'Ağ',
-        'uptime': 'Çalışma süresi',
-        'keyboard': 'Klavye',
-        'mouse': 'Fare',
-        'clicks': 'tıklama',
-        'presses': 'tuş basımı',
-        'gb': 'GB',
-        'mbps': 'MB/s',
-        'temperature': '°C',
+from __future__ import annotations
+
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Dict, Iterator
+
+from .constants import SUPPORTED_LANGS
+
+# Shown in the language menu, so building it does not import every locale.
+LANGUAGE_NAMES = {
+    'ru': "Русский",
+    'en': "English",
+    'cn': "中文",
+    'de': "Deutsch",
+    'it': "Italiano",
+    'es': "Español",
+    'tr': "Türkçe",
+    'fr': "Français",
+}
 
-        'max_log_size_mb': 'Maksimum günlük dosyası boyutu (MB)',
-        'graph_history_minutes': 'Grafik geçmişi (dk.)',
-        'graph_history_hint': 'Aralık: {}–{} dk ({} saate kadar).',
-        'graph_colors_title': 'Grafik renkleri',
-        'graph_colors_info': 'Her grafik için çizgi renklerini seçin.',
 
-        'ping_network': 'Ağı kontrol et (ping)',
-        'ping_running': 'Ağ kontrolü yapılıyor…',
-        'ping_done': 'Kontrol tamamlandı:',
-        'ping_error': 'Ping çalıştırılırken hata oluştu',
-        'system_info': 'Sistem bilgisi',
-        'menu_order_title': 'Menü öğesi sırası',
-        'display_section': 'Görünüm',
-        'display_tab': 'Görünüm',
-        'poll_interval_tab': 'Gecikme',
-        'poll_interval_section': 'Yoklama aralığı (sn.)',
-        'logging_section': 'Günlükler ve grafikler',
-        'logging_tab': 'Günlükleme',
-        'license_tab': 'Lisans',
-        'license_info': 'Proje lisansı ve kullanım koşulları SyMo GitHub deposunda mevcuttur.',
-        'notification_section': 'Bildirimler',
-        'system_info_title': 'Bilgisayar özellikleri',
-        'system_info_error': 'Sistem bilgisi alınamadı',
-        'unknown_value': 'Bilinmiyor',
-        'system_label': 'Sistem',
-        'hostname_label': 'Ana bilgisayar adı',
-        'architecture_label': 'Mimari',
-        'python_version_label': 'Python sürümü',
-        'cpu_label': 'İşlemci',
-        'cores_label': 'Fiziksel çekirdek',
-        'threads_label': 'İş parçacığı',
-        'cpu_frequency_label': 'CPU frekansı',
-        'ram_total_label': 'Toplam RAM',
-        'ram_available_label': 'Kullanılabilir RAM',
-        'swap_total_label': 'Toplam takas alanı',
-        'disk_total_label': 'Toplam disk',
-        'disk_free_label': 'Boş disk',
-        'boot_time_label': 'Açılış zamanı',
-        'uptime_day_one': 'gün',
-        'uptime_day_few': 'gün',
-        'uptime_day_many': 'gün',
+def load_language(code: str) -> Dict[str, str]:
+    """Translation table of ``code`` from ``app_core/locales/<code>.py``, imported on first use."""
+    if code not in SUPPORTED_LANGS:
+        raise KeyError(code)
+    return import_module(f".locales.{code}", __package__).STRINGS
 
-        'bot_shutdown_message': "🔌 Sistem kapatılıyor...",
-        'bot_reboot_message': "🔄 Sistem yeniden başlatılıyor...",
-        'bot_lock_message': "🔒 Ekran kilitleniyor...",
-        'bot_help_message': "🤖 Mevcut komutlar:\n/status - mevcut sistem durumu\n/screenshot - masaüstü ekran görüntüsü al\n/poweroff - bilgisayarı kapat\n/reboot - bilgisayarı yeniden başlat\n/lock - bilgisayarı kilitle\n/help - bu yardım",
-        'bot_screenshot_processing': "📸 Ekran görüntüsü alınıyor, lütfen bekleyin...",
-        'bot_screenshot_caption': "Masaüstü ekran görüntüsü",
-        'bot_screenshot_sent': "Ekran görüntüsü gönderildi.",
-        'bot_screenshot_failed': "Ekran görüntüsü alınamadı. Grafik oturumunu (headless değil), Wayland/X11 izinlerini ve gnome-screenshot/scrot/grim/import kurulumunu kontrol edin.",
-        'bot_screenshot_send_error': "Ekran görüntüsü alındı ancak Telegram'a gönderilemedi.",
-        'bot_screenshot_howto': "Düzeltme: 1) SyMo'yu normal grafik kullanıcı oturumunda çalıştırın (sudo/systemd ile değil). 2) Kurun: sudo apt install gnome-screenshot. 3) /screenshot komutunu tekrar deneyin.",
-    },
-    'fr': {
-        'cpu_tray': "CPU dans la barre",
-        'ram_tray': "RAM dans la barre",
-        'cpu_info': " CPU",
-        'ram_loading': "RAM",
-        'swap_loading': "Swap",
-        'disk_loading': "Disque",
-        'lan_speed': "Réseau",
-        'uptime_label': "Temps de fonctionnement",
-        'settings_label': "Paramètres",
-        'exit_app': "Quitter",
-        'apply_label': "Appliquer",
-        'cancel_label': "Annuler",
-        'download_log': " Télécharger ",
-        'language': "Langue",
-        'language_name': "Français",
-        'enable_logging': "Enregistrement des logs",
-        'show_graph_zoom_controls': "Afficher les boutons de zoom du graphique",
-        'zoom_out': "Zoom arrière",
-        'reset_zoom': "Réinitialiser le zoom",
-        'zoom_in': "Zoom avant",
-        'graph_commands_title': "Commandes de graphiques",
-        'graph_unavailable': "Graphique indisponible",
-        'graph_send_failed': "Échec de l'envoi de l'image du graphique",
-        'unknown_command': "Commande inconnue",
-        'unknown_command_help': "Utilisez /help",
-        'keyboard_clicks': "Frappes clavier",
-        'mouse_clicks': "Clics souris",
-        'power_off': "Arrêt",
-        'reboot': "Redémarrage",
-        'lock': "Verrouillage",
-        'settings': "Minuterie",
-        'minutes': "Minutes:",
-        'action': "Action :",
-        'apply': "Appliquer",
-        'cancel': "Annuler",
-        'reset': "Réinitialiser",
-        'confirm_title': "Confirmation d'action",
-        'confirm_text_power_off': "Éteindre l'ordinateur?",
-        'confirm_text_reboot': "Redémarrer l'ordinateur?",
-        'confirm_text_lock': "Verrouiller l'écran?",
-        'scheduled': "Planifié",
-        'error': "Erreur",
-        'error_minutes_positive': "Entrez une valeur supérieure à 0.",
-        'notification': "Avertissement",
-        'action_in_1_min': "{} dans 1 minute.",
-        'action_in_time': "{} dans {} minutes.",
-        'cancelled': "Annulé",
-        'cancelled_text': "Action planifiée annulée.",
 
-        'token_bot': "Token:",
-        'id_chat': "ID chat:",
-        'time_send': "Temps notification (sec.):",
-        'screenshot_quality': "Qualité de capture d’écran :",
-        'quality_low': "Faible",
-        'quality_medium': "Moyenne",
-        'quality_max': "Maximale",
-        'check_telegram': "Vérifier",
-        'bot_message': "Veuillez entrer le token du bot et l'ID du chat",
-        'test_message': "Notification test",
-        'test_message_ok': "Message test envoyé avec succès.",
-        'test_message_error': "Impossible d'envoyer le message test. Vérifiez vos données.",
-        'setting_telegram_error': "Impossible de sauvegarder la configuration Telegram.",
-        'telegram_notification': "Notifications Telegram",
-        'ok': "Succès",
+class _LazyLanguages(Mapping):
+    """``{code: table}`` view over all locales that imports each one only when it is accessed."""
 
-        'discord_notification': 'Notifications Discord',
-        'webhook_url': 'URL Webhook',
-        'check_discord': 'Vérifier',
-        'webhook_required': 'Entrez l\'URL webhook Discord.',
-        'setting_discord_error': 'Erreur de sauvegarde des paramètres Discord.',
+    def __getitem__(self, code: str) -> Dict[str, str]:
+        return load_language(code)
 
-        'system_status': 'État du système',
-        'cpu': 'CPU',
-        'ram': 'RAM',
-        'swap': 'Swap',
-        'disk': 'Disque',
-        'network': 'Réseau',
-        'uptime': 'Temps de fonctionnement',
-        'keyboard': 'Clavier',
-        'mouse': 'Souris',
-        'clicks': 'clics',
-        'presses': 'frappes',
-        'gb': 'GB',
-        'mbps': 'MB/s',
-        'temperature': '°C',
+    def __iter__(self) -> Iterator[str]:
+        return iter(SUPPORTED_LANGS)
 
-        'max_log_size_mb': 'Taille maximale du fichier journal (Mo)',
-        'graph_history_minutes': 'Historique des graphiques (min)',
-        'graph_history_hint': 'Plage : {}–{} min (jusqu’à {} heures).',
-        'graph_colors_title': 'Couleurs des graphiques',
-        'graph_colors_info': 'Choisissez les couleurs de ligne pour chaque graphique.',
+    def __len__(self) -> int:
+        return len(SUPPORTED_LANGS)
 
-        'ping_network': 'Vérifier le réseau (ping)',
-        'ping_running': 'Vérification du réseau en cours…',
-        'ping_done': 'Vérification terminée pour',
-        'ping_error': 'Erreur lors de l\'exécution du ping',
-        'system_info': 'Informations système',
-        'menu_order_title': 'Ordre des éléments du menu',
-        'display_section': 'Affichage',
-        'display_tab': 'Affichage',
-        'poll_interval_tab': 'Délai',
-        'poll_interval_section': 'Intervalle d’interrogation (s)',
-        'logging_section': 'Journaux et graphiques',
-        'logging_tab': 'Journalisation',
-        'license_tab': 'Licence',
-        'license_info': 'La licence du projet et les conditions d’utilisation sont disponibles dans le dépôt GitHub de SyMo.',
-        'notification_section': 'Notifications',
-        'system_info_title': 'Caractéristiques du PC',
-        'system_info_error': 'Impossible de récupérer les informations système',
-        'unknown_value': 'Inconnu',
-        'system_label': 'Système',
-        'hostname_label': 'Nom d’hôte',
-        'architecture_label': 'Architecture',
-        'python_version_label': 'Version de Python',
-        'cpu_label': 'Processeur',
-        'cores_label': 'Cœurs physiques',
-        'threads_label': 'Threads',
-        'cpu_frequency_label': 'Fréquence CPU',
-        'ram_total_label': 'RAM totale',
-        'ram_available_label': 'RAM disponible',
-        'swap_total_label': 'Swap total',
-        'disk_total_label': 'Disque total',
-        'disk_free_label': 'Disque libre',
-        'boot_time_label': 'Heure de démarrage',
-        'uptime_day_one': 'jour',
-        'uptime_day_few': 'jours',
-        'uptime_day_many': 'jours',
 
-        'bot_shutdown_message': "🔌 Arrêt du système en cours...",
-        'bot_reboot_message': "🔄 Redémarrage du système en cours...",
-        'bot_lock_message': "🔒 Verrouillage de l'écran...",
-        'bot_help_message': "🤖 Commandes disponibles:\n/status - état actuel du système\n/screenshot - capturer l’écran du bureau\n/poweroff - éteindre l'ordinateur\n/reboot - redémarrer l'ordinateur\n/lock - verrouiller l'ordinateur\n/help - cette aide",
-        'bot_screenshot_processing': "📸 Capture d’écran en cours, veuillez patienter...",
-        'bot_screenshot_caption': "Capture d’écran du bureau",
-        'bot_screenshot_sent': "Capture envoyée.",
-        'bot_screenshot_failed': "Impossible de faire la capture. Vérifiez la session graphique (non headless), les permissions Wayland/X11 et la présence de gnome-screenshot/scrot/grim/import.",
-        'bot_screenshot_send_error': "Capture effectuée, mais l’envoi vers Telegram a échoué.",
-        'bot_screenshot_howto': "Comment corriger : 1) Lancez SyMo dans une session graphique utilisateur normale (pas via sudo/systemd). 2) Installez : sudo apt install gnome-screenshot. 3) Relancez /screenshot.",
-    }
-}
+LANGUAGES = _LazyLanguages()
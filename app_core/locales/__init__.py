@@ -0,0 +1 @@
+"""One module per UI language, each defining ``STRINGS``; imported on demand by ``app_core.language``."""
@@ -0,0 +1,160 @@
+STRINGS = {
+    'cpu_tray': "CPU在托盘",
+    'ram_tray': "内存托盘显示",
+    'cpu_info': " 处理器",
+    'ram_loading': "内存",
+    'swap_loading': "交换分区",
+    'disk_loading': "磁盘",
+    'lan_speed': "网络",
+    'uptime_label': "运行时间",
+    'cpu_cores_label': "处理器核心",
+    'net_interfaces_label': "网络接口",
+    'mounts_label': "文件系统",
+    'disk_io_label': "磁盘 I/O",
+    'settings_label': "设置",
+    'exit_app': "退出",
+    'apply_label': "应用",
+    'cancel_label': "取消",
+    'download_log': "下载日志",
+    'export_compress': "压缩 (gzip)",
+    'export_range_all': "全部日志",
+    'export_range_hour': "最近一小时",
+    'export_range_day': "最近 24 小时",
+    'export_range_week': "最近 7 天",
+    'export_done': "日志已保存",
+    'export_failed': "保存日志失败",
+    'language': "语言",
+    'language_name': "中文",
+    'enable_logging': "启用日志记录",
+    'enable_binary_log': "二进制指标日志",
+    'show_graph_zoom_controls': "显示图表缩放按钮",
+    'zoom_out': "缩小",
+    'reset_zoom': "重置缩放",
+    'zoom_in': "放大",
+    'graph_commands_title': "图表命令",
+    'graph_unavailable': "图表不可用",
+    'graph_send_failed': "发送图表图片失败",
+    'unknown_command': "未知命令",
+    'unknown_command_help': "请使用 /help",
+    'keyboard_clicks': "键盘点击",
+    'mouse_clicks': "鼠标点击",
+    'power_off': "关闭电源",
+    'reboot': "重启",
+    'lock': "锁屏",
+    'settings': "设置",
+    'minutes': "分钟:",
+    'action': "操作:",
+    'apply': "应用",
+    'cancel': "取消",
+    'reset': "重置",
+    'confirm_title': "确认操作",
+    'confirm_text_power_off': "关闭计算机？",
+    'confirm_text_reboot': "重启计算机？",
+    'confirm_text_lock': "锁定屏幕？",
+    'scheduled': "已安排",
+    'error': "错误",
+    'error_minutes_positive': "请输入大于0的值。",
+    'notification': "通知",
+    'action_in_1_min': "{} 还有1分钟。",
+    'action_in_time': "{} 还有{}分钟。",
+    'cancelled': "已取消",
+    'cancelled_text': "已取消计划操作。",
+
+    'token_bot': "机器人令牌:",
+    'id_chat': "聊天ID:",
+    'time_send': "发送间隔（秒）:",
+    'screenshot_quality': "截图质量：",
+    'quality_low': "低",
+    'quality_medium': "中",
+    'quality_max': "高",
+    'check_telegram': "检查",
+    'bot_message': "请输入机器人令牌和聊天ID",
+    'test_message': "测试通知",
+    'test_message_ok': "测试消息已成功发送。",
+    'test_message_error': "无法发送测试消息。请检查您的信息。",
+    'setting_telegram_error': "无法保存Telegram配置。",
+    'telegram_notification': "Telegram 通知",
+    'ok': "成功",
+
+    'discord_notification': 'Discord 通知',
+    'webhook_url': 'Webhook URL',
+    'check_discord': '检查',
+    'webhook_required': '请输入 Discord 的 Webhook URL',
+    'setting_discord_error': '保存 Discord 设置时出错',
+
+    'system_status': '系统状态',
+    'cpu': 'CPU',
+    'ram': '内存',
+    'swap': '交换空间',
+    'disk': '磁盘',
+    'network': '网络',
+    'uptime': '运行时间',
+    'keyboard': '键盘',
+    'mouse': '鼠标',
+    'clicks': '次点击',
+    'presses': '次按键',
+    'gb': 'GB',
+    'mbps': 'MB/s',
+    'temperature': '°C',
+
+    'max_log_size_mb': '日志文件的最大大小 (MB)',
+    'log_backups': '压缩日志备份数',
+    'log_compression_none': '不压缩',
+    'alerts_section': '告警',
+    'alerts_enabled': '基于规则的告警',
+    'alert_rules_hint': '每行一条规则，例如：cpu_temp > 90 for 30s、disk > 95%、cpu_usage zscore > 4',
+    'alert_firing': '告警触发',
+    'alert_resolved': '告警解除',
+    'graph_history_minutes': '图表历史记录（分钟）',
+    'graph_history_hint': '范围：{}–{} 分钟（最多 {} 小时）。',
+    'history_retention_days': '磁盘历史保留（天）',
+    'graph_colors_title': '图表颜色',
+    'graph_colors_info': '为每个图表选择线条颜色。',
+
+    'ping_network': '网络连通性测试（ping）',
+    'ping_running': '正在进行网络测试…',
+    'ping_done': '已完成测试：',
+    'ping_error': '执行 ping 时出错',
+    'system_info': '系统信息',
+    'menu_order_title': '菜单项顺序',
+    'display_section': '显示',
+    'display_tab': '显示',
+    'poll_interval_tab': '延迟',
+    'poll_interval_section': '轮询间隔（秒）',
+    'logging_section': '日志和图表',
+    'logging_tab': '日志',
+    'license_tab': '许可证',
+    'license_info': '项目许可证和使用条款可在 SyMo 的 GitHub 仓库中查看。',
+    'notification_section': '通知',
+    'system_info_title': '电脑配置',
+    'system_info_error': '无法获取系统信息',
+    'unknown_value': '未知',
+    'system_label': '系统',
+    'hostname_label': '主机名',
+    'architecture_label': '架构',
+    'python_version_label': 'Python 版本',
+    'cpu_label': '处理器',
+    'cores_label': '物理核心',
+    'threads_label': '线程',
+    'cpu_frequency_label': 'CPU 频率',
+    'ram_total_label': '内存总量',
+    'ram_available_label': '可用内存',
+    'swap_total_label': '交换分区总量',
+    'disk_total_label': '磁盘总量',
+    'disk_free_label': '可用磁盘',
+    'boot_time_label': '启动时间',
+    'uptime_day_one': '天',
+    'uptime_day_few': '天',
+    'uptime_day_many': '天',
+
+    'bot_shutdown_message': "🔌 正在关闭系统...",
+    'bot_reboot_message': "🔄 正在重启系统...",
+    'bot_lock_message': "🔒 正在锁定屏幕...",
+    'bot_help_message': "🤖 可用命令:\n/status - 当前系统状态\n/screenshot - 捕获桌面截图\n/poweroff - 关闭计算机\n/reboot - 重启计算机\n/lock - 锁定计算机\n/help - 帮助信息",
+    'bot_screenshot_processing': "📸 正在截图，请稍候...",
+    'bot_screenshot_caption': "桌面截图",
+    'bot_screenshot_sent': "截图已发送。",
+    'bot_screenshot_failed': "无法截图。请检查图形会话（非 headless）、Wayland/X11 权限，并确认已安装 gnome-screenshot/scrot/grim/import。",
+    'bot_screenshot_send_error': "截图已创建，但发送到 Telegram 失败。",
+    'bot_screenshot_howto': "修复方法：1）在普通用户图形会话中运行 SyMo（不要使用 sudo/systemd）。2）安装工具：sudo apt install gnome-screenshot。3）再次执行 /screenshot。",
+}
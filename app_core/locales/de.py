@@ -0,0 +1,160 @@
+STRINGS = {
+    'cpu_tray': "CPU im Tray",
+    'ram_tray': "RAM im Tray",
+    'cpu_info': " CPU",
+    'ram_loading': "RAM",
+    'swap_loading': "Auslagerung",
+    'disk_loading': "Festplatte",
+    'lan_speed': "Netzwerk",
+    'uptime_label': "Betriebszeit",
+    'cpu_cores_label': "CPU-Kerne",
+    'net_interfaces_label': "Netzwerkschnittstellen",
+    'mounts_label': "Dateisysteme",
+    'disk_io_label': "Datenträger-E/A",
+    'settings_label': "Einstellungen",
+    'exit_app': "Beenden",
+    'apply_label': "Übernehmen",
+    'cancel_label': "Abbrechen",
+    'download_log': "Herunterladen",
+    'export_compress': "Komprimieren (gzip)",
+    'export_range_all': "Gesamtes Protokoll",
+    'export_range_hour': "Letzte Stunde",
+    'export_range_day': "Letzte 24 Stunden",
+    'export_range_week': "Letzte 7 Tage",
+    'export_done': "Protokoll gespeichert",
+    'export_failed': "Protokoll konnte nicht gespeichert werden",
+    'language': "Sprache",
+    'language_name': "Deutsch",
+    'enable_logging': "Protokolle",
+    'enable_binary_log': "Binäres Metrikprotokoll",
+    'show_graph_zoom_controls': "Graph-Zoom-Schaltflächen anzeigen",
+    'zoom_out': "Verkleinern",
+    'reset_zoom': "Zoom zurücksetzen",
+    'zoom_in': "Vergrößern",
+    'graph_commands_title': "Graph-Befehle",
+    'graph_unavailable': "Graph nicht verfügbar",
+    'graph_send_failed': "Graphbild konnte nicht gesendet werden",
+    'unknown_command': "Unbekannter Befehl",
+    'unknown_command_help': "Verwenden Sie /help",
+    'keyboard_clicks': "Tastenklicks",
+    'mouse_clicks': "Mausklicks",
+    'power_off': "Herunterfahren",
+    'reboot': "Neustart",
+    'lock': "Sperren",
+    'settings': "Einstellungen",
+    'minutes': "Minuten:",
+    'action': "Aktion:",
+    'apply': "Übernehmen",
+    'cancel': "Abbrechen",
+    'reset': "Zurücksetzen",
+    'confirm_title': "Aktion bestätigen",
+    'confirm_text_power_off': "Computer ausschalten?",
+    'confirm_text_reboot': "Computer neu starten?",
+    'confirm_text_lock': "Bildschirm sperren?",
+    'scheduled': "Geplant",
+    'error': "Fehler",
+    'error_minutes_positive': "Bitte geben Sie einen Wert größer als 0 ein.",
+    'notification': "Benachrichtigung",
+    'action_in_1_min': "{} in 1 Minute.",
+    'action_in_time': "{} in {} Minuten.",
+    'cancelled': "Abgebrochen",
+    'cancelled_text': "Geplante Aktion abgebrochen.",
+
+    'token_bot': "Token:",
+    'id_chat': "ID:",
+    'time_send': "Intervall (sek.):",
+    'screenshot_quality': "Screenshot-Qualität:",
+    'quality_low': "Niedrig",
+    'quality_medium': "Mittel",
+    'quality_max': "Maximal",
+    'check_telegram': "Prüfen",
+    'bot_message': "Bitte geben Sie den Bot-Token und die Chat-ID ein",
+    'test_message': "Testbenachrichtigung",
+    'test_message_ok': "Testnachricht wurde erfolgreich gesendet.",
+    'test_message_error': "Testnachricht konnte nicht gesendet werden. Bitte überprüfen Sie Ihre Angaben.",
+    'setting_telegram_error': "Telegram Konfiguration konnte nicht gespeichert werden.",
+    'telegram_notification': "Telegram Benachrichtigungen",
+    'ok': "Erfolg",
+
+    'discord_notification': 'Discord Benachrichtigungen',
+    'webhook_url': 'Webhook-URL',
+    'check_discord': 'Überprüfen',
+    'webhook_required': 'Bitte geben Sie die Discord Webhook-URL ein.',
+    'setting_discord_error': 'Fehler beim Speichern der Discord-Einstellungen.',
+
+    'system_status': 'Systemstatus',
+    'cpu': 'CPU',
+    'ram': 'RAM',
+    'swap': 'Swap',
+    'disk': 'Festplatte',
+    'network': 'Netzwerk',
+    'uptime': 'Laufzeit',
+    'keyboard': 'Tastatur',
+    'mouse': 'Maus',
+    'clicks': 'Klicks',
+    'presses': 'Tastendrücke',
+    'gb': 'GB',
+    'mbps': 'MB/s',
+    'temperature': '°C',
+
+    'max_log_size_mb': 'Maximale Protokolldateigröße (MB)',
+    'log_backups': 'Komprimierte Protokollsicherungen',
+    'log_compression_none': 'ohne Komprimierung',
+    'alerts_section': 'Warnungen',
+    'alerts_enabled': 'Regelbasierte Warnungen',
+    'alert_rules_hint': 'Eine Regel pro Zeile, z. B. cpu_temp > 90 for 30s, disk > 95%, cpu_usage zscore > 4',
+    'alert_firing': 'Warnung ausgelöst',
+    'alert_resolved': 'Warnung aufgehoben',
+    'graph_history_minutes': 'Diagrammverlauf (Min.)',
+    'graph_history_hint': 'Bereich: {}–{} Min (bis zu {} Stunden).',
+    'history_retention_days': 'Verlauf auf Festplatte behalten (Tage)',
+    'graph_colors_title': 'Diagrammfarben',
+    'graph_colors_info': 'Wählen Sie Linienfarben für jedes Diagramm.',
+
+    'ping_network': 'Netzwerk prüfen (Ping)',
+    'ping_running': 'Netzwerkprüfung läuft…',
+    'ping_done': 'Prüfung abgeschlossen für',
+    'ping_error': 'Fehler beim Ausführen von Ping',
+    'system_info': 'Systeminformationen',
+    'menu_order_title': 'Reihenfolge der Menüpunkte',
+    'display_section': 'Anzeige',
+    'display_tab': 'Anzeige',
+    'poll_interval_tab': 'Verzögerung',
+    'poll_interval_section': 'Abfrageintervall (Sek.)',
+    'logging_section': 'Protokolle und Diagramme',
+    'logging_tab': 'Protokollierung',
+    'license_tab': 'Lizenz',
+    'license_info': 'Projektlizenz und Nutzungsbedingungen sind im SyMo-GitHub-Repository verfügbar.',
+    'notification_section': 'Benachrichtigungen',
+    'system_info_title': 'PC-Spezifikationen',
+    'system_info_error': 'Systeminformationen konnten nicht ermittelt werden',
+    'unknown_value': 'Unbekannt',
+    'system_label': 'System',
+    'hostname_label': 'Hostname',
+    'architecture_label': 'Architektur',
+    'python_version_label': 'Python-Version',
+    'cpu_label': 'Prozessor',
+    'cores_label': 'Physische Kerne',
+    'threads_label': 'Threads',
+    'cpu_frequency_label': 'CPU-Takt',
+    'ram_total_label': 'RAM gesamt',
+    'ram_available_label': 'RAM verfügbar',
+    'swap_total_label': 'Swap gesamt',
+    'disk_total_label': 'Festplatte gesamt',
+    'disk_free_label': 'Festplatte frei',
+    'boot_time_label': 'Startzeit',
+    'uptime_day_one': 'Tag',
+    'uptime_day_few': 'Tage',
+    'uptime_day_many': 'Tage',
+
+    'bot_shutdown_message': "🔌 System wird heruntergefahren...",
+    'bot_reboot_message': "🔄 System wird neu gestartet...",
+    'bot_lock_message': "🔒 Bildschirm wird gesperrt...",
+    'bot_help_message': "🤖 Verfügbare Befehle:\n/status - aktueller Systemstatus\n/screenshot - Desktop-Screenshot erstellen\n/poweroff - Computer ausschalten\n/reboot - Computer neu starten\n/lock - Computer sperren\n/help - diese Hilfe",
+    'bot_screenshot_processing': "📸 Screenshot wird erstellt, bitte warten...",
+    'bot_screenshot_caption': "Desktop-Screenshot",
+    'bot_screenshot_sent': "Screenshot gesendet.",
+    'bot_screenshot_failed': "Screenshot konnte nicht erstellt werden. Bitte prüfen Sie die grafische Sitzung (nicht headless), Wayland/X11-Berechtigungen und ob gnome-screenshot/scrot/grim/import installiert ist.",
+    'bot_screenshot_send_error': "Screenshot wurde erstellt, aber das Senden an Telegram ist fehlgeschlagen.",
+    'bot_screenshot_howto': "So beheben Sie das Problem: 1) SyMo in einer normalen grafischen Benutzersitzung starten (nicht via sudo/systemd). 2) Tool installieren: sudo apt install gnome-screenshot. 3) /screenshot erneut ausführen.",
+}
@@ -0,0 +1,160 @@
+STRINGS = {
+    'cpu_tray': "CPU in tray",
+    'ram_tray': "RAM in tray",
+    'cpu_info': " CPU",
+    'ram_loading': "RAM",
+    'swap_loading': "Swap",
+    'disk_loading': "Disk",
+    'lan_speed': "Network",
+    'uptime_label': "Uptime",
+    'cpu_cores_label': "CPU cores",
+    'net_interfaces_label': "Network interfaces",
+    'mounts_label': "Filesystems",
+    'disk_io_label': "Disk I/O",
+    'settings_label': "Settings",
+    'exit_app': "Exit",
+    'apply_label': "Apply",
+    'cancel_label': "Cancel",
+    'download_log': "Download",
+    'export_compress': "Compress (gzip)",
+    'export_range_all': "Whole log",
+    'export_range_hour': "Last hour",
+    'export_range_day': "Last 24 hours",
+    'export_range_week': "Last 7 days",
+    'export_done': "Log saved",
+    'export_failed': "Failed to save log",
+    'language': "Language",
+    'language_name': "English",
+    'enable_logging': "Enable logging",
+    'enable_binary_log': "Binary metrics log",
+    'show_graph_zoom_controls': "Show graph zoom buttons",
+    'zoom_out': "Zoom out",
+    'reset_zoom': "Reset zoom",
+    'zoom_in': "Zoom in",
+    'graph_commands_title': "Graph commands",
+    'graph_unavailable': "Graph is unavailable",
+    'graph_send_failed': "Failed to send graph image",
+    'unknown_command': "Unknown command",
+    'unknown_command_help': "Use /help",
+    'keyboard_clicks': "Keyboard clicks",
+    'mouse_clicks': "Mouse clicks",
+    'power_off': "Power Off",
+    'reboot': "Reboot",
+    'lock': "Lock",
+    'settings': "Settings",
+    'minutes': "Minutes:",
+    'action': "Action:",
+    'apply': "Apply",
+    'cancel': "Cancel",
+    'reset': "Reset",
+    'confirm_title': "Confirm Action",
+    'confirm_text_power_off': "Power off the computer?",
+    'confirm_text_reboot': "Reboot the computer?",
+    'confirm_text_lock': "Lock the screen?",
+    'scheduled': "Scheduled",
+    'error': "Error",
+    'error_minutes_positive': "Please enter a value greater than 0.",
+    'notification': "Notification",
+    'action_in_1_min': "{} in 1 minute.",
+    'action_in_time': "{} in {} minutes.",
+    'cancelled': "Cancelled",
+    'cancelled_text': "Scheduled action cancelled.",
+
+    'token_bot': "Token:",
+    'id_chat': "ID:",
+    'time_send': "Interval (sec.):",
+    'screenshot_quality': "Screenshot quality:",
+    'quality_low': "Low",
+    'quality_medium': "Medium",
+    'quality_max': "Maximum",
+    'check_telegram': "Check",
+    'bot_message': "Please enter the bot token and chat ID",
+    'test_message': "Test notification",
+    'test_message_ok': "Test message was sent successfully.",
+    'test_message_error': "Failed to send test message. Please check your data.",
+    'setting_telegram_error': "Failed to save Telegram configuration.",
+    'telegram_notification': "Telegram notifications",
+    'ok': "Success",
+
+    'discord_notification': 'Discord Notifications',
+    'webhook_url': 'Webhook URL',
+    'check_discord': 'Test',
+    'webhook_required': 'Please enter Discord webhook URL.',
+    'setting_discord_error': 'Failed to save Discord settings.',
+
+    'system_status': 'System Status',
+    'cpu': 'CPU',
+    'ram': 'RAM',
+    'swap': 'Swap',
+    'disk': 'Disk',
+    'network': 'Network',
+    'uptime': 'Uptime',
+    'keyboard': 'Keyboard',
+    'mouse': 'Mouse',
+    'clicks': 'clicks',
+    'presses': 'presses',
+    'gb': 'GB',
+    'mbps': 'MB/s',
+    'temperature': '°C',
+
+    'max_log_size_mb': 'Maximum log file size (MB)',
+    'log_backups': 'Compressed log backups',
+    'log_compression_none': 'no compression',
+    'alerts_section': 'Alerts',
+    'alerts_enabled': 'Rule-based alerts',
+    'alert_rules_hint': 'One rule per line, e.g. cpu_temp > 90 for 30s, disk > 95%, cpu_usage zscore > 4',
+    'alert_firing': 'Alert triggered',
+    'alert_resolved': 'Alert resolved',
+    'graph_history_minutes': 'Graph history (min)',
+    'graph_history_hint': 'Range: {}–{} min (up to {} hours).',
+    'history_retention_days': 'Keep history on disk (days)',
+    'graph_colors_title': 'Graph colors',
+    'graph_colors_info': 'Choose line colors for each graph.',
+
+    'ping_network': 'Ping network',
+    'ping_running': 'Running network check…',
+    'ping_done': 'Ping finished for',
+    'ping_error': 'Error running ping',
+    'system_info': 'System information',
+    'menu_order_title': 'Menu item order',
+    'display_section': 'Display',
+    'display_tab': 'Display',
+    'poll_interval_tab': 'Delay',
+    'poll_interval_section': 'Polling interval (sec.)',
+    'logging_section': 'Logs and charts',
+    'logging_tab': 'Logging',
+    'license_tab': 'License',
+    'license_info': 'Project license and usage terms are available in the SyMo GitHub repository.',
+    'notification_section': 'Notifications',
+    'system_info_title': 'PC specifications',
+    'system_info_error': 'Failed to collect system information',
+    'unknown_value': 'Unknown',
+    'system_label': 'System',
+    'hostname_label': 'Hostname',
+    'architecture_label': 'Architecture',
+    'python_version_label': 'Python version',
+    'cpu_label': 'CPU',
+    'cores_label': 'Physical cores',
+    'threads_label': 'Threads',
+    'cpu_frequency_label': 'CPU frequency',
+    'ram_total_label': 'RAM total',
+    'ram_available_label': 'RAM available',
+    'swap_total_label': 'Swap total',
+    'disk_total_label': 'Disk total',
+    'disk_free_label': 'Disk free',
+    'boot_time_label': 'Boot time',
+    'uptime_day_one': 'day',
+    'uptime_day_few': 'days',
+    'uptime_day_many': 'days',
+
+    'bot_shutdown_message': "🔌 Shutting down system...",
+    'bot_reboot_message': "🔄 Rebooting system...",
+    'bot_lock_message': "🔒 Locking screen...",
+    'bot_help_message': "🤖 Available commands:\n/status - current system status\n/screenshot - capture desktop screenshot\n/poweroff - shutdown computer\n/reboot - reboot computer\n/lock - lock computer\n/help - this help",
+    'bot_screenshot_processing': "📸 Taking screenshot, please wait...",
+    'bot_screenshot_caption': "Desktop screenshot",
+    'bot_screenshot_sent': "Screenshot sent.",
+    'bot_screenshot_failed': "Could not take screenshot. Check graphical session (not headless), Wayland/X11 permissions, and gnome-screenshot/scrot/grim/import availability.",
+    'bot_screenshot_send_error': "Screenshot captured, but failed to send it to Telegram.",
+    'bot_screenshot_howto': "How to fix: 1) Run SyMo in your regular user GUI session (not via sudo/systemd). 2) Install a tool: sudo apt install gnome-screenshot. 3) Run /screenshot again.",
+}
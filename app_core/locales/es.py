@@ -0,0 +1,160 @@
+STRINGS = {
+    'cpu_tray': "CPU en bandeja",
+    'ram_tray': "RAM en bandeja",
+    'cpu_info': " CPU",
+    'ram_loading': "RAM",
+    'swap_loading': "Swap",
+    'disk_loading': "Disco",
+    'lan_speed': "Red",
+    'uptime_label': "Tiempo de actividad",
+    'cpu_cores_label': "Núcleos de CPU",
+    'net_interfaces_label': "Interfaces de red",
+    'mounts_label': "Sistemas de archivos",
+    'disk_io_label': "E/S de disco",
+    'settings_label': "Configuración",
+    'exit_app': "Salir",
+    'apply_label': "Aplicar",
+    'cancel_label': "Cancelar",
+    'download_log': " Descargar ",
+    'export_compress': "Comprimir (gzip)",
+    'export_range_all': "Todo el registro",
+    'export_range_hour': "Última hora",
+    'export_range_day': "Últimas 24 horas",
+    'export_range_week': "Últimos 7 días",
+    'export_done': "Registro guardado",
+    'export_failed': "No se pudo guardar el registro",
+    'language': "Idioma",
+    'language_name': "Español",
+    'enable_logging': "Registro de logs",
+    'enable_binary_log': "Registro binario de métricas",
+    'show_graph_zoom_controls': "Mostrar botones de zoom del gráfico",
+    'zoom_out': "Alejar",
+    'reset_zoom': "Restablecer zoom",
+    'zoom_in': "Acercar",
+    'graph_commands_title': "Comandos de gráficos",
+    'graph_unavailable': "Gráfico no disponible",
+    'graph_send_failed': "No se pudo enviar la imagen del gráfico",
+    'unknown_command': "Comando desconocido",
+    'unknown_command_help': "Usa /help",
+    'keyboard_clicks': "Pulsaciones de teclas",
+    'mouse_clicks': "Clics del ratón",
+    'power_off': "Apagar",
+    'reboot': "Reiniciar",
+    'lock': "Bloquear pantalla",
+    'settings': "Temporizador",
+    'minutes': "Minutos:",
+    'action': "Acción:",
+    'apply': "Aplicar",
+    'cancel': "Cancelar",
+    'reset': "Restablecer",
+    'confirm_title': "Confirmar acción",
+    'confirm_text_power_off': "¿Apagar el equipo?",
+    'confirm_text_reboot': "¿Reiniciar el equipo?",
+    'confirm_text_lock': "¿Bloquear la pantalla?",
+    'scheduled': "Programado",
+    'error': "Error",
+    'error_minutes_positive': "Introduce un valor mayor que 0.",
+    'notification': "Advertencia",
+    'action_in_1_min': "{} en 1 minuto.",
+    'action_in_time': "{} en {} minutos.",
+    'cancelled': "Cancelado",
+    'cancelled_text': "Acción programada cancelada.",
+
+    'token_bot': "Token:",
+    'id_chat': "ID de chat:",
+    'time_send': "Tiempo notificación (seg.):",
+    'screenshot_quality': "Calidad de captura:",
+    'quality_low': "Baja",
+    'quality_medium': "Media",
+    'quality_max': "Máxima",
+    'check_telegram': "Comprobar",
+    'bot_message': "Introduce el token del bot y el ID del chat",
+    'test_message': "Notificación de prueba",
+    'test_message_ok': "Mensaje de prueba enviado con éxito.",
+    'test_message_error': "No se pudo enviar el mensaje de prueba. Verifica los datos.",
+    'setting_telegram_error': "No se pudo guardar la configuración de Telegram.",
+    'telegram_notification': "Notificaciones Telegram",
+    'ok': "Éxito",
+
+    'discord_notification': 'Notificaciones Discord',
+    'webhook_url': 'URL Webhook',
+    'check_discord': 'Comprobar',
+    'webhook_required': 'Introduce la URL del webhook de Discord.',
+    'setting_discord_error': 'Error al guardar la configuración de Discord.',
+
+    'system_status': 'Estado del sistema',
+    'cpu': 'CPU',
+    'ram': 'RAM',
+    'swap': 'Swap',
+    'disk': 'Disco',
+    'network': 'Red',
+    'uptime': 'Tiempo de actividad',
+    'keyboard': 'Teclado',
+    'mouse': 'Ratón',
+    'clicks': 'clics',
+    'presses': 'pulsaciones',
+    'gb': 'GB',
+    'mbps': 'MB/s',
+    'temperature': '°C',
+
+    'max_log_size_mb': 'Tamaño máximo del archivo de registro (MB)',
+    'log_backups': 'Copias de registro comprimidas',
+    'log_compression_none': 'sin compresión',
+    'alerts_section': 'Alertas',
+    'alerts_enabled': 'Alertas basadas en reglas',
+    'alert_rules_hint': 'Una regla por línea, p. ej. cpu_temp > 90 for 30s, disk > 95%, cpu_usage zscore > 4',
+    'alert_firing': 'Alerta activada',
+    'alert_resolved': 'Alerta resuelta',
+    'graph_history_minutes': 'Historial de gráficos (min)',
+    'graph_history_hint': 'Rango: {}–{} min (hasta {} horas).',
+    'history_retention_days': 'Conservar historial en disco (días)',
+    'graph_colors_title': 'Colores de gráficos',
+    'graph_colors_info': 'Elige los colores de línea para cada gráfico.',
+
+    'ping_network': 'Probar red (ping)',
+    'ping_running': 'Comprobando la red…',
+    'ping_done': 'Comprobación finalizada para',
+    'ping_error': 'Error al ejecutar ping',
+    'system_info': 'Información del sistema',
+    'menu_order_title': 'Orden de elementos del menú',
+    'display_section': 'Visualización',
+    'display_tab': 'Visualización',
+    'poll_interval_tab': 'Retraso',
+    'poll_interval_section': 'Intervalo de sondeo (seg.)',
+    'logging_section': 'Registros y gráficos',
+    'logging_tab': 'Registro',
+    'license_tab': 'Licencia',
+    'license_info': 'La licencia del proyecto y las condiciones de uso están disponibles en el repositorio de SyMo en GitHub.',
+    'notification_section': 'Notificaciones',
+    'system_info_title': 'Especificaciones del PC',
+    'system_info_error': 'No se pudo obtener la información del sistema',
+    'unknown_value': 'Desconocido',
+    'system_label': 'Sistema',
+    'hostname_label': 'Nombre del host',
+    'architecture_label': 'Arquitectura',
+    'python_version_label': 'Versión de Python',
+    'cpu_label': 'CPU',
+    'cores_label': 'Núcleos físicos',
+    'threads_label': 'Hilos',
+    'cpu_frequency_label': 'Frecuencia de CPU',
+    'ram_total_label': 'RAM total',
+    'ram_available_label': 'RAM disponible',
+    'swap_total_label': 'Swap total',
+    'disk_total_label': 'Disco total',
+    'disk_free_label': 'Disco libre',
+    'boot_time_label': 'Hora de inicio',
+    'uptime_day_one': 'día',
+    'uptime_day_few': 'días',
+    'uptime_day_many': 'días',
+
+    'bot_shutdown_message': "🔌 Apagando el sistema...",
+    'bot_reboot_message': "🔄 Reiniciando el sistema...",
+    'bot_lock_message': "🔒 Bloqueando la pantalla...",
+    'bot_help_message': "🤖 Comandos disponibles:\n/status - estado actual del sistema\n/screenshot - capturar pantalla del escritorio\n/poweroff - apagar computadora\n/reboot - reiniciar computadora\n/lock - bloquear computadora\n/help - esta ayuda",
+    'bot_screenshot_processing': "📸 Tomando captura, por favor espera...",
+    'bot_screenshot_caption': "Captura del escritorio",
+    'bot_screenshot_sent': "Captura enviada.",
+    'bot_screenshot_failed': "No se pudo tomar la captura. Verifica la sesión gráfica (no headless), permisos Wayland/X11 y la instalación de gnome-screenshot/scrot/grim/import.",
+    'bot_screenshot_send_error': "Se tomó la captura, pero falló el envío a Telegram.",
+    'bot_screenshot_howto': "Cómo solucionarlo: 1) Ejecuta SyMo en una sesión gráfica de usuario normal (no con sudo/systemd). 2) Instala: sudo apt install gnome-screenshot. 3) Repite /screenshot.",
+}
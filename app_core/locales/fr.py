@@ -0,0 +1,160 @@
+STRINGS = {
+    'cpu_tray': "CPU dans la barre",
+    'ram_tray': "RAM dans la barre",
+    'cpu_info': " CPU",
+    'ram_loading': "RAM",
+    'swap_loading': "Swap",
+    'disk_loading': "Disque",
+    'lan_speed': "Réseau",
+    'uptime_label': "Temps de fonctionnement",
+    'cpu_cores_label': "Cœurs CPU",
+    'net_interfaces_label': "Interfaces réseau",
+    'mounts_label': "Systèmes de fichiers",
+    'disk_io_label': "E/S disque",
+    'settings_label': "Paramètres",
+    'exit_app': "Quitter",
+    'apply_label': "Appliquer",
+    'cancel_label': "Annuler",
+    'download_log': " Télécharger ",
+    'export_compress': "Compresser (gzip)",
+    'export_range_all': "Journal complet",
+    'export_range_hour': "Dernière heure",
+    'export_range_day': "Dernières 24 heures",
+    'export_range_week': "7 derniers jours",
+    'export_done': "Journal enregistré",
+    'export_failed': "Échec de l'enregistrement du journal",
+    'language': "Langue",
+    'language_name': "Français",
+    'enable_logging': "Enregistrement des logs",
+    'enable_binary_log': "Journal binaire des métriques",
+    'show_graph_zoom_controls': "Afficher les boutons de zoom du graphique",
+    'zoom_out': "Zoom arrière",
+    'reset_zoom': "Réinitialiser le zoom",
+    'zoom_in': "Zoom avant",
+    'graph_commands_title': "Commandes de graphiques",
+    'graph_unavailable': "Graphique indisponible",
+    'graph_send_failed': "Échec de l'envoi de l'image du graphique",
+    'unknown_command': "Commande inconnue",
+    'unknown_command_help': "Utilisez /help",
+    'keyboard_clicks': "Frappes clavier",
+    'mouse_clicks': "Clics souris",
+    'power_off': "Arrêt",
+    'reboot': "Redémarrage",
+    'lock': "Verrouillage",
+    'settings': "Minuterie",
+    'minutes': "Minutes:",
+    'action': "Action :",
+    'apply': "Appliquer",
+    'cancel': "Annuler",
+    'reset': "Réinitialiser",
+    'confirm_title': "Confirmation d'action",
+    'confirm_text_power_off': "Éteindre l'ordinateur?",
+    'confirm_text_reboot': "Redémarrer l'ordinateur?",
+    'confirm_text_lock': "Verrouiller l'écran?",
+    'scheduled': "Planifié",
+    'error': "Erreur",
+    'error_minutes_positive': "Entrez une valeur supérieure à 0.",
+    'notification': "Avertissement",
+    'action_in_1_min': "{} dans 1 minute.",
+    'action_in_time': "{} dans {} minutes.",
+    'cancelled': "Annulé",
+    'cancelled_text': "Action planifiée annulée.",
+
+    'token_bot': "Token:",
+    'id_chat': "ID chat:",
+    'time_send': "Temps notification (sec.):",
+    'screenshot_quality': "Qualité de capture d’écran :",
+    'quality_low': "Faible",
+    'quality_medium': "Moyenne",
+    'quality_max': "Maximale",
+    'check_telegram': "Vérifier",
+    'bot_message': "Veuillez entrer le token du bot et l'ID du chat",
+    'test_message': "Notification test",
+    'test_message_ok': "Message test envoyé avec succès.",
+    'test_message_error': "Impossible d'envoyer le message test. Vérifiez vos données.",
+    'setting_telegram_error': "Impossible de sauvegarder la configuration Telegram.",
+    'telegram_notification': "Notifications Telegram",
+    'ok': "Succès",
+
+    'discord_notification': 'Notifications Discord',
+    'webhook_url': 'URL Webhook',
+    'check_discord': 'Vérifier',
+    'webhook_required': 'Entrez l\'URL webhook Discord.',
+    'setting_discord_error': 'Erreur de sauvegarde des paramètres Discord.',
+
+    'system_status': 'État du système',
+    'cpu': 'CPU',
+    'ram': 'RAM',
+    'swap': 'Swap',
+    'disk': 'Disque',
+    'network': 'Réseau',
+    'uptime': 'Temps de fonctionnement',
+    'keyboard': 'Clavier',
+    'mouse': 'Souris',
+    'clicks': 'clics',
+    'presses': 'frappes',
+    'gb': 'GB',
+    'mbps': 'MB/s',
+    'temperature': '°C',
+
+    'max_log_size_mb': 'Taille maximale du fichier journal (Mo)',
+    'log_backups': 'Sauvegardes de journal compressées',
+    'log_compression_none': 'sans compression',
+    'alerts_section': 'Alertes',
+    'alerts_enabled': 'Alertes basées sur des règles',
+    'alert_rules_hint': 'Une règle par ligne, p. ex. cpu_temp > 90 for 30s, disk > 95%, cpu_usage zscore > 4',
+    'alert_firing': 'Alerte déclenchée',
+    'alert_resolved': 'Alerte levée',
+    'graph_history_minutes': 'Historique des graphiques (min)',
+    'graph_history_hint': 'Plage : {}–{} min (jusqu’à {} heures).',
+    'history_retention_days': 'Conserver l’historique sur disque (jours)',
+    'graph_colors_title': 'Couleurs des graphiques',
+    'graph_colors_info': 'Choisissez les couleurs de ligne pour chaque graphique.',
+
+    'ping_network': 'Vérifier le réseau (ping)',
+    'ping_running': 'Vérification du réseau en cours…',
+    'ping_done': 'Vérification terminée pour',
+    'ping_error': 'Erreur lors de l\'exécution du ping',
+    'system_info': 'Informations système',
+    'menu_order_title': 'Ordre des éléments du menu',
+    'display_section': 'Affichage',
+    'display_tab': 'Affichage',
+    'poll_interval_tab': 'Délai',
+    'poll_interval_section': 'Intervalle d’interrogation (s)',
+    'logging_section': 'Journaux et graphiques',
+    'logging_tab': 'Journalisation',
+    'license_tab': 'Licence',
+    'license_info': 'La licence du projet et les conditions d’utilisation sont disponibles dans le dépôt GitHub de SyMo.',
+    'notification_section': 'Notifications',
+    'system_info_title': 'Caractéristiques du PC',
+    'system_info_error': 'Impossible de récupérer les informations système',
+    'unknown_value': 'Inconnu',
+    'system_label': 'Système',
+    'hostname_label': 'Nom d’hôte',
+    'architecture_label': 'Architecture',
+    'python_version_label': 'Version de Python',
+    'cpu_label': 'Processeur',
+    'cores_label': 'Cœurs physiques',
+    'threads_label': 'Threads',
+    'cpu_frequency_label': 'Fréquence CPU',
+    'ram_total_label': 'RAM totale',
+    'ram_available_label': 'RAM disponible',
+    'swap_total_label': 'Swap total',
+    'disk_total_label': 'Disque total',
+    'disk_free_label': 'Disque libre',
+    'boot_time_label': 'Heure de démarrage',
+    'uptime_day_one': 'jour',
+    'uptime_day_few': 'jours',
+    'uptime_day_many': 'jours',
+
+    'bot_shutdown_message': "🔌 Arrêt du système en cours...",
+    'bot_reboot_message': "🔄 Redémarrage du système en cours...",
+    'bot_lock_message': "🔒 Verrouillage de l'écran...",
+    'bot_help_message': "🤖 Commandes disponibles:\n/status - état actuel du système\n/screenshot - capturer l’écran du bureau\n/poweroff - éteindre l'ordinateur\n/reboot - redémarrer l'ordinateur\n/lock - verrouiller l'ordinateur\n/help - cette aide",
+    'bot_screenshot_processing': "📸 Capture d’écran en cours, veuillez patienter...",
+    'bot_screenshot_caption': "Capture d’écran du bureau",
+    'bot_screenshot_sent': "Capture envoyée.",
+    'bot_screenshot_failed': "Impossible de faire la capture. Vérifiez la session graphique (non headless), les permissions Wayland/X11 et la présence de gnome-screenshot/scrot/grim/import.",
+    'bot_screenshot_send_error': "Capture effectuée, mais l’envoi vers Telegram a échoué.",
+    'bot_screenshot_howto': "Comment corriger : 1) Lancez SyMo dans une session graphique utilisateur normale (pas via sudo/systemd). 2) Installez : sudo apt install gnome-screenshot. 3) Relancez /screenshot.",
+}
@@ -0,0 +1,160 @@
+STRINGS = {
+    'cpu_tray': "CPU in tray",
+    'ram_tray': "RAM in tray",
+    'cpu_info': " CPU",
+    'ram_loading': "RAM",
+    'swap_loading': "Swap",
+    'disk_loading': "Disco",
+    'lan_speed': "Rete",
+    'uptime_label': "Tempo di attività",
+    'cpu_cores_label': "Core CPU",
+    'net_interfaces_label': "Interfacce di rete",
+    'mounts_label': "File system",
+    'disk_io_label': "I/O disco",
+    'settings_label': "Impostazioni",
+    'exit_app': "Esci",
+    'apply_label': "Applica",
+    'cancel_label': "Annulla",
+    'download_log': " Scarica ",
+    'export_compress': "Comprimi (gzip)",
+    'export_range_all': "Tutto il log",
+    'export_range_hour': "Ultima ora",
+    'export_range_day': "Ultime 24 ore",
+    'export_range_week': "Ultimi 7 giorni",
+    'export_done': "Log salvato",
+    'export_failed': "Impossibile salvare il log",
+    'language': "Lingua",
+    'language_name': "Italiano",
+    'enable_logging': "Registrazione log",
+    'enable_binary_log': "Log binario delle metriche",
+    'show_graph_zoom_controls': "Mostra pulsanti zoom grafico",
+    'zoom_out': "Riduci zoom",
+    'reset_zoom': "Reimposta zoom",
+    'zoom_in': "Aumenta zoom",
+    'graph_commands_title': "Comandi grafici",
+    'graph_unavailable': "Grafico non disponibile",
+    'graph_send_failed': "Impossibile inviare l'immagine del grafico",
+    'unknown_command': "Comando sconosciuto",
+    'unknown_command_help': "Usa /help",
+    'keyboard_clicks': "Tasti premuti",
+    'mouse_clicks': "Clic del mouse",
+    'power_off': "Spegnimento",
+    'reboot': "Riavvio",
+    'lock': "Blocco schermo",
+    'settings': "Timer",
+    'minutes': "Minuti:",
+    'action': "Azione:",
+    'apply': "Applica",
+    'cancel': "Annulla",
+    'reset': "Resetta",
+    'confirm_title': "Conferma azione",
+    'confirm_text_power_off': "Spegnere il computer?",
+    'confirm_text_reboot': "Riavviare il computer?",
+    'confirm_text_lock': "Bloccare lo schermo?",
+    'scheduled': "Pianificato",
+    'error': "Errore",
+    'error_minutes_positive': "Inserisci un valore maggiore di 0.",
+    'notification': "Avviso",
+    'action_in_1_min': "{} tra 1 minuto.",
+    'action_in_time': "{} tra {} minuti.",
+    'cancelled': "Annullato",
+    'cancelled_text': "Azione pianificata annullata.",
+
+    'token_bot': "Token:",
+    'id_chat': "ID chat:",
+    'time_send': "Tempo notifica (sec.):",
+    'screenshot_quality': "Qualità screenshot:",
+    'quality_low': "Bassa",
+    'quality_medium': "Media",
+    'quality_max': "Massima",
+    'check_telegram': "Controlla",
+    'bot_message': "Inserisci il token del bot e l'ID della chat",
+    'test_message': "Notifica di test",
+    'test_message_ok': "Messaggio di test inviato con successo.",
+    'test_message_error': "Impossibile inviare il messaggio di test. Verifica i dati.",
+    'setting_telegram_error': "Impossibile salvare la configurazione Telegram.",
+    'telegram_notification': "Notifiche Telegram",
+    'ok': "Successo",
+
+    'discord_notification': 'Notifiche Discord',
+    'webhook_url': 'URL Webhook',
+    'check_discord': 'Controlla',
+    'webhook_required': 'Inserisci URL webhook Discord.',
+    'setting_discord_error': 'Errore nel salvare le impostazioni Discord.',
+
+    'system_status': 'Stato del sistema',
+    'cpu': 'CPU',
+    'ram': 'RAM',
+    'swap': 'Swap',
+    'disk': 'Disco',
+    'network': 'Rete',
+    'uptime': 'Tempo di attività',
+    'keyboard': 'Tastiera',
+    'mouse': 'Mouse',
+    'clicks': 'clic',
+    'presses': 'pressioni',
+    'gb': 'GB',
+    'mbps': 'MB/s',
+    'temperature': '°C',
+
+    'max_log_size_mb': 'Dimensione massima del file di log (MB)',
+    'log_backups': 'Backup di log compressi',
+    'log_compression_none': 'nessuna compressione',
+    'alerts_section': 'Avvisi',
+    'alerts_enabled': 'Avvisi basati su regole',
+    'alert_rules_hint': 'Una regola per riga, ad es. cpu_temp > 90 for 30s, disk > 95%, cpu_usage zscore > 4',
+    'alert_firing': 'Avviso attivato',
+    'alert_resolved': 'Avviso risolto',
+    'graph_history_minutes': 'Cronologia grafici (min)',
+    'graph_history_hint': 'Intervallo: {}–{} min (fino a {} ore).',
+    'history_retention_days': 'Conserva cronologia su disco (giorni)',
+    'graph_colors_title': 'Colori dei grafici',
+    'graph_colors_info': 'Scegli i colori delle linee per ogni grafico.',
+
+    'ping_network': 'Verifica rete (ping)',
+    'ping_running': 'Verifica della rete in corso…',
+    'ping_done': 'Verifica completata per',
+    'ping_error': 'Errore durante l\'esecuzione di ping',
+    'system_info': 'Informazioni di sistema',
+    'menu_order_title': 'Ordine delle voci del menu',
+    'display_section': 'Visualizzazione',
+    'display_tab': 'Visualizzazione',
+    'poll_interval_tab': 'Ritardo',
+    'poll_interval_section': 'Intervallo di polling (sec.)',
+    'logging_section': 'Log e grafici',
+    'logging_tab': 'Registrazione',
+    'license_tab': 'Licenza',
+    'license_info': 'La licenza del progetto e i termini d’uso sono disponibili nel repository GitHub di SyMo.',
+    'notification_section': 'Notifiche',
+    'system_info_title': 'Specifiche del PC',
+    'system_info_error': 'Impossibile ottenere le informazioni di sistema',
+    'unknown_value': 'Sconosciuto',
+    'system_label': 'Sistema',
+    'hostname_label': 'Nome host',
+    'architecture_label': 'Architettura',
+    'python_version_label': 'Versione di Python',
+    'cpu_label': 'CPU',
+    'cores_label': 'Core fisici',
+    'threads_label': 'Thread',
+    'cpu_frequency_label': 'Frequenza CPU',
+    'ram_total_label': 'RAM totale',
+    'ram_available_label': 'RAM disponibile',
+    'swap_total_label': 'Swap totale',
+    'disk_total_label': 'Disco totale',
+    'disk_free_label': 'Disco libero',
+    'boot_time_label': 'Ora di avvio',
+    'uptime_day_one': 'giorno',
+    'uptime_day_few': 'giorni',
+    'uptime_day_many': 'giorni',
+
+    'bot_shutdown_message': "🔌 Spegnimento del sistema in corso...",
+    'bot_reboot_message': "🔄 Riavvio del sistema in corso...",
+    'bot_lock_message': "🔒 Blocco dello schermo...",
+    'bot_help_message': "🤖 Comandi disponibili:\n/status - stato attuale del sistema\n/screenshot - cattura screenshot del desktop\n/poweroff - spegni computer\n/reboot - riavvia computer\n/lock - blocca computer\n/help - questo aiuto",
+    'bot_screenshot_processing': "📸 Catturo lo screenshot, attendi...",
+    'bot_screenshot_caption': "Screenshot desktop",
+    'bot_screenshot_sent': "Screenshot inviato.",
+    'bot_screenshot_failed': "Impossibile acquisire lo screenshot. Controlla la sessione grafica (non headless), i permessi Wayland/X11 e la presenza di gnome-screenshot/scrot/grim/import.",
+    'bot_screenshot_send_error': "Screenshot acquisito, ma invio su Telegram non riuscito.",
+    'bot_screenshot_howto': "Come risolvere: 1) Avvia SyMo in una normale sessione grafica utente (non via sudo/systemd). 2) Installa: sudo apt install gnome-screenshot. 3) Riprova /screenshot.",
+}
@@ -0,0 +1,160 @@
+STRINGS = {
+    'cpu_tray': "ЦПУ в трее",
+    'ram_tray': "ОЗУ в трее",
+    'cpu_info': " ЦПУ",
+    'ram_loading': "ОЗУ",
+    'swap_loading': "Подкачка",
+    'disk_loading': "Диск",
+    'lan_speed': "Сеть",
+    'uptime_label': "Время работы",
+    'cpu_cores_label': "Ядра ЦПУ",
+    'net_interfaces_label': "Сетевые интерфейсы",
+    'mounts_label': "Файловые системы",
+    'disk_io_label': "Дисковый ввод-вывод",
+    'settings_label': "Настройки",
+    'exit_app': "Выход",
+    'apply_label': "Применить",
+    'cancel_label': "Отмена",
+    'download_log': " Скачать ",
+    'export_compress': "Сжать (gzip)",
+    'export_range_all': "Весь лог",
+    'export_range_hour': "Последний час",
+    'export_range_day': "Последние 24 часа",
+    'export_range_week': "Последние 7 дней",
+    'export_done': "Лог сохранён",
+    'export_failed': "Не удалось сохранить лог",
+    'language': "Язык",
+    'language_name': "Русский",
+    'enable_logging': "Запись логирования",
+    'enable_binary_log': "Бинарный лог метрик",
+    'show_graph_zoom_controls': "Показывать кнопки масштаба графиков",
+    'zoom_out': "Уменьшить масштаб",
+    'reset_zoom': "Сбросить масштаб",
+    'zoom_in': "Увеличить масштаб",
+    'graph_commands_title': "Команды графиков",
+    'graph_unavailable': "График недоступен",
+    'graph_send_failed': "Не удалось отправить изображение графика",
+    'unknown_command': "Неизвестная команда",
+    'unknown_command_help': "Используйте /help",
+    'keyboard_clicks': "Нажатия клавиш",
+    'mouse_clicks': "Клики мыши",
+    'power_off': "Выключение",
+    'reboot': "Перезагрузка",
+    'lock': "Блокировка",
+    'settings': "Планировщик",
+    'minutes': "Минуты:",
+    'action': "Действие:",
+    'apply': "Применить",
+    'cancel': "Отмена",
+    'reset': "Сбросить",
+    'confirm_title': "Подтверждение действия",
+    'confirm_text_power_off': "Выключить компьютер?",
+    'confirm_text_reboot': "Перезагрузить компьютер?",
+    'confirm_text_lock': "Заблокировать экран?",
+    'scheduled': "Запланировано",
+    'error': "Ошибка",
+    'error_minutes_positive': "Введите значение больше 0.",
+    'notification': "Предупреждение",
+    'action_in_1_min': "{} через 1 минуту.",
+    'action_in_time': "{} через {} минут.",
+    'cancelled': "Отменено",
+    'cancelled_text': "Запланированное действие сброшено.",
+
+    'token_bot': "Токен:",
+    'id_chat': "ID чат:",
+    'time_send': "Время уведомления (сек.):",
+    'screenshot_quality': "Качество скриншота:",
+    'quality_low': "Низкое",
+    'quality_medium': "Среднее",
+    'quality_max': "Максимальное",
+    'check_telegram': "Проверить",
+    'bot_message': "Пожалуйста, введите токен бота и ID чата",
+    'test_message': "Тестовое уведомление",
+    'test_message_ok': "Тестовое сообщение успешно отправлено.",
+    'test_message_error': "Не удалось отправить тестовое сообщение. Проверьте ваши данные.",
+    'setting_telegram_error': "Не удалось сохранить конфигурацию Telegram.",
+    'telegram_notification': "Уведомления в Telegram",
+    'ok': "Успех",
+
+    'discord_notification': 'Уведомления в Discord',
+    'webhook_url': 'Webhook URL',
+    'check_discord': 'Проверить',
+    'webhook_required': 'Введите URL webhook Discord.',
+    'setting_discord_error': 'Ошибка сохранения настроек Discord.',
+
+    'system_status': 'Статус системы',
+    'cpu': 'ЦПУ',
+    'ram': 'ОЗУ',
+    'swap': 'Подкачка',
+    'disk': 'Диск',
+    'network': 'Сеть',
+    'uptime': 'Время работы',
+    'keyboard': 'Клавиши',
+    'mouse': 'Мышь',
+    'clicks': 'кликов',
+    'presses': 'нажатий',
+    'gb': 'ГБ',
+    'mbps': 'МБ/с',
+    'temperature': '°C',
+
+    'max_log_size_mb': 'Размер файла логов (МБ)',
+    'log_backups': 'Архивов логов (сжатых)',
+    'log_compression_none': 'без сжатия',
+    'alerts_section': 'Оповещения',
+    'alerts_enabled': 'Оповещения по правилам',
+    'alert_rules_hint': 'Одно правило в строке, например: cpu_temp > 90 for 30s, disk > 95%, cpu_usage zscore > 4',
+    'alert_firing': 'Сработало оповещение',
+    'alert_resolved': 'Оповещение снято',
+    'graph_history_minutes': 'История графиков (мин.)',
+    'graph_history_hint': 'Диапазон: {}–{} мин (до {} часов).',
+    'history_retention_days': 'Хранить историю на диске (дн.)',
+    'graph_colors_title': 'Цвета графиков',
+    'graph_colors_info': 'Выберите цвета линий для каждого графика.',
+
+    'ping_network': 'Проверить сеть',
+    'ping_running': 'Выполняется проверка сети…',
+    'ping_done': 'Проверка завершена для',
+    'ping_error': 'Ошибка при выполнении ping',
+    'system_info': 'Информация о системе',
+    'menu_order_title': 'Порядок отображения пунктов',
+    'display_section': 'Отображение в трее',
+    'display_tab': 'Отображение',
+    'poll_interval_tab': 'Задержка',
+    'poll_interval_section': 'Интервал опроса (сек.)',
+    'logging_section': 'Логи и графики',
+    'logging_tab': 'Логирование',
+    'license_tab': 'Лицензия',
+    'license_info': 'Лицензия проекта и условия использования доступны в репозитории SyMo на GitHub.',
+    'notification_section': 'Уведомления',
+    'system_info_title': 'Характеристики ПК',
+    'system_info_error': 'Не удалось получить информацию о системе',
+    'unknown_value': 'Неизвестно',
+    'system_label': 'Система',
+    'hostname_label': 'Имя хоста',
+    'architecture_label': 'Архитектура',
+    'python_version_label': 'Версия Python',
+    'cpu_label': 'Процессор',
+    'cores_label': 'Физические ядра',
+    'threads_label': 'Потоки',
+    'cpu_frequency_label': 'Частота CPU',
+    'ram_total_label': 'ОЗУ всего',
+    'ram_available_label': 'ОЗУ доступно',
+    'swap_total_label': 'Подкачка всего',
+    'disk_total_label': 'Диск всего',
+    'disk_free_label': 'Диск свободно',
+    'boot_time_label': 'Время загрузки',
+    'uptime_day_one': 'день',
+    'uptime_day_few': 'дня',
+    'uptime_day_many': 'дней',
+
+    'bot_shutdown_message': "🔌 Выполняется выключение системы...",
+    'bot_reboot_message': "🔄 Выполняется перезагрузка системы...",
+    'bot_lock_message': "🔒 Выполняется блокировка экрана...",
+    'bot_help_message': "🤖 Доступные команды:\n/status - текущий статус системы\n/screenshot - сделать скриншот экрана\n/poweroff - выключить компьютер\n/reboot - перезагрузить компьютер\n/lock - заблокировать компьютер\n/help - эта справка",
+    'bot_screenshot_processing': "📸 Делаю скриншот, подождите...",
+    'bot_screenshot_caption': "Скриншот рабочего стола",
+    'bot_screenshot_sent': "Скриншот отправлен.",
+    'bot_screenshot_failed': "Не удалось сделать скриншот. Проверьте графическую сессию (не headless), разрешения Wayland/X11 и наличие gnome-screenshot/scrot/grim/import.",
+    'bot_screenshot_send_error': "Скриншот сделан, но отправка в Telegram не удалась.",
+    'bot_screenshot_howto': "Как исправить: 1) Запустите SyMo в обычной пользовательской графической сессии (не через sudo/systemd). 2) Установите утилиту: sudo apt install gnome-screenshot. 3) Повторите команду /screenshot.",
+}
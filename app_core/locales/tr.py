@@ -0,0 +1,160 @@
+STRINGS = {
+    'cpu_tray': "Sistem çekmecesinde CPU",
+    'ram_tray': "Sistem çekmecesinde RAM",
+    'cpu_info': " CPU",
+    'ram_loading': "RAM",
+    'swap_loading': "Takas",
+    'disk_loading': "Disk",
+    'lan_speed': "Ağ",
+    'uptime_label': "Çalışma süresi",
+    'cpu_cores_label': "CPU çekirdekleri",
+    'net_interfaces_label': "Ağ arabirimleri",
+    'mounts_label': "Dosya sistemleri",
+    'disk_io_label': "Disk G/Ç",
+    'settings_label': "Ayarlar",
+    'exit_app': "Çıkış",
+    'apply_label': "Uygula",
+    'cancel_label': "İptal",
+    'download_log': " İndir ",
+    'export_compress': "Sıkıştır (gzip)",
+    'export_range_all': "Tüm günlük",
+    'export_range_hour': "Son saat",
+    'export_range_day': "Son 24 saat",
+    'export_range_week': "Son 7 gün",
+    'export_done': "Günlük kaydedildi",
+    'export_failed': "Günlük kaydedilemedi",
+    'language': "Dil",
+    'language_name': "Türkçe",
+    'enable_logging': "Günlük kaydı",
+    'enable_binary_log': "İkili metrik günlüğü",
+    'show_graph_zoom_controls': "Grafik yakınlaştırma düğmelerini göster",
+    'zoom_out': "Uzaklaştır",
+    'reset_zoom': "Yakınlaştırmayı sıfırla",
+    'zoom_in': "Yakınlaştır",
+    'graph_commands_title': "Grafik komutları",
+    'graph_unavailable': "Grafik kullanılamıyor",
+    'graph_send_failed': "Grafik görseli gönderilemedi",
+    'unknown_command': "Bilinmeyen komut",
+    'unknown_command_help': "/help kullanın",
+    'keyboard_clicks': "Tuş vuruşları",
+    'mouse_clicks': "Fare tıklamaları",
+    'power_off': "Kapat",
+    'reboot': "Yeniden başlat",
+    'lock': "Ekranı kilitle",
+    'settings': "Zamanlayıcı",
+    'minutes': "Dakika:",
+    'action': "Eylem:",
+    'apply': "Uygula",
+    'cancel': "İptal",
+    'reset': "Sıfırla",
+    'confirm_title': "Eylemi onayla",
+    'confirm_text_power_off': "Bilgisayar kapatılsın mı?",
+    'confirm_text_reboot': "Bilgisayar yeniden başlatılsın mı?",
+    'confirm_text_lock': "Ekran kilitlensin mi?",
+    'scheduled': "Planlandı",
+    'error': "Hata",
+    'error_minutes_positive': "0'dan büyük bir değer girin.",
+    'notification': "Uyarı",
+    'action_in_1_min': "{} 1 dakika içinde.",
+    'action_in_time': "{} {} dakika içinde.",
+    'cancelled': "İptal edildi",
+    'cancelled_text': "Planlanan eylem iptal edildi.",
+
+    'token_bot': "Token:",
+    'id_chat': "Sohbet ID:",
+    'time_send': "Bildirim zamanı (sn.):",
+    'screenshot_quality': "Ekran görüntüsü kalitesi:",
+    'quality_low': "Düşük",
+    'quality_medium': "Orta",
+    'quality_max': "Maksimum",
+    'check_telegram': "Kontrol et",
+    'bot_message': "Bot token'ını ve sohbet ID'sini girin",
+    'test_message': "Test bildirimi",
+    'test_message_ok': "Test mesajı başarıyla gönderildi.",
+    'test_message_error': "Test mesajı gönderilemedi. Verilerinizi kontrol edin.",
+    'setting_telegram_error': "Telegram yapılandırması kaydedilemedi.",
+    'telegram_notification': "Telegram Bildirimleri",
+    'ok': "Başarılı",
+
+    'discord_notification': 'Discord Bildirimleri',
+    'webhook_url': 'Webhook URL',
+    'check_discord': 'Kontrol et',
+    'webhook_required': 'Discord webhook URL\'sini girin.',
+    'setting_discord_error': 'Discord ayarları kaydedilirken hata.',
+
+    'system_status': 'Sistem durumu',
+    'cpu': 'CPU',
+    'ram': 'RAM',
+    'swap': 'Swap',
+    'disk': 'Disk',
+    'network': 'Ağ',
+    'uptime': 'Çalışma süresi',
+    'keyboard': 'Klavye',
+    'mouse': 'Fare',
+    'clicks': 'tıklama',
+    'presses': 'tuş basımı',
+    'gb': 'GB',
+    'mbps': 'MB/s',
+    'temperature': '°C',
+
+    'max_log_size_mb': 'Maksimum günlük dosyası boyutu (MB)',
+    'log_backups': 'Sıkıştırılmış günlük yedekleri',
+    'log_compression_none': 'sıkıştırma yok',
+    'alerts_section': 'Uyarılar',
+    'alerts_enabled': 'Kural tabanlı uyarılar',
+    'alert_rules_hint': 'Her satıra bir kural, ör. cpu_temp > 90 for 30s, disk > 95%, cpu_usage zscore > 4',
+    'alert_firing': 'Uyarı tetiklendi',
+    'alert_resolved': 'Uyarı kalktı',
+    'graph_history_minutes': 'Grafik geçmişi (dk.)',
+    'graph_history_hint': 'Aralık: {}–{} dk ({} saate kadar).',
+    'history_retention_days': 'Geçmişi diskte tut (gün)',
+    'graph_colors_title': 'Grafik renkleri',
+    'graph_colors_info': 'Her grafik için çizgi renklerini seçin.',
+
+    'ping_network': 'Ağı kontrol et (ping)',
+    'ping_running': 'Ağ kontrolü yapılıyor…',
+    'ping_done': 'Kontrol tamamlandı:',
+    'ping_error': 'Ping çalıştırılırken hata oluştu',
+    'system_info': 'Sistem bilgisi',
+    'menu_order_title': 'Menü öğesi sırası',
+    'display_section': 'Görünüm',
+    'display_tab': 'Görünüm',
+    'poll_interval_tab': 'Gecikme',
+    'poll_interval_section': 'Yoklama aralığı (sn.)',
+    'logging_section': 'Günlükler ve grafikler',
+    'logging_tab': 'Günlükleme',
+    'license_tab': 'Lisans',
+    'license_info': 'Proje lisansı ve kullanım koşulları SyMo GitHub deposunda mevcuttur.',
+    'notification_section': 'Bildirimler',
+    'system_info_title': 'Bilgisayar özellikleri',
+    'system_info_error': 'Sistem bilgisi alınamadı',
+    'unknown_value': 'Bilinmiyor',
+    'system_label': 'Sistem',
+    'hostname_label': 'Ana bilgisayar adı',
+    'architecture_label': 'Mimari',
+    'python_version_label': 'Python sürümü',
+    'cpu_label': 'İşlemci',
+    'cores_label': 'Fiziksel çekirdek',
+    'threads_label': 'İş parçacığı',
+    'cpu_frequency_label': 'CPU frekansı',
+    'ram_total_label': 'Toplam RAM',
+    'ram_available_label': 'Kullanılabilir RAM',
+    'swap_total_label': 'Toplam takas alanı',
+    'disk_total_label': 'Toplam disk',
+    'disk_free_label': 'Boş disk',
+    'boot_time_label': 'Açılış zamanı',
+    'uptime_day_one': 'gün',
+    'uptime_day_few': 'gün',
+    'uptime_day_many': 'gün',
+
+    'bot_shutdown_message': "🔌 Sistem kapatılıyor...",
+    'bot_reboot_message': "🔄 Sistem yeniden başlatılıyor...",
+    'bot_lock_message': "🔒 Ekran kilitleniyor...",
+    'bot_help_message': "🤖 Mevcut komutlar:\n/status - mevcut sistem durumu\n/screenshot - masaüstü ekran görüntüsü al\n/poweroff - bilgisayarı kapat\n/reboot - bilgisayarı yeniden başlat\n/lock - bilgisayarı kilitle\n/help - bu yardım",
+    'bot_screenshot_processing': "📸 Ekran görüntüsü alınıyor, lütfen bekleyin...",
+    'bot_screenshot_caption': "Masaüstü ekran görüntüsü",
+    'bot_screenshot_sent': "Ekran görüntüsü gönderildi.",
+    'bot_screenshot_failed': "Ekran görüntüsü alınamadı. Grafik oturumunu (headless değil), Wayland/X11 izinlerini ve gnome-screenshot/scrot/grim/import kurulumunu kontrol edin.",
+    'bot_screenshot_send_error': "Ekran görüntüsü alındı ancak Telegram'a gönderilemedi.",
+    'bot_screenshot_howto': "Düzeltme: 1) SyMo'yu normal grafik kullanıcı oturumunda çalıştırın (sudo/systemd ile değil). 2) Kurun: sudo apt install gnome-screenshot. 3) /screenshot komutunu tekrar deneyin.",
+}
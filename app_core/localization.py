@@ -2,18 +2,35 @@ from __future__ import annotations
 
 import locale
 import os
-from typing import Dict
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 
-from .language import LANGUAGES
+from .language import load_language
 
 from .constants import SUPPORTED_LANGS
 
 current_lang = 'ru'
 
+# Frozen table of the active language and its bound ``get``; set_language()
+# swaps both with single assignments, so readers on other threads never see a
+# half-built table and tr() costs one dict lookup.
+_table: Mapping[str, str] = MappingProxyType({})
+_lookup: Optional[Callable[[str, str], str]] = None
+
 
 def tr(key: str) -> str:
-    lang_map: Dict[str, str] = LANGUAGES.get(current_lang) or LANGUAGES.get('en', {})
-    return lang_map.get(key, key)
+    lookup = _lookup
+    if lookup is None:
+        set_language(current_lang)
+        lookup = _lookup
+    return lookup(key, key)
+
+
+def translations() -> Mapping[str, str]:
+    """Read-only table of the active language, for resolving many labels at once."""
+    if _lookup is None:
+        set_language(current_lang)
+    return _table
 
 
 def detect_system_language() -> str:
@@ -29,9 +46,13 @@ def detect_system_language() -> str:
 
 
 def set_language(lang_code: str) -> None:
-    global current_lang
+    global current_lang, _table, _lookup
     normalized = (lang_code or '').strip().lower()
-    current_lang = normalized if normalized in SUPPORTED_LANGS else 'ru'
+    code = normalized if normalized in SUPPORTED_LANGS else 'ru'
+    strings = dict(load_language(code))
+    current_lang = code
+    _table = MappingProxyType(strings)
+    _lookup = strings.get
 
 
 def get_language() -> str:
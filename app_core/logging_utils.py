@@ -1,17 +1,372 @@
 from __future__ import annotations
 
+import gzip
+import io
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional, Tuple
+
 from .constants import LOG_FILE
 
+try:
+    import zstandard as _zstd
+except ImportError:  # zstd compression is optional
+    _zstd = None
+
+# Rotated generation suffix per compression setting.
+LOG_COMPRESSIONS = {'gzip': '.gz', 'zstd': '.zst', 'none': ''}
+LOG_BACKUPS_DEFAULT = 3
+LOG_BACKUPS_MAX = 20
+
+
+def available_compressions() -> List[str]:
+    return [name for name in LOG_COMPRESSIONS if name != 'zstd' or _zstd is not None]
+
+
+def open_log(path: Path) -> BinaryIO:
+    """Open a log file for reading, decompressing ``.gz``/``.zst`` generations on the fly."""
+    name = str(path)
+    if name.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if name.endswith('.zst'):
+        if _zstd is None:
+            raise OSError(f"{path}: zstandard is not installed")
+        return io.BufferedReader(_zstd.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True))
+    return open(path, 'rb')
 
-def rotate_log_if_needed(max_size_bytes: int) -> None:
+
+def _compress_file(src: Path, dst: Path, compression: str) -> None:
+    with open(src, 'rb') as fin:
+        if compression == 'zstd':
+            with open(dst, 'wb') as raw, _zstd.ZstdCompressor().stream_writer(raw, closefd=False) as fout:
+                shutil.copyfileobj(fin, fout, EXPORT_CHUNK_BYTES)
+        else:
+            with gzip.open(dst, 'wb', compresslevel=6) as fout:
+                shutil.copyfileobj(fin, fout, EXPORT_CHUNK_BYTES)
+
+
+def rotated_logs(path: Path = LOG_FILE) -> List[Tuple[int, Path]]:
+    """Rotated generations of ``path`` as ``(generation, path)``, oldest first.
+
+    Generation 0 is a just-rotated file still waiting for compression; it is
+    newer than generation 1.
+    """
+    path = Path(path)
+    prefix = path.name + "."
+    found = []
     try:
-        if LOG_FILE.exists() and LOG_FILE.stat().st_size > max_size_bytes:
-            bak = LOG_FILE.with_suffix(LOG_FILE.suffix + ".1")
+        entries = os.listdir(path.parent)
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.startswith(prefix):
+            continue
+        number, _dot, ext = entry[len(prefix):].partition('.')
+        if number.isdigit() and (not ext or '.' + ext in LOG_COMPRESSIONS.values()):
+            found.append((int(number), path.parent / entry))
+    found.sort(key=lambda item: (item[0] == 0, -item[0]))
+    return found
+
+
+class LogWriter:
+    """Append-only text log kept open and written from a background thread.
+
+    ``write`` only queues the encoded line; the ``symo-log`` thread flushes the
+    queue every ``flush_interval`` seconds or as soon as ``flush_bytes`` are
+    pending. The file size is tracked from the bytes written, so no ``stat()``
+    is needed, and once a flush would pass ``max_bytes`` the file is renamed to
+    ``.0`` and a fresh one is opened. A ``symo-log-rotate`` thread then
+    compresses ``.0`` into generation ``.1.gz`` (or ``.1.zst``/``.1``) and
+    shifts older generations, keeping ``backups`` of them. A ``.0`` left behind
+    by a crash is finished when the log is opened; if compression fails the
+    generation is kept uncompressed.
+    ``header`` is written at the start of every new file (binary logs).
+    """
+
+    def __init__(self,
+                 path: Path = LOG_FILE,
+                 max_bytes: int = 5 * 1024 * 1024,
+                 flush_interval: float = 5.0,
+                 flush_bytes: int = 64 * 1024,
+                 header: bytes = b"",
+                 backups: int = LOG_BACKUPS_DEFAULT,
+                 compression: str = 'gzip'):
+        self.path = Path(path)
+        self.max_bytes = int(max_bytes)
+        self.flush_interval = float(flush_interval)
+        self.flush_bytes = int(flush_bytes)
+        self.header = header
+        self.backups = backups
+        self.compression = compression
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._rotate_thread: Optional[threading.Thread] = None
+        self._file: Optional[BinaryIO] = None
+        self._size = 0
+
+    def generation_path(self, generation: int, ext: str = "") -> Path:
+        return self.path.with_name(f"{self.path.name}.{generation}{ext}")
+
+    def write(self, line: str) -> None:
+        self.write_bytes(line.encode("utf-8"))
+
+    def write_bytes(self, data: bytes) -> None:
+        with self._lock:
+            self._pending.append(data)
+            self._pending_bytes += len(data)
+            full = self._pending_bytes >= self.flush_bytes
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="symo-log", daemon=True)
+                self._thread.start()
+        if full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """Write everything queued so far; safe to call from any thread."""
+        with self._lock:
+            chunk = b"".join(self._pending)
+            self._pending = []
+            self._pending_bytes = 0
+        if not chunk:
+            return
+        with self._io_lock:
             try:
-                if bak.exists():
-                    bak.unlink()
+                if self._file is None:
+                    self._open()
+                if self._size > len(self.header) and self._size + len(chunk) > self.max_bytes:
+                    if self._rotate():
+                        self._open()
+                self._file.write(chunk)
+                self._size += len(chunk)
             except Exception as e:
-                print("Ошибка", e)
-            LOG_FILE.rename(bak)
-    except Exception as e:
-        print("Ошибка ротации лога:", e)
+                print("Ошибка записи в лог:", e)
+                self._close_file()
+
+    def close(self) -> None:
+        """Stop the flush thread, write the remaining lines and release the file."""
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self._thread = None
+        self.flush()
+        with self._io_lock:
+            self._close_file()
+        rotate_thread = self._rotate_thread
+        if rotate_thread and rotate_thread.is_alive() and rotate_thread is not threading.current_thread():
+            rotate_thread.join(timeout=10.0)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def _open(self) -> None:
+        # Unbuffered: chunks are already batched, so every flush is one write().
+        self._file = open(self.path, "ab", buffering=0)
+        self._size = os.fstat(self._file.fileno()).st_size
+        if self._size == 0 and self.header:
+            self._file.write(self.header)
+            self._size = len(self.header)
+        # A ``.0`` left by a crash or a failed compression would block rotation for good.
+        self._resume_rotation()
+
+    def _rotate(self) -> bool:
+        pending = self.generation_path(0)
+        if pending.exists():
+            # The previous rotation is still being compressed; keep appending until it is done.
+            self._resume_rotation()
+            return False
+        self._close_file()
+        try:
+            os.replace(self.path, pending)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print("Ошибка ротации лога:", e)
+        self._size = 0
+        self._start_rotate_thread()
+        return True
+
+    def _resume_rotation(self) -> None:
+        if self.generation_path(0).exists() and not (self._rotate_thread and self._rotate_thread.is_alive()):
+            self._start_rotate_thread()
+
+    def _start_rotate_thread(self) -> None:
+        self._rotate_thread = threading.Thread(target=self._finish_rotation, name="symo-log-rotate", daemon=True)
+        self._rotate_thread.start()
+
+    def _finish_rotation(self) -> None:
+        """Turn the pending ``.0`` file into generation 1 and shift or drop older generations."""
+        pending = self.generation_path(0)
+        compression = self.compression if self.compression in available_compressions() else 'gzip'
+        ext = LOG_COMPRESSIONS[compression]
+        backups = max(1, min(int(self.backups), LOG_BACKUPS_MAX))
+        try:
+            if ext:
+                tmp = self.generation_path(1, ext + ".tmp")
+                try:
+                    _compress_file(pending, tmp, compression)
+                except Exception as e:
+                    # Keep the generation uncompressed rather than leave ``.0`` blocking rotation.
+                    print("Ошибка сжатия лога:", e)
+                    tmp.unlink(missing_ok=True)
+                    ext = ''
+            for generation, path in rotated_logs(self.path):
+                if generation == 0:
+                    continue
+                if generation >= backups:
+                    path.unlink()
+                else:
+                    _number, _dot, ext_old = path.name[len(self.path.name) + 1:].partition('.')
+                    os.replace(path, self.generation_path(generation + 1, '.' + ext_old if ext_old else ''))
+            if ext:
+                os.replace(tmp, self.generation_path(1, ext))
+                pending.unlink()
+            else:
+                os.replace(pending, self.generation_path(1))
+        except Exception as e:
+            print("Ошибка ротации лога:", e)
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+
+EXPORT_CHUNK_BYTES = 1024 * 1024
+
+
+def log_files(path: Path = LOG_FILE) -> List[Path]:
+    """Existing log files oldest first: rotated generations, then the current file."""
+    path = Path(path)
+    return [p for _generation, p in rotated_logs(path)] + ([path] if path.exists() else [])
+
+
+def _time_key(ts: Optional[float]) -> Optional[bytes]:
+    # Log lines start with "[%Y-%m-%d %H:%M:%S]", which sorts like the time itself.
+    if ts is None:
+        return None
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)).encode("ascii")
+
+
+def iter_log_chunks(paths: Iterable[Path],
+                    start_ts: Optional[float] = None,
+                    end_ts: Optional[float] = None,
+                    chunk_size: int = EXPORT_CHUNK_BYTES) -> Iterator[Tuple[bytes, int]]:
+    """Yield ``(output bytes, input bytes consumed)`` of lines logged within ``[start_ts, end_ts]``.
+
+    Files are read line by line (compressed generations through ``open_log``)
+    and output is batched into ``chunk_size`` pieces, so memory does not depend
+    on the log size. Lines without a timestamp follow the decision for the
+    previous line. Compressed files count as consumed once fully read.
+    """
+    start_key, end_key = _time_key(start_ts), _time_key(end_ts)
+    out: List[bytes] = []
+    out_bytes = 0
+    consumed = 0
+    keep = start_key is None
+    past_end = False
+    for path in paths:
+        if past_end:
+            break
+        plain = not str(path).endswith(('.gz', '.zst'))
+        with open_log(path) as f:
+            for line in f:
+                if plain:
+                    consumed += len(line)
+                if line.startswith(b"[") and line[20:21] == b"]":
+                    key = line[1:20]
+                    if end_key is not None and key > end_key:
+                        past_end = True
+                        break
+                    keep = start_key is None or key >= start_key
+                if keep:
+                    out.append(line)
+                    out_bytes += len(line)
+                if out_bytes >= chunk_size or consumed >= chunk_size:
+                    yield b"".join(out), consumed
+                    out, out_bytes, consumed = [], 0, 0
+            if not plain and not past_end:
+                consumed += os.path.getsize(path)
+    if out or consumed:
+        yield b"".join(out), consumed
+
+
+def _copy_file(src: BinaryIO, dst: BinaryIO, chunk_size: int, on_chunk: Callable[[int], None]) -> None:
+    size = os.fstat(src.fileno()).st_size
+    offset = 0
+    dst.flush()
+    try:
+        while offset < size:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset, min(chunk_size, size - offset))
+            if sent == 0:
+                break
+            offset += sent
+            on_chunk(sent)
+        return
+    except (AttributeError, OSError):
+        src.seek(offset)
+        dst.seek(0, os.SEEK_END)
+    while True:
+        data = src.read(chunk_size)
+        if not data:
+            return
+        dst.write(data)
+        on_chunk(len(data))
+
+
+def export_log(paths: Iterable[Path],
+               dest: Path,
+               compress: bool = False,
+               start_ts: Optional[float] = None,
+               end_ts: Optional[float] = None,
+               progress: Optional[Callable[[int, int], None]] = None,
+               chunk_size: int = EXPORT_CHUNK_BYTES) -> None:
+    """Stream log files into ``dest``, optionally gzip-compressed and limited to a time range.
+
+    A plain full export is a kernel-side ``sendfile`` copy (compressed
+    generations are decompressed into it); otherwise lines go through
+    ``iter_log_chunks``. ``progress(done, total)`` gets on-disk input bytes.
+    """
+    paths = list(paths)
+    total = sum(p.stat().st_size for p in paths)
+    done = 0
+
+    def advance(n: int) -> None:
+        nonlocal done
+        done += n
+        if progress is not None:
+            progress(min(done, total), total)
+
+    if not compress and start_ts is None and end_ts is None:
+        with open(dest, "wb") as out:
+            for path in paths:
+                if str(path).endswith(('.gz', '.zst')):
+                    with open_log(path) as src:
+                        shutil.copyfileobj(src, out, chunk_size)
+                    advance(os.path.getsize(path))
+                    continue
+                with open(path, "rb") as src:
+                    _copy_file(src, out, chunk_size, advance)
+    else:
+        with (gzip.open(dest, "wb") if compress else open(dest, "wb")) as out:
+            for data, consumed in iter_log_chunks(paths, start_ts, end_ts, chunk_size):
+                out.write(data)
+                advance(consumed)
+    if progress is not None:
+        progress(total, total)
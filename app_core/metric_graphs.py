@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .localization import tr
+
+RGB = Tuple[float, float, float]
+YRange = Callable[[Sequence[tuple]], float]
+
+
+class GraphSeries(NamedTuple):
+    """One line of a metric graph."""
+    column: int  # index in a history row; 0 is the timestamp
+    color_key: str  # settings key of the line colour
+    legend: Callable[[], str]
+    legend_rgb: RGB
+    y_max: Optional[YRange] = None  # own scale; None uses the graph axis
+    value_label: Optional[Callable[[float], str]] = None  # hover min/max; None uses the axis label
+
+
+class MetricDescriptor(NamedTuple):
+    """Everything ``MetricGraph`` needs to draw and feed the graph of one metric.
+
+    ``history`` names the ``SystemTrayApp`` attribute holding the
+    ``MetricHistory``; ``sample`` turns a ``MetricsSnapshot`` into the values
+    of one history row. ``watched`` lists the sampler keys kept fresh while the
+    graph window is open.
+    """
+    key: str
+    history: str
+    title: Callable[[], str]
+    series: Tuple[GraphSeries, ...]
+    y_max: YRange
+    axis_label: Callable[[float], str]
+    axis_rgb: RGB
+    summary: Callable[[tuple], str]
+    hover: Callable[[tuple], List[str]]
+    sample: Callable[..., tuple]
+    watched: Tuple[str, ...] = ()
+    margin_left: int = 48
+
+
+def fixed_range(top: float) -> YRange:
+    return lambda samples: top
+
+
+def auto_range(*columns: int, floor: float = 1.0, headroom: float = 1.0, pad: float = 0.0) -> YRange:
+    """Axis top from the largest visible value: ``max(floor, peak * headroom + pad)``."""
+    def y_max(samples: Sequence[tuple]) -> float:
+        peak = max(max(sample[col] for col in columns) for sample in samples)
+        return max(floor, peak * headroom + pad)
+    return y_max
+
+
+def hover_time(sample: tuple) -> str:
+    return datetime.fromtimestamp(sample[0]).strftime("%H:%M:%S")
+
+
+def _number(value: object, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _clamped(value: object, low: float, high: float) -> float:
+    return max(low, min(high, _number(value)))
+
+
+def _cpu_sample(s) -> tuple:
+    return _clamped(s.cpu_usage, 0.0, 100.0), _clamped(s.cpu_temp, 0.0, 150.0)
+
+
+def _usage_sample(used: object, total: object) -> tuple:
+    used_gb, total_gb = _number(used), _number(total)
+    percent = used_gb / total_gb * 100.0 if total_gb > 0 else 0.0
+    return used_gb, total_gb, max(0.0, min(100.0, percent))
+
+
+def _count_sample(count: object) -> tuple:
+    try:
+        return max(0, int(count)),
+    except (TypeError, ValueError):
+        return 0,
+
+
+def _percent_label(value: float) -> str:
+    return f"{value:.0f}%"
+
+
+def _usage_graph(key: str, label: Callable[[], str], axis_rgb: RGB, legend_rgb: RGB,
+                 sample: Callable[..., tuple]) -> MetricDescriptor:
+    """used/total GB graph drawn as a percentage (RAM, swap, disk)."""
+    return MetricDescriptor(
+        key=key,
+        history=f"{key}_history",
+        title=label,
+        series=(GraphSeries(3, f"graph_line_color_{key}", lambda: f"{label()} (%)", legend_rgb),),
+        y_max=fixed_range(100.0),
+        axis_label=_percent_label,
+        axis_rgb=axis_rgb,
+        summary=lambda s: f"{label()}: {s[1]:.1f}/{s[2]:.1f} GB ({s[3]:.0f}%)",
+        hover=lambda s: [hover_time(s), f"{label()}: {s[3]:.1f}%", f"{s[1]:.1f}/{s[2]:.1f} GB"],
+        sample=sample,
+        watched=(key,),
+    )
+
+
+def _clicks_graph(key: str, label: Callable[[], str], legend_rgb: RGB,
+                  sample: Callable[..., tuple]) -> MetricDescriptor:
+    return MetricDescriptor(
+        key=key,
+        history=f"{key}_history",
+        title=label,
+        series=(GraphSeries(1, f"graph_line_color_{key}", label, legend_rgb),),
+        y_max=auto_range(1, floor=1.05, headroom=1.05),
+        axis_label=lambda value: f"{int(value)}",
+        axis_rgb=(0.85, 0.85, 0.85),
+        summary=lambda s: f"{label()}: {s[1]:.0f}",
+        hover=lambda s: [hover_time(s), f"{label()}: {s[1]:.0f}"],
+        sample=sample,
+        margin_left=58,
+    )
+
+
+# Line graphs opened from the menu, in menu order. A new metric only needs a
+# descriptor here and a history attribute on the app.
+METRIC_GRAPHS: Tuple[MetricDescriptor, ...] = (
+    MetricDescriptor(
+        key='cpu',
+        history='cpu_history',
+        title=lambda: tr('cpu_info'),
+        series=(
+            GraphSeries(1, 'graph_line_color_cpu', lambda: f"{tr('cpu')} (%)", (0.88, 0.92, 1.0)),
+            GraphSeries(2, 'graph_line_color_temp', lambda: tr('temperature'), (1.0, 0.88, 0.82),
+                        y_max=auto_range(2, floor=100.0, pad=5.0), value_label=lambda value: f"{value:.1f}°C"),
+        ),
+        y_max=fixed_range(100.0),
+        axis_label=_percent_label,
+        axis_rgb=(0.72, 0.82, 0.9),
+        summary=lambda s: f"{tr('cpu')}: {s[1]:.0f}%   {tr('temperature')}: {s[2]:.1f}°C",
+        hover=lambda s: [hover_time(s), f"{tr('cpu')}: {s[1]:.1f}%", f"{tr('temperature')}: {s[2]:.1f}°C"],
+        sample=_cpu_sample,
+        watched=('cpu_usage', 'cpu_temp'),
+    ),
+    _usage_graph('ram', lambda: tr('ram_loading'), (0.72, 0.9, 0.72), (0.9, 1.0, 0.9),
+                 lambda s: _usage_sample(s.ram_used, s.ram_total)),
+    _usage_graph('swap', lambda: tr('swap_loading'), (0.9, 0.72, 0.95), (0.98, 0.88, 1.0),
+                 lambda s: _usage_sample(s.swap_used, s.swap_total)),
+    _usage_graph('disk', lambda: tr('disk_loading'), (0.7, 0.85, 1.0), (0.88, 0.95, 1.0),
+                 lambda s: _usage_sample(s.disk_used, s.disk_total)),
+    MetricDescriptor(
+        key='net',
+        history='net_history',
+        title=lambda: tr('lan_speed'),
+        series=(
+            GraphSeries(1, 'graph_line_color_net_recv', lambda: f"↓ {tr('mbps')}", (0.85, 1.0, 0.87)),
+            GraphSeries(2, 'graph_line_color_net_sent', lambda: f"↑ {tr('mbps')}", (1.0, 0.94, 0.8)),
+        ),
+        y_max=auto_range(1, 2, headroom=1.15),
+        axis_label=lambda value: f"{value:.1f}",
+        axis_rgb=(0.8, 0.8, 0.8),
+        summary=lambda s: f"{tr('lan_speed')}: ↓{s[1]:.1f} / ↑{s[2]:.1f} {tr('mbps')}",
+        hover=lambda s: [hover_time(s), f"↓ {s[1]:.2f} {tr('mbps')}", f"↑ {s[2]:.2f} {tr('mbps')}"],
+        sample=lambda s: (max(0.0, _number(s.net_recv)), max(0.0, _number(s.net_sent))),
+        watched=('net',),
+        margin_left=58,
+    ),
+    _clicks_graph('keyboard', lambda: tr('keyboard_clicks'), (1.0, 0.96, 0.78),
+                  lambda s: _count_sample(s.keyboard_clicks)),
+    _clicks_graph('mouse', lambda: tr('mouse_clicks'), (0.85, 0.98, 1.0),
+                  lambda s: _count_sample(s.mouse_clicks)),
+)
@@ -0,0 +1,441 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as _np
+except ImportError:  # slow pure-Python fallback; numpy is in requirements.txt
+    _np = None
+
+_MAGIC = b'SYMO'
+_VERSION = 1
+# magic, version, stats per field (1 = raw samples, 4 = mean/min/max/last), resolution (s), names length
+_HEADER = struct.Struct('<4sHHIH')
+_RAW_SUFFIX = '.raw'
+_ROLLUP_SUFFIX = '.r60'
+_OLD_SUFFIX = '.old'
+ROLLUP_RESOLUTION_SEC = 60
+FLUSH_INTERVAL_SEC = 30.0
+
+
+class SegmentFormatError(ValueError):
+    pass
+
+
+class Segment:
+    """Memory-mapped, append-only file of fixed-width ``(timestamp, float32 * n)`` records."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with path.open('rb') as f:
+            self.fields, self.stats, self.resolution, self.offset = self.read_header(f, path)
+        self.record = struct.Struct('<d' + 'f' * (len(self.fields) * self.stats))
+
+    @staticmethod
+    def read_header(f: BinaryIO, name: object = '') -> Tuple[Tuple[str, ...], int, int, int]:
+        """Parse a segment header from a stream: ``(fields, stats, resolution, data offset)``."""
+        head = f.read(_HEADER.size)
+        if len(head) < _HEADER.size:
+            raise SegmentFormatError(f"{name}: short header")
+        magic, version, stats, resolution, names_len = _HEADER.unpack(head)
+        if magic != _MAGIC or version != _VERSION:
+            raise SegmentFormatError(f"{name}: unknown format")
+        names = f.read(names_len).decode('utf-8')
+        fields = tuple(names.split('\n')) if names else ()
+        return fields, stats, resolution, _HEADER.size + names_len
+
+    @staticmethod
+    def header(fields: Sequence[str], stats: int = 1, resolution: int = 0) -> bytes:
+        names = '\n'.join(fields).encode('utf-8')
+        return _HEADER.pack(_MAGIC, _VERSION, stats, resolution, len(names)) + names
+
+    def rows(self, start_ts: float, end_ts: float) -> List[tuple]:
+        """Return records with ``start_ts <= timestamp <= end_ts``, located by binary search over the map."""
+        size = self.path.stat().st_size
+        count = max(0, size - self.offset) // self.record.size
+        if count == 0:
+            return []
+        with self.path.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _np is not None:
+                return self._rows_numpy(mm, count, start_ts, end_ts)
+            view = memoryview(mm)
+            try:
+                record = self.record
+                offset = self.offset
+                timestamps = _TimestampIndex(view, offset, record.size, count)
+                lo = bisect_left(timestamps, start_ts)
+                rows = []
+                for row in record.iter_unpack(view[offset + lo * record.size:offset + count * record.size]):
+                    if row[0] > end_ts:
+                        break
+                    rows.append(row)
+                return rows
+            finally:
+                view.release()
+
+    def iter_rows(self, start_ts: float, end_ts: float, chunk_records: int = 4096) -> Iterator[tuple]:
+        """Yield records in ``[start_ts, end_ts]``, reading ``chunk_records`` at a time so memory stays flat."""
+        record = self.record
+        with self.path.open('rb') as f:
+            count = max(0, os.fstat(f.fileno()).st_size - self.offset) // record.size
+            if count == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    lo = bisect_left(_TimestampIndex(view, self.offset, record.size, count), start_ts)
+                finally:
+                    view.release()
+            f.seek(self.offset + lo * record.size)
+            remaining = count - lo
+            while remaining > 0:
+                data = f.read(min(chunk_records, remaining) * record.size)
+                usable = len(data) - len(data) % record.size
+                if usable == 0:
+                    return
+                for row in record.iter_unpack(data[:usable] if usable != len(data) else data):
+                    if row[0] > end_ts:
+                        return
+                    yield row
+                remaining -= usable // record.size
+
+    def columns(self, start_ts: float, end_ts: float, fields: Sequence[str]) -> List[array]:
+        """Return ``[timestamps, *values]`` for ``fields`` as float64 arrays, without building a tuple per row.
+
+        Missing fields read as 0; rollup segments contribute their means.
+        """
+        positions = {name: idx for idx, name in enumerate(self.fields)}
+        size = self.path.stat().st_size
+        count = max(0, size - self.offset) // self.record.size
+        if _np is None or count == 0:
+            rows = self.rows(start_ts, end_ts)
+            out = [array('d', col) for col in zip(*rows)] or [array('d') for _ in range(len(self.fields) * self.stats + 1)]
+            zeros = array('d', bytes(8 * len(rows)))
+            return [out[0], *[out[positions[name] + 1] if name in positions else zeros for name in fields]]
+        with self.path.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            dtype = _np.dtype([('ts', '<f8'), ('values', '<f4', (self.record.size - 8) // 4)])
+            data = _np.frombuffer(mm, dtype=dtype, count=count, offset=self.offset)
+            lo = int(_np.searchsorted(data['ts'], start_ts, side='left'))
+            hi = int(_np.searchsorted(data['ts'], end_ts, side='right'))
+            chunk = data[lo:hi]
+            out = [array('d', chunk['ts'].tobytes())]
+            for name in fields:
+                if name in positions:
+                    out.append(array('d', chunk['values'][:, positions[name]].astype('<f8').tobytes()))
+                else:
+                    out.append(array('d', bytes(8 * len(chunk))))
+            del chunk, data
+            return out
+
+    def _rows_numpy(self, mm: mmap.mmap, count: int, start_ts: float, end_ts: float) -> List[tuple]:
+        dtype = _np.dtype([('ts', '<f8'), ('values', '<f4', (self.record.size - 8) // 4)])
+        data = _np.frombuffer(mm, dtype=dtype, count=count, offset=self.offset)
+        lo = int(_np.searchsorted(data['ts'], start_ts, side='left'))
+        hi = int(_np.searchsorted(data['ts'], end_ts, side='right'))
+        chunk = data[lo:hi]
+        rows = [(ts, *values) for ts, values in zip(chunk['ts'].tolist(), chunk['values'].tolist())]
+        del chunk, data
+        return rows
+
+
+class _TimestampIndex:
+    """Sequence facade over the timestamp of every record, for ``bisect``."""
+
+    def __init__(self, view: memoryview, offset: int, size: int, count: int):
+        self._view = view
+        self._offset = offset
+        self._size = size
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> float:
+        return struct.unpack_from('<d', self._view, self._offset + index * self._size)[0]
+
+
+class MetricsStore:
+    """Daily on-disk segments of every graph metric under ``directory``.
+
+    Samples are buffered in memory and appended to ``YYYY-MM-DD.raw`` once every
+    ``flush_interval`` seconds without fsync. When the field set changes, the
+    day's segment is renamed to ``YYYY-MM-DD.N.raw`` and a new one is started;
+    reads project every segment by field name. Finished days are compacted into
+    one-minute ``.r60`` rollups (mean/min/max/last) and removed after
+    ``retention_days``.
+    """
+
+    def __init__(self,
+                 directory: Path,
+                 fields: Sequence[str],
+                 retention_days: int = 7,
+                 flush_interval: float = FLUSH_INTERVAL_SEC):
+        self.directory = Path(directory)
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.retention_days = max(1, int(retention_days))
+        self.flush_interval = float(flush_interval)
+        self._record = struct.Struct('<d' + 'f' * len(self.fields))
+        self._pending: List[Tuple[date, bytes]] = []
+        self._last_flush = time.monotonic()
+        self._last_day: Optional[date] = None
+        self._checked_path: Optional[Path] = None
+        self._lock = threading.Lock()  # guards _pending; held only for the list swap
+        self._io_lock = threading.Lock()  # serializes segment writes and maintenance
+
+    def _path(self, day: date, suffix: str) -> Path:
+        return self.directory / f"{day.isoformat()}{suffix}"
+
+    def _raw_segments(self, day: date) -> List[Path]:
+        """Return the day's raw segments oldest first: ``.N.raw`` by N, then ``.raw``."""
+        numbered = []
+        for path in self.directory.glob(f"{day.isoformat()}.*{_RAW_SUFFIX}"):
+            seq = path.name[len(day.isoformat()) + 1:-len(_RAW_SUFFIX)]
+            if seq.isdigit():
+                numbered.append((int(seq), path))
+        segments = [path for _, path in sorted(numbered)]
+        base = self._path(day, _RAW_SUFFIX)
+        if base.exists():
+            segments.append(base)
+        return segments
+
+    def set_fields(self, fields: Sequence[str]) -> None:
+        """Switch to a new field set; buffered records are flushed with the old one first."""
+        fields = tuple(fields)
+        if fields == self.fields:
+            return
+        self.flush()
+        self.fields = fields
+        self._record = struct.Struct('<d' + 'f' * len(fields))
+        self._checked_path = None
+
+    def stored_fields(self) -> Tuple[str, ...]:
+        """Field set of the newest segment on disk, or ``()`` when there is none."""
+        for day in reversed(self.segment_days()):
+            for path in reversed(self._raw_segments(day) + [self._path(day, _ROLLUP_SUFFIX)]):
+                try:
+                    return Segment(path).fields
+                except (OSError, ValueError):
+                    continue
+        return ()
+
+    def segment_days(self) -> List[date]:
+        days = set()
+        try:
+            for path in self.directory.iterdir():
+                if path.suffix in (_RAW_SUFFIX, _ROLLUP_SUFFIX, _OLD_SUFFIX):
+                    try:
+                        days.add(date.fromisoformat(path.name.split('.', 1)[0]))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return sorted(days)
+
+    def append(self, timestamp: float, values: Sequence[float]) -> None:
+        """Buffer one record; flushes to disk at most once per ``flush_interval``."""
+        day = datetime.fromtimestamp(timestamp).date()
+        record = self._record.pack(timestamp, *values)
+        with self._lock:
+            self._pending.append((day, record))
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+        with self._io_lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            batch = bytearray()
+            day = pending[0][0]
+            for record_day, record in pending:
+                if record_day != day:
+                    self._write(day, batch)
+                    batch = bytearray()
+                    day = record_day
+                batch += record
+            self._write(day, batch)
+        if self._last_day is not None and day != self._last_day:
+            threading.Thread(target=self.maintain, args=(day,), daemon=True).start()
+        self._last_day = day
+
+    def _write(self, day: date, payload: bytes) -> None:
+        path = self._path(day, _RAW_SUFFIX)
+        if path != self._checked_path:
+            self._prepare(path)
+            self._checked_path = path
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size == 0:
+                os.write(fd, Segment.header(self.fields))
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+
+    def _prepare(self, path: Path) -> None:
+        """Set aside a segment written with another field set and cut a torn trailing record."""
+        if not path.exists():
+            return
+        try:
+            segment = Segment(path)
+        except SegmentFormatError:
+            os.replace(path, path.with_name(path.name + _OLD_SUFFIX))
+            return
+        if segment.stats != 1:
+            os.replace(path, path.with_name(path.name + _OLD_SUFFIX))
+            return
+        if segment.fields != self.fields:
+            day = path.name[:-len(_RAW_SUFFIX)]
+            seq = 1
+            while path.with_name(f"{day}.{seq}{_RAW_SUFFIX}").exists():
+                seq += 1
+            os.replace(path, path.with_name(f"{day}.{seq}{_RAW_SUFFIX}"))
+            return
+        size = path.stat().st_size
+        torn = (size - segment.offset) % segment.record.size
+        if torn:
+            os.truncate(path, size - torn)
+
+    def read(self, start_ts: float, end_ts: float) -> Iterator[tuple]:
+        """Yield ``(timestamp, *values)`` in this store's field order, oldest first.
+
+        Raw segments are preferred; compacted days yield their one-minute means.
+        Fields missing from an older segment read as 0.
+        """
+        first_day = datetime.fromtimestamp(start_ts).date()
+        last_day = datetime.fromtimestamp(end_ts).date()
+        for day in self.segment_days():
+            if day < first_day or day > last_day:
+                continue
+            paths = self._raw_segments(day)
+            if not paths:
+                paths = [self._path(day, _ROLLUP_SUFFIX)]
+            for path in paths:
+                if not path.exists():
+                    continue
+                try:
+                    segment = Segment(path)
+                    rows = segment.rows(start_ts, end_ts)
+                except (OSError, ValueError) as e:
+                    print(f"Не удалось прочитать сегмент истории {path}: {e}")
+                    continue
+                yield from self._project(segment, rows)
+
+    def read_columns(self, start_ts: float, end_ts: float) -> List[array]:
+        """Like ``read`` but column-wise: ``[timestamps, *values]`` as float64 arrays."""
+        out = [array('d') for _ in range(len(self.fields) + 1)]
+        first_day = datetime.fromtimestamp(start_ts).date()
+        last_day = datetime.fromtimestamp(end_ts).date()
+        for day in self.segment_days():
+            if day < first_day or day > last_day:
+                continue
+            paths = self._raw_segments(day)
+            if not paths:
+                paths = [self._path(day, _ROLLUP_SUFFIX)]
+            for path in paths:
+                if not path.exists():
+                    continue
+                try:
+                    columns = Segment(path).columns(start_ts, end_ts, self.fields)
+                except (OSError, ValueError) as e:
+                    print(f"Не удалось прочитать сегмент истории {path}: {e}")
+                    continue
+                for col, values in zip(out, columns):
+                    col.extend(values)
+        return out
+
+    def _project(self, segment: Segment, rows: Iterable[tuple]) -> Iterator[tuple]:
+        return _project_rows(segment, rows, self.fields)
+
+    def maintain(self, today: Optional[date] = None) -> None:
+        """Compact finished days into rollups and evict segments older than the retention."""
+        today = today or date.today()
+        cutoff = today - timedelta(days=self.retention_days)
+        with self._io_lock:
+            for day in self.segment_days():
+                raw = self._path(day, _RAW_SUFFIX)
+                rollup = self._path(day, _ROLLUP_SUFFIX)
+                try:
+                    if day < cutoff:
+                        for path in self._raw_segments(day):
+                            path.unlink(missing_ok=True)
+                        rollup.unlink(missing_ok=True)
+                        raw.with_name(raw.name + _OLD_SUFFIX).unlink(missing_ok=True)
+                    elif day < today:
+                        segments = self._raw_segments(day)
+                        if segments:
+                            self._compact(segments, rollup)
+                except (OSError, ValueError) as e:
+                    print(f"Ошибка обслуживания истории метрик {raw}: {e}")
+
+    def _compact(self, raws: List[Path], rollup: Path) -> None:
+        """Merge a finished day's raw segments into one rollup in the newest segment's field order."""
+        segments = [Segment(path) for path in raws]
+        fields = segments[-1].fields
+        rows: List[tuple] = []
+        for segment in segments:
+            if segment.stats == 1:
+                rows.extend(_project_rows(segment, segment.rows(float('-inf'), float('inf')), fields))
+        width = len(fields)
+        record = struct.Struct('<d' + 'f' * (width * 4))
+        out = bytearray(Segment.header(fields, 4, ROLLUP_RESOLUTION_SEC))
+        for row in rollup_rows(rows, width, ROLLUP_RESOLUTION_SEC):
+            out += record.pack(*row)
+        tmp = rollup.with_suffix('.r60.tmp')
+        tmp.write_bytes(bytes(out))
+        os.replace(tmp, rollup)
+        for path in raws:
+            path.unlink()
+
+
+def _project_rows(segment: Segment, rows: Iterable[tuple], fields: Sequence[str]) -> Iterator[tuple]:
+    """Reorder ``rows`` of ``segment`` into ``fields``; rollup rows contribute their means."""
+    if segment.fields == tuple(fields) and segment.stats == 1:
+        yield from rows
+        return
+    positions = {name: idx for idx, name in enumerate(segment.fields, 1)}
+    mapping = [positions.get(name) for name in fields]
+    for row in rows:
+        yield (row[0], *[row[idx] if idx is not None else 0.0 for idx in mapping])
+
+
+def rollup_rows(rows: Iterable[tuple], width: int, resolution: float) -> Iterator[tuple]:
+    """Group raw ``(timestamp, *values)`` rows into ``(last_ts, *means, *mins, *maxs, *lasts)`` buckets."""
+    bucket = None
+    count = 0
+    sums: List[float] = []
+    mins: List[float] = []
+    maxs: List[float] = []
+    last: tuple = ()
+    for row in rows:
+        row_bucket = int(row[0] // resolution)
+        values = row[1:width + 1]
+        if row_bucket != bucket:
+            if bucket is not None:
+                yield (last[0], *[total / count for total in sums], *mins, *maxs, *last[1:width + 1])
+            bucket = row_bucket
+            count = 0
+            sums = [0.0] * width
+            mins = list(values)
+            maxs = list(values)
+        count += 1
+        for idx, value in enumerate(values):
+            sums[idx] += value
+            if value < mins[idx]:
+                mins[idx] = value
+            if value > maxs[idx]:
+                maxs[idx] = value
+        last = row
+    if bucket is not None:
+        yield (last[0], *[total / count for total in sums], *mins, *maxs, *last[1:width + 1])
@@ -194,7 +194,7 @@ class PowerControl:
                 setattr(self, tid, None)
         self.scheduled_action = None
         self.remaining_seconds = 0
-        self.app.indicator.set_label("", "")
+        self._set_indicator_label("")
         self._show_message(tr('cancelled'), tr('cancelled_text'))
 
     def _notify_before_action(self, act: Action) -> bool:
@@ -202,20 +202,25 @@ class PowerControl:
         self._show_message(tr('notification'), tr('action_in_1_min').format(action_label(act)))
         return False
 
+    def _set_indicator_label(self, text: str) -> None:
+        self.app.indicator.set_label(text, "")
+        # The tray label no longer shows what the app last applied, so its next text must be set again.
+        self.app.label_cache.forget_applied('tray')
+
     def _update_indicator_label(self) -> bool:
         if self.remaining_seconds <= 0:
-            self.app.indicator.set_label("", "")
+            self._set_indicator_label("")
             return False
         h = self.remaining_seconds // 3600
         m = (self.remaining_seconds % 3600) // 60
         s = self.remaining_seconds % 60
-        self.app.indicator.set_label(f"  {action_label(self.scheduled_action)} — {h:02d}:{m:02d}:{s:02d}", "")
+        self._set_indicator_label(f"  {action_label(self.scheduled_action)} — {h:02d}:{m:02d}:{s:02d}")
         self.remaining_seconds -= 1
         return True
 
     def _delayed_action(self, act: Action) -> bool:
         self._action_timer_id = None
-        self.app.indicator.set_label("", "")
+        self._set_indicator_label("")
         self.scheduled_action = None
         self.remaining_seconds = 0
         if self._update_timer_id:
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+
+class MetricsSnapshot(NamedTuple):
+    """Immutable result of one sampling cycle, handed from the sampler thread to the UI."""
+    timestamp: float
+    cpu_temp: int
+    cpu_usage: float
+    ram_used: float
+    ram_total: float
+    disk_used: float
+    disk_total: float
+    swap_used: float
+    swap_total: float
+    net_recv: float
+    net_sent: float
+    uptime: str
+    keyboard_clicks: int
+    mouse_clicks: int
+    families: Dict[str, Any]
+    texts: Dict[str, str]
+
+
+class TimingStats:
+    """Running average/max of durations in milliseconds."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def reset(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+
+class SamplingEngine:
+    """Runs ``collect`` on a dedicated thread every ``interval`` seconds.
+
+    When ``next_delay`` is given the thread instead sleeps for the number of
+    seconds it returns, i.e. exactly until the next metric is due; ``poke()``
+    wakes it early (a graph window opened). ``wakeups`` counts loop iterations.
+
+    The newest snapshot is published through a single slot: a plain attribute
+    that the sampler overwrites and the UI reads, so neither side takes a lock
+    and a slow UI only ever sees the latest data. ``on_snapshot`` runs on the
+    sampler thread and returns True when something visible changed; only then
+    is ``deliver`` scheduled on the UI thread through ``wake`` (``GLib.idle_add``),
+    at most once until the UI has picked the slot up.
+    """
+
+    def __init__(self,
+                 collect: Callable[[], Any],
+                 on_snapshot: Callable[[Any], bool],
+                 deliver: Callable[[Any], None],
+                 wake: Callable[[Callable[[], bool]], Any],
+                 interval: float = 1.0,
+                 next_delay: Optional[Callable[[], float]] = None):
+        self._collect = collect
+        self._on_snapshot = on_snapshot
+        self._deliver = deliver
+        self._wake = wake
+        self.interval = float(interval)
+        self._next_delay = next_delay
+        self.wakeups = 0
+        self.collect_stats = TimingStats()
+        self.ui_stats = TimingStats()
+        self._slot: Optional[Any] = None
+        self._wake_pending = False
+        self._stop_event = threading.Event()
+        self._poke_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def latest(self) -> Optional[Any]:
+        return self._slot
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="symo-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop_event.set()
+        self._poke_event.set()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def poke(self) -> None:
+        """Sample right away instead of waiting for the next deadline."""
+        self._poke_event.set()
+
+    def run_once(self) -> None:
+        """Sample and deliver synchronously on the calling thread (initial snapshot)."""
+        if self._sample():
+            self._wake_pending = True
+            self._deliver_latest()
+
+    def _run(self) -> None:
+        next_tick = time.monotonic()
+        while True:
+            if self._next_delay is not None:
+                try:
+                    delay = max(0.0, float(self._next_delay()))
+                except Exception as e:
+                    print(f"Ошибка планировщика метрик: {e}")
+                    delay = self.interval
+                self._poke_event.wait(delay)
+                self._poke_event.clear()
+                if self._stop_event.is_set():
+                    return
+            else:
+                next_tick += self.interval
+                if self._stop_event.wait(max(0.0, next_tick - time.monotonic())):
+                    return
+                now = time.monotonic()
+                if now - next_tick > self.interval:
+                    # Skip ticks missed while collection was stalled instead of bursting.
+                    next_tick = now
+            self.wakeups += 1
+            if self._sample() and not self._wake_pending:
+                self._wake_pending = True
+                self._wake(self._deliver_latest)
+
+    def _sample(self) -> bool:
+        start = time.perf_counter()
+        try:
+            snapshot = self._collect()
+        except Exception as e:
+            print(f"Ошибка сбора метрик: {e}")
+            return False
+        self.collect_stats.add((time.perf_counter() - start) * 1000.0)
+        self._slot = snapshot
+        try:
+            return bool(self._on_snapshot(snapshot))
+        except Exception as e:
+            print(f"Ошибка обработки метрик: {e}")
+            return True
+
+    def _deliver_latest(self) -> bool:
+        self._wake_pending = False
+        snapshot = self._slot
+        if snapshot is not None:
+            start = time.perf_counter()
+            try:
+                self._deliver(snapshot)
+            except Exception as e:
+                print(f"Ошибка обновления интерфейса: {e}")
+            self.ui_stats.add((time.perf_counter() - start) * 1000.0)
+        return False
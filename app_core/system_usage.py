@@ -1,46 +1,556 @@
 from __future__ import annotations
 
+import heapq
+import os
+import select
+import threading
 import time
 from datetime import timedelta
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import psutil
 
 
+class _ProcFile:
+    """A /proc file kept open and re-read with ``preadv`` into one reusable buffer."""
+
+    def __init__(self, path: str, size: int = 4096):
+        self.fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+        self.buf = bytearray(size)
+
+    def read(self) -> int:
+        """Refill ``buf`` from offset 0 and return the number of valid bytes."""
+        while True:
+            n = os.preadv(self.fd, [self.buf], 0)
+            if n < len(self.buf):
+                return n
+            self.buf = bytearray(len(self.buf) * 2)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _SharedRead:
+    """One parsed /proc read shared by several getters collected in the same pass.
+
+    Each ``part`` gets the result once and only while it is younger than
+    ``max_age``; asking again, or later, reads the file anew. CPU total and
+    per-core usage (or RAM and swap) sampled together thus cost one ``preadv``.
+    """
+
+    def __init__(self, parse: Callable[[], Any], max_age: float = 0.25):
+        self._parse = parse
+        self.max_age = max_age
+        self._value: Any = None
+        self._read_at = 0.0
+        self._taken: set = set()
+
+    def take(self, part: str) -> Any:
+        now = time.monotonic()
+        if self._value is None or part in self._taken or now - self._read_at > self.max_age:
+            self._value = self._parse()
+            self._read_at = now
+            self._taken = set()
+        self._taken.add(part)
+        return self._value
+
+
+class ProcReader:
+    """Linux fast path for CPU, memory, swap and network counters.
+
+    Parses only the needed fields of ``/proc/stat``, ``/proc/meminfo`` and
+    ``/proc/net/dev``; every getter returns None when the data is unavailable so
+    callers can fall back to psutil. The read buffers and previous counters are
+    shared, so getters hold one lock and are safe to call from any thread.
+    """
+
+    _MEMINFO_KEYS = (b'MemTotal:', b'MemAvailable:', b'SwapTotal:', b'SwapFree:')
+
+    def __init__(self, root: str = '/proc'):
+        self._stat = _ProcFile(os.path.join(root, 'stat'))
+        self._meminfo = _ProcFile(os.path.join(root, 'meminfo'))
+        self._net_dev = _ProcFile(os.path.join(root, 'net', 'dev'), 8192)
+        self._prev_cpu: Optional[Tuple[int, int]] = None
+        self._prev_cores: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._stat_read = _SharedRead(self._read_stat)
+        self._meminfo_read = _SharedRead(self.meminfo)
+
+    @classmethod
+    def create(cls, root: str = '/proc') -> Optional["ProcReader"]:
+        try:
+            return cls(root)
+        except (OSError, AttributeError):
+            return None
+
+    @staticmethod
+    def _counters(fields: List[bytes]) -> Tuple[int, int]:
+        """``(total, idle)`` jiffies of one ``cpu`` line."""
+        values = [int(v) for v in fields[:8]]
+        return sum(values), values[3] + (values[4] if len(values) > 4 else 0)
+
+    @staticmethod
+    def _busy_percent(counters: Tuple[int, int], prev: Optional[Tuple[int, int]]) -> float:
+        total, idle = counters
+        if prev is None or total <= prev[0]:
+            return 0.0
+        busy = (total - prev[0]) - (idle - prev[1])
+        return round(max(0.0, min(100.0, busy * 100.0 / (total - prev[0]))), 1)
+
+    def _read_stat(self) -> Tuple[Optional[Tuple[int, int]], Dict[str, Tuple[int, int]]]:
+        """Parse the aggregate and per-core ``cpu`` lines from one read of /proc/stat."""
+        f = self._stat
+        n = f.read()
+        buf = f.buf
+        total = None
+        cores: Dict[str, Tuple[int, int]] = {}
+        pos = 0
+        while pos < n and buf.startswith(b'cpu', pos):
+            end = buf.find(b'\n', pos, n)
+            if end < 0:
+                end = n
+            fields = buf[pos:end].split()
+            if len(fields) >= 5:
+                if fields[0] == b'cpu':
+                    total = self._counters(fields[1:])
+                else:
+                    cores[fields[0].decode('ascii')] = self._counters(fields[1:])
+            pos = end + 1
+        return total, cores
+
+    def cpu_percent(self) -> Optional[float]:
+        """Busy share of all CPUs since the previous call, like ``psutil.cpu_percent()``."""
+        with self._lock:
+            total = self._stat_read.take('total')[0]
+            if total is None:
+                return None
+            value = self._busy_percent(total, self._prev_cpu)
+            self._prev_cpu = total
+            return value
+
+    def cpu_core_percents(self) -> Optional[Dict[str, float]]:
+        """Return ``{"cpuN": busy %}`` since the previous call."""
+        with self._lock:
+            cores = self._stat_read.take('cores')[1]
+            prev = self._prev_cores
+            self._prev_cores = cores
+            return {core: self._busy_percent(counters, prev.get(core)) for core, counters in cores.items()} or None
+
+    def meminfo(self) -> Optional[Dict[bytes, int]]:
+        """Return the MemTotal/MemAvailable/SwapTotal/SwapFree values in bytes."""
+        f = self._meminfo
+        n = f.read()
+        buf = f.buf
+        result: Dict[bytes, int] = {}
+        for key in self._MEMINFO_KEYS:
+            pos = buf.find(key, 0, n)
+            if pos < 0:
+                return None
+            end = buf.find(b'\n', pos, n)
+            result[key] = int(buf[pos + len(key):end].split()[0]) * 1024
+        return result
+
+    def ram_usage(self) -> Optional[Tuple[float, float]]:
+        with self._lock:
+            mem = self._meminfo_read.take('ram')
+            if mem is None:
+                return None
+            total = mem[b'MemTotal:']
+            return (total - mem[b'MemAvailable:']) / (1024 ** 3), total / (1024 ** 3)
+
+    def swap_usage(self) -> Optional[Tuple[float, float]]:
+        with self._lock:
+            mem = self._meminfo_read.take('swap')
+            if mem is None:
+                return None
+            total = mem[b'SwapTotal:']
+            return (total - mem[b'SwapFree:']) / (1024 ** 3), total / (1024 ** 3)
+
+    def _net_rows(self) -> Optional[List[Tuple[str, int, int]]]:
+        f = self._net_dev
+        n = f.read()
+        buf = f.buf
+        # Skip the two header lines.
+        pos = buf.find(b'\n', buf.find(b'\n', 0, n) + 1, n) + 1
+        if pos <= 0:
+            return None
+        rows = []
+        while pos < n:
+            end = buf.find(b'\n', pos, n)
+            if end < 0:
+                end = n
+            colon = buf.find(b':', pos, end)
+            if colon > 0:
+                fields = buf[colon + 1:end].split()
+                rows.append((buf[pos:colon].strip().decode('utf-8', 'replace'), int(fields[0]), int(fields[8])))
+            pos = end + 1
+        return rows
+
+    def net_bytes(self) -> Optional[Tuple[int, int]]:
+        """Return ``(bytes_recv, bytes_sent)`` summed over all interfaces."""
+        with self._lock:
+            rows = self._net_rows()
+            if rows is None:
+                return None
+            return sum(row[1] for row in rows), sum(row[2] for row in rows)
+
+    def net_bytes_per_interface(self) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Return ``{interface: (bytes_recv, bytes_sent)}`` in /proc/net/dev order, loopback excluded."""
+        with self._lock:
+            rows = self._net_rows()
+            if rows is None:
+                return None
+            return {name: (recv, sent) for name, recv, sent in rows if name != 'lo'}
+
+    def close(self) -> None:
+        for f in (self._stat, self._meminfo, self._net_dev):
+            f.close()
+
+
+_proc = ProcReader.create()
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return f.read().strip()
+    except (OSError, ValueError):
+        return None
+
+
+# Read-only image mounts (snap packages) are always full and only add noise.
+_IGNORED_FSTYPES = frozenset({'squashfs'})
+
+
+def _unescape_mount_path(raw: str) -> str:
+    """Decode the octal escapes (``\\040`` for a space) used in mountinfo paths."""
+    if '\\' not in raw:
+        return raw
+    out = []
+    idx = 0
+    while idx < len(raw):
+        if raw[idx] == '\\' and raw[idx + 1:idx + 4].isdigit():
+            out.append(chr(int(raw[idx + 1:idx + 4], 8)))
+            idx += 4
+        else:
+            out.append(raw[idx])
+            idx += 1
+    return ''.join(out)
+
+
+class MountTable:
+    """Cached list of real filesystem mount points.
+
+    ``/proc/self/mountinfo`` is parsed once and kept open only to be polled: the
+    kernel flags it with ``POLLPRI`` whenever the mount namespace changes, so the
+    table is re-read only after a mount or unmount. Pseudo filesystems (``nodev``
+    in ``/proc/filesystems``) and bind mounts of an already listed device are skipped.
+    """
+
+    def __init__(self, root: str = '/proc'):
+        self._path = os.path.join(root, 'self', 'mountinfo')
+        self._fd = os.open(self._path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+        self._poller = select.poll()
+        self._poller.register(self._fd, select.POLLPRI | select.POLLERR)
+        self._nodev = self._read_nodev(os.path.join(root, 'filesystems'))
+        self._mounts: Optional[List[str]] = None
+
+    @classmethod
+    def create(cls, root: str = '/proc') -> Optional["MountTable"]:
+        try:
+            return cls(root)
+        except (OSError, AttributeError):
+            return None
+
+    @staticmethod
+    def _read_nodev(path: str) -> frozenset:
+        text = _read_text(path) or ''
+        return frozenset(
+            line.split()[-1] for line in text.splitlines() if line.startswith('nodev')
+        )
+
+    def _changed(self) -> bool:
+        return any(events & (select.POLLPRI | select.POLLERR) for _, events in self._poller.poll(0))
+
+    def invalidate(self) -> None:
+        self._mounts = None
+
+    def mount_points(self) -> List[str]:
+        if self._changed() or self._mounts is None:
+            self._mounts = self._parse()
+        return self._mounts
+
+    def _parse(self) -> List[str]:
+        mounts: List[str] = []
+        seen_devices = set()
+        with open(self._path, encoding='utf-8', errors='replace') as f:
+            for line in f:
+                head, sep, tail = line.partition(' - ')
+                fields = head.split()
+                if not sep or len(fields) < 5:
+                    continue
+                fstype = tail.split(' ', 1)[0]
+                if fstype in self._nodev or fstype in _IGNORED_FSTYPES:
+                    continue
+                device = fields[2]
+                if device in seen_devices:
+                    continue
+                seen_devices.add(device)
+                mounts.append(_unescape_mount_path(fields[4]))
+        return mounts
+
+    def usage(self) -> Dict[str, Tuple[float, float]]:
+        """Return ``{mount point: (used GB, total GB)}`` computed like ``psutil.disk_usage``."""
+        result: Dict[str, Tuple[float, float]] = {}
+        for mount in self.mount_points():
+            try:
+                st = os.statvfs(mount)
+            except OSError:
+                continue
+            if st.f_blocks == 0:
+                continue
+            total = st.f_blocks * st.f_frsize
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            result[mount] = (used / (1024 ** 3), total / (1024 ** 3))
+        return result
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class DiskStats:
+    """Per-device I/O counters from one read of ``/proc/diskstats``.
+
+    Only whole block devices are reported: partitions (no ``/sys/block`` entry)
+    would double count their disk, and loop/ram devices are skipped. Which
+    names are disks is remembered, so ``/sys`` is only consulted for new names.
+    """
+
+    SECTOR_BYTES = 512
+    _SKIPPED_PREFIXES = ('loop', 'ram')
+
+    def __init__(self, root: str = '/proc', sys_block: str = '/sys/block'):
+        self._diskstats = _ProcFile(os.path.join(root, 'diskstats'), 8192)
+        self._sys_block = sys_block if os.path.isdir(sys_block) else None
+        self._is_disk: Dict[str, bool] = {}
+
+    @classmethod
+    def create(cls, root: str = '/proc', sys_block: str = '/sys/block') -> Optional["DiskStats"]:
+        try:
+            return cls(root, sys_block)
+        except (OSError, AttributeError):
+            return None
+
+    def _whole_disk(self, name: str) -> bool:
+        known = self._is_disk.get(name)
+        if known is None:
+            known = not name.startswith(self._SKIPPED_PREFIXES) and (
+                self._sys_block is None
+                or os.path.isdir(os.path.join(self._sys_block, name.replace('/', '!')))
+            )
+            self._is_disk[name] = known
+        return known
+
+    def counters(self) -> Optional[Dict[str, Tuple[int, int, int, int, int]]]:
+        """Return ``{device: (reads, read bytes, writes, written bytes, busy ms)}``."""
+        f = self._diskstats
+        n = f.read()
+        if n == 0:
+            return None
+        sector = self.SECTOR_BYTES
+        result: Dict[str, Tuple[int, int, int, int, int]] = {}
+        for line in f.buf[:n].splitlines():
+            fields = line.split()
+            if len(fields) < 13:
+                continue
+            name = fields[2].decode('utf-8', 'replace')
+            if not self._whole_disk(name):
+                continue
+            result[name] = (
+                int(fields[3]),
+                int(fields[5]) * sector,
+                int(fields[7]),
+                int(fields[9]) * sector,
+                int(fields[12]),
+            )
+        return result
+
+    def close(self) -> None:
+        self._diskstats.close()
+
+
+_mounts = MountTable.create()
+_diskstats = DiskStats.create()
+
+
+_PREFERRED_TEMP_SENSORS = ('coretemp', 'k10temp', 'cpu-thermal', 'soc_thermal', 'acpitz')
+
+
+def _pick_cpu_sensor(groups: Dict[str, List[Tuple[str, Any]]]) -> Optional[Any]:
+    """Pick the CPU package sensor from ``{chip name: [(label, value), ...]}``."""
+    for key in _PREFERRED_TEMP_SENSORS:
+        entries = groups.get(key)
+        if entries:
+            for label, value in entries:
+                label = (label or '').lower()
+                if label.startswith('package') or label.startswith('tctl'):
+                    return value
+            return entries[0][1]
+    for entries in groups.values():
+        if entries:
+            return entries[0][1]
+    return None
+
+
+class TempSensorResolver:
+    """Resolve the CPU temperature sensor once and then read only its ``temp*_input`` file.
+
+    Discovery follows ``psutil.sensors_temperatures()`` (hwmon first, thermal zones
+    when hwmon has no temperatures). The chosen file stays open and is re-read with
+    ``os.pread``; a failed read or a changed hwmon listing triggers re-discovery.
+    """
+
+    def __init__(self, sys_root: str = '/sys/class', rescan_interval: float = 30.0):
+        self._hwmon_root = os.path.join(sys_root, 'hwmon')
+        self._thermal_root = os.path.join(sys_root, 'thermal')
+        self.rescan_interval = float(rescan_interval)
+        self.path: Optional[str] = None
+        self._fd: Optional[int] = None
+        self._listing: Optional[List[str]] = None
+        self._next_scan = 0.0
+
+    def _hwmon_listing(self) -> List[str]:
+        try:
+            return sorted(os.listdir(self._hwmon_root))
+        except OSError:
+            return []
+
+    def _candidates(self, listing: List[str]) -> Dict[str, List[Tuple[str, str]]]:
+        bases = []
+        for entry in listing:
+            for sub in ('', 'device'):
+                directory = os.path.join(self._hwmon_root, entry, sub)
+                try:
+                    names = os.listdir(directory)
+                except OSError:
+                    continue
+                bases.extend(
+                    os.path.join(directory, name[:-len('_input')])
+                    for name in names
+                    if name.startswith('temp') and name.endswith('_input')
+                )
+
+        groups: Dict[str, List[Tuple[str, str]]] = {}
+        for base in sorted(bases):
+            unit = _read_text(os.path.join(os.path.dirname(base), 'name'))
+            if unit is None or _read_text(base + '_input') is None:
+                continue
+            groups.setdefault(unit, []).append((_read_text(base + '_label') or '', base + '_input'))
+        if bases:
+            return groups
+
+        try:
+            zones = sorted(name for name in os.listdir(self._thermal_root) if name.startswith('thermal_zone'))
+        except OSError:
+            zones = []
+        for zone in zones:
+            base = os.path.join(self._thermal_root, zone)
+            unit = _read_text(os.path.join(base, 'type'))
+            if unit is None or _read_text(os.path.join(base, 'temp')) is None:
+                continue
+            groups.setdefault(unit, []).append(('', os.path.join(base, 'temp')))
+        return groups
+
+    def _resolve(self, listing: List[str]) -> None:
+        self._close()
+        self._listing = listing
+        self.path = _pick_cpu_sensor(self._candidates(listing))
+        if self.path is None:
+            return
+        try:
+            self._fd = os.open(self.path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+        except OSError:
+            self.path = None
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+        self._fd = None
+
+    def read(self) -> Optional[int]:
+        """Return the temperature in whole °C, or None when no sensor is available."""
+        now = time.monotonic()
+        if now >= self._next_scan:
+            self._next_scan = now + self.rescan_interval
+            listing = self._hwmon_listing()
+            if self._fd is None or listing != self._listing:
+                self._resolve(listing)
+
+        for attempt in range(2):
+            if self._fd is None:
+                return None
+            try:
+                return int(int(os.pread(self._fd, 32, 0).strip()) / 1000.0)
+            except (OSError, ValueError):
+                if attempt == 0:
+                    self._resolve(self._hwmon_listing())
+        self._close()
+        return None
+
+
+_temp_sensor = TempSensorResolver() if os.path.isdir('/sys/class') else None
+
+
 class SystemUsage:
     @staticmethod
     def get_cpu_temp() -> int:
+        if _temp_sensor is not None:
+            return _temp_sensor.read() or 0
         try:
             temps = psutil.sensors_temperatures()
             if not temps:
                 return 0
-
-            preferred_keys = ('coretemp', 'k10temp', 'cpu-thermal', 'soc_thermal', 'acpitz')
-            for key in preferred_keys:
-                arr = temps.get(key)
-                if arr:
-                    for t in arr:
-                        label = (getattr(t, 'label', '') or '').lower()
-                        if label.startswith('package') or label.startswith('tctl'):
-                            return int(t.current)
-                    return int(arr[0].current)
-
-            first_list = next(iter(temps.values()))
-            return int(first_list[0].current) if first_list else 0
+            groups = {name: [(t.label, t.current) for t in entries] for name, entries in temps.items()}
+            value = _pick_cpu_sensor(groups)
+            return int(value) if value is not None else 0
         except Exception:
             return 0
 
     @staticmethod
     def get_cpu_usage() -> float:
+        if _proc is not None:
+            try:
+                value = _proc.cpu_percent()
+                if value is not None:
+                    return value
+            except (OSError, ValueError, IndexError):
+                pass
         return psutil.cpu_percent()
 
     @staticmethod
     def get_ram_usage() -> Tuple[float, float]:
+        if _proc is not None:
+            try:
+                value = _proc.ram_usage()
+                if value is not None:
+                    return value
+            except (OSError, ValueError, IndexError):
+                pass
         m = psutil.virtual_memory()
         return m.used / (1024 ** 3), m.total / (1024 ** 3)
 
     @staticmethod
     def get_swap_usage() -> Tuple[float, float]:
+        if _proc is not None:
+            try:
+                value = _proc.swap_usage()
+                if value is not None:
+                    return value
+            except (OSError, ValueError, IndexError):
+                pass
         s = psutil.swap_memory()
         return s.used / (1024 ** 3), s.total / (1024 ** 3)
 
@@ -50,22 +560,129 @@ class SystemUsage:
         return d.used / (1024 ** 3), d.total / (1024 ** 3)
 
     @staticmethod
-    def get_network_speed(prev_data: Dict[str, float]) -> Tuple[float, float]:
+    def get_net_bytes() -> Tuple[int, int]:
+        if _proc is not None:
+            try:
+                value = _proc.net_bytes()
+                if value is not None:
+                    return value
+            except (OSError, ValueError, IndexError):
+                pass
         net = psutil.net_io_counters()
+        return net.bytes_recv, net.bytes_sent
+
+    @staticmethod
+    def get_network_speed(prev_data: Dict[str, float]) -> Tuple[float, float]:
+        bytes_recv, bytes_sent = SystemUsage.get_net_bytes()
         now = time.time()
         elapsed = max(0.0001, now - prev_data['time'])
 
-        recv_delta = max(0, net.bytes_recv - prev_data['recv'])
-        sent_delta = max(0, net.bytes_sent - prev_data['sent'])
+        recv_delta = max(0, bytes_recv - prev_data['recv'])
+        sent_delta = max(0, bytes_sent - prev_data['sent'])
 
         recv_speed = recv_delta / elapsed / 1024 / 1024
         sent_speed = sent_delta / elapsed / 1024 / 1024
 
-        prev_data['recv'] = net.bytes_recv
-        prev_data['sent'] = net.bytes_sent
+        prev_data['recv'] = bytes_recv
+        prev_data['sent'] = bytes_sent
         prev_data['time'] = now
         return recv_speed, sent_speed
 
+    @staticmethod
+    def get_cpu_core_usage() -> Dict[str, float]:
+        if _proc is not None:
+            try:
+                value = _proc.cpu_core_percents()
+                if value is not None:
+                    return value
+            except (OSError, ValueError, IndexError):
+                pass
+        return {f"cpu{idx}": value for idx, value in enumerate(psutil.cpu_percent(percpu=True))}
+
+    @staticmethod
+    def get_interface_bytes() -> Dict[str, Tuple[int, int]]:
+        if _proc is not None:
+            try:
+                value = _proc.net_bytes_per_interface()
+                if value is not None:
+                    return value
+            except (OSError, ValueError, IndexError):
+                pass
+        counters = psutil.net_io_counters(pernic=True)
+        return {name: (c.bytes_recv, c.bytes_sent) for name, c in counters.items() if name != 'lo'}
+
+    @staticmethod
+    def get_interface_speeds(prev_data: Dict[str, Any]) -> Dict[str, Tuple[float, float]]:
+        """Return ``{interface: (recv MB/s, sent MB/s)}``; ``prev_data`` keeps the previous counters."""
+        counters = SystemUsage.get_interface_bytes()
+        now = time.time()
+        elapsed = max(0.0001, now - prev_data.get('time', now))
+        previous = prev_data.get('ifaces', {})
+        speeds: Dict[str, Tuple[float, float]] = {}
+        for name, (recv, sent) in counters.items():
+            prev_recv, prev_sent = previous.get(name, (recv, sent))
+            speeds[name] = (
+                max(0, recv - prev_recv) / elapsed / 1024 / 1024,
+                max(0, sent - prev_sent) / elapsed / 1024 / 1024,
+            )
+        prev_data['ifaces'] = counters
+        prev_data['time'] = now
+        return speeds
+
+    @staticmethod
+    def get_mount_usage() -> Dict[str, Tuple[float, float]]:
+        if _mounts is not None:
+            try:
+                return _mounts.usage()
+            except (OSError, ValueError, IndexError):
+                pass
+        result: Dict[str, Tuple[float, float]] = {}
+        for part in psutil.disk_partitions():
+            try:
+                d = psutil.disk_usage(part.mountpoint)
+            except OSError:
+                continue
+            result[part.mountpoint] = (d.used / (1024 ** 3), d.total / (1024 ** 3))
+        return result
+
+    @staticmethod
+    def get_disk_counters() -> Dict[str, Tuple[int, int, int, int, int]]:
+        if _diskstats is not None:
+            try:
+                value = _diskstats.counters()
+                if value is not None:
+                    return value
+            except (OSError, ValueError, IndexError):
+                pass
+        counters = psutil.disk_io_counters(perdisk=True) or {}
+        return {
+            name: (c.read_count, c.read_bytes, c.write_count, c.write_bytes, getattr(c, 'busy_time', 0))
+            for name, c in counters.items() if not name.startswith(DiskStats._SKIPPED_PREFIXES)
+        }
+
+    @staticmethod
+    def get_disk_io(prev_data: Dict[str, Any]) -> Dict[str, Tuple[float, float, float, float]]:
+        """Return ``{device: (read MB/s, write MB/s, IOPS, busy %)}``; ``prev_data`` keeps the previous counters."""
+        counters = SystemUsage.get_disk_counters()
+        now = time.time()
+        elapsed = max(0.0001, now - prev_data.get('time', now))
+        previous = prev_data.get('disks', {})
+        mb = elapsed * 1024 * 1024
+        result: Dict[str, Tuple[float, float, float, float]] = {}
+        for name, current in counters.items():
+            reads, read_bytes, writes, write_bytes, busy_ms = (
+                max(0, c - p) for c, p in zip(current, previous.get(name, current))
+            )
+            result[name] = (
+                read_bytes / mb,
+                write_bytes / mb,
+                (reads + writes) / elapsed,
+                min(100.0, busy_ms / elapsed / 10.0),
+            )
+        prev_data['disks'] = counters
+        prev_data['time'] = now
+        return result
+
     @staticmethod
     def get_uptime() -> str:
         seconds = time.time() - psutil.boot_time()
@@ -73,7 +690,14 @@ class SystemUsage:
 
 
 class MetricsSampler:
-    """Collect metrics using per-metric cache intervals to reduce psutil polling."""
+    """Collect metrics on a deadline heap: each key is read only when its next due time arrives.
+
+    Metric families (per core, per interface, per mount, per disk) are collected only
+    while listed in ``families``. With ``adaptive`` on, a key nobody is looking
+    at (not in ``watched``) doubles its interval after every stable reading, up
+    to ``ADAPTIVE_MAX_FACTOR`` times its base; a fast change or becoming watched
+    brings it back to the base interval.
+    """
 
     _METRIC_KEYS = (
         "cpu_temp",
@@ -84,8 +708,20 @@ class MetricsSampler:
         "net",
         "uptime",
     )
+    FAMILY_KEYS = (
+        "cpu_cores",
+        "net_ifaces",
+        "mounts",
+        "disk_io",
+    )
+    ADAPTIVE_MAX_FACTOR = 8
+    ADAPTIVE_MAX_INTERVAL_SEC = 30.0
+    # Relative change between two readings that counts as "changing fast".
+    ADAPTIVE_CHANGE_RATIO = 0.1
+    # Keys due within this window are read in the same wakeup.
+    COALESCE_SEC = 0.05
 
-    def __init__(self) -> None:
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
         self._cache: Dict[str, Any] = {
             "cpu_temp": 0,
             "cpu_usage": 0.0,
@@ -95,20 +731,112 @@ class MetricsSampler:
             "net": (0.0, 0.0),
             "uptime": "00:00:00",
         }
-        self._last_update_ts: Dict[str, float] = {key: 0.0 for key in self._METRIC_KEYS}
+        self._clock = clock
+        self._heap: List[Tuple[float, str]] = []
+        self._due: Dict[str, float] = {}
+        self._base: Dict[str, float] = {}
+        self._factor: Dict[str, int] = {}
+        self._prev_iface_data: Dict[str, Any] = {}
+        self._prev_disk_data: Dict[str, Any] = {}
+        self.families: Tuple[str, ...] = ()
+        self._requested_families: Tuple[str, ...] = ()
+        self.watched: frozenset = frozenset()
+        self.adaptive = False
+        self.collections = 0
+
+    def set_families(self, families) -> None:
+        """Request a new family set; the next ``collect`` applies it on the sampler thread."""
+        self._requested_families = tuple(key for key in self.FAMILY_KEYS if key in families)
+
+    def _apply_families(self, enabled: Tuple[str, ...]) -> None:
+        for key in self.families:
+            if key not in enabled:
+                self._cache.pop(key, None)
+                self._due.pop(key, None)
+                self._base.pop(key, None)
+        if "net_ifaces" not in enabled:
+            self._prev_iface_data = {}
+        if "disk_io" not in enabled:
+            self._prev_disk_data = {}
+        self.families = enabled
+
+    def set_watched(self, keys) -> None:
+        """Mark keys shown on screen; newly watched keys are re-read at their base interval."""
+        keys = frozenset(keys)
+        now = self._clock()
+        for key in keys - self.watched:
+            if self._factor.get(key, 1) > 1 and key in self._base:
+                self._factor[key] = 1
+                self._schedule(key, now)
+        self.watched = keys
+
+    def next_due(self) -> float:
+        """Clock time of the earliest pending collection (``inf`` before the first ``collect``)."""
+        heap = self._heap
+        while heap and self._due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else float('inf')
+
+    def _schedule(self, key: str, due: float) -> None:
+        self._due[key] = due
+        heapq.heappush(self._heap, (due, key))
 
     def collect(self, prev_net_data: Dict[str, float], intervals: Dict[str, int]) -> Dict[str, Any]:
-        now = time.time()
-        for key in self._METRIC_KEYS:
-            min_interval = max(1, int(intervals.get(key, 1)))
-            if now - self._last_update_ts[key] < min_interval:
+        requested = self._requested_families
+        if requested != self.families:
+            self._apply_families(requested)
+        now = self._clock()
+        for key in self._METRIC_KEYS + self.families:
+            base = float(max(1, int(intervals.get(key, 1))))
+            if self._base.get(key) != base:
+                self._base[key] = base
+                self._factor[key] = 1
+                self._schedule(key, min(self._due.get(key, now), now + base))
+
+        heap = self._heap
+        while heap and heap[0][0] <= now + self.COALESCE_SEC:
+            due, key = heapq.heappop(heap)
+            if self._due.get(key) != due:
                 continue
+            previous = self._cache.get(key)
             self._cache[key] = self._collect_metric(key, prev_net_data)
-            self._last_update_ts[key] = now
+            self.collections += 1
+            next_due = due + self._next_interval(key, previous, self._cache[key])
+            self._schedule(key, next_due if next_due > now else now + self._base[key])
         return dict(self._cache)
 
+    def _next_interval(self, key: str, previous: Any, current: Any) -> float:
+        base = self._base[key]
+        if (not self.adaptive or key in self.watched
+                or self._change_ratio(previous, current) >= self.ADAPTIVE_CHANGE_RATIO):
+            self._factor[key] = 1
+            return base
+        factor = min(self.ADAPTIVE_MAX_FACTOR, self._factor.get(key, 1) * 2)
+        self._factor[key] = factor
+        return min(max(base, self.ADAPTIVE_MAX_INTERVAL_SEC), base * factor)
+
     @staticmethod
-    def _collect_metric(key: str, prev_net_data: Dict[str, float]) -> Any:
+    def _numbers(value: Any) -> List[float]:
+        if isinstance(value, (int, float)):
+            return [float(value)]
+        if isinstance(value, tuple):
+            return [float(v) for v in value if isinstance(v, (int, float))]
+        if isinstance(value, dict):
+            return [n for v in value.values() for n in MetricsSampler._numbers(v)]
+        return []
+
+    @classmethod
+    def _change_ratio(cls, previous: Any, current: Any) -> float:
+        """Largest change between two readings relative to their size (at least 10 units)."""
+        before, after = cls._numbers(previous), cls._numbers(current)
+        if len(before) != len(after):
+            return 1.0
+        return max(
+            (abs(a - b) / max(abs(a), abs(b), 10.0) for a, b in zip(before, after)),
+            default=0.0,
+        )
+
+    def _collect_metric(self, key: str, prev_net_data: Dict[str, float]) -> Any:
         if key == "cpu_temp":
             return SystemUsage.get_cpu_temp()
         if key == "cpu_usage":
@@ -123,4 +851,12 @@ class MetricsSampler:
             return SystemUsage.get_network_speed(prev_net_data)
         if key == "uptime":
             return SystemUsage.get_uptime()
+        if key == "cpu_cores":
+            return SystemUsage.get_cpu_core_usage()
+        if key == "net_ifaces":
+            return SystemUsage.get_interface_speeds(self._prev_iface_data)
+        if key == "mounts":
+            return SystemUsage.get_mount_usage()
+        if key == "disk_io":
+            return SystemUsage.get_disk_io(self._prev_disk_data)
         return 0
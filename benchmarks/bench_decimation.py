@@ -0,0 +1,73 @@
+"""Compare the legacy evenly-spaced decimation with the min/max and LTTB engine.
+
+Run from the repository root: ``python -m benchmarks.bench_decimation``.
+"""
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+
+from app_core import decimation
+from app_core.history import RAW_POINTS_MAX, MetricHistory
+
+# The widest series a graph decimates: longer windows are served by rollup tiers
+# of at most the same number of rows.
+POINTS = RAW_POINTS_MAX
+PIXELS = 700
+REPEATS = 50
+
+
+def legacy_decimate(samples: list[tuple], max_points: int) -> list[tuple]:
+    if max_points <= 0 or len(samples) <= max_points:
+        return samples
+    step = (len(samples) - 1) / float(max_points - 1)
+    result: list[tuple] = []
+    for idx in range(max_points):
+        src_index = int(round(idx * step))
+        if src_index >= len(samples):
+            src_index = len(samples) - 1
+        result.append(samples[src_index])
+    return result
+
+
+def _build_data() -> tuple[deque, MetricHistory, set[int]]:
+    rng = random.Random(42)
+    legacy = deque(maxlen=POINTS)
+    history = MetricHistory(('usage', 'temp'), POINTS)
+    spikes = set(rng.sample(range(POINTS), 40))
+    for i in range(POINTS):
+        usage = 99.0 if i in spikes else rng.uniform(5.0, 25.0)
+        temp = rng.uniform(40.0, 55.0)
+        legacy.append((float(i), usage, temp))
+        history.append(float(i), usage, temp)
+    return legacy, history, spikes
+
+
+def _timeit(func) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func()
+    return (time.perf_counter() - start) * 1000.0 / REPEATS
+
+
+def main() -> None:
+    legacy, history, spikes = _build_data()
+    max_points = PIXELS * 2
+
+    cases = {
+        "legacy list(deque) + even step": lambda: legacy_decimate(list(legacy), max_points),
+        "minmax per pixel (view)": lambda: decimation.decimate_view(history.view(), max_points),
+        "lttb (view)": lambda: decimation.decimate_view(history.view(), max_points, decimation.MODE_LTTB),
+    }
+    results = {name: func() for name, func in cases.items()}
+
+    backend = "numpy" if decimation._np is not None else "pure python"
+    print(f"points={POINTS} pixels={PIXELS} backend={backend}")
+    for name, func in cases.items():
+        kept = sum(1 for row in results[name] if row[1] == 99.0)
+        print(f"{name:34s} {_timeit(func):8.3f} ms/draw  spikes kept {kept}/{len(spikes)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare per-cycle CPU/RAM/swap/network collection: psutil calls vs the /proc fast path.
+
+Run from the repository root: ``python -m benchmarks.bench_proc``.
+"""
+from __future__ import annotations
+
+import time
+
+import psutil
+
+from app_core.system_usage import ProcReader
+
+REPEATS = 2000
+
+
+def psutil_cycle() -> None:
+    psutil.cpu_percent()
+    psutil.virtual_memory()
+    psutil.swap_memory()
+    psutil.net_io_counters()
+
+
+def _timeit(func) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func()
+    return (time.perf_counter() - start) * 1e6 / REPEATS
+
+
+def main() -> None:
+    reader = ProcReader.create()
+    if reader is None:
+        print("/proc is not available, nothing to compare")
+        return
+
+    def proc_cycle() -> None:
+        reader.cpu_percent()
+        reader.ram_usage()
+        reader.swap_usage()
+        reader.net_bytes()
+
+    legacy = _timeit(psutil_cycle)
+    fast = _timeit(proc_cycle)
+    print(f"psutil (4 calls)      {legacy:8.1f} us/cycle")
+    print(f"/proc fast path       {fast:8.1f} us/cycle")
+    print(f"speedup               {legacy / fast:8.1f}x")
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()
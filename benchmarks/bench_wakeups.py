@@ -0,0 +1,57 @@
+"""Count sampler wakeups per minute: fixed 1-second ticks vs the adaptive deadline scheduler.
+
+Both engines run side by side against the real collectors for the same period,
+with nothing on screen (no menu, no graph windows), which is the idle tray case.
+Run from the repository root: ``python -m benchmarks.bench_wakeups [seconds]``.
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+from app_core.sampler import SamplingEngine
+from app_core.system_usage import MetricsSampler, SystemUsage
+
+DEFAULT_SECONDS = 60
+
+
+def _engine(sampler: MetricsSampler, adaptive: bool) -> SamplingEngine:
+    recv, sent = SystemUsage.get_net_bytes()
+    prev_net = {'recv': recv, 'sent': sent, 'time': time.time()}
+    intervals = {key: 1 for key in MetricsSampler._METRIC_KEYS}
+    sampler.adaptive = adaptive
+
+    def next_delay() -> float:
+        delay = sampler.next_due() - time.monotonic()
+        return max(0.0, min(MetricsSampler.ADAPTIVE_MAX_INTERVAL_SEC, delay))
+
+    return SamplingEngine(
+        collect=lambda: sampler.collect(prev_net, intervals),
+        on_snapshot=lambda _snapshot: False,
+        deliver=lambda _snapshot: None,
+        wake=lambda _callback: None,
+        interval=1.0,
+        next_delay=next_delay if adaptive else None,
+    )
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SECONDS
+    fixed_sampler, adaptive_sampler = MetricsSampler(), MetricsSampler()
+    fixed, adaptive = _engine(fixed_sampler, False), _engine(adaptive_sampler, True)
+    fixed.start()
+    adaptive.start()
+    time.sleep(seconds)
+    fixed.stop()
+    adaptive.stop()
+
+    minutes = seconds / 60.0
+    print(f"measured over {seconds:.0f} s, nothing on screen")
+    print(f"{'':22}{'wakeups/min':>12}{'reads/min':>12}")
+    for name, engine, sampler in (("fixed 1 s ticks", fixed, fixed_sampler),
+                                  ("adaptive deadlines", adaptive, adaptive_sampler)):
+        print(f"{name:22}{engine.wakeups / minutes:12.1f}{sampler.collections / minutes:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -56,6 +56,20 @@ add_optional_module() {
 add_optional_module gi._gi_cairo
 add_optional_module cairo
 
+# ---------- Обязательные модули для Nuitka ----------
+add_required_module() {
+    local module_name="$1"
+    if ! python -c "import importlib.util; import sys; sys.exit(0 if importlib.util.find_spec('$module_name') else 1)" 2>/dev/null; then
+        echo "❌ Required module not found: ${module_name} (pip install -r requirements.txt)"
+        exit 1
+    fi
+    NUITKA_EXTRA_MODULE_ARGS+=("--include-module=${module_name}")
+    echo "➕ Include required module: ${module_name}"
+}
+
+# Графики прореживаются векторно; без numpy остаётся медленный запасной путь.
+add_required_module numpy
+
 # ---------- Пути для ярлыков ----------
 DESKTOP_MAIN="$HOME/.local/share/applications/${APP_NAME}.desktop"
 DESKTOP_AUTOSTART="$HOME/.config/autostart/${APP_NAME}.desktop"
@@ -102,6 +116,8 @@ $NUITKA_CMD --standalone \
     --assume-yes-for-downloads \
     --include-data-files=logo.png=logo.png \
     --include-data-files=app_core/language.py=app_core/language.py \
+    --include-package=app_core.locales \
+    --include-package=notifications \
     --include-data-files=app_core/localization.py=app_core/localization.py \
     --include-data-files=app_core/system_usage.py=app_core/system_usage.py \
     --include-data-files=app_core/power_control.py=app_core/power_control.py \
@@ -187,6 +203,8 @@ $NUITKA_CMD --onefile \
     --assume-yes-for-downloads \
     --include-data-files=logo.png=logo.png \
     --include-data-files=app_core/language.py=app_core/language.py \
+    --include-package=app_core.locales \
+    --include-package=notifications \
     --include-data-files=app_core/localization.py=app_core/localization.py \
     --include-data-files=app_core/system_usage.py=app_core/system_usage.py \
     --include-data-files=app_core/power_control.py=app_core/power_control.py \
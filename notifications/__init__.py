@@ -1,7 +1,23 @@
-from .telegram import TelegramNotifier
-from .discord import DiscordNotifier
+from importlib import import_module
 
-__all__ = [
-    "TelegramNotifier",
-    "DiscordNotifier",
-]
+# Submodules are imported on first attribute access, so loading the channel
+# interface or the dispatcher does not pull in GTK through the Telegram bot.
+_EXPORTS = {
+    "TelegramNotifier": ".telegram",
+    "DiscordNotifier": ".discord",
+    "WebhookNotifier": ".webhook",
+    "NotificationDispatcher": ".dispatcher",
+    "NotificationChannel": ".base",
+    "ChannelCapabilities": ".base",
+    "register_channel": ".base",
+    "create_channels": ".base",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import importlib
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, List, NamedTuple, Sequence, Type
+
+from app_core.localization import tr
+
+logger = logging.getLogger(__name__)
+
+# Modules imported by ``create_channels``; each registers its channel class.
+BUILTIN_CHANNEL_MODULES = (
+    'notifications.telegram',
+    'notifications.discord',
+    'notifications.webhook',
+)
+
+
+class ChannelCapabilities(NamedTuple):
+    max_length: int = 4096
+    min_interval: float = 1.0
+    supports_images: bool = False
+    supports_batching: bool = False
+
+
+class NotificationChannel(ABC):
+    """Common interface of a notification channel.
+
+    A channel loads its own config (``enabled``, ``notification_interval``),
+    turns a ``MetricsSnapshot`` into its message format and sends text. When
+    ``capabilities.supports_batching`` is set, the dispatcher hands several
+    pending messages to ``send_batch`` in one request instead of dropping all
+    but the newest while the channel is rate limited. ``send_message`` and
+    ``format_status`` are abstract, so a plugin missing either fails when
+    ``create_channels`` instantiates it.
+    """
+
+    name = ""
+    capabilities = ChannelCapabilities()
+    BATCH_SEPARATOR = "\n\n"
+
+    enabled: bool = False
+    notification_interval: int = 3600
+
+    @abstractmethod
+    def send_message(self, message: str, force: bool = False) -> bool:
+        """Send ``message``; ``force`` ignores ``enabled``. Return True on delivery."""
+
+    def send_batch(self, messages: Sequence[str]) -> bool:
+        return self.send_message(self.join_batch(messages))
+
+    @abstractmethod
+    def format_status(self, snapshot) -> str:
+        """Render a ``MetricsSnapshot`` in the channel's message format."""
+
+    def format_alert(self, event) -> str:
+        """Text of an ``AlertEvent`` (an alert rule fired or resolved)."""
+        if event.firing:
+            return f"⚠️ {tr('alert_firing')}: {event.describe()}"
+        return f"✅ {tr('alert_resolved')}: {event.describe()}"
+
+    def join_batch(self, messages: Sequence[str]) -> str:
+        """Join messages oldest first, dropping the oldest ones that do not fit ``max_length``."""
+        kept: List[str] = []
+        size = 0
+        for message in reversed(messages):
+            extra = len(message) + (len(self.BATCH_SEPARATOR) if kept else 0)
+            if kept and size + extra > self.capabilities.max_length:
+                break
+            kept.append(message)
+            size += extra
+        return self.BATCH_SEPARATOR.join(reversed(kept))
+
+
+_REGISTRY: Dict[str, Type[NotificationChannel]] = {}
+
+
+def register_channel(cls: Type[NotificationChannel]) -> Type[NotificationChannel]:
+    """Class decorator that makes a channel available to ``create_channels``."""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__}: channel name is required")
+    _REGISTRY[cls.name] = cls
+    return cls
+
+
+def channel_types() -> Dict[str, Type[NotificationChannel]]:
+    return dict(_REGISTRY)
+
+
+def create_channels(modules: Sequence[str] = BUILTIN_CHANNEL_MODULES) -> Dict[str, NotificationChannel]:
+    """Import the channel modules and instantiate every registered channel, keyed by name."""
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.exception("Не удалось загрузить канал уведомлений %s: %s", module, e)
+    channels: Dict[str, NotificationChannel] = {}
+    for name, cls in _REGISTRY.items():
+        try:
+            channels[name] = cls()
+        except Exception as e:
+            logger.exception("Не удалось создать канал уведомлений %s: %s", name, e)
+    return channels
@@ -3,22 +3,39 @@ from __future__ import annotations
 import json
 import logging
 import time
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 import requests
 from requests import Response
 
 from app_core.constants import DISCORD_CONFIG_FILE
+from app_core.http_transport import HttpTransport, get_transport
+from app_core.localization import tr
+
+from .base import ChannelCapabilities, NotificationChannel, register_channel
+
+if TYPE_CHECKING:
+    from app_core.sampler import MetricsSnapshot
 
 logger = logging.getLogger(__name__)
 
 
-class DiscordNotifier:
+@register_channel
+class DiscordNotifier(NotificationChannel):
+    name = "discord"
     MAX_MESSAGE_LENGTH = 2000
     _RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
     _MAX_SEND_RETRIES = 3
+    # Webhooks are limited to 30 messages per minute.
+    capabilities = ChannelCapabilities(
+        max_length=MAX_MESSAGE_LENGTH,
+        min_interval=2.0,
+        supports_images=False,
+        supports_batching=True,
+    )
 
-    def __init__(self):
+    def __init__(self, transport: Optional[HttpTransport] = None):
+        self.transport = transport or get_transport()
         self.webhook_url: Optional[str] = None
         self.enabled: bool = False
         self.notification_interval: int = 3600
@@ -81,6 +98,19 @@ class DiscordNotifier:
             logger.exception("Ошибка отправки сообщения в Discord: %s", e)
             return False
 
+    def format_status(self, s: "MetricsSnapshot") -> str:
+        return (
+            f"**{tr('system_status')}**\n"
+            f"**{tr('cpu')}**: {s.cpu_usage:.0f}% ({s.cpu_temp}{tr('temperature')})\n"
+            f"**{tr('ram')}**: {s.ram_used:.1f}/{s.ram_total:.1f} {tr('gb')}\n"
+            f"**{tr('swap')}**: {s.swap_used:.1f}/{s.swap_total:.1f} {tr('gb')}\n"
+            f"**{tr('disk')}**: {s.disk_used:.1f}/{s.disk_total:.1f} {tr('gb')}\n"
+            f"**{tr('network')}**: ↓{s.net_recv:.1f}/↑{s.net_sent:.1f} {tr('mbps')}\n"
+            f"**{tr('uptime')}**: {s.uptime}\n"
+            f"**{tr('keyboard')}**: {s.keyboard_clicks} {tr('presses')}\n"
+            f"**{tr('mouse')}**: {s.mouse_clicks} {tr('clicks')}"
+        )
+
     @staticmethod
     def _truncate_message(message: str, max_length: int) -> str:
         text = str(message or "")
@@ -93,7 +123,7 @@ class DiscordNotifier:
         last_response: Optional[Response] = None
         for _attempt in range(self._MAX_SEND_RETRIES):
             try:
-                response = requests.post(self.webhook_url, json=payload, timeout=(3, 7))
+                response = self.transport.post(self.webhook_url, json=payload, timeout=(3, 7))
                 last_response = response
                 if response.status_code == 429:
                     retry_after = self._extract_retry_after(response)
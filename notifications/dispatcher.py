@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import NotificationChannel
+
+logger = logging.getLogger(__name__)
+
+
+class _Channel:
+    def __init__(self,
+                 name: str,
+                 send: Callable[[str], bool],
+                 min_interval: float,
+                 send_batch: Optional[Callable[[Sequence[str]], bool]]):
+        self.name = name
+        self.send = send
+        self.send_batch = send_batch
+        self.min_interval = float(min_interval)
+        self.pending: List[str] = []
+        self.ready: Optional[asyncio.Event] = None
+        self.task: Optional[asyncio.Task] = None
+        self.next_send = 0.0
+        self.sent = 0
+        self.failed = 0
+        self.coalesced = 0
+        self.batched = 0
+
+
+class NotificationDispatcher:
+    """Owns all outbound notifications and bot polling on one asyncio loop thread.
+
+    ``submit`` can be called from any thread and never blocks. Each channel
+    sends at most once per ``min_interval``; messages that arrive meanwhile
+    replace the pending one (only the latest status matters) or, for channels
+    with ``send_batch``, queue up (at most ``MAX_BATCH``) and go out together
+    in one request.
+
+    Blocking HTTP calls run on a small persistent executor that reuses the
+    pooled notifier transport, so the loop itself never waits on the network
+    and no thread is started per message. ``start_poller`` runs a long-poll
+    function (Telegram ``getUpdates``) in a loop until ``stop_poller``; the
+    function returns the pause before its next call. A poll already running
+    on the executor cannot be interrupted, so a restarted poller first waits
+    for it to finish instead of overlapping it.
+    """
+
+    MAX_BATCH = 10
+
+    def __init__(self, max_workers: int = 3):
+        self._max_workers = max_workers
+        self._channels: Dict[str, _Channel] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+        self._poll_futures: Dict[str, Future] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+
+    def add_channel(self,
+                    name: str,
+                    send: Callable[[str], bool],
+                    min_interval: float = 0.0,
+                    send_batch: Optional[Callable[[Sequence[str]], bool]] = None) -> None:
+        channel = _Channel(name, send, min_interval, send_batch)
+        self._channels[name] = channel
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._start_channel, channel)
+
+    def add(self, channel: "NotificationChannel") -> None:
+        caps = channel.capabilities
+        self.add_channel(channel.name, channel.send_message, caps.min_interval,
+                         channel.send_batch if caps.supports_batching else None)
+
+    def channel_stats(self, name: str) -> Dict[str, int]:
+        channel = self._channels[name]
+        return {'sent': channel.sent, 'failed': channel.failed,
+                'coalesced': channel.coalesced, 'batched': channel.batched}
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._started.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="symo-notify")
+        self._thread = threading.Thread(target=self._run, name="symo-notify-loop", daemon=True)
+        self._thread.start()
+        self._started.wait(timeout=2.0)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(self._shutdown)
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+        self._thread = None
+        if self._executor is not None:
+            # A long poll in flight is abandoned rather than waited for.
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def submit(self, name: str, message: str) -> None:
+        loop = self._loop
+        if loop is None or name not in self._channels:
+            return
+        try:
+            loop.call_soon_threadsafe(self._offer, self._channels[name], str(message))
+        except RuntimeError:
+            # Loop already closed during shutdown.
+            pass
+
+    def start_poller(self, name: str, poll: Callable[[], float]) -> None:
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._start_poller, name, poll)
+
+    def stop_poller(self, name: str) -> None:
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._cancel_poller, name)
+            except RuntimeError:
+                pass
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        for channel in self._channels.values():
+            self._start_channel(channel)
+        loop.call_soon(self._started.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop = None
+            loop.close()
+
+    def _shutdown(self) -> None:
+        for task in asyncio.all_tasks(self._loop):
+            task.cancel()
+        self._loop.stop()
+
+    def _start_channel(self, channel: _Channel) -> None:
+        channel.ready = asyncio.Event()
+        channel.task = self._loop.create_task(self._channel_loop(channel))
+        if channel.pending:
+            channel.ready.set()
+
+    def _offer(self, channel: _Channel, message: str) -> None:
+        limit = self.MAX_BATCH if channel.send_batch is not None else 1
+        if len(channel.pending) >= limit:
+            channel.pending.pop(0)
+            channel.coalesced += 1
+        channel.pending.append(message)
+        channel.ready.set()
+
+    async def _channel_loop(self, channel: _Channel) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await channel.ready.wait()
+            delay = channel.next_send - loop.time()
+            if delay > 0:
+                # Rate limited: newer messages replace or join the pending ones meanwhile.
+                await asyncio.sleep(delay)
+            channel.ready.clear()
+            messages, channel.pending = channel.pending, []
+            if not messages:
+                continue
+            channel.next_send = loop.time() + channel.min_interval
+            if len(messages) > 1:
+                send, arg = channel.send_batch, messages
+            else:
+                send, arg = channel.send, messages[0]
+            try:
+                ok = await loop.run_in_executor(self._executor, send, arg)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception("Ошибка отправки уведомления (%s): %s", channel.name, e)
+                ok = False
+            if ok:
+                channel.sent += 1
+                if len(messages) > 1:
+                    channel.batched += len(messages)
+            else:
+                channel.failed += 1
+
+    def _start_poller(self, name: str, poll: Callable[[], float]) -> None:
+        self._cancel_poller(name)
+        self._pollers[name] = self._loop.create_task(self._poll_loop(name, poll))
+
+    def _cancel_poller(self, name: str) -> None:
+        task = self._pollers.pop(name, None)
+        if task is not None:
+            task.cancel()
+
+    async def _poll_loop(self, name: str, poll: Callable[[], float]) -> None:
+        while True:
+            previous = self._poll_futures.get(name)
+            if previous is not None and not previous.done():
+                # Cancelling the task left its long poll running; a second one would get 409 Conflict.
+                await asyncio.wait([asyncio.wrap_future(previous)])
+            future = self._executor.submit(poll)
+            self._poll_futures[name] = future
+            try:
+                delay = await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception("Ошибка опроса (%s): %s", name, e)
+                delay = 5.0
+            if delay and delay > 0:
+                await asyncio.sleep(delay)
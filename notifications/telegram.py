@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+import html
 import json
 import logging
 import os
 import shutil
 import subprocess
 import tempfile
-import threading
 import time
 from typing import Optional, TYPE_CHECKING
 
@@ -15,33 +15,51 @@ from requests import Response
 from gi.repository import GLib
 
 from app_core.constants import TELEGRAM_CONFIG_FILE
+from app_core.decimation import lttb_indices
+from app_core.http_transport import HttpTransport, get_transport
 from app_core.localization import tr
 from app_core.system_usage import SystemUsage
 from app_core.click_tracker import get_counts
 
+from .base import ChannelCapabilities, NotificationChannel, register_channel
+
 if TYPE_CHECKING:
     from app_core.power_control import PowerControl
     from app_core.app import SystemTrayApp
+    from app_core.sampler import MetricsSnapshot
+    from .dispatcher import NotificationDispatcher
 
 logger = logging.getLogger(__name__)
 
 
-class TelegramNotifier:
+@register_channel
+class TelegramNotifier(NotificationChannel):
+    name = "telegram"
     MAX_MESSAGE_LENGTH = 4096
     _RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
     _MAX_SEND_RETRIES = 3
     _MAX_PHOTO_SEND_RETRIES = 3
     _PHOTO_OPTIMIZE_THRESHOLD_BYTES = 2 * 1024 * 1024
-
-    def __init__(self):
+    _GRAPH_MAX_POINTS = 900
+    # Telegram allows about one message per second to the same chat.
+    capabilities = ChannelCapabilities(
+        max_length=MAX_MESSAGE_LENGTH,
+        min_interval=1.0,
+        supports_images=True,
+        supports_batching=True,
+    )
+
+    def __init__(self, transport: Optional[HttpTransport] = None):
+        self.transport = transport or get_transport()
         self.token: Optional[str] = None
         self.chat_id: Optional[str] = None
         self.enabled: bool = False
         self.notification_interval: int = 3600
         self.screenshot_quality: str = "medium"
         self.last_update_id: int = 0
-        self.bot_thread: Optional[threading.Thread] = None
         self.bot_running: bool = False
+        self.dispatcher: Optional["NotificationDispatcher"] = None
+        self._poll_backoff = 1.0
         self.power_control_ref: Optional["PowerControl"] = None
         self.app_ref: Optional["SystemTrayApp"] = None
         self.load_config()
@@ -131,6 +149,24 @@ class TelegramNotifier:
             logger.exception("Ошибка отправки сообщения в Telegram: %s", e)
             return False
 
+    def format_status(self, s: "MetricsSnapshot") -> str:
+        return (
+            f"<b>{tr('system_status')}</b>\n"
+            f"<b>{tr('cpu')}:</b> {s.cpu_usage:.0f}% ({s.cpu_temp}{tr('temperature')})\n"
+            f"<b>{tr('ram')}:</b> {s.ram_used:.1f}/{s.ram_total:.1f} {tr('gb')}\n"
+            f"<b>{tr('swap')}:</b> {s.swap_used:.1f}/{s.swap_total:.1f} {tr('gb')}\n"
+            f"<b>{tr('disk')}:</b> {s.disk_used:.1f}/{s.disk_total:.1f} {tr('gb')}\n"
+            f"<b>{tr('network')}:</b> ↓{s.net_recv:.1f}/↑{s.net_sent:.1f} {tr('mbps')}\n"
+            f"<b>{tr('uptime')}:</b> {s.uptime}\n"
+            f"<b>{tr('keyboard')}:</b> {s.keyboard_clicks} {tr('presses')}\n"
+            f"<b>{tr('mouse')}:</b> {s.mouse_clicks} {tr('clicks')}"
+        )
+
+    def format_alert(self, event) -> str:
+        title = tr('alert_firing') if event.firing else tr('alert_resolved')
+        icon = "⚠️" if event.firing else "✅"
+        return f"{icon} <b>{title}</b>\n{html.escape(event.describe())}"
+
     @staticmethod
     def _truncate_message(message: str, max_length: int) -> str:
         text = str(message or "")
@@ -143,7 +179,7 @@ class TelegramNotifier:
         last_response: Optional[Response] = None
         for _attempt in range(self._MAX_SEND_RETRIES):
             try:
-                response = requests.post(url, data=payload, timeout=(3, 7))
+                response = self.transport.post(url, data=payload, timeout=(3, 7))
                 last_response = response
                 if response.status_code in self._RETRYABLE_STATUS_CODES:
                     time.sleep(backoff_seconds)
@@ -199,7 +235,7 @@ class TelegramNotifier:
             try:
                 with open(photo_path, 'rb') as photo_file:
                     files = {'photo': photo_file}
-                    response = requests.post(url, data=data, files=files, timeout=(5, 60))
+                    response = self.transport.post(url, data=data, files=files, timeout=(5, 60))
                 last_response = response
                 if response.status_code in self._RETRYABLE_STATUS_CODES:
                     time.sleep(backoff_seconds)
@@ -350,34 +386,45 @@ class TelegramNotifier:
 
         metric_key = (metric or "").strip().lower()
         mapping = {
-            "cpu": (tr("cpu"), list(getattr(app, "cpu_history", [])), lambda s: float(s[1]) if len(s) > 1 else 0.0, "%"),
-            "top": (tr("cpu"), list(getattr(app, "cpu_history", [])), lambda s: float(s[1]) if len(s) > 1 else 0.0, "%"),
-            "temp": (f"{tr('cpu')} {tr('temperature')}", list(getattr(app, "cpu_history", [])), lambda s: float(s[2]) if len(s) > 2 else 0.0, tr("temperature")),
-            "temperature": (f"{tr('cpu')} {tr('temperature')}", list(getattr(app, "cpu_history", [])), lambda s: float(s[2]) if len(s) > 2 else 0.0, tr("temperature")),
-            "ram": (tr("ram"), list(getattr(app, "ram_history", [])), lambda s: float(s[3]) if len(s) > 3 else 0.0, "%"),
-            "swap": (tr("swap"), list(getattr(app, "swap_history", [])), lambda s: float(s[3]) if len(s) > 3 else 0.0, "%"),
-            "disk": (tr("disk"), list(getattr(app, "disk_history", [])), lambda s: float(s[3]) if len(s) > 3 else 0.0, "%"),
-            "net": (tr("network"), list(getattr(app, "net_history", [])), lambda s: float(s[1]) + float(s[2]), tr("mbps")),
-            "keyboard": (tr("keyboard_clicks"), list(getattr(app, "keyboard_history", [])), lambda s: float(s[1]) if len(s) > 1 else 0.0, tr("clicks")),
-            "mouse": (tr("mouse_clicks"), list(getattr(app, "mouse_history", [])), lambda s: float(s[1]) if len(s) > 1 else 0.0, tr("clicks")),
+            "cpu": (tr("cpu"), "cpu_history", (1,), "%"),
+            "top": (tr("cpu"), "cpu_history", (1,), "%"),
+            "temp": (f"{tr('cpu')} {tr('temperature')}", "cpu_history", (2,), tr("temperature")),
+            "temperature": (f"{tr('cpu')} {tr('temperature')}", "cpu_history", (2,), tr("temperature")),
+            "ram": (tr("ram"), "ram_history", (3,), "%"),
+            "swap": (tr("swap"), "swap_history", (3,), "%"),
+            "disk": (tr("disk"), "disk_history", (3,), "%"),
+            "net": (tr("network"), "net_history", (1, 2), tr("mbps")),
+            "io": (tr("disk_io_label"), "disk_io_history", (1, 2), tr("mbps")),
+            "keyboard": (tr("keyboard_clicks"), "keyboard_history", (1,), tr("clicks")),
+            "mouse": (tr("mouse_clicks"), "mouse_history", (1,), tr("clicks")),
         }
-        title, samples, extractor, unit = mapping.get(metric_key, ("", [], lambda _s: 0.0, ""))
-        points: list[tuple[float, float]] = []
-        for sample in samples:
-            try:
-                ts = float(sample[0])
-                value = max(0.0, float(extractor(sample)))
-                points.append((ts, value))
-            except Exception:
-                continue
+        title, history_attr, value_columns, unit = mapping.get(metric_key, ("", "", (), ""))
+        history = getattr(app, history_attr, None) if history_attr else None
+        if history is None:
+            return title, [], unit
+
+        try:
+            with history.lock:
+                span = history.span()
+                if span is None:
+                    return title, [], unit
+                view = history.select(span[0], span[1], self._GRAPH_MAX_POINTS)
+                timestamps = view.column(0)
+                if len(value_columns) == 1:
+                    values = view.column(value_columns[0]).tolist()
+                else:
+                    values = [sum(row) for row in zip(*(view.column(idx) for idx in value_columns))]
+                indices = lttb_indices(timestamps, values, self._GRAPH_MAX_POINTS)
+                points = [(timestamps[idx], max(0.0, values[idx])) for idx in indices]
+        except Exception as e:
+            logger.warning("Не удалось прочитать историю метрики %s: %s", metric_key, e)
+            return title, [], unit
         return title, points, unit
 
     def _render_metric_graph_to_temp(self, metric: str) -> Optional[tuple[str, str]]:
         title, points, unit = self._metric_samples_for_graph(metric)
         if not points or not title:
             return None
-        if len(points) > 180:
-            points = points[-180:]
 
         try:
             import cairo  # type: ignore
@@ -430,16 +477,18 @@ class TelegramNotifier:
         cr.move_to(margin_left + plot_w - extents[2], margin_top + plot_h + 16)
         cr.show_text(time_end_label)
 
-        for i in range(1, len(points)):
-            x1 = margin_left + (i - 1) * (plot_w / max(1, len(points) - 1))
-            x2 = margin_left + i * (plot_w / max(1, len(points) - 1))
-            y1 = margin_top + plot_h - ((points[i - 1][1] - v_min) / (v_max - v_min)) * plot_h
-            y2 = margin_top + plot_h - ((points[i][1] - v_min) / (v_max - v_min)) * plot_h
-            cr.set_source_rgb(*self._graph_line_color_rgb(metric))
-            cr.set_line_width(2.0)
-            cr.move_to(x1, y1)
-            cr.line_to(x2, y2)
-            cr.stroke()
+        t_start = points[0][0]
+        t_span = max(1e-9, points[-1][0] - t_start)
+        cr.set_source_rgb(*self._graph_line_color_rgb(metric))
+        cr.set_line_width(2.0)
+        for i, (ts, value) in enumerate(points):
+            x = margin_left + plot_w * (ts - t_start) / t_span if len(points) > 1 else margin_left
+            y = margin_top + plot_h - ((value - v_min) / (v_max - v_min)) * plot_h
+            if i == 0:
+                cr.move_to(x, y)
+            else:
+                cr.line_to(x, y)
+        cr.stroke()
 
         cr.set_source_rgb(0.82, 0.82, 0.82)
         cr.move_to(8, margin_top + 6)
@@ -467,6 +516,7 @@ class TelegramNotifier:
             "ram": "graph_line_color_ram",
             "swap": "graph_line_color_swap",
             "disk": "graph_line_color_disk",
+            "io": "graph_line_color_disk",
             "net": "graph_line_color_net_recv",
             "keyboard": "graph_line_color_keyboard",
             "mouse": "graph_line_color_mouse",
@@ -490,7 +540,7 @@ class TelegramNotifier:
         if render_result is None:
             self.send_message(
                 f"❌ {tr('graph_unavailable')}. "
-                "/cpu_graph|/temp_graph|/ram_graph|/net_graph|/disk_graph|/swap_graph|/keyboard_graph|/mouse_graph"
+                "/cpu_graph|/temp_graph|/ram_graph|/net_graph|/disk_graph|/io_graph|/swap_graph|/keyboard_graph|/mouse_graph"
             )
             return
         path, title = render_result
@@ -504,139 +554,166 @@ class TelegramNotifier:
             except Exception:
                 pass
 
+    def set_dispatcher(self, dispatcher: "NotificationDispatcher") -> None:
+        self.dispatcher = dispatcher
+
     def start_bot(self) -> None:
         if not self.enabled or not self.token or self.bot_running:
             return
+        if self.dispatcher is None:
+            logger.warning("Telegram бот не запущен: нет диспетчера уведомлений")
+            return
 
         self.bot_running = True
-        self.bot_thread = threading.Thread(target=self._bot_worker, daemon=True)
-        self.bot_thread.start()
+        self._poll_backoff = 1.0
+        self.dispatcher.start_poller("telegram", self._poll_updates)
         logger.info("Telegram бот запущен")
 
     def stop_bot(self) -> None:
         self.bot_running = False
-        if self.bot_thread and self.bot_thread.is_alive():
-            self.bot_thread.join(timeout=2.0)
+        if self.dispatcher is not None:
+            self.dispatcher.stop_poller("telegram")
         logger.info("Telegram бот остановлен")
 
-    def _bot_worker(self) -> None:
-        backoff_seconds = 1.0
-        while self.bot_running and self.enabled and self.token:
-            try:
-                url = f"https://api.telegram.org/bot{self.token}/getUpdates"
-                params = {'timeout': 30, 'offset': self.last_update_id + 1}
-                response = requests.get(url, params=params, timeout=35)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('ok'):
-                        for update in data.get('result', []):
-                            self.last_update_id = update['update_id']
-
-                            message = update.get('message', {})
-                            chat_id = str(message.get('chat', {}).get('id', ''))
-
-                            if chat_id != self.chat_id:
-                                continue
-
-                            text = message.get('text', '').strip()
-                            if not text:
-                                continue
-
-                            parts = text.split(maxsplit=1)
-                            raw_command = parts[0].strip().lower()
-                            command = raw_command.split('@', 1)[0]
-
-                            if command == '/poweroff' and self.power_control_ref:
-                                self.send_message(tr('bot_shutdown_message'))
-                                GLib.idle_add(self.power_control_ref._shutdown)
-
-                            elif command == '/reboot' and self.power_control_ref:
-                                self.send_message(tr('bot_reboot_message'))
-                                GLib.idle_add(self.power_control_ref._reboot)
-
-                            elif command == '/lock' and self.power_control_ref:
-                                self.send_message(tr('bot_lock_message'))
-                                GLib.idle_add(self.power_control_ref._lock_screen)
-
-                            elif command == '/status':
-                                self._send_system_status()
-
-                            elif command == '/screenshot':
-                                self.send_message(tr('bot_screenshot_processing'))
-                                self._send_screenshot()
-
-                            elif command == '/help':
-                                help_text = tr('bot_help_message')
-                                help_text += (
-                                    f"\n\n📊 {tr('graph_commands_title')}:"
-                                    f"\n/cpu_graph - {tr('cpu')}"
-                                    f"\n/temp_graph - {tr('cpu')} {tr('temperature')}"
-                                    f"\n/ram_graph - {tr('ram')}"
-                                    f"\n/net_graph - {tr('network')}"
-                                    f"\n/disk_graph - {tr('disk')}"
-                                    f"\n/swap_graph - {tr('swap')}"
-                                    f"\n/keyboard_graph - {tr('keyboard_clicks')}"
-                                    f"\n/mouse_graph - {tr('mouse_clicks')}"
-                                )
-                                self.send_message(help_text)
-
-                            elif command in {
-                                '/cpu_graph',
-                                '/temp_graph',
-                                '/ram_graph',
-                                '/net_graph',
-                                '/disk_graph',
-                                '/swap_graph',
-                                '/keyboard_graph',
-                                '/mouse_graph',
-                            }:
-                                metric_alias_map = {
-                                    '/cpu_graph': 'cpu',
-                                    '/temp_graph': 'temp',
-                                    '/ram_graph': 'ram',
-                                    '/net_graph': 'net',
-                                    '/disk_graph': 'disk',
-                                    '/swap_graph': 'swap',
-                                    '/keyboard_graph': 'keyboard',
-                                    '/mouse_graph': 'mouse',
-                                }
-                                self._send_metric_graph(metric_alias_map.get(command, 'cpu'))
-
-                            else:
-                                self.send_message(f"{tr('unknown_command')}. {tr('unknown_command_help')}")
-                    backoff_seconds = 1.0
-
-                elif response.status_code == 409:
-                    logger.warning("Предупреждение: Другой экземпляр бота уже получает обновления")
-                    time.sleep(min(backoff_seconds, 30.0))
-                    backoff_seconds = min(backoff_seconds * 2, 30.0)
-                else:
-                    logger.warning("Ошибка Telegram getUpdates: HTTP %s", response.status_code)
-                    time.sleep(min(backoff_seconds, 30.0))
-                    backoff_seconds = min(backoff_seconds * 2, 30.0)
+    def _poll_updates(self) -> float:
+        """One getUpdates long poll (runs on the dispatcher executor); returns the pause before the next one."""
+        if not (self.bot_running and self.enabled and self.token):
+            return 1.0
+        backoff_seconds = self._poll_backoff
+        try:
+            url = f"https://api.telegram.org/bot{self.token}/getUpdates"
+            params = {'timeout': 30, 'offset': self.last_update_id + 1}
+            response = self.transport.get(url, params=params, timeout=35)
+
+            if response.status_code == 200:
+                data = response.json()
+                if data.get('ok'):
+                    for update in data.get('result', []):
+                        if not self.bot_running:
+                            break
+                        self.last_update_id = update['update_id']
+                        self._handle_update(update)
+                self._poll_backoff = 1.0
+                return 0.0
+
+            if response.status_code == 409:
+                logger.warning("Предупреждение: Другой экземпляр бота уже получает обновления")
+            else:
+                logger.warning("Ошибка Telegram getUpdates: HTTP %s", response.status_code)
 
-            except requests.exceptions.Timeout:
-                continue
-            except requests.exceptions.RequestException as e:
-                logger.warning("Ошибка связи с Telegram API: %s", e)
-                time.sleep(min(backoff_seconds, 30.0))
-                backoff_seconds = min(backoff_seconds * 2, 30.0)
-            except Exception as e:
-                logger.exception("Неожиданная ошибка в боте: %s", e)
-                time.sleep(min(backoff_seconds, 30.0))
-                backoff_seconds = min(backoff_seconds * 2, 30.0)
+        except requests.exceptions.Timeout:
+            return 0.0
+        except requests.exceptions.RequestException as e:
+            logger.warning("Ошибка связи с Telegram API: %s", e)
+        except Exception as e:
+            logger.exception("Неожиданная ошибка в боте: %s", e)
+
+        delay = min(backoff_seconds, 30.0)
+        backoff_seconds = min(backoff_seconds * 2, 30.0)
+        self._poll_backoff = backoff_seconds
+        return delay
+
+    def _handle_update(self, update: dict) -> None:
+        message = update.get('message', {})
+        chat_id = str(message.get('chat', {}).get('id', ''))
+
+        if chat_id != self.chat_id:
+            return
+
+        text = message.get('text', '').strip()
+        if not text:
+            return
+
+        parts = text.split(maxsplit=1)
+        raw_command = parts[0].strip().lower()
+        command = raw_command.split('@', 1)[0]
+
+        if command == '/poweroff' and self.power_control_ref:
+            self.send_message(tr('bot_shutdown_message'))
+            GLib.idle_add(self.power_control_ref._shutdown)
+
+        elif command == '/reboot' and self.power_control_ref:
+            self.send_message(tr('bot_reboot_message'))
+            GLib.idle_add(self.power_control_ref._reboot)
+
+        elif command == '/lock' and self.power_control_ref:
+            self.send_message(tr('bot_lock_message'))
+            GLib.idle_add(self.power_control_ref._lock_screen)
+
+        elif command == '/status':
+            self._send_system_status()
+
+        elif command == '/screenshot':
+            self.send_message(tr('bot_screenshot_processing'))
+            self._send_screenshot()
+
+        elif command == '/help':
+            help_text = tr('bot_help_message')
+            help_text += (
+                f"\n\n📊 {tr('graph_commands_title')}:"
+                f"\n/cpu_graph - {tr('cpu')}"
+                f"\n/temp_graph - {tr('cpu')} {tr('temperature')}"
+                f"\n/ram_graph - {tr('ram')}"
+                f"\n/net_graph - {tr('network')}"
+                f"\n/disk_graph - {tr('disk')}"
+                f"\n/io_graph - {tr('disk_io_label')}"
+                f"\n/swap_graph - {tr('swap')}"
+                f"\n/keyboard_graph - {tr('keyboard_clicks')}"
+                f"\n/mouse_graph - {tr('mouse_clicks')}"
+            )
+            self.send_message(help_text)
+
+        elif command in {
+            '/cpu_graph',
+            '/temp_graph',
+            '/ram_graph',
+            '/net_graph',
+            '/disk_graph',
+            '/io_graph',
+            '/swap_graph',
+            '/keyboard_graph',
+            '/mouse_graph',
+        }:
+            metric_alias_map = {
+                '/cpu_graph': 'cpu',
+                '/temp_graph': 'temp',
+                '/ram_graph': 'ram',
+                '/net_graph': 'net',
+                '/disk_graph': 'disk',
+                '/io_graph': 'io',
+                '/swap_graph': 'swap',
+                '/keyboard_graph': 'keyboard',
+                '/mouse_graph': 'mouse',
+            }
+            self._send_metric_graph(metric_alias_map.get(command, 'cpu'))
+
+        else:
+            self.send_message(f"{tr('unknown_command')}. {tr('unknown_command_help')}")
+
+    def _latest_snapshot(self) -> Optional["MetricsSnapshot"]:
+        engine = getattr(self.app_ref, 'sampler_engine', None)
+        return engine.latest if engine is not None else None
 
     def _send_system_status(self) -> None:
         try:
-            cpu_temp = SystemUsage.get_cpu_temp()
-            cpu_usage = SystemUsage.get_cpu_usage()
-            ram_used, ram_total = SystemUsage.get_ram_usage()
-            disk_used, disk_total = SystemUsage.get_disk_usage()
-            swap_used, swap_total = SystemUsage.get_swap_usage()
-            uptime = SystemUsage.get_uptime()
-
-            kbd, ms = get_counts()
+            # Reuse the sampler's last reading: sampling again from this thread would
+            # race the sampler and steal its CPU delta.
+            s = self._latest_snapshot()
+            if s is not None:
+                cpu_temp, cpu_usage = s.cpu_temp, s.cpu_usage
+                ram_used, ram_total = s.ram_used, s.ram_total
+                disk_used, disk_total = s.disk_used, s.disk_total
+                swap_used, swap_total = s.swap_used, s.swap_total
+                uptime = s.uptime
+                kbd, ms = s.keyboard_clicks, s.mouse_clicks
+            else:
+                cpu_temp = SystemUsage.get_cpu_temp()
+                cpu_usage = SystemUsage.get_cpu_usage()
+                ram_used, ram_total = SystemUsage.get_ram_usage()
+                disk_used, disk_total = SystemUsage.get_disk_usage()
+                swap_used, swap_total = SystemUsage.get_swap_usage()
+                uptime = SystemUsage.get_uptime()
+                kbd, ms = get_counts()
 
             status_msg = (
                 f"🖥 <b>{tr('system_status')}</b>\n"
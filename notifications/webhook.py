@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import Optional, Sequence, TYPE_CHECKING
+
+import requests
+
+from app_core.constants import WEBHOOK_CONFIG_FILE
+from app_core.http_transport import HttpTransport, get_transport
+from app_core.localization import tr
+
+from .base import ChannelCapabilities, NotificationChannel, register_channel
+
+if TYPE_CHECKING:
+    from app_core.sampler import MetricsSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+@register_channel
+class WebhookNotifier(NotificationChannel):
+    """Posts status messages as JSON to a generic HTTP endpoint (Home Assistant, n8n, a local script).
+
+    Configured by hand in ``~/.symo_webhook.json``::
+
+        {"WEBHOOK_URL": "http://127.0.0.1:8123/api/webhook/symo", "enabled": true, "notification_interval": 300}
+
+    One message is sent as ``{"source": "SyMo", "time": ..., "text": ...}``; a
+    batch as ``{"source": "SyMo", "time": ..., "messages": [...]}``.
+    """
+
+    name = "webhook"
+    capabilities = ChannelCapabilities(
+        max_length=65536,
+        min_interval=1.0,
+        supports_images=False,
+        supports_batching=True,
+    )
+
+    def __init__(self, transport: Optional[HttpTransport] = None):
+        self.transport = transport or get_transport()
+        self.url: Optional[str] = None
+        self.enabled: bool = False
+        self.notification_interval: int = 3600
+        self.load_config()
+
+    def load_config(self) -> None:
+        try:
+            if WEBHOOK_CONFIG_FILE.exists():
+                config = json.loads(WEBHOOK_CONFIG_FILE.read_text(encoding="utf-8"))
+                self.url = (config.get('WEBHOOK_URL') or '').strip() or None
+                self.enabled = bool(config.get('enabled', False))
+                self.notification_interval = self._normalize_interval(config.get('notification_interval', 3600))
+        except Exception as e:
+            logger.exception("Ошибка загрузки конфигурации webhook: %s", e)
+
+    @staticmethod
+    def _normalize_interval(interval: object) -> int:
+        try:
+            value = int(interval)
+        except (TypeError, ValueError):
+            value = 3600
+        return max(10, min(86400, value))
+
+    def send_message(self, message: str, force: bool = False) -> bool:
+        if (not force and not self.enabled) or not self.url:
+            return False
+        return self._post({"text": str(message or "")[: self.capabilities.max_length]})
+
+    def send_batch(self, messages: Sequence[str]) -> bool:
+        if not self.enabled or not self.url:
+            return False
+        return self._post({"messages": [str(message) for message in messages]})
+
+    def format_status(self, s: "MetricsSnapshot") -> str:
+        return (
+            f"{tr('system_status')}\n"
+            f"{tr('cpu')}: {s.cpu_usage:.0f}% ({s.cpu_temp}{tr('temperature')})\n"
+            f"{tr('ram')}: {s.ram_used:.1f}/{s.ram_total:.1f} {tr('gb')}\n"
+            f"{tr('swap')}: {s.swap_used:.1f}/{s.swap_total:.1f} {tr('gb')}\n"
+            f"{tr('disk')}: {s.disk_used:.1f}/{s.disk_total:.1f} {tr('gb')}\n"
+            f"{tr('network')}: ↓{s.net_recv:.1f}/↑{s.net_sent:.1f} {tr('mbps')}\n"
+            f"{tr('uptime')}: {s.uptime}"
+        )
+
+    def _post(self, body: dict) -> bool:
+        payload = {"source": "SyMo", "time": round(time.time(), 3), **body}
+        try:
+            response = self.transport.post(self.url, json=payload, timeout=(3, 7))
+        except requests.exceptions.RequestException as e:
+            logger.warning("Ошибка связи с webhook: %s", e)
+            return False
+        if not 200 <= response.status_code < 300:
+            logger.error("Ошибка отправки webhook: HTTP %s", response.status_code)
+            return False
+        return True
@@ -0,0 +1,6 @@
+import sys
+
+from app_core.binary_log import main
+
+if __name__ == "__main__":
+    sys.exit(main())
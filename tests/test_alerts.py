@@ -0,0 +1,97 @@
+import random
+import types
+
+import pytest
+
+from app_core.alerts import AlertEngine, AlertRuleError, RollingStats, parse_rule
+
+
+def _snap(ts, cpu_temp=50, cpu_usage=10.0, disk_used=100.0, disk_total=200.0):
+    return types.SimpleNamespace(
+        timestamp=ts, cpu_temp=cpu_temp, cpu_usage=cpu_usage,
+        ram_used=4.0, ram_total=16.0, swap_used=0.0, swap_total=0.0,
+        disk_used=disk_used, disk_total=disk_total, net_recv=0.0, net_sent=0.0,
+    )
+
+
+def test_parse_rule_with_options_and_default_hysteresis():
+    rule = parse_rule("cpu_temp > 90 for 30s cooldown 10m")
+    assert (rule.metric, rule.op, rule.threshold) == ("cpu_temp", ">", 90.0)
+    assert rule.duration == 30.0
+    assert rule.cooldown == 600.0
+    assert rule.clear == pytest.approx(85.5)
+
+    assert parse_rule("disk > 95%").clear == pytest.approx(90.25)
+    assert parse_rule("ram < 10 clear 20").clear == 20.0
+    zscore = parse_rule("cpu_usage zscore > 4 window 60")
+    assert zscore.zscore and zscore.window == 60 and zscore.clear == 3.0
+
+
+@pytest.mark.parametrize("text", ["", "gpu > 10", "cpu_temp >> 5", "cpu_temp > 90 for soon", "cpu_temp > 90 every 5"])
+def test_parse_rule_rejects_bad_rules(text):
+    with pytest.raises(AlertRuleError):
+        parse_rule(text)
+
+
+def test_rule_fires_after_duration_and_resolves_with_hysteresis():
+    engine = AlertEngine(["cpu_temp > 90 for 30s"])
+
+    assert engine.evaluate(_snap(0, cpu_temp=95)) == []
+    assert engine.evaluate(_snap(20, cpu_temp=95)) == []
+    events = engine.evaluate(_snap(30, cpu_temp=96))
+    assert [(e.firing, e.value) for e in events] == [(True, 96.0)]
+    assert "cpu_temp > 90 for 30s" in events[0].describe()
+
+    # Inside the hysteresis band the alert stays active without new events.
+    assert engine.evaluate(_snap(40, cpu_temp=88)) == []
+    assert engine.firing
+    events = engine.evaluate(_snap(50, cpu_temp=80))
+    assert [e.firing for e in events] == [False]
+    assert engine.firing == []
+
+
+def test_condition_must_hold_continuously():
+    engine = AlertEngine(["cpu_temp > 90 for 30s"])
+    engine.evaluate(_snap(0, cpu_temp=95))
+    engine.evaluate(_snap(20, cpu_temp=70))
+    assert engine.evaluate(_snap(35, cpu_temp=95)) == []
+    assert engine.evaluate(_snap(65, cpu_temp=95))[0].firing
+
+
+def test_cooldown_suppresses_refiring():
+    engine = AlertEngine(["disk > 95% cooldown 60"])
+    assert engine.evaluate(_snap(0, disk_used=196))[0].firing
+    assert not engine.evaluate(_snap(10, disk_used=100))[0].firing
+    assert engine.evaluate(_snap(20, disk_used=196)) == []
+    assert engine.evaluate(_snap(60, disk_used=196))[0].firing
+
+
+def test_zscore_rule_flags_outlier_only():
+    rng = random.Random(1)
+    engine = AlertEngine(["cpu_usage zscore > 4 window 50"])
+    for ts in range(100):
+        assert engine.evaluate(_snap(ts, cpu_usage=20 + rng.uniform(-2, 2))) == []
+    events = engine.evaluate(_snap(100, cpu_usage=60))
+    assert len(events) == 1 and events[0].firing and events[0].value > 4
+
+
+def test_rolling_stats_match_exact_window():
+    rng = random.Random(7)
+    stats = RollingStats(20)
+    values = [rng.uniform(0, 1e6) for _ in range(500)]
+    for value in values:
+        stats.add(value)
+    window = values[-20:]
+    mean = sum(window) / 20
+    std = (sum((v - mean) ** 2 for v in window) / 20) ** 0.5
+    assert len(stats) == 20
+    assert stats.zscore(mean + std) == pytest.approx(1.0, rel=1e-6)
+
+
+def test_set_rules_keeps_state_and_reports_errors():
+    engine = AlertEngine(["cpu_temp > 90"])
+    assert engine.evaluate(_snap(0, cpu_temp=95))[0].firing
+    errors = engine.set_rules(["cpu_temp > 90", "bogus rule", ""])
+    assert [text for text, _error in errors] == ["bogus rule"]
+    assert engine.evaluate(_snap(1, cpu_temp=95)) == []
+    assert len(engine.rules) == 1
@@ -0,0 +1,86 @@
+import io
+import struct
+
+from app_core.binary_log import LOG_FIELDS, LOG_HEADER, encode_snapshot, export, iter_records, log_paths, main
+from app_core.metrics_store import Segment
+from app_core.sampler import MetricsSnapshot
+
+
+def _snapshot(ts, cpu):
+    return MetricsSnapshot(ts, 50, cpu, 4.0, 16.0, 100.0, 500.0, 0.5, 2.0, 1.5, 0.25, "0:01:00", 7, 3, {}, {})
+
+
+def _write_log(path, start, count):
+    with path.open('ab') as f:
+        if f.tell() == 0:
+            f.write(LOG_HEADER)
+        for i in range(count):
+            f.write(encode_snapshot(_snapshot(start + i, float(i % 100))))
+
+
+def test_records_are_fixed_size_and_readable_as_segment(tmp_path):
+    path = tmp_path / "symo.bin"
+    _write_log(path, 1000.0, 10)
+    assert len(encode_snapshot(_snapshot(0.0, 1.0))) == 8 + 4 * len(LOG_FIELDS)
+    segment = Segment(path)
+    assert segment.fields == LOG_FIELDS
+    assert path.stat().st_size == len(LOG_HEADER) + 10 * segment.record.size
+
+
+def test_iter_records_streams_time_range_across_rotated_file(tmp_path):
+    path = tmp_path / "symo.bin"
+    _write_log(path.with_suffix(".bin.1"), 0.0, 5000)
+    _write_log(path, 5000.0, 5000)
+
+    paths = log_paths(path)
+    assert paths == [path.with_suffix(".bin.1"), path]
+    rows = list(iter_records(paths, 4990.0, 5010.0))
+    assert [row[0] for row in rows] == [float(ts) for ts in range(4990, 5011)]
+    assert rows[0][1] == 90.0
+    assert rows[0][-2:] == (7.0, 3.0)
+
+
+def test_export_csv_and_text(tmp_path):
+    path = tmp_path / "symo.bin"
+    _write_log(path, 1000.0, 3)
+
+    out = io.StringIO()
+    assert export(iter_records([path]), out, 'csv') == 3
+    lines = out.getvalue().splitlines()
+    assert lines[0].split(',')[:3] == ['timestamp', 'time', 'cpu.usage']
+    assert lines[1].startswith('1000.000,')
+
+    out = io.StringIO()
+    export(iter_records([path], 1001.0, 1001.0), out, 'text')
+    assert out.getvalue().count('\n') == 1
+    assert 'CPU: 1% 50°C | RAM: 4.0/16.0 GB' in out.getvalue()
+
+
+def test_cli_writes_range_to_file(tmp_path):
+    path = tmp_path / "symo.bin"
+    _write_log(path, 1000.0, 100)
+    output = tmp_path / "out.csv"
+    assert main(['--file', str(path), '--from', '1010', '--to', '1019', '--output', str(output)]) == 0
+    assert len(output.read_text().splitlines()) == 11
+    assert main(['--file', str(tmp_path / "missing.bin")]) == 1
+
+
+def test_truncated_tail_record_is_ignored(tmp_path):
+    path = tmp_path / "symo.bin"
+    _write_log(path, 1000.0, 2)
+    with path.open('ab') as f:
+        f.write(struct.pack('<d', 1002.0))
+    assert len(list(iter_records([path]))) == 2
+
+
+def test_iter_records_streams_compressed_generation(tmp_path):
+    import gzip
+
+    path = tmp_path / "symo.bin"
+    plain = tmp_path / "plain.bin"
+    _write_log(plain, 0.0, 300)
+    (tmp_path / "symo.bin.1.gz").write_bytes(gzip.compress(plain.read_bytes()))
+    _write_log(path, 300.0, 10)
+
+    rows = list(iter_records(log_paths(path), 295.0, 302.0))
+    assert [row[0] for row in rows] == [float(ts) for ts in range(295, 303)]
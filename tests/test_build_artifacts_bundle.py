@@ -23,3 +23,16 @@ def test_uninstall_script_removes_all_build_outputs():
     assert 'SyMo-launch' in code
     assert 'SyMo-run' in code
     assert '.config/autostart/SyMo.desktop' in code
+
+
+def test_build_script_includes_lazily_imported_packages():
+    code = Path('build.sh').read_text(encoding='utf-8')
+    # Locales and notification channels are imported by name at runtime, invisible to --follow-imports.
+    assert code.count('--include-package=app_core.locales') == 2
+    assert code.count('--include-package=notifications') == 2
+
+
+def test_build_script_requires_numpy_and_requirements_pin_it():
+    code = Path('build.sh').read_text(encoding='utf-8')
+    assert 'add_required_module numpy' in code
+    assert any(line.startswith('numpy==') for line in Path('requirements.txt').read_text(encoding='utf-8').splitlines())
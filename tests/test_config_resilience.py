@@ -80,7 +80,7 @@ def test_set_language_falls_back_to_russian_for_invalid_value():
         localization.set_language(prev_lang)
 
 
-def test_graph_history_minutes_is_capped_to_8_hours():
-    assert GRAPH_HISTORY_MINUTES_MAX == 480
+def test_graph_history_minutes_is_capped_to_7_days():
+    assert GRAPH_HISTORY_MINUTES_MAX == 7 * 24 * 60
     app_code = Path("app_core/app.py").read_text(encoding="utf-8")
     assert "min(GRAPH_HISTORY_MINUTES_MAX, minutes)" in app_code
@@ -0,0 +1,103 @@
+import pytest
+
+from app_core import decimation
+from app_core.history import MetricHistory
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    if request.param == "pure":
+        monkeypatch.setattr(decimation, "_np", None)
+    elif decimation._np is None:
+        pytest.skip("numpy is not installed")
+    return request.param
+
+
+def _history_with_spike(size: int, spike_at: int) -> MetricHistory:
+    history = MetricHistory(('usage', 'temp'), size)
+    for i in range(size):
+        usage = 97.0 if i == spike_at else 10.0 + (i % 7)
+        history.append(float(i), usage, 40.0 - (30.0 if i == spike_at + 3 else 0.0))
+    return history
+
+
+def test_minmax_keeps_single_sample_spikes(backend):
+    history = _history_with_spike(28_800, 12_345)
+    rows = decimation.decimate_view(history.view(), 1400)
+
+    assert len(rows) <= 1400
+    assert max(row[1] for row in rows) == 97.0
+    assert min(row[2] for row in rows) == 10.0
+    timestamps = [row[0] for row in rows]
+    assert timestamps == sorted(timestamps)
+
+
+def test_minmax_indices_cover_every_bucket(backend):
+    values = [float(i % 10) for i in range(1003)]
+    pairs = decimation.minmax_indices(values, 100)
+
+    assert len(pairs) == 100
+    for lo, hi in pairs:
+        assert values[lo] == 0.0 or values[lo] <= values[hi]
+    assert max(max(pair) for pair in pairs) < len(values)
+
+
+def test_lttb_keeps_endpoints_and_peak(backend):
+    xs = [float(i) for i in range(5000)]
+    ys = [0.0] * 5000
+    ys[2500] = 100.0
+    indices = decimation.lttb_indices(xs, ys, 200)
+
+    assert len(indices) == 200
+    assert indices[0] == 0 and indices[-1] == 4999
+    assert 2500 in indices
+    assert indices == sorted(indices)
+
+
+def test_short_views_are_returned_unchanged():
+    history = MetricHistory(('value',), 10)
+    for i in range(5):
+        history.append(float(i), float(i))
+    view = history.view()
+
+    assert decimation.decimate_view(view, 100) is view
+
+
+def test_minmax_on_rollup_view_uses_bucket_extremes(backend):
+    history = MetricHistory(('value',), 86_400)
+    for i in range(86_400):
+        history.append(float(i), 250.0 if i == 40_001 else 5.0)
+
+    view = history.select(0.0, 86_399.0, 100)
+    assert view.stats
+    rows = decimation.decimate_view(view, 40)
+
+    assert len(rows) <= 40
+    assert max(row[1] for row in rows) == 250.0
+
+
+def test_lttb_view_rows_are_real_samples(backend):
+    history = _history_with_spike(28_800, 20_000)
+    view = history.view()
+    rows = decimation.decimate_view(view, 900, decimation.MODE_LTTB)
+
+    assert len(rows) == 900
+    assert tuple(rows[0]) == view[0] and tuple(rows[-1]) == view[-1]
+    assert max(row[1] for row in rows) == 97.0
+    for row in rows[::97]:
+        assert tuple(row) == view[int(row[0])]
+
+
+def test_numpy_lttb_picks_bucket_extremes():
+    if decimation._np is None:
+        pytest.skip("numpy is not installed")
+    ys = [float((i * 7919) % 101) for i in range(10_000)]
+    indices = decimation.lttb_indices([float(i) for i in range(10_000)], ys, 500)
+
+    assert len(set(indices)) == 500 and indices == sorted(indices)
+    every = (10_000 - 2) / 498.0
+    for bucket, idx in enumerate(indices[1:-1]):
+        start = int(bucket * every) + 1
+        stop = int((bucket + 1) * every) + 1 if bucket < 497 else 9_999
+        chunk = ys[start:stop]
+        assert ys[idx] in (min(chunk), max(chunk))
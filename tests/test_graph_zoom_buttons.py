@@ -16,14 +16,13 @@ def test_graph_windows_have_plus_minus_zoom_controls():
 
 def test_each_graph_attaches_zoom_controls():
     code = Path("app_core/app.py").read_text(encoding="utf-8")
+    widget_code = Path("app_core/graph_widget.py").read_text(encoding="utf-8")
     assert "def _maybe_add_graph_zoom_controls(self, box: Gtk.Box, graph_key: str, area: Gtk.DrawingArea) -> None:" in code
-    assert "self._maybe_add_graph_zoom_controls(box, 'cpu', area)" in code
-    assert "self._maybe_add_graph_zoom_controls(box, 'ram', area)" in code
-    assert "self._maybe_add_graph_zoom_controls(box, 'swap', area)" in code
-    assert "self._maybe_add_graph_zoom_controls(box, 'disk', area)" in code
-    assert "self._maybe_add_graph_zoom_controls(box, 'net', area)" in code
-    assert "self._maybe_add_graph_zoom_controls(box, 'keyboard', area)" in code
-    assert "self._maybe_add_graph_zoom_controls(box, 'mouse', area)" in code
+    # Line graphs and family heatmaps share MetricGraph.show.
+    assert "self.app._maybe_add_graph_zoom_controls(box, self.key, area)" in widget_code
+    assert "self.app._connect_graph_zoom(area, self.key)" in widget_code
+    for key in ('cpu', 'ram', 'swap', 'disk', 'net', 'keyboard', 'mouse'):
+        assert f"connect(\"activate\", self.show_graph, '{key}')" in code
 
 
 def test_zoom_control_order_is_minus_plus_then_reset():
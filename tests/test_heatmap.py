@@ -0,0 +1,36 @@
+import pytest
+
+from app_core import heatmap
+from app_core.heatmap import PALETTE, heatmap_levels, heatmap_pixels
+from app_core.history import MetricHistory
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_levels_keep_bucket_peaks_per_series(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(heatmap, "_np", None)
+    elif heatmap._np is None:
+        pytest.skip("numpy is not installed")
+    history = MetricHistory(("cpu0", "cpu1"), 100)
+    for i in range(8):
+        history.append(float(i), 100.0 if i == 5 else 0.0, 50.0)
+
+    levels, scale = heatmap_levels(history.view(), 4, 100.0)
+
+    assert scale == 100.0
+    assert levels == [bytes([0, 0, 255, 0]), bytes([127, 127, 127, 127])]
+
+    pixels, stride = heatmap_pixels(levels)
+    assert stride == 16
+    assert len(pixels) == 2 * 16
+    assert bytes(pixels[8:12]) == PALETTE[255]
+
+
+def test_levels_scale_to_view_maximum_without_fixed_range():
+    history = MetricHistory(("eth0.recv",), 100)
+    for i, value in enumerate((1.0, 4.0)):
+        history.append(float(i), value)
+
+    levels, scale = heatmap_levels(history.view(), 10)
+    assert scale == 4.0
+    assert levels == [bytes([63, 255])]
@@ -0,0 +1,193 @@
+import pytest
+
+from app_core import history as history_module
+from app_core.history import MetricHistory, SeriesFamily
+
+
+def test_append_keeps_only_newest_rows():
+    history = MetricHistory(('usage', 'temp'), 3)
+    for i in range(500):
+        history.append(float(i), i * 1.0, i * 2.0)
+
+    assert len(history) == 3
+    assert list(history.view()) == [(497.0, 497.0, 994.0), (498.0, 498.0, 996.0), (499.0, 499.0, 998.0)]
+    assert history.last() == (499.0, 499.0, 998.0)
+
+
+def test_view_columns_are_zero_copy_slices():
+    history = MetricHistory(('value',), 100)
+    for i in range(10):
+        history.append(float(i), float(i * 10))
+
+    view = history.view()[2:5]
+    column = view.column(1)
+    assert isinstance(column, memoryview)
+    assert column.tolist() == [20.0, 30.0, 40.0]
+    assert view[-1] == (4.0, 40.0)
+
+
+def test_between_uses_timestamp_window():
+    history = MetricHistory(('value',), 100)
+    for ts in (1.0, 2.0, 5.0, 6.0, 9.0):
+        history.append(ts, ts)
+
+    window = history.view().between(2.0, 6.0)
+    assert [row[0] for row in window] == [2.0, 5.0, 6.0]
+
+
+def test_resize_in_place_keeps_newest_rows():
+    history = MetricHistory(('value',), 10)
+    for i in range(10):
+        history.append(float(i), float(i))
+
+    history.resize(4)
+    assert [row[1] for row in history.view()] == [6.0, 7.0, 8.0, 9.0]
+
+    history.resize(20)
+    history.append(10.0, 10.0)
+    assert len(history) == 5
+    assert history.maxlen == 20
+
+
+def test_append_rejects_wrong_value_count():
+    history = MetricHistory(('a', 'b'), 4)
+    try:
+        history.append(1.0, 1.0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_rollup_tiers_track_min_max_mean_last():
+    history = MetricHistory(('value',), 3600, resolutions=(10, 60))
+    for i in range(25):
+        history.append(120.0 + i, float(i))
+
+    minute = history.select(120.0, 240.0, 1)
+    assert minute.stats == ('mean', 'min', 'max', 'last')
+    assert len(minute) == 1
+    assert minute.column(1, 'min').tolist() == [0.0]
+    assert minute.column(1, 'max').tolist() == [24.0]
+    assert minute.column(1, 'last').tolist() == [24.0]
+    assert minute[0] == (144.0, 12.0)
+
+    ten_seconds = history.select(120.0, 144.0, 2)
+    assert [row[0] for row in ten_seconds] == [129.0, 139.0, 144.0]
+    assert ten_seconds.column(1, 'max').tolist() == [9.0, 19.0, 24.0]
+
+
+def test_nearest_row_bisects_timestamps_across_gaps():
+    history = MetricHistory(('value',), 200)
+    for ts in [*range(100), *range(120, 150)]:  # suspended between 100 and 119
+        history.append(float(ts), float(ts) * 2)
+
+    view = history.view()
+    assert view.nearest(109.4) == (99.0, 198.0)
+    assert view.nearest(110.0) == (120.0, 240.0)
+    assert view.nearest(-5.0) == (0.0, 0.0)
+    assert view.nearest(1e9) == (149.0, 298.0)
+    assert history.view()[:0].nearest(1.0) is None
+
+
+def test_finest_level_falls_back_to_tiers_for_old_timestamps():
+    history = MetricHistory(('value',), 20, resolutions=(10,))
+    for ts in range(40):
+        history.append(float(ts), float(ts))
+
+    assert history.finest(25.0).stats == ()
+    assert history.finest(15.0).stats == ('mean', 'min', 'max', 'last')
+
+
+def test_select_prefers_raw_rows_when_zoomed_in():
+    history = MetricHistory(('value',), 3600)
+    for i in range(3600):
+        history.append(float(i), float(i % 7))
+
+    zoomed = history.select(3000.0, 3300.0, 600)
+    assert zoomed.stats == ()
+    assert len(zoomed) == 301
+
+    full = history.select(0.0, 3599.0, 100)
+    assert full.stats
+    assert 100 <= len(full) <= 400
+    assert history.resolution(3000.0, 3300.0, 600) == 1.0
+    assert history.resolution(0.0, 3599.0, 100) == 10.0
+
+
+def test_long_window_keeps_memory_bounded():
+    week = MetricHistory(('usage', 'temp'), 7 * 24 * 60 * 60)
+    hour = MetricHistory(('usage', 'temp'), 60 * 60)
+    assert week.nbytes < 8 * 1024 * 1024
+    assert hour.nbytes < week.nbytes
+
+    for i in range(40_000):
+        week.append(float(i), 1.0, 2.0)
+    first, last = week.span()
+    assert last == 39_999.0
+    assert first < 10.0
+    assert len(week) < 40_000
+
+
+def test_window_is_measured_in_time_when_samples_are_sparse():
+    history = MetricHistory(('value',), 300)  # a "5 minute" window of 1 s samples
+    for i in range(240):  # two hours of adaptive 30 s samples
+        history.append(i * 30.0, float(i))
+
+    first, last = history.span()
+    assert last == 239 * 30.0
+    assert last - first <= 300.0
+    assert all(row[0] >= last - 300.0 for row in history.view())
+    assert history.select(first, last, 100)[0][0] >= last - 300.0 - 10.0
+
+
+def test_restored_rows_older_than_the_window_are_dropped():
+    history = MetricHistory(('value',), 600, resolutions=(10, 60))
+    history.extend([0.0, 1.0, 2.0], [1.0, 2.0, 3.0])  # from the store, before a long gap
+    history.extend([5000.0, 5001.0], [4.0, 5.0])
+
+    assert [row[0] for row in history.view()] == [5000.0, 5001.0]
+    assert history.span() == (5000.0, 5001.0)
+    assert history.finest(0.0).timestamps.tolist() in ([5000.0, 5001.0], [5001.0])
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_extend_matches_repeated_append(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(history_module, "_np", None)
+    elif history_module._np is None:
+        pytest.skip("numpy is not installed")
+
+    timestamps = [1000.0 + i * 1.5 for i in range(900)]
+    usage = [float((i * 37) % 101) for i in range(900)]
+    temp = [40.0 + (i % 13) for i in range(900)]
+
+    appended = MetricHistory(('usage', 'temp'), 300)
+    for ts, u, t in zip(timestamps, usage, temp):
+        appended.append(ts, u, t)
+
+    extended = MetricHistory(('usage', 'temp'), 300)
+    extended.extend(timestamps[:400], usage[:400], temp[:400])
+    extended.extend(timestamps[400:], usage[400:], temp[400:])
+    extended.append(timestamps[-1] + 1.0, 1.0, 2.0)
+    appended.append(timestamps[-1] + 1.0, 1.0, 2.0)
+
+    assert list(extended.view()) == list(appended.view())
+    span = appended.span()
+    for points in (5, 30, 120):
+        left = extended.select(span[0], span[1], points)
+        right = appended.select(span[0], span[1], points)
+        assert left.stats == right.stats
+        for index in (1, 2):
+            for stat in ('mean', 'min', 'max', 'last'):
+                assert left.column(index, stat).tolist() == pytest.approx(right.column(index, stat).tolist())
+
+
+def test_series_family_widens_for_new_names():
+    family = SeriesFamily(10)
+    family.append(1.0, {"eth0": 1.0})
+    family.append(2.0, {"eth0": 2.0, "wlan0": 5.0})
+    family.append(3.0, {"wlan0": 6.0})
+
+    assert family.fields == ("eth0", "wlan0")
+    assert list(family.history.view()) == [(1.0, 1.0, 0.0), (2.0, 2.0, 5.0), (3.0, 0.0, 6.0)]
@@ -0,0 +1,124 @@
+import importlib.util
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+from app_core.http_transport import HttpTransport, get_transport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply(200, b'{"ok": true, "result": []}')
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.bodies.append(self.rfile.read(length))
+        self._reply(204 if self.path == "/webhook" else 200, b"" if self.path == "/webhook" else b'{"ok": true}')
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.bodies = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(httpd, path: str) -> str:
+    return f"http://127.0.0.1:{httpd.server_address[1]}{path}"
+
+
+def test_keep_alive_reuses_one_connection(server):
+    transport = HttpTransport()
+    try:
+        for _ in range(5):
+            assert transport.post(_url(server, "/send"), data={"text": "x"}, timeout=5).status_code == 200
+        assert transport.get(_url(server, "/updates"), params={"offset": 1}, timeout=5).json()["ok"] is True
+    finally:
+        transport.close()
+
+    assert transport.stats.requests == 6
+    assert transport.stats.handshakes == 1
+    assert transport.stats.reused == 5
+    assert transport.stats.errors == 0
+    assert transport.stats.latency.count == 6
+    assert transport.stats.latency.max_ms > 0
+
+
+def test_concurrent_requests_open_separate_connections(server):
+    transport = HttpTransport(pool_maxsize=2)
+    barrier = threading.Barrier(2)
+
+    def worker():
+        barrier.wait()
+        for _ in range(3):
+            transport.post(_url(server, "/send"), data={"text": "x"}, timeout=5)
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+    finally:
+        transport.close()
+
+    assert transport.stats.requests == 6
+    assert 1 <= transport.stats.handshakes <= 2
+
+
+def test_connection_errors_are_counted_and_raised():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    transport = HttpTransport(connect_retries=1, backoff=0)
+    try:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            transport.post(f"http://127.0.0.1:{port}/", data={}, timeout=1)
+    finally:
+        transport.close()
+
+    assert transport.stats.requests == 1
+    assert transport.stats.errors == 1
+    assert transport.stats.handshakes == 0
+
+
+def test_discord_notifier_sends_through_shared_transport(tmp_path, server):
+    path = Path(__file__).resolve().parents[1] / "notifications" / "discord.py"
+    spec = importlib.util.spec_from_file_location("notifications.discord", path)
+    discord = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(discord)
+    discord.DISCORD_CONFIG_FILE = tmp_path / "discord.json"
+
+    transport = HttpTransport()
+    notifier = discord.DiscordNotifier(transport=transport)
+    notifier.save_config(_url(server, "/webhook"), True, 60)
+    try:
+        assert notifier.send_message("one") is True
+        assert notifier.send_message("two") is True
+    finally:
+        transport.close()
+
+    assert [json.loads(body)["content"] for body in server.bodies] == ["one", "two"]
+    assert transport.stats.handshakes == 1
+    assert discord.DiscordNotifier().transport is get_transport()
@@ -0,0 +1,52 @@
+import random
+from pathlib import Path
+
+from app_core.label_cache import LabelCache
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_render_matches_direct_formatting():
+    rng = random.Random(3)
+    cache = LabelCache()
+    template = "RAM: {:.1f}/{:.1f} GB  CPU {:.0f}%  🌡{}°C"
+    for _ in range(2000):
+        values = (rng.uniform(0, 64), rng.choice([2.25, 0.05, 15.95, 7.0]), rng.uniform(0, 100), rng.randint(20, 99))
+        assert cache.render('ram', template, values) == template.format(*values)
+
+
+def test_render_skips_formatting_within_display_precision():
+    cache = LabelCache()
+    assert cache.render('cpu', "CPU: {:.0f}%", (12.2,)) == "CPU: 12%"
+    assert cache.render('cpu', "CPU: {:.0f}%", (11.8,)) == "CPU: 12%"
+    assert cache.render('cpu', "CPU: {:.0f}%", (12.6,)) == "CPU: 13%"
+    assert (cache.renders, cache.renders_skipped) == (2, 1)
+
+    # A new template (language switch) is formatted even for the same values.
+    assert cache.render('cpu', "ЦП: {:.0f}%", (12.6,)) == "ЦП: 13%"
+    assert cache.renders == 3
+
+
+def test_apply_calls_setter_only_on_change():
+    cache = LabelCache()
+    shown = []
+    assert cache.apply('tray', "CPU: 12%", shown.append) is True
+    assert cache.apply('tray', "CPU: 12%", shown.append) is False
+    assert cache.apply('tray', "CPU: 13%", shown.append) is True
+    cache.forget_applied('tray')
+    assert cache.apply('tray', "CPU: 13%", shown.append) is True
+    assert shown == ["CPU: 12%", "CPU: 13%", "CPU: 13%"]
+    assert (cache.updates, cache.updates_skipped, cache.suppressed) == (3, 1, 1)
+
+    cache.reset_stats()
+    assert cache.suppressed == 0
+
+
+def test_app_diffs_menu_labels_and_logs_suppressed_updates():
+    source = (ROOT / "app_core" / "app.py").read_text(encoding="utf-8")
+    update_ui = source[source.index("def _update_ui"):source.index("def _set_tray_label")]
+
+    assert "item.set_label(texts[key])" not in update_ui
+    assert "apply(key, texts[key], item.set_label)" in update_ui
+    assert "Profiling labels: suppressed=%d" in source
+    assert "self.label_cache.forget_applied()" in source
@@ -0,0 +1,55 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app_core import localization
+from app_core.constants import SUPPORTED_LANGS
+from app_core.language import LANGUAGE_NAMES, LANGUAGES, load_language
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_language_names_match_locale_tables():
+    assert set(LANGUAGE_NAMES) == set(SUPPORTED_LANGS)
+    for code in SUPPORTED_LANGS:
+        assert LANGUAGE_NAMES[code] == LANGUAGES[code]['language_name']
+
+
+def test_only_the_selected_locale_is_imported():
+    code = (
+        "import sys\n"
+        "from app_core import localization\n"
+        "assert not [m for m in sys.modules if m.startswith('app_core.locales.')]\n"
+        "localization.set_language('de')\n"
+        "print(localization.tr('settings_label'))\n"
+        "print(sorted(m for m in sys.modules if m.startswith('app_core.locales.')))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    lines = out.stdout.strip().splitlines()
+    assert lines[0] == load_language('de')['settings_label']
+    assert lines[1] == "['app_core.locales.de']"
+
+
+def test_set_language_swaps_frozen_table():
+    prev = localization.get_language()
+    try:
+        localization.set_language('en')
+        table = localization.translations()
+        assert localization.tr('language_name') == "English"
+        assert localization.tr('no_such_key') == 'no_such_key'
+        with pytest.raises(TypeError):
+            table['language_name'] = "x"
+
+        localization.set_language('fr')
+        assert localization.tr('language_name') == "Français"
+        assert table['language_name'] == "English"
+    finally:
+        localization.set_language(prev)
+
+
+def test_unknown_locale_is_rejected():
+    with pytest.raises(KeyError):
+        load_language('xx')
+    assert LANGUAGES.get('xx') is None
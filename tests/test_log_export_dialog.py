@@ -0,0 +1,61 @@
+import sys
+import types
+
+if "gi" not in sys.modules:
+    fake_repository = types.SimpleNamespace(GLib=types.SimpleNamespace(idle_add=lambda *args, **kwargs: None))
+    sys.modules["gi"] = types.SimpleNamespace(repository=fake_repository)
+    sys.modules["gi.repository"] = fake_repository
+if isinstance(sys.modules["gi.repository"], types.SimpleNamespace):
+    # Other test modules may have stubbed gi with only part of the namespaces.
+    _repository = sys.modules["gi.repository"]
+    for _name in ("Gtk", "Gdk", "GLib"):
+        if not hasattr(_repository, _name):
+            setattr(_repository, _name, types.SimpleNamespace())
+    if not hasattr(_repository.Gtk, "Dialog"):
+        _repository.Gtk.Dialog = object
+
+from app_core import dialogs
+
+
+class _WidgetRecorder:
+    def __init__(self, calls):
+        self._calls = calls
+
+    def __getattr__(self, name):
+        return lambda *args: self._calls.append((name, args))
+
+
+def _export_dialog(monkeypatch):
+    calls = []
+    scheduled = []
+    monkeypatch.setattr(dialogs.GLib, "idle_add", lambda func, *args: scheduled.append((func, args)), raising=False)
+    dialog = dialogs.SettingsDialog.__new__(dialogs.SettingsDialog)
+    dialog._destroyed = False
+    dialog._export_percent = -1
+    dialog.export_progress = _WidgetRecorder(calls)
+    dialog.download_button = _WidgetRecorder(calls)
+    return dialog, calls, scheduled
+
+
+def test_worker_callbacks_after_destroy_do_not_touch_widgets(monkeypatch):
+    dialog, calls, scheduled = _export_dialog(monkeypatch)
+    dialog._on_destroy(None)
+
+    # A worker still running after the dialog closed reports progress and then finishes.
+    dialog._report_export_progress(5, 10)
+    assert dialog._set_export_progress(0.5) is False
+    assert dialog._finish_log_export(None) is False
+
+    assert scheduled == []
+    assert calls == []
+
+
+def test_worker_callbacks_update_a_live_dialog(monkeypatch):
+    dialog, calls, scheduled = _export_dialog(monkeypatch)
+
+    dialog._report_export_progress(5, 10)
+    assert scheduled == [(dialog._set_export_progress, (0.5,))]
+    dialog._finish_log_export(None)
+
+    assert ('set_sensitive', (True,)) in calls
+    assert ('set_fraction', (1.0,)) in calls
@@ -0,0 +1,164 @@
+import gzip
+import os
+import time
+
+from app_core import logging_utils
+from app_core.logging_utils import LogWriter, export_log, iter_log_chunks, log_files
+
+
+def test_lines_are_batched_until_flush(tmp_path):
+    path = tmp_path / "symo.log"
+    writer = LogWriter(path, flush_interval=60.0)
+    writer.write("one\n")
+    writer.write("two\n")
+    assert not path.exists() or path.read_text() == ""
+
+    writer.flush()
+    assert path.read_text() == "one\ntwo\n"
+    writer.close()
+
+
+def test_size_threshold_wakes_the_flush_thread(tmp_path):
+    path = tmp_path / "symo.log"
+    writer = LogWriter(path, flush_interval=60.0, flush_bytes=8)
+    writer.write("0123456789\n")
+    for _ in range(50):
+        if path.exists() and path.read_text():
+            break
+        time.sleep(0.01)
+    assert path.read_text() == "0123456789\n"
+    writer.close()
+
+
+def test_rotates_by_tracked_size_and_close_flushes(tmp_path):
+    path = tmp_path / "symo.log"
+    path.write_text("x" * 90)
+    writer = LogWriter(path, max_bytes=100, flush_interval=60.0, compression='none')
+    writer.write("a" * 20 + "\n")
+    writer.flush()
+    assert path.read_text() == "a" * 20 + "\n"
+
+    writer.write("b\n")
+    writer.close()
+    assert writer.generation_path(1).read_text() == "x" * 90
+    assert path.read_text() == "a" * 20 + "\nb\n"
+    assert writer._file is None
+    assert os.path.getsize(path) == writer._size
+
+
+def test_header_starts_every_new_file(tmp_path):
+    path = tmp_path / "symo.bin"
+    writer = LogWriter(path, max_bytes=20, flush_interval=60.0, header=b"HEAD", compression='none')
+    writer.write_bytes(b"12345678")
+    writer.flush()
+    writer.write_bytes(b"abcdefghijkl")
+    writer.close()
+    assert writer.generation_path(1).read_bytes() == b"HEAD12345678"
+    assert path.read_bytes() == b"HEADabcdefghijkl"
+
+
+def _log_line(ts, text):
+    return f"[{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))}] {text}\n"
+
+
+def test_export_copies_backup_and_current_file_with_progress(tmp_path):
+    log = tmp_path / "symo.log"
+    log.with_suffix(".log.1").write_text("old\n" * 1000)
+    log.write_text("new\n" * 1000)
+    dest = tmp_path / "out.txt"
+    seen = []
+
+    export_log(log_files(log), dest, progress=lambda done, total: seen.append((done, total)), chunk_size=1024)
+    assert dest.read_text() == "old\n" * 1000 + "new\n" * 1000
+    assert seen[-1] == (8000, 8000)
+    assert len(seen) > 2
+
+
+def test_export_filters_time_range_and_gzips(tmp_path):
+    log = tmp_path / "symo.log"
+    base = time.mktime((2026, 1, 1, 12, 0, 0, 0, 0, -1))
+    log.with_suffix(".log.1").write_text("".join(_log_line(base + i, f"a{i}") for i in range(10)))
+    log.write_text("".join(_log_line(base + i, f"b{i}") for i in range(10, 20)) + "untimestamped tail\n")
+    dest = tmp_path / "out.txt.gz"
+
+    export_log(log_files(log), dest, compress=True, start_ts=base + 8, end_ts=base + 11, chunk_size=16)
+    lines = gzip.decompress(dest.read_bytes()).decode().splitlines()
+    assert [line.split()[-1] for line in lines] == ["a8", "a9", "b10", "b11"]
+
+
+def test_iter_log_chunks_keeps_memory_to_chunk_size(tmp_path):
+    log = tmp_path / "symo.log"
+    log.write_text(("y" * 99 + "\n") * 100)
+    chunks = list(iter_log_chunks([log], chunk_size=500))
+    assert all(len(data) <= 500 for data, _consumed in chunks)
+    assert sum(consumed for _data, consumed in chunks) == 10000
+
+
+def test_rotation_keeps_compressed_generations(tmp_path):
+    path = tmp_path / "symo.log"
+    writer = LogWriter(path, max_bytes=10, flush_interval=60.0, backups=2)
+    for text in ("first\n", "second\n", "third\n", "fourth\n"):
+        writer.write(text * 2)
+        writer.flush()
+        writer._rotate_thread and writer._rotate_thread.join()
+    writer.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["symo.log", "symo.log.1.gz", "symo.log.2.gz"]
+    assert gzip.decompress(writer.generation_path(1, ".gz").read_bytes()) == b"third\n" * 2
+    assert log_files(path) == [writer.generation_path(2, ".gz"), writer.generation_path(1, ".gz"), path]
+
+
+def test_stale_pending_generation_is_finished_on_open(tmp_path):
+    path = tmp_path / "symo.log"
+    path.write_text("current\n")
+    (tmp_path / "symo.log.0").write_text("left by a crash\n")
+    writer = LogWriter(path, max_bytes=100, flush_interval=60.0)
+    writer.write("first\n")
+    writer.flush()
+    writer._rotate_thread.join()
+    assert not writer.generation_path(0).exists()
+    assert gzip.decompress(writer.generation_path(1, ".gz").read_bytes()) == b"left by a crash\n"
+
+    for _ in range(200):
+        writer.write("y" * 29 + "\n")
+        writer.flush()
+        writer._rotate_thread and writer._rotate_thread.join()
+    writer.close()
+    assert os.path.getsize(path) <= 100
+
+
+def test_failed_compression_keeps_generation_uncompressed(tmp_path, monkeypatch):
+    def broken(*_args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(logging_utils, "_compress_file", broken)
+    path = tmp_path / "symo.log"
+    path.write_text("x" * 90)
+    writer = LogWriter(path, max_bytes=100, flush_interval=60.0)
+    writer.write("a" * 20 + "\n")
+    writer.flush()
+    writer._rotate_thread.join()
+    writer.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["symo.log", "symo.log.1"]
+    assert writer.generation_path(1).read_text() == "x" * 90
+
+
+def test_export_streams_across_compressed_generations(tmp_path):
+    log = tmp_path / "symo.log"
+    base = time.mktime((2026, 1, 1, 12, 0, 0, 0, 0, -1))
+    with gzip.open(tmp_path / "symo.log.2.gz", "wb") as f:
+        f.write("".join(_log_line(base + i, f"g2-{i}") for i in range(5)).encode())
+    with gzip.open(tmp_path / "symo.log.1.gz", "wb") as f:
+        f.write("".join(_log_line(base + i, f"g1-{i}") for i in range(5, 10)).encode())
+    (tmp_path / "symo.log.0").write_text(_log_line(base + 10, "pending"))
+    log.write_text(_log_line(base + 11, "current"))
+
+    dest = tmp_path / "all.txt"
+    export_log(log_files(log), dest)
+    assert [line.split()[-1] for line in dest.read_text().splitlines()] == (
+        [f"g2-{i}" for i in range(5)] + [f"g1-{i}" for i in range(5, 10)] + ["pending", "current"]
+    )
+
+    export_log(log_files(log), dest, start_ts=base + 4, end_ts=base + 5)
+    assert [line.split()[-1] for line in dest.read_text().splitlines()] == ["g2-4", "g1-5"]
@@ -0,0 +1,360 @@
+import sys
+import types
+
+import pytest
+
+if "gi" not in sys.modules:
+    fake_glib = types.SimpleNamespace(idle_add=lambda *args, **kwargs: None)
+    fake_repository = types.SimpleNamespace(GLib=fake_glib, Gtk=types.SimpleNamespace())
+    sys.modules["gi"] = types.SimpleNamespace(repository=fake_repository)
+    sys.modules["gi.repository"] = fake_repository
+if isinstance(sys.modules["gi.repository"], types.SimpleNamespace):
+    # Another test module may have stubbed gi with GLib only.
+    sys.modules["gi.repository"].Gtk = getattr(sys.modules["gi.repository"], "Gtk", types.SimpleNamespace())
+if "cairo" not in sys.modules:
+    try:
+        import cairo  # noqa: F401
+    except ImportError:
+        sys.modules["cairo"] = types.SimpleNamespace()
+
+from app_core import graph_widget, localization
+from app_core.graph_widget import MetricGraph
+from app_core.history import MetricHistory
+from app_core.metric_graphs import METRIC_GRAPHS, auto_range, fixed_range
+from app_core.sampler import MetricsSnapshot
+
+DESCRIPTORS = {descriptor.key: descriptor for descriptor in METRIC_GRAPHS}
+
+
+def _snapshot(**overrides):
+    values = dict(
+        timestamp=100.0, cpu_temp=55, cpu_usage=12.0, ram_used=4.0, ram_total=16.0,
+        disk_used=100.0, disk_total=500.0, swap_used=0.0, swap_total=0.0,
+        net_recv=1.5, net_sent=0.5, uptime="1:00:00", keyboard_clicks=10, mouse_clicks=5,
+        families={}, texts={},
+    )
+    values.update(overrides)
+    return MetricsSnapshot(**values)
+
+
+class _Recorder:
+    """Minimal cairo context that records calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def text_extents(self, text):
+        return (0, 0, len(text) * 6.0, 10.0, len(text) * 6.0, 0)
+
+    def clip_extents(self):
+        return self.clip_rect
+
+    clip_rect = (0.0, 0.0, 400.0, 200.0)
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+
+class _Surface:
+    def __init__(self, fmt, width, height):
+        self.format = fmt
+        self.size = (width, height)
+
+    def set_device_scale(self, *_scale):
+        pass
+
+    def flush(self):
+        pass
+
+
+class _Widget:
+    width = 400
+
+    def get_allocated_width(self):
+        return self.width
+
+    def get_allocated_height(self):
+        return 200
+
+    def get_scale_factor(self):
+        return 1
+
+
+class _Area(_Widget):
+    """DrawingArea double: records invalidations and the pending frame-clock callback."""
+
+    def __init__(self):
+        self.ticks = []
+        self.full = 0
+        self.rects = []
+
+    def add_tick_callback(self, callback):
+        self.ticks.append(callback)
+
+    def queue_draw(self):
+        self.full += 1
+
+    def queue_draw_area(self, *rect):
+        self.rects.append(rect)
+
+    def frame(self, seconds):
+        """Run the pending tick callbacks for a frame at ``seconds``."""
+        clock = types.SimpleNamespace(get_frame_time=lambda: int(seconds * 1_000_000))
+        self.ticks = [callback for callback in self.ticks if callback(self, clock)]
+
+
+class _App:
+    def __init__(self, history):
+        self.cpu_history = history
+        self.graph_zoom_state = {'cpu': {'hovering': 0.0, 'hover_x': 0.0, 'hover_y': 0.0}}
+
+    @staticmethod
+    def _visible_range(_key, history):
+        return history.span()
+
+    @staticmethod
+    def _visible_samples(_key, history, _points):
+        return history.view()
+
+    @staticmethod
+    def _decimate_samples(samples, _max_points):
+        return list(samples)
+
+    @staticmethod
+    def _graph_line_color_rgb(_key):
+        return 1.0, 0.0, 0.0
+
+
+def test_every_menu_graph_has_a_descriptor():
+    assert list(DESCRIPTORS) == ['cpu', 'ram', 'swap', 'disk', 'net', 'keyboard', 'mouse']
+    for descriptor in METRIC_GRAPHS:
+        assert descriptor.history == f"{descriptor.key}_history"
+        assert descriptor.series
+        sample = (0.0, *descriptor.sample(_snapshot()))
+        assert descriptor.summary(sample)
+        assert len(descriptor.hover(sample)) >= 2
+
+
+def test_samples_are_normalized_like_history_rows():
+    assert DESCRIPTORS['cpu'].sample(_snapshot(cpu_usage=140.0, cpu_temp="bad")) == (100.0, 0.0)
+    assert DESCRIPTORS['ram'].sample(_snapshot()) == (4.0, 16.0, 25.0)
+    assert DESCRIPTORS['swap'].sample(_snapshot()) == (0.0, 0.0, 0.0)
+    assert DESCRIPTORS['net'].sample(_snapshot(net_recv=-1.0)) == (0.0, 0.5)
+    assert DESCRIPTORS['keyboard'].sample(_snapshot(keyboard_clicks=None)) == (0,)
+
+
+def test_y_range_policies():
+    samples = [(0.0, 2.0, 40.0), (1.0, 8.0, 120.0)]
+    assert fixed_range(100.0)(samples) == 100.0
+    assert auto_range(1, headroom=1.15)(samples) == pytest.approx(9.2)
+    assert auto_range(2, floor=100.0, pad=5.0)(samples) == 125.0
+    assert auto_range(1, floor=50.0)(samples) == 50.0
+
+
+@pytest.fixture
+def painted(monkeypatch):
+    """Fake cairo surfaces; returns ``(surface, recorder)`` for every offscreen context."""
+    contexts = []
+
+    def context(surface):
+        contexts.append((surface, _Recorder()))
+        return contexts[-1][1]
+
+    monkeypatch.setattr(graph_widget, "cairo", types.SimpleNamespace(
+        FORMAT_RGB24=1, FORMAT_ARGB32=0, OPERATOR_CLEAR=0, OPERATOR_SOURCE=1,
+        ImageSurface=_Surface, Context=context,
+    ))
+    return contexts
+
+
+def _chrome(painted):
+    return [recorder for surface, recorder in painted if surface.format == 1]
+
+
+def _lines(painted):
+    return [recorder for surface, recorder in painted if surface.format == 0]
+
+
+def _cpu_graph(samples=10):
+    history = MetricHistory(('usage', 'temp'), 100, 1)
+    for ts in range(samples):
+        history.append(float(ts), 10.0 * ts % 100, 50.0)
+    return MetricGraph(_App(history), 'cpu', DESCRIPTORS['cpu'])
+
+
+def test_metric_graph_draws_every_series_from_the_descriptor(painted):
+    graph = _cpu_graph()
+    cr = _Recorder()
+
+    graph.draw(_Widget(), cr)
+
+    assert any("90%" in args[0] for name, args in cr.calls if name == 'show_text')
+    chrome = _chrome(painted)[0]
+    assert [args[0] for name, args in chrome.calls if name == 'show_text'][:5] == ["100%", "75%", "50%", "25%", "0%"]
+    assert [name for name, _args in chrome.calls].count('stroke') == 1  # grid
+    lines = [name for recorder in _lines(painted) for name, _args in recorder.calls]
+    assert lines.count('stroke') == 2  # one per series
+    assert lines.count('line_to') == 2 * 9
+
+
+def test_static_chrome_is_rendered_once_and_blitted(painted):
+    graph = _cpu_graph()
+    widget = _Widget()
+    for _ in range(5):
+        cr = _Recorder()
+        graph.draw(widget, cr)
+        assert cr.calls[0][0] == 'set_source_surface'
+        assert not any(args and args[0] == "100%" for _name, args in cr.calls)
+    assert graph.background_renders == 1
+
+    widget.width = 500
+    graph.draw(widget, _Recorder())
+    assert graph.background_renders == 2
+
+    prev = localization.get_language()
+    try:
+        localization.set_language('de' if prev != 'de' else 'en')
+        graph.draw(widget, _Recorder())
+    finally:
+        localization.set_language(prev)
+    assert graph.background_renders == 3
+
+    graph.app._graph_line_color_rgb = lambda _key: (0.0, 1.0, 0.0)
+    graph.draw(widget, _Recorder())
+    assert graph.background_renders == 4
+
+
+def _tick(graph, ticks):
+    """Append ``ticks`` samples to a full 100-sample history, drawing after each like ``_update_ui``."""
+    history = graph.history()
+    widget = _Widget()
+    for _ in range(ticks):
+        ts = history.last()[0] + 1.0
+        history.append(ts, ts % 100, 50.0)
+        graph.draw(widget, _Recorder())
+
+
+def test_live_graph_scrolls_and_strokes_only_new_rows(painted):
+    graph = _cpu_graph(samples=100)
+    graph.draw(_Widget(), _Recorder())
+    assert (graph.canvas_renders, graph.canvas_scrolls) == (1, 0)
+    del painted[:]
+
+    _tick(graph, 3)
+
+    assert (graph.canvas_renders, graph.canvas_scrolls) == (1, 3)
+    lines = [name for recorder in _lines(painted) for name, args in recorder.calls]
+    assert lines.count('line_to') == 2 * 3  # one new segment per series and tick
+    shifts = [args for recorder in _lines(painted) for name, args in recorder.calls if name == 'set_source_surface']
+    assert len(shifts) == 3 and all(-5 <= x <= -3 for _surface, x, _y in shifts)  # 336 px / 99 s per tick
+    assert graph._canvas.last_row[0] == 102.0
+
+
+def test_zoom_resize_or_range_change_redraws_the_canvas(painted):
+    graph = _cpu_graph(samples=100)
+    widget = _Widget()
+    graph.draw(widget, _Recorder())
+
+    widget.width = 500
+    graph.draw(widget, _Recorder())
+    assert graph.canvas_renders == 2
+
+    history = graph.history()
+    history.append(100.0, 1.0, 140.0)  # temperature leaves its 0-100 axis
+    graph.draw(widget, _Recorder())
+    assert graph.canvas_renders == 3
+
+    # Growing window (history not full yet, or a zoom step) rescales every line.
+    graph.app._visible_range = lambda _key, hist: (hist.span()[0] - 50.0, hist.span()[1])
+    graph.draw(widget, _Recorder())
+    assert (graph.canvas_renders, graph.canvas_scrolls) == (4, 0)
+
+
+def test_metric_graph_without_samples_shows_placeholder():
+    graph = MetricGraph(_App(MetricHistory(('usage', 'temp'), 10, 1)), 'cpu', DESCRIPTORS['cpu'])
+    cr = _Recorder()
+    graph.draw(_Widget(), cr)
+    assert ('show_text', ('No data yet…',)) in cr.calls
+
+
+def test_redraw_requests_are_coalesced_per_frame_and_capped():
+    graph = _cpu_graph()
+    graph.area = area = _Area()
+    for _ in range(5):
+        graph.queue_draw()
+    assert len(area.ticks) == 1
+
+    area.frame(100.0)
+    assert (area.full, area.ticks) == (1, [])
+
+    graph.queue_draw()
+    area.frame(100.0 + 0.5 / graph.MAX_FPS)  # too soon: wait for a later frame
+    assert area.full == 1 and len(area.ticks) == 1
+    area.frame(100.0 + 1.0 / graph.MAX_FPS)
+    assert (area.full, area.ticks) == (2, [])
+
+
+def test_hover_motion_damages_only_crosshair_and_tooltip(painted):
+    graph = _cpu_graph()
+    graph.area = area = _Area()
+    state = graph.app.graph_zoom_state['cpu']
+    state.update(hovering=1.0, hover_x=200.0, hover_y=100.0)
+    graph.draw(area, _Recorder())
+    crosshair, tooltip = graph._hover_rects
+    assert crosshair[2] == 1.0 and tooltip[:2] == (212.0, 112.0)
+
+    state.update(hover_x=150.0, hover_y=60.0)
+    graph.queue_hover_draw()
+    area.frame(1.0)
+    assert area.full == 0
+    assert len(area.rects) == 4  # old crosshair and tooltip, new ones around the pointer
+    assert all(w * h < 400 * 200 / 4 for _x, _y, w, h in area.rects)
+    assert (162 - 2, 72 - 2) in [rect[:2] for rect in area.rects]
+
+    # A clipped draw that could not paint the whole tooltip damages the rest.
+    cr = _Recorder()
+    cr.clip_rect = (140.0, 0.0, 170.0, 200.0)
+    graph.draw(area, cr)
+    area.frame(2.0)
+    assert area.rects[-1][:2] == (162 - 2, 72 - 2)
+
+    state['hovering'] = 0.0
+    graph.queue_hover_draw()
+    graph.draw(area, _Recorder())
+    assert graph._hover_rects == []
+
+
+def _hover_texts(graph, timestamp):
+    """Draw with the pointer over ``timestamp``; return the tooltip lines."""
+    canvas = graph._canvas
+    x = canvas.plot.left + canvas.plot.plot_w - (canvas.end_ts - timestamp) * canvas.px_per_sec
+    graph.app.graph_zoom_state['cpu'].update(hovering=1.0, hover_x=x, hover_y=100.0)
+    cr = _Recorder()
+    graph.draw(_Widget(), cr)
+    texts = [args[0] for name, args in cr.calls if name == 'show_text']
+    return texts[1:-2]  # between the latest values and the time axis
+
+
+def test_hover_bisects_raw_samples_by_timestamp(painted):
+    history = MetricHistory(('usage', 'temp'), 2000, 1)
+    for ts in [*range(0, 300), *range(900, 1200)]:  # suspended for ten minutes
+        history.append(float(ts), float(ts % 50), 40.0 + ts % 3)
+    app = _App(history)
+    graph = MetricGraph(app, 'cpu', DESCRIPTORS['cpu'])
+    graph.draw(_Widget(), _Recorder())
+    decimated = []
+    app._decimate_samples = lambda samples, max_points: decimated.append(max_points) or list(samples)
+
+    lines = _hover_texts(graph, 905.0)
+    assert lines[:3] == DESCRIPTORS['cpu'].hover((905.0, 5.0, 42.0))
+    # ~3.6 s per pixel: the rows at 904-906 share the pixel column under the pointer.
+    usage, temp = DESCRIPTORS['cpu'].series
+    assert lines[3:] == [f"{usage.legend()}: 4% – 6%", f"{temp.legend()}: 40.0°C – 42.0°C"]
+    assert decimated == []
+
+    # Inside the gap the crosshair snaps to the nearest real sample, not to the pointer.
+    assert _hover_texts(graph, 650.0)[:3] == DESCRIPTORS['cpu'].hover((900.0, 0.0, 40.0))
+    canvas = graph._canvas
+    crosshair = graph._hover_rects[0]
+    right = canvas.plot.left + canvas.plot.plot_w
+    assert crosshair[0] + 0.5 == pytest.approx(right - (canvas.end_ts - 900.0) * canvas.px_per_sec)
@@ -0,0 +1,139 @@
+import sys
+import threading
+from array import array
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app_core import metrics_store
+from app_core.metrics_store import MetricsStore
+
+
+def _ts(day: date, seconds: int) -> float:
+    return datetime(day.year, day.month, day.day).timestamp() + seconds
+
+
+def test_append_is_batched_until_flush(tmp_path):
+    store = MetricsStore(tmp_path, ('cpu.usage', 'cpu.temp'), flush_interval=3600)
+    today = date.today()
+    for i in range(10):
+        store.append(_ts(today, i), (float(i), 40.0))
+
+    assert list(store.read(_ts(today, 0), _ts(today, 100))) == []
+    store.flush()
+    rows = list(store.read(_ts(today, 3), _ts(today, 5)))
+    assert rows == [(_ts(today, i), float(i), 40.0) for i in (3, 4, 5)]
+
+
+def test_flush_from_another_thread_loses_no_rows(tmp_path):
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # make the append/flush interleaving likely
+    store = MetricsStore(tmp_path, ('value',), flush_interval=3600)
+    start = _ts(date.today(), 0)
+    done = threading.Event()
+
+    def flusher():
+        while not done.is_set():
+            store.flush()
+
+    thread = threading.Thread(target=flusher)
+    thread.start()
+    try:
+        for i in range(5000):
+            store.append(start + i * 0.001, (float(i),))
+    finally:
+        done.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+    store.flush()
+    assert len(list(store.read(start, start + 10))) == 5000
+
+
+def test_read_without_numpy_and_torn_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics_store, "_np", None)
+    store = MetricsStore(tmp_path, ('value',), flush_interval=0)
+    today = date.today()
+    store.append(_ts(today, 1), (1.0,))
+    store.append(_ts(today, 2), (2.0,))
+    segment = tmp_path / f"{today.isoformat()}.raw"
+    with segment.open("ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    fresh = MetricsStore(tmp_path, ('value',), flush_interval=0)
+    fresh.append(_ts(today, 3), (3.0,))
+    assert [row[1] for row in fresh.read(_ts(today, 0), _ts(today, 10))] == [1.0, 2.0, 3.0]
+
+
+def test_old_days_are_compacted_then_evicted(tmp_path):
+    store = MetricsStore(tmp_path, ('value',), retention_days=3, flush_interval=3600)
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+    stale = today - timedelta(days=5)
+    for day in (stale, yesterday):
+        for i in range(180):
+            store.append(_ts(day, i), (float(i % 60),))
+    store.flush()
+
+    store.maintain(today)
+
+    assert not (tmp_path / f"{stale.isoformat()}.raw").exists()
+    assert not (tmp_path / f"{yesterday.isoformat()}.raw").exists()
+    assert (tmp_path / f"{yesterday.isoformat()}.r60").exists()
+    rows = list(store.read(_ts(yesterday, 0), _ts(yesterday, 86_399)))
+    assert [row[0] for row in rows] == [_ts(yesterday, 59), _ts(yesterday, 119), _ts(yesterday, 179)]
+    assert [row[1] for row in rows] == [29.5, 29.5, 29.5]
+
+
+def test_reader_maps_fields_by_name(tmp_path):
+    today = date.today()
+    old = MetricsStore(tmp_path, ('cpu.usage',), flush_interval=0)
+    old.append(_ts(today, 1), (12.0,))
+
+    new = MetricsStore(tmp_path, ('cpu.usage', 'cpu.temp'), flush_interval=0)
+    assert list(new.read(_ts(today, 0), _ts(today, 10))) == [(_ts(today, 1), 12.0, 0.0)]
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_read_columns_matches_rows_across_segments_and_rollups(tmp_path, monkeypatch, with_numpy):
+    if not with_numpy:
+        monkeypatch.setattr(metrics_store, "_np", None)
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+    old = MetricsStore(tmp_path, ('cpu.usage',), flush_interval=3600)
+    for i in range(120):
+        old.append(_ts(yesterday, i), (float(i),))
+    old.flush()
+    old.maintain(today)
+    old.append(_ts(today, 1), (12.0,))
+    old.flush()
+
+    store = MetricsStore(tmp_path, ('cpu.temp', 'cpu.usage'), flush_interval=0)
+    store.append(_ts(today, 2), (40.0, 20.0))
+    start, end = _ts(yesterday, 0), _ts(today, 10)
+
+    columns = store.read_columns(start, end)
+    assert all(isinstance(col, array) and col.typecode == 'd' for col in columns)
+    assert list(zip(*columns)) == list(store.read(start, end))
+    assert list(zip(*columns))[-2:] == [(_ts(today, 1), 0.0, 12.0), (_ts(today, 2), 40.0, 20.0)]
+    assert [list(col) for col in store.read_columns(end + 1, end + 10)] == [[], [], []]
+
+
+def test_field_change_starts_new_segment_and_compaction_merges_them(tmp_path):
+    yesterday = date.today() - timedelta(days=1)
+    store = MetricsStore(tmp_path, ('cpu0',), flush_interval=3600)
+    store.append(_ts(yesterday, 1), (10.0,))
+    store.set_fields(('cpu0', 'cpu1'))
+    store.append(_ts(yesterday, 2), (20.0, 5.0))
+    store.flush()
+
+    assert (tmp_path / f"{yesterday.isoformat()}.1.raw").exists()
+    assert store.stored_fields() == ('cpu0', 'cpu1')
+    assert list(store.read(_ts(yesterday, 0), _ts(yesterday, 10))) == [
+        (_ts(yesterday, 1), 10.0, 0.0),
+        (_ts(yesterday, 2), 20.0, 5.0),
+    ]
+
+    store.maintain(date.today())
+    assert list(tmp_path.glob("*.raw")) == []
+    rows = list(store.read(_ts(yesterday, 0), _ts(yesterday, 10)))
+    assert rows == [(_ts(yesterday, 2), 15.0, 2.5)]
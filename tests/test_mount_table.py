@@ -0,0 +1,37 @@
+from app_core.system_usage import MountTable
+
+
+def _fake_proc(tmp_path, lines):
+    (tmp_path / "self").mkdir(exist_ok=True)
+    (tmp_path / "filesystems").write_text("nodev\tproc\nnodev\ttmpfs\n\text4\n\tsquashfs\n")
+    (tmp_path / "self" / "mountinfo").write_text("".join(line + "\n" for line in lines))
+
+
+def test_mount_points_skip_pseudo_and_bind_mounts(tmp_path):
+    _fake_proc(tmp_path, [
+        "22 1 0:21 / /proc rw - proc proc rw",
+        "23 1 8:1 / / rw - ext4 /dev/sda1 rw",
+        "24 23 8:2 / /mnt/my\\040data rw - ext4 /dev/sda2 rw",
+        "25 23 8:1 /srv /var/srv rw - ext4 /dev/sda1 rw",
+        "26 23 0:30 / /run rw - tmpfs tmpfs rw",
+        "27 23 7:0 / /snap/core/1 ro - squashfs /dev/loop0 ro",
+    ])
+    table = MountTable(str(tmp_path))
+    assert table.mount_points() == ["/", "/mnt/my data"]
+    table.close()
+
+
+def test_mount_table_is_cached_until_invalidated(tmp_path):
+    _fake_proc(tmp_path, ["23 1 8:1 / / rw - ext4 /dev/sda1 rw"])
+    table = MountTable(str(tmp_path))
+    assert table.mount_points() == ["/"]
+
+    _fake_proc(tmp_path, [
+        "23 1 8:1 / / rw - ext4 /dev/sda1 rw",
+        "24 23 8:2 / /data rw - ext4 /dev/sda2 rw",
+    ])
+    assert table.mount_points() == ["/"]
+    table.invalidate()
+    assert table.mount_points() == ["/", "/data"]
+    assert "/" in table.usage()
+    table.close()
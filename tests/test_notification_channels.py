@@ -0,0 +1,175 @@
+import json
+import sys
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+if "gi" not in sys.modules:
+    fake_glib = types.SimpleNamespace(idle_add=lambda *args, **kwargs: None)
+    fake_repository = types.SimpleNamespace(GLib=fake_glib)
+    sys.modules["gi"] = types.SimpleNamespace(repository=fake_repository)
+    sys.modules["gi.repository"] = fake_repository
+
+from app_core.http_transport import HttpTransport
+from app_core.sampler import MetricsSnapshot
+from notifications import base, webhook
+from notifications.base import ChannelCapabilities, NotificationChannel, create_channels, register_channel
+from notifications.dispatcher import NotificationDispatcher
+
+
+def _snapshot():
+    return MetricsSnapshot(
+        timestamp=0.0, cpu_temp=55, cpu_usage=12.0, ram_used=3.5, ram_total=16.0,
+        disk_used=100.0, disk_total=500.0, swap_used=0.0, swap_total=2.0,
+        net_recv=1.5, net_sent=0.5, uptime="1:00:00", keyboard_clicks=10, mouse_clicks=5,
+        families={}, texts={},
+    )
+
+
+class _Recorder(NotificationChannel):
+    name = "recorder"
+    capabilities = ChannelCapabilities(max_length=20, min_interval=0.3, supports_batching=True)
+
+    def __init__(self):
+        self.enabled = True
+        self.requests = []
+
+    def send_message(self, message, force=False):
+        self.requests.append(message)
+        return True
+
+    def format_status(self, snapshot):
+        return f"cpu {snapshot.cpu_usage:.0f}"
+
+
+def test_builtin_channels_are_registered_with_capabilities(monkeypatch, tmp_path):
+    monkeypatch.setattr(webhook, "WEBHOOK_CONFIG_FILE", tmp_path / "webhook.json")
+    channels = create_channels()
+
+    assert {"telegram", "discord", "webhook"} <= set(channels)
+    assert channels["telegram"].capabilities.supports_images is True
+    assert channels["discord"].capabilities.max_length == 2000
+    for channel in channels.values():
+        assert isinstance(channel, NotificationChannel)
+        assert channel.format_status(_snapshot())
+
+
+def test_register_channel_requires_a_name():
+    class Nameless(NotificationChannel):
+        pass
+
+    with pytest.raises(ValueError):
+        register_channel(Nameless)
+
+
+def test_channel_missing_a_required_method_fails_at_creation(monkeypatch, caplog):
+    monkeypatch.setattr(base, "_REGISTRY", {})
+
+    @register_channel
+    class Silent(NotificationChannel):
+        name = "silent"
+
+        def send_message(self, message, force=False):
+            return True
+
+    register_channel(_Recorder)
+    channels = create_channels(modules=())
+
+    assert set(channels) == {"recorder"}
+    assert "silent" in caplog.text
+
+
+def test_join_batch_keeps_newest_messages_within_max_length():
+    channel = _Recorder()
+    assert channel.join_batch(["a" * 8, "b" * 8, "c" * 8]) == "b" * 8 + "\n\n" + "c" * 8
+    assert channel.join_batch(["x" * 50]) == "x" * 50
+
+
+def test_rate_limited_channel_batches_pending_messages():
+    channel = _Recorder()
+    dispatcher = NotificationDispatcher()
+    dispatcher.add(channel)
+    dispatcher.start()
+    try:
+        dispatcher.submit("recorder", "one")
+        deadline = time.monotonic() + 3
+        while not channel.requests and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for message in ("two", "three", "four"):
+            dispatcher.submit("recorder", message)
+        deadline = time.monotonic() + 3
+        while len(channel.requests) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        dispatcher.stop()
+
+    assert channel.requests == ["one", "two\n\nthree\n\nfour"]
+    assert dispatcher.channel_stats("recorder")["batched"] == 3
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.bodies.append(json.loads(self.rfile.read(length)))
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *_args):
+        pass
+
+
+def test_webhook_plugin_posts_messages_and_batches(monkeypatch, tmp_path):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.bodies = []
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    config = tmp_path / "webhook.json"
+    config.write_text(json.dumps({
+        "WEBHOOK_URL": f"http://127.0.0.1:{httpd.server_address[1]}/hook",
+        "enabled": True,
+        "notification_interval": 5,
+    }), encoding="utf-8")
+    monkeypatch.setattr(webhook, "WEBHOOK_CONFIG_FILE", config)
+
+    transport = HttpTransport()
+    try:
+        channel = webhook.WebhookNotifier(transport=transport)
+        assert channel.notification_interval == 10
+        assert channel.send_message(channel.format_status(_snapshot())) is True
+        assert channel.send_batch(["a", "b"]) is True
+    finally:
+        transport.close()
+        httpd.shutdown()
+        httpd.server_close()
+
+    assert "12%" in httpd.bodies[0]["text"]
+    assert httpd.bodies[1]["messages"] == ["a", "b"]
+    assert all(body["source"] == "SyMo" for body in httpd.bodies)
+    assert transport.stats.handshakes == 1
+    assert base.channel_types()["webhook"] is webhook.WebhookNotifier
+
+
+def test_disabled_webhook_does_not_send(monkeypatch, tmp_path):
+    monkeypatch.setattr(webhook, "WEBHOOK_CONFIG_FILE", tmp_path / "missing.json")
+    channel = webhook.WebhookNotifier()
+    monkeypatch.setattr(channel.transport, "post", lambda *_a, **_k: pytest.fail("should not post"))
+    assert channel.send_message("x") is False
+    assert channel.send_batch(["x"]) is False
+
+
+def test_alert_messages_are_formatted_per_channel(monkeypatch, tmp_path):
+    from app_core.alerts import AlertEngine
+
+    monkeypatch.setattr(webhook, "WEBHOOK_CONFIG_FILE", tmp_path / "webhook.json")
+    engine = AlertEngine(["cpu_temp > 90"])
+    event = engine.evaluate(_snapshot()._replace(cpu_temp=95))[0]
+    channels = create_channels()
+
+    assert "cpu_temp &gt; 90" in channels["telegram"].format_alert(event)
+    assert channels["webhook"].format_alert(event).startswith("⚠️")
+    assert "cpu_temp = 95.0" in channels["discord"].format_alert(event)
@@ -29,7 +29,7 @@ def test_discord_send_message_retries_on_rate_limit(tmp_path, monkeypatch):
             return types.SimpleNamespace(status_code=429, json=lambda: {"retry_after": 0})
         return types.SimpleNamespace(status_code=204, json=lambda: {})
 
-    monkeypatch.setattr(discord.requests, "post", fake_post)
+    monkeypatch.setattr(notifier.transport, "post", fake_post)
     monkeypatch.setattr(discord.time, "sleep", lambda *_args, **_kwargs: None)
 
     assert notifier.send_message("ok") is True
@@ -54,7 +54,7 @@ def test_telegram_send_message_checks_ok_flag(tmp_path, monkeypatch):
     def fake_post(_url, _data, _timeout):
         return types.SimpleNamespace(status_code=200, json=lambda: {"ok": False, "description": "Bad Request"})
 
-    monkeypatch.setattr(telegram.requests, "post", fake_post)
+    monkeypatch.setattr(notifier.transport, "post", fake_post)
 
     assert notifier.send_message("ok") is False
 
@@ -80,7 +80,7 @@ def test_telegram_send_photo_checks_ok_flag(tmp_path, monkeypatch):
     def fake_post(_url, data=None, files=None, timeout=None):
         return types.SimpleNamespace(status_code=200, json=lambda: {"ok": False, "description": "Bad Request"})
 
-    monkeypatch.setattr(telegram.requests, "post", fake_post)
+    monkeypatch.setattr(notifier.transport, "post", fake_post)
 
     assert notifier.send_photo(str(photo), "caption") is False
 
@@ -162,7 +162,7 @@ def test_telegram_send_photo_retries_on_connection_error(tmp_path, monkeypatch):
             raise telegram.requests.exceptions.ConnectionError("timeout")
         return types.SimpleNamespace(status_code=200, json=lambda: {"ok": True})
 
-    monkeypatch.setattr(telegram.requests, "post", fake_post)
+    monkeypatch.setattr(notifier.transport, "post", fake_post)
     monkeypatch.setattr(telegram.time, "sleep", lambda *_args, **_kwargs: None)
 
     assert notifier.send_photo(str(photo), "caption") is True
@@ -191,7 +191,7 @@ def test_send_photo_cleans_optimized_temp_file(tmp_path, monkeypatch):
 
     monkeypatch.setattr(notifier, "_optimize_photo_for_upload", lambda _p: (str(optimized), str(optimized)))
     monkeypatch.setattr(
-        telegram.requests,
+        notifier.transport,
         "post",
         lambda _url, data=None, files=None, timeout=None: types.SimpleNamespace(status_code=200, json=lambda: {"ok": True}),
     )
@@ -0,0 +1,176 @@
+import sys
+import threading
+import time
+import types
+
+if "gi" not in sys.modules:
+    fake_glib = types.SimpleNamespace(idle_add=lambda *args, **kwargs: None)
+    fake_repository = types.SimpleNamespace(GLib=fake_glib)
+    sys.modules["gi"] = types.SimpleNamespace(repository=fake_repository)
+    sys.modules["gi.repository"] = fake_repository
+
+from notifications.dispatcher import NotificationDispatcher
+
+
+def _wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_submit_sends_on_the_loop_executor():
+    sent = []
+    dispatcher = NotificationDispatcher()
+    dispatcher.add_channel("chat", lambda message: sent.append((message, threading.current_thread().name)) or True)
+    dispatcher.start()
+    try:
+        dispatcher.submit("chat", "hello")
+        assert _wait_for(lambda: sent)
+    finally:
+        dispatcher.stop()
+
+    assert sent[0][0] == "hello"
+    assert sent[0][1].startswith("symo-notify")
+    assert dispatcher.channel_stats("chat") == {"sent": 1, "failed": 0, "coalesced": 0, "batched": 0}
+
+
+def test_rate_limited_channel_coalesces_to_latest_message():
+    sent = []
+    dispatcher = NotificationDispatcher()
+    dispatcher.add_channel("chat", lambda message: sent.append(message) or True, min_interval=0.3)
+    dispatcher.start()
+    try:
+        dispatcher.submit("chat", "first")
+        assert _wait_for(lambda: sent == ["first"])
+        for idx in range(5):
+            dispatcher.submit("chat", f"status {idx}")
+        assert _wait_for(lambda: len(sent) == 2)
+        time.sleep(0.4)
+    finally:
+        dispatcher.stop()
+
+    assert sent == ["first", "status 4"]
+    assert dispatcher.channel_stats("chat")["coalesced"] == 4
+
+
+def test_failed_sends_are_counted_and_channel_keeps_running():
+    calls = []
+
+    def send(message):
+        calls.append(message)
+        if message == "boom":
+            raise RuntimeError("network down")
+        return message != "rejected"
+
+    dispatcher = NotificationDispatcher()
+    dispatcher.add_channel("chat", send)
+    dispatcher.start()
+    try:
+        for message in ("boom", "rejected", "ok"):
+            dispatcher.submit("chat", message)
+            assert _wait_for(lambda: calls[-1:] == [message])
+        assert _wait_for(lambda: dispatcher.channel_stats("chat")["sent"] == 1)
+    finally:
+        dispatcher.stop()
+
+    assert dispatcher.channel_stats("chat") == {"sent": 1, "failed": 2, "coalesced": 0, "batched": 0}
+
+
+def test_poller_runs_until_stopped_and_honours_returned_pause():
+    polls = []
+    dispatcher = NotificationDispatcher()
+    dispatcher.start()
+    try:
+        dispatcher.start_poller("bot", lambda: polls.append(time.monotonic()) or 0.05)
+        assert _wait_for(lambda: len(polls) >= 3)
+        dispatcher.stop_poller("bot")
+        time.sleep(0.1)
+        count = len(polls)
+        time.sleep(0.2)
+        assert len(polls) == count
+    finally:
+        dispatcher.stop()
+
+    assert all(b - a >= 0.04 for a, b in zip(polls, polls[1:]))
+
+
+def test_restarted_poller_waits_for_the_long_poll_still_in_flight():
+    release = threading.Event()
+    lock = threading.Lock()
+    active = []
+    overlaps = []
+    polls = []
+
+    def poll():
+        with lock:
+            overlaps.append(len(active))
+            active.append(1)
+        polls.append(time.monotonic())
+        if len(polls) == 1:
+            release.wait(timeout=3.0)
+        with lock:
+            active.pop()
+        return 0.05
+
+    dispatcher = NotificationDispatcher()
+    dispatcher.start()
+    try:
+        dispatcher.start_poller("bot", poll)
+        assert _wait_for(lambda: polls)
+        dispatcher.stop_poller("bot")
+        dispatcher.start_poller("bot", poll)
+        time.sleep(0.2)
+        assert len(polls) == 1
+        release.set()
+        assert _wait_for(lambda: len(polls) >= 3)
+    finally:
+        dispatcher.stop()
+
+    assert not any(overlaps)
+
+
+def test_submit_after_stop_is_ignored():
+    dispatcher = NotificationDispatcher()
+    dispatcher.add_channel("chat", lambda message: True)
+    dispatcher.start()
+    dispatcher.stop()
+    dispatcher.submit("chat", "late")
+    dispatcher.submit("unknown", "late")
+
+
+def test_telegram_poll_backs_off_and_handles_updates(tmp_path, monkeypatch):
+    import importlib.util
+    from pathlib import Path
+
+    spec = importlib.util.spec_from_file_location(
+        "notifications.telegram",
+        Path(__file__).resolve().parents[1] / "notifications" / "telegram.py",
+    )
+    telegram = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(telegram)
+    telegram.TELEGRAM_CONFIG_FILE = tmp_path / "telegram.json"
+    notifier = telegram.TelegramNotifier()
+    notifier.save_config("token", "100", True, 60)
+
+    responses = []
+    monkeypatch.setattr(notifier.transport, "get", lambda _url, params=None, timeout=None: responses.pop(0))
+    handled = []
+    monkeypatch.setattr(notifier, "_handle_update", handled.append)
+
+    error = types.SimpleNamespace(status_code=502, json=lambda: {})
+    update = {"update_id": 7, "message": {"chat": {"id": 100}, "text": "/status"}}
+    ok = types.SimpleNamespace(status_code=200, json=lambda: {"ok": True, "result": [update]})
+    responses.extend([error, error, error, ok, error])
+
+    notifier.bot_running = True
+    assert [notifier._poll_updates() for _ in range(3)] == [1.0, 2.0, 4.0]
+    assert notifier._poll_updates() == 0.0
+    assert handled == [update]
+    assert notifier.last_update_id == 7
+    assert notifier._poll_updates() == 1.0
+
+    notifier.bot_running = False
+    assert notifier._poll_updates() == 1.0
@@ -30,7 +30,7 @@ def test_discord_send_message_force_ignores_enabled(tmp_path, monkeypatch):
         called["timeout"] = timeout
         return types.SimpleNamespace(status_code=204)
 
-    monkeypatch.setattr(discord.requests, "post", fake_post)
+    monkeypatch.setattr(notifier.transport, "post", fake_post)
 
     assert notifier.send_message("test", force=True) is True
     assert called["url"] == "https://example.com/webhook"
@@ -60,7 +60,7 @@ def test_telegram_send_message_force_ignores_enabled(tmp_path, monkeypatch):
         called["timeout"] = timeout
         return types.SimpleNamespace(status_code=200, json=lambda: {"ok": True})
 
-    monkeypatch.setattr(telegram.requests, "post", fake_post)
+    monkeypatch.setattr(notifier.transport, "post", fake_post)
 
     assert notifier.send_message("test", force=True) is True
     assert called["url"] == "https://api.telegram.org/bottoken/sendMessage"
@@ -5,7 +5,8 @@ def test_sampler_exists_and_is_interval_cached():
     code = Path("app_core/system_usage.py").read_text(encoding="utf-8")
     assert "class MetricsSampler:" in code
     assert "def collect(self, prev_net_data: Dict[str, float], intervals: Dict[str, int])" in code
-    assert "if now - self._last_update_ts[key] < min_interval:" in code
+    assert "while heap and heap[0][0] <= now + self.COALESCE_SEC:" in code
+    assert "def next_due(self) -> float:" in code
     assert "self._cache[key] = self._collect_metric(key, prev_net_data)" in code
 
 
@@ -14,19 +15,18 @@ def test_update_info_uses_sampler_snapshot_and_profiling_toggle():
     assert "self.metrics_sampler.collect(self.prev_net_data, metric_intervals)" in code
     assert "'profiling_enabled': False" in code
     assert "if self.visibility_settings.get('profiling_enabled', False):" in code
-    assert '"Profiling update_info: avg=%.2fms max=%.2fms samples=%d"' in code
+    assert '"Profiling update_info: collect avg=%.2fms max=%.2fms, ui avg=%.2fms max=%.2fms samples=%d"' in code
+    assert "GLib.timeout_add_seconds(TIME_UPDATE_SEC, self.update_info)" not in code
+    assert "self.sampler_engine.start()" in code
 
 
 def test_graph_draw_paths_use_decimation_cap():
     code = Path("app_core/app.py").read_text(encoding="utf-8")
-    assert "def _decimate_samples(samples: list[tuple], max_points: int) -> list[tuple]:" in code
-    assert "self._decimate_samples(self._visible_samples('cpu', list(self.cpu_history)), max(200, width * 2))" in code
-    assert "self._decimate_samples(self._visible_samples('ram', list(self.ram_history)), max(200, width * 2))" in code
-    assert "self._decimate_samples(self._visible_samples('swap', list(self.swap_history)), max(200, width * 2))" in code
-    assert "self._decimate_samples(self._visible_samples('disk', list(self.disk_history)), max(200, width * 2))" in code
-    assert "self._decimate_samples(self._visible_samples('net', list(self.net_history)), max(200, width * 2))" in code
-    assert "self._decimate_samples(self._visible_samples('keyboard', list(self.keyboard_history)), max(200, width * 2))" in code
-    assert "self._decimate_samples(self._visible_samples('mouse', list(self.mouse_history)), max(200, width * 2))" in code
+    widget_code = Path("app_core/graph_widget.py").read_text(encoding="utf-8")
+    assert "def _decimate_samples(samples: Sequence[tuple], max_points: int) -> Sequence[tuple]:" in code
+    # Every line graph draws through MetricGraph, so the cap applies to all metrics at once.
+    assert "self.app._visible_samples(self.key, history, width), max(200, width * 2)" in widget_code
+    assert "def _draw_cpu_graph" not in code
 
 
 def test_roadmap_artifact_kept_for_follow_up_prs():
@@ -0,0 +1,150 @@
+from app_core import system_usage
+from app_core.system_usage import DiskStats, ProcReader
+
+NET_HEADER = (
+    "Inter-|   Receive                                                |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed\n"
+)
+
+
+def _fake_proc(tmp_path, cpu_line, interfaces=2):
+    (tmp_path / "net").mkdir(exist_ok=True)
+    (tmp_path / "stat").write_text(cpu_line + "\ncpu0 1 2 3 4 5 6 7 8 0 0\nintr 1\n")
+    (tmp_path / "meminfo").write_text(
+        "MemTotal:       16000000 kB\n"
+        "MemFree:         2000000 kB\n"
+        "MemAvailable:    6000000 kB\n"
+        "SwapTotal:       4000000 kB\n"
+        "SwapFree:        3000000 kB\n"
+    )
+    rows = "".join(
+        f"  eth{i}: {1000 + i} 10 0 0 0 0 0 0 {2000 + i} 20 0 0 0 0 0 0\n" for i in range(interfaces)
+    )
+    (tmp_path / "net" / "dev").write_text(NET_HEADER + rows)
+
+
+def test_cpu_percent_uses_deltas_between_calls(tmp_path):
+    _fake_proc(tmp_path, "cpu  100 0 100 800 0 0 0 0 0 0")
+    reader = ProcReader(str(tmp_path))
+    assert reader.cpu_percent() == 0.0
+
+    # 100 more busy jiffies out of 400: 25 %.
+    (tmp_path / "stat").write_text("cpu  150 0 150 1100 0 0 0 0 0 0\n")
+    assert reader.cpu_percent() == 25.0
+    reader.close()
+
+
+def test_total_and_per_core_usage_share_one_stat_read(tmp_path, monkeypatch):
+    _fake_proc(tmp_path, "cpu  100 0 100 800 0 0 0 0 0 0")
+    reader = ProcReader(str(tmp_path))
+    reads = []
+    preadv = system_usage.os.preadv
+    monkeypatch.setattr(system_usage.os, "preadv", lambda fd, bufs, offset: reads.append(fd) or preadv(fd, bufs, offset))
+
+    reader.cpu_percent()
+    reader.cpu_core_percents()
+    reader.ram_usage()
+    reader.swap_usage()
+    assert len(reads) == 2  # one /proc/stat, one /proc/meminfo
+
+    # Asking for the same part again is a new sample and reads the file anew.
+    reader.cpu_percent()
+    assert len(reads) == 3
+    reader.close()
+
+
+def test_memory_and_swap_match_psutil_formula(tmp_path):
+    _fake_proc(tmp_path, "cpu  1 1 1 1 1 1 1 1 0 0")
+    reader = ProcReader(str(tmp_path))
+
+    used, total = reader.ram_usage()
+    assert total == 16000000 * 1024 / 1024 ** 3
+    assert used == (16000000 - 6000000) * 1024 / 1024 ** 3
+    swap_used, swap_total = reader.swap_usage()
+    assert swap_used == 1000000 * 1024 / 1024 ** 3
+    assert swap_total == 4000000 * 1024 / 1024 ** 3
+    reader.close()
+
+
+def test_net_bytes_sum_interfaces_and_grow_buffer(tmp_path):
+    _fake_proc(tmp_path, "cpu  1 1 1 1 1 1 1 1 0 0", interfaces=200)
+    reader = ProcReader(str(tmp_path))
+
+    recv, sent = reader.net_bytes()
+    assert recv == sum(1000 + i for i in range(200))
+    assert sent == sum(2000 + i for i in range(200))
+    reader.close()
+
+
+def test_create_returns_none_without_procfs(tmp_path):
+    assert ProcReader.create(str(tmp_path / "missing")) is None
+
+
+def test_per_core_and_per_interface_counters(tmp_path):
+    _fake_proc(tmp_path, "cpu  1 1 1 1 1 1 1 1 0 0")
+    (tmp_path / "stat").write_text(
+        "cpu  200 0 0 200 0 0 0 0 0 0\n"
+        "cpu0 100 0 0 100 0 0 0 0 0 0\n"
+        "cpu1 100 0 0 100 0 0 0 0 0 0\n"
+        "intr 1\n"
+    )
+    (tmp_path / "net" / "dev").write_text(
+        NET_HEADER
+        + "    lo: 500 1 0 0 0 0 0 0 500 1 0 0 0 0 0 0\n"
+        + "  eth0: 100 1 0 0 0 0 0 0 200 1 0 0 0 0 0 0\n"
+    )
+    reader = ProcReader(str(tmp_path))
+    assert reader.cpu_core_percents() == {"cpu0": 0.0, "cpu1": 0.0}
+
+    (tmp_path / "stat").write_text(
+        "cpu  300 0 0 300 0 0 0 0 0 0\n"
+        "cpu0 200 0 0 100 0 0 0 0 0 0\n"
+        "cpu1 100 0 0 200 0 0 0 0 0 0\n"
+    )
+    assert reader.cpu_core_percents() == {"cpu0": 100.0, "cpu1": 0.0}
+    assert reader.net_bytes_per_interface() == {"eth0": (100, 200)}
+    assert reader.net_bytes() == (600, 700)
+    reader.close()
+
+
+def test_disk_stats_report_whole_disks_and_bulk_rates(tmp_path, monkeypatch):
+    sys_block = tmp_path / "block"
+    (sys_block / "sda").mkdir(parents=True)
+    (sys_block / "loop0").mkdir()
+    (tmp_path / "diskstats").write_text(
+        "   8       0 sda 100 0 2048 0 50 0 4096 0 0 1000 0 0 0 0 0\n"
+        "   8       1 sda1 100 0 2048 0 50 0 4096 0 0 1000 0 0 0 0 0\n"
+        "   7       0 loop0 10 0 80 0 0 0 0 0 0 4 0 0 0 0 0\n"
+    )
+    stats = DiskStats(str(tmp_path), str(sys_block))
+    assert stats.counters() == {"sda": (100, 2048 * 512, 50, 4096 * 512, 1000)}
+
+    monkeypatch.setattr(system_usage, "_diskstats", stats)
+    clock = iter([100.0, 102.0])
+    monkeypatch.setattr(system_usage.time, "time", lambda: next(clock))
+    prev = {}
+    assert system_usage.SystemUsage.get_disk_io(prev) == {"sda": (0.0, 0.0, 0.0, 0.0)}
+
+    # Two seconds later: 4 MiB read, 2 MiB written, 300 requests, 1.5 s busy.
+    (tmp_path / "diskstats").write_text(
+        "   8       0 sda 300 0 10240 0 150 0 8192 0 0 2500 0 0 0 0 0\n"
+    )
+    assert system_usage.SystemUsage.get_disk_io(prev) == {"sda": (2.0, 1.0, 150.0, 75.0)}
+    stats.close()
+
+
+def test_getters_share_one_lock_with_other_threads(tmp_path):
+    import threading
+
+    _fake_proc(tmp_path, "cpu  100 0 100 800 0 0 0 0 0 0")
+    reader = ProcReader(str(tmp_path))
+    results = []
+    with reader._lock:
+        worker = threading.Thread(target=lambda: results.append(reader.ram_usage()))
+        worker.start()
+        worker.join(0.1)
+        # Another thread is parsing the shared buffers; this one has to wait.
+        assert worker.is_alive() and results == []
+    worker.join(2.0)
+    assert results and results[0][1] > 0
+    reader.close()
@@ -18,12 +18,13 @@ def test_uninstall_handles_desktop_name_variants():
     assert "symo.desktop" in code
 
 
-def test_app_uses_queued_notification_workers():
+def test_app_sends_notifications_through_dispatcher():
     code = Path("app_core/app.py").read_text(encoding="utf-8")
-    assert "Queue(maxsize=1)" in code
-    assert "self._notification_worker" in code
-    assert "self._enqueue_latest_notification(self._telegram_queue, msg)" in code
-    assert "self._enqueue_latest_notification(self._discord_queue, msg)" in code
+    assert "self.notification_dispatcher = NotificationDispatcher()" in code
+    assert "self.notification_channels = create_channels()" in code
+    assert "self.notification_dispatcher.submit(name, channel.format_status(s))" in code
+    assert "self.telegram_notifier.set_dispatcher(self.notification_dispatcher)" in code
+    assert "threading.Thread(\n            target=self._notification_worker" not in code
 
 
 def test_notifiers_use_logging_instead_of_print():
@@ -0,0 +1,100 @@
+import threading
+import time
+
+from app_core.sampler import SamplingEngine
+
+
+def _engine(values, visible, delivered, woken, interval=0.01):
+    counter = iter(values)
+    return SamplingEngine(
+        collect=lambda: next(counter),
+        on_snapshot=visible,
+        deliver=delivered.append,
+        wake=woken.append,
+        interval=interval,
+    )
+
+
+def test_run_once_delivers_synchronously():
+    delivered, woken = [], []
+    engine = _engine([1, 2], lambda snap: True, delivered, woken)
+
+    engine.run_once()
+
+    assert delivered == [1]
+    assert woken == []
+    assert engine.collect_stats.count == 1
+    assert engine.ui_stats.count == 1
+
+
+def test_wakeups_are_coalesced_and_read_latest_slot():
+    delivered, woken = [], []
+    engine = _engine(range(100), lambda snap: True, delivered, woken)
+
+    engine.start()
+    deadline = time.monotonic() + 2.0
+    while engine.collect_stats.count < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    engine.stop()
+
+    # The UI never ran, so only one delivery was ever scheduled.
+    assert len(woken) == 1
+    woken[0]()
+    assert delivered == [engine.latest]
+    assert engine.latest >= 4
+
+
+def test_invisible_changes_do_not_wake_ui():
+    delivered, woken = [], []
+    engine = _engine(range(100), lambda snap: False, delivered, woken)
+
+    engine.start()
+    deadline = time.monotonic() + 2.0
+    while engine.collect_stats.count < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    engine.stop()
+
+    assert woken == []
+    assert delivered == []
+
+
+def test_collect_errors_keep_the_thread_alive(capsys):
+    calls = []
+    done = threading.Event()
+
+    def collect():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("sensor stalled")
+        done.set()
+        return len(calls)
+
+    engine = SamplingEngine(collect, lambda snap: False, lambda snap: None, lambda cb: None, 0.01)
+    engine.start()
+    assert done.wait(2.0)
+    engine.stop()
+    assert "sensor stalled" in capsys.readouterr().out
+
+
+def test_deadline_mode_sleeps_for_next_delay_and_poke_wakes_it():
+    delivered, woken = [], []
+    engine = SamplingEngine(
+        collect=lambda: 1,
+        on_snapshot=lambda snap: False,
+        deliver=delivered.append,
+        wake=woken.append,
+        interval=0.01,
+        next_delay=lambda: 60.0,
+    )
+
+    engine.start()
+    time.sleep(0.05)
+    assert engine.wakeups == 0
+
+    engine.poke()
+    deadline = time.monotonic() + 2.0
+    while engine.wakeups < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    engine.stop()
+    assert engine.wakeups == 1
+    assert engine.collect_stats.count == 1
@@ -0,0 +1,120 @@
+from app_core.system_usage import MetricsSampler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _sampler(readings):
+    clock = FakeClock()
+    sampler = MetricsSampler(clock=clock)
+    calls = []
+
+    def fake_collect(key, _prev):
+        calls.append(key)
+        return readings.get(key, 0.0)
+
+    sampler._collect_metric = fake_collect
+    return sampler, clock, calls
+
+
+def _keys_intervals(**overrides):
+    intervals = {key: 1 for key in MetricsSampler._METRIC_KEYS}
+    intervals.update(overrides)
+    return intervals
+
+
+def test_only_due_metrics_are_collected():
+    sampler, clock, calls = _sampler({})
+    intervals = _keys_intervals(disk=5)
+
+    sampler.collect({}, intervals)
+    assert sorted(calls) == sorted(MetricsSampler._METRIC_KEYS)
+    assert sampler.next_due() == clock.now + 1
+
+    calls.clear()
+    for _ in range(4):
+        clock.now += 1
+        sampler.collect({}, intervals)
+    assert "disk" not in calls
+
+    calls.clear()
+    clock.now += 1
+    sampler.collect({}, intervals)
+    assert "disk" in calls
+
+
+def test_stable_unwatched_metrics_back_off_until_they_change():
+    readings = {"cpu_usage": 5.0}
+    sampler, clock, calls = _sampler(readings)
+    sampler.adaptive = True
+    intervals = _keys_intervals()
+
+    sampler.collect({}, intervals)
+    gaps = []
+    last = clock.now
+    while len(gaps) < 5:
+        clock.now = sampler.next_due()
+        calls.clear()
+        sampler.collect({}, intervals)
+        if "cpu_usage" in calls:
+            gaps.append(clock.now - last)
+            last = clock.now
+    # The first reading differs from the 0.0 placeholder, so backing off starts one read later.
+    assert gaps == [1.0, 2.0, 4.0, 8.0, 8.0]
+
+    readings["cpu_usage"] = 90.0
+    calls.clear()
+    while "cpu_usage" not in calls:
+        clock.now = sampler.next_due()
+        sampler.collect({}, intervals)
+    assert sampler.next_due() == clock.now + 1
+
+
+def test_watched_metric_returns_to_base_interval():
+    sampler, clock, calls = _sampler({})
+    sampler.adaptive = True
+    intervals = _keys_intervals()
+    sampler.collect({}, intervals)
+    for _ in range(3):
+        clock.now = sampler.next_due()
+        sampler.collect({}, intervals)
+    assert sampler._factor["ram"] > 1
+
+    sampler.set_watched({"ram"})
+    assert sampler.next_due() == clock.now
+    calls.clear()
+    sampler.collect({}, intervals)
+    assert calls == ["ram"]
+    assert sampler.next_due() == clock.now + 1
+
+
+def test_family_change_during_collect_waits_for_the_next_cycle():
+    sampler, clock, calls = _sampler({})
+    intervals = _keys_intervals(cpu_cores=1, mounts=1)
+    sampler.set_families(("cpu_cores", "mounts"))
+    sampler.collect({}, intervals)
+    assert sampler.families == ("cpu_cores", "mounts")
+
+    def collect_and_disable(key, _prev):
+        calls.append(key)
+        if key == "cpu_cores":
+            # The settings dialog turns families off while this cycle is running.
+            sampler.set_families(())
+        return 0.0
+
+    sampler._collect_metric = collect_and_disable
+    clock.now += 1
+    calls.clear()
+    snapshot = sampler.collect({}, intervals)
+    assert "mounts" in calls and "mounts" in snapshot
+
+    clock.now += 1
+    calls.clear()
+    snapshot = sampler.collect({}, intervals)
+    assert sampler.families == ()
+    assert "mounts" not in calls and "mounts" not in snapshot
@@ -11,6 +11,7 @@ def test_telegram_graph_commands_are_supported():
     assert "'/ram_graph'" in code
     assert "'/net_graph'" in code
     assert "'/disk_graph'" in code
+    assert "'/io_graph'" in code
     assert "'/swap_graph'" in code
     assert "'/keyboard_graph'" in code
     assert "'/mouse_graph'" in code
@@ -34,3 +35,85 @@ def test_telegram_notifier_has_graph_render_pipeline():
     assert "time_start_label = self._format_graph_time(points[0][0])" in code
     assert "time_end_label = self._format_graph_time(points[-1][0])" in code
     assert '"uptime"' not in code.split("mapping = {", 1)[1].split("}", 1)[0]
+
+
+def test_metric_samples_for_graph_reads_history_columns(tmp_path):
+    import importlib.util
+    import sys
+    import types
+
+    from app_core.history import MetricHistory
+
+    if "gi" not in sys.modules:
+        fake_glib = types.SimpleNamespace(idle_add=lambda *args, **kwargs: None)
+        fake_repository = types.SimpleNamespace(GLib=fake_glib)
+        sys.modules["gi"] = types.SimpleNamespace(repository=fake_repository)
+        sys.modules["gi.repository"] = fake_repository
+
+    spec = importlib.util.spec_from_file_location(
+        "notifications.telegram",
+        Path(__file__).resolve().parents[1] / "notifications" / "telegram.py",
+    )
+    telegram = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(telegram)
+    telegram.TELEGRAM_CONFIG_FILE = tmp_path / "telegram.json"
+
+    net_history = MetricHistory(('recv', 'sent'), 5000)
+    for i in range(400):
+        net_history.append(float(i), 1.0, 2.0)
+
+    notifier = telegram.TelegramNotifier()
+    notifier.set_app_context(types.SimpleNamespace(net_history=net_history, visibility_settings={}))
+
+    _title, points, _unit = notifier._metric_samples_for_graph("net")
+    assert len(points) == 400
+    assert points[-1] == (399.0, 3.0)
+
+    for i in range(400, 5000):
+        net_history.append(float(i), 1.0, 250.0 if i == 2345 else 2.0)
+    _title, points, _unit = notifier._metric_samples_for_graph("net")
+    assert len(points) == notifier._GRAPH_MAX_POINTS
+    assert max(value for _ts, value in points) == 251.0
+
+
+def test_system_status_reuses_the_sampler_snapshot(tmp_path, monkeypatch):
+    import importlib.util
+    import sys
+    import types
+
+    from app_core.sampler import MetricsSnapshot
+
+    if "gi" not in sys.modules:
+        fake_glib = types.SimpleNamespace(idle_add=lambda *args, **kwargs: None)
+        fake_repository = types.SimpleNamespace(GLib=fake_glib)
+        sys.modules["gi"] = types.SimpleNamespace(repository=fake_repository)
+        sys.modules["gi.repository"] = fake_repository
+
+    spec = importlib.util.spec_from_file_location(
+        "notifications.telegram",
+        Path(__file__).resolve().parents[1] / "notifications" / "telegram.py",
+    )
+    telegram = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(telegram)
+    telegram.TELEGRAM_CONFIG_FILE = tmp_path / "telegram.json"
+
+    def no_sampling(*_args):
+        raise AssertionError("/status must not sample from the bot thread")
+
+    for name in ("get_cpu_temp", "get_cpu_usage", "get_ram_usage", "get_disk_usage", "get_swap_usage", "get_uptime"):
+        monkeypatch.setattr(telegram.SystemUsage, name, no_sampling)
+    snapshot = MetricsSnapshot(
+        timestamp=1.0, cpu_temp=61, cpu_usage=37.0, ram_used=5.5, ram_total=16.0,
+        disk_used=120.0, disk_total=500.0, swap_used=0.5, swap_total=4.0,
+        net_recv=0.0, net_sent=0.0, uptime="2:00:00", keyboard_clicks=12, mouse_clicks=7,
+        families={}, texts={},
+    )
+    sent = []
+    notifier = telegram.TelegramNotifier()
+    notifier.set_app_context(types.SimpleNamespace(sampler_engine=types.SimpleNamespace(latest=snapshot)))
+    monkeypatch.setattr(notifier, "send_message", lambda text, *args, **kwargs: sent.append(text))
+
+    notifier._send_system_status()
+
+    assert len(sent) == 1
+    assert "37%" in sent[0] and "5.5/16.0" in sent[0] and "2:00:00" in sent[0]
@@ -0,0 +1,66 @@
+import os
+import shutil
+
+from app_core.system_usage import TempSensorResolver, _pick_cpu_sensor
+
+
+def _chip(root, index, name, sensors):
+    chip = root / "hwmon" / f"hwmon{index}"
+    chip.mkdir(parents=True)
+    (chip / "name").write_text(name + "\n")
+    for num, (label, millideg) in enumerate(sensors, 1):
+        (chip / f"temp{num}_input").write_text(f"{millideg}\n")
+        if label:
+            (chip / f"temp{num}_label").write_text(label + "\n")
+    return chip
+
+
+def test_prefers_package_sensor_and_reads_only_its_file(tmp_path):
+    _chip(tmp_path, 0, "acpitz", [("", 30000)])
+    chip = _chip(tmp_path, 1, "coretemp", [("Core 0", 41000), ("Package id 0", 47500)])
+
+    resolver = TempSensorResolver(str(tmp_path), rescan_interval=3600)
+    assert resolver.read() == 47
+    assert resolver.path == str(chip / "temp2_input")
+
+    (chip / "temp2_input").write_text("52999\n")
+    assert resolver.read() == 52
+
+
+def test_rediscovers_after_read_failure(tmp_path):
+    _chip(tmp_path, 0, "acpitz", [("", 30000)])
+    chip = _chip(tmp_path, 1, "k10temp", [("Tctl", 61000)])
+
+    resolver = TempSensorResolver(str(tmp_path), rescan_interval=3600)
+    assert resolver.read() == 61
+
+    # A removed hwmon device fails reads on the kept descriptor (ENODEV in sysfs).
+    shutil.rmtree(chip)
+    os.close(resolver._fd)
+    assert resolver.read() == 30
+
+
+def test_hotplugged_chip_is_picked_up_on_rescan(tmp_path):
+    _chip(tmp_path, 0, "acpitz", [("", 30000)])
+    resolver = TempSensorResolver(str(tmp_path), rescan_interval=0)
+    assert resolver.read() == 30
+
+    _chip(tmp_path, 1, "coretemp", [("Package id 0", 55000)])
+    assert resolver.read() == 55
+
+
+def test_thermal_zones_are_used_without_hwmon(tmp_path):
+    zone = tmp_path / "thermal" / "thermal_zone0"
+    zone.mkdir(parents=True)
+    (zone / "type").write_text("x86_pkg_temp\n")
+    (zone / "temp").write_text("44000\n")
+
+    assert TempSensorResolver(str(tmp_path)).read() == 44
+    assert TempSensorResolver(str(tmp_path / "missing")).read() is None
+
+
+def test_pick_cpu_sensor_order():
+    groups = {"nvme": [("Composite", 1)], "acpitz": [("", 2)], "coretemp": [("Core 0", 3), ("Package id 0", 4)]}
+    assert _pick_cpu_sensor(groups) == 4
+    assert _pick_cpu_sensor({"nvme": [("Composite", 1)]}) == 1
+    assert _pick_cpu_sensor({}) is None